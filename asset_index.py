@@ -0,0 +1,631 @@
+"""
+Asset Index
+===========
+
+SQLite index of the meshes imported into UE5, so that placement code can look
+up how large an asset is, where its pivot sits and what it costs without
+re-reading its OBJ or querying the editor. unreal_engine_import.py adds a row
+for every mesh it imports, holding:
+
+    mesh_path, blueprint_path       /Game/... paths of the Static Mesh and its blueprint
+    obj_path, content_hash          source OBJ and a hash over it, its MTLs and textures
+    bounds                          local bounds in UE axes and units (cm) at scale 1
+    pivot                           actor origin relative to the bottom center of the bounds
+    vertex_count, triangle_count
+    texture_bytes, texture_count    estimated GPU memory of the textures (block compressed)
+
+Lookups take a mesh or blueprint path (/Game/Meshes/MeshBP or the class path
+/Game/Meshes/MeshBP.MeshBP_C) and go through an in-memory LRU in front of
+SQLite: a repeated lookup is a dictionary hit of about a microsecond, a first
+one a single indexed query of 10-20 microseconds, whether the index holds a
+hundred assets or 100k (see --benchmark). Rows written by
+another process (the editor) are noticed through PRAGMA data_version, which
+is checked at most once per second.
+
+Only the standard library is used, so the index is written inside the editor
+and read by the command line tools. The database is
+~/.cache/hunyuan3d_ue5/asset_index.sqlite (set HUNYUAN3D_CACHE_DIR or
+HUNYUAN3D_ASSET_INDEX to move it; the editor and the tools must use the same
+file).
+
+Example usage:
+python asset_index.py --list
+python asset_index.py --show /Game/Meshes/MeshBP
+python asset_index.py --add data/result/mesh.obj --mesh_path /Game/Meshes/mesh --blueprint_path /Game/Meshes/MeshBP
+python asset_index.py --from_manifest MyProject/Saved/HunYuan3D/import_manifest.json
+python asset_index.py --benchmark 100000
+"""
+import argparse
+import collections
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+import tempfile
+import time
+
+import import_sources
+import placement_index
+import texture_pipeline
+
+DEFAULT_CACHE_DIR = os.environ.get('HUNYUAN3D_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'hunyuan3d_ue5'))
+DEFAULT_INDEX_PATH = os.environ.get('HUNYUAN3D_ASSET_INDEX', os.path.join(DEFAULT_CACHE_DIR, 'asset_index.sqlite'))
+DEFAULT_CACHE_SIZE = 16384
+# Largest dimension, in cm, that suggested_scale() scales a mesh to. HunYuan3D
+# meshes span about 2 units, so this matches the old fixed scale of 100.
+DEFAULT_TARGET_SIZE = 200.0
+
+COLUMNS = ('mesh_path', 'blueprint_path', 'obj_path', 'content_hash', 'min_x', 'min_y', 'min_z',
+           'max_x', 'max_y', 'max_z', 'vertex_count', 'triangle_count', 'texture_bytes', 'texture_count', 'indexed')
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    mesh_path TEXT PRIMARY KEY,
+    blueprint_path TEXT,
+    obj_path TEXT,
+    content_hash TEXT,
+    min_x REAL, min_y REAL, min_z REAL,
+    max_x REAL, max_y REAL, max_z REAL,
+    vertex_count INTEGER,
+    triangle_count INTEGER,
+    texture_bytes INTEGER,
+    texture_count INTEGER,
+    indexed REAL
+);
+CREATE INDEX IF NOT EXISTS assets_blueprint_path ON assets (blueprint_path);
+"""
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM assets"
+_BY_MESH = f"{_SELECT} WHERE mesh_path = ?"
+_BY_BLUEPRINT = f"{_SELECT} WHERE blueprint_path = ? ORDER BY indexed DESC LIMIT 1"
+_INSERT = f"INSERT OR REPLACE INTO assets ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+_VERTEX = re.compile(rb'^v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)', re.M)
+_FACE = re.compile(rb'^f[ \t]+([^\r\n]*)', re.M)
+# JPEG start-of-frame markers (everything from C0 to CF except DHT, JPG and DAC)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Exceptions that mean the index could not be read or written
+INDEX_ERRORS = (OSError, ValueError, sqlite3.Error)
+
+_default_index = None
+
+
+def normalize_path(path):
+    """
+    Args:
+        path (str): Asset or class path, e.g. /Game/Meshes/MeshBP.MeshBP_C
+
+    Returns:
+        str: The package path, e.g. /Game/Meshes/MeshBP
+    """
+    folder, _, name = path.rpartition('/')
+    return f"{folder}/{name.split('.', 1)[0]}" if folder else name.split('.', 1)[0]
+
+
+def scan_obj(obj_path):
+    """
+    Count the vertices and triangles of an OBJ and measure its bounds in one pass.
+
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        dict: vertex_count, triangle_count and bounds ((min x, y, z), (max x, y, z))
+            in UE axes (OBJ x, y, z -> UE x, -z, y, see placement_index.obj_bounds)
+
+    Raises:
+        ValueError: If the OBJ has no vertices
+    """
+    low = [float('inf')] * 3
+    high = [float('-inf')] * 3
+    vertex_count = 0
+    triangle_count = 0
+    for chunk in import_sources.iter_line_blocks(obj_path):
+        vertices = _VERTEX.findall(chunk)
+        if vertices:
+            vertex_count += len(vertices)
+            for axis in range(3):
+                values = [float(v[axis]) for v in vertices]
+                low[axis] = min(low[axis], min(values))
+                high[axis] = max(high[axis], max(values))
+        for face in _FACE.findall(chunk):
+            triangle_count += max(0, len(face.split()) - 2)
+    if not vertex_count:
+        raise ValueError(f"No vertices in {obj_path}")
+    return {
+        'vertex_count': vertex_count,
+        'triangle_count': triangle_count,
+        'bounds': ((low[0], -high[2], low[1]), (high[0], -low[2], high[1])),
+    }
+
+
+def image_info(path):
+    """
+    Read the size of a texture from its header, without decoding it.
+
+    Args:
+        path (str): PNG, JPEG, TGA or DDS file
+
+    Returns:
+        tuple or None: (width, height, has_alpha, compressed) or None for other formats
+    """
+    with open(path, 'rb') as f:
+        header = f.read(128)
+        if header.startswith(b'\x89PNG\r\n\x1a\n') and len(header) >= 26:
+            width, height = struct.unpack('>II', header[16:24])
+            # Color types 4 and 6 carry an alpha channel
+            return width, height, header[25] in (4, 6), False
+        if header.startswith(b'DDS ') and len(header) >= 88:
+            height, width = struct.unpack('<II', header[12:20])
+            return width, height, header[84:88] in (b'DXT3', b'DXT5'), True
+        if header.startswith(b'\xff\xd8'):
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                if marker[1] == 0xFF:
+                    f.seek(-1, 1)
+                    continue
+                if marker[1] in _JPEG_SOF:
+                    height, width = struct.unpack('>xHH', f.read(7)[2:])
+                    return width, height, False, False
+                length = struct.unpack('>H', f.read(2))[0]
+                f.seek(length - 2, 1)
+        if path.lower().endswith('.tga') and len(header) >= 18:
+            width, height = struct.unpack('<HH', header[12:16])
+            return width, height, header[16] == 32, False
+    return None
+
+
+def texture_stats(obj_path):
+    """
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        tuple: (estimated GPU bytes, number of textures) of the textures its materials reference
+    """
+    total = 0
+    count = 0
+    for path in import_sources.material_files(obj_path)[1]:
+        try:
+            info = image_info(path)
+        except OSError:
+            continue
+        if info is None:
+            continue
+        width, height, has_alpha, compressed = info
+        power_of_two = width & (width - 1) == 0 and height & (height - 1) == 0
+        # Like UE on import: DXT1, or DXT5 with alpha, and no mips for non-power-of-two sources
+        total += texture_pipeline.gpu_bytes(width, height, 'DXT5' if has_alpha else 'DXT1',
+                                            mips=compressed or power_of_two)
+        count += 1
+    return total, count
+
+
+def source_hashes(obj_path):
+    """
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        dict: Path -> {'hash': ...} for the OBJ and its existing material files
+    """
+    return {path: {'hash': import_sources.file_hash(path)} for path in import_sources.source_files(obj_path)}
+
+
+def content_hash(obj_path, files=None):
+    """
+    Hash an OBJ together with its material libraries and textures.
+
+    Args:
+        obj_path (str): Path to the .obj file
+        files (dict): File records from import_sources.ImportManifest.check, to
+            reuse their hashes instead of reading the files again
+
+    Returns:
+        str: Hex BLAKE2b digest; unchanged when the folder is moved
+    """
+    if files is None:
+        files = source_hashes(obj_path)
+    digest = hashlib.blake2b(digest_size=20)
+    for path in sorted(files, key=os.path.basename):
+        if not files[path].get('missing'):
+            digest.update(f"{os.path.basename(path)}:{files[path]['hash']}\n".encode())
+    return digest.hexdigest()
+
+
+def describe_obj(obj_path, mesh_path, blueprint_path=None, files=None):
+    """
+    Build the index row of an imported mesh from its source files.
+
+    Args:
+        obj_path (str): Source .obj file
+        mesh_path (str): Static Mesh asset path, e.g. /Game/Meshes/chair_01/mesh
+        blueprint_path (str): Blueprint asset path, if one was created
+        files (dict): File records from the import manifest (see content_hash)
+
+    Returns:
+        dict: Row for AssetIndex.put
+    """
+    stats = scan_obj(obj_path)
+    texture_bytes, texture_count = texture_stats(obj_path)
+    (min_x, min_y, min_z), (max_x, max_y, max_z) = stats['bounds']
+    return _record((normalize_path(mesh_path), normalize_path(blueprint_path) if blueprint_path else None,
+                    os.path.abspath(obj_path), content_hash(obj_path, files), min_x, min_y, min_z,
+                    max_x, max_y, max_z, stats['vertex_count'], stats['triangle_count'],
+                    texture_bytes, texture_count, time.time()))
+
+
+def _record(row):
+    """Turn a database row into a record with bounds, size and pivot"""
+    record = dict(zip(COLUMNS, row))
+    low = (record['min_x'], record['min_y'], record['min_z'])
+    high = (record['max_x'], record['max_y'], record['max_z'])
+    record['bounds'] = (low, high)
+    record['size'] = (high[0] - low[0], high[1] - low[1], high[2] - low[2])
+    record['pivot'] = (-(low[0] + high[0]) / 2, -(low[1] + high[1]) / 2, -low[2])
+    return record
+
+
+def _row(record):
+    return tuple(record[column] for column in COLUMNS)
+
+
+class AssetIndex:
+    """
+    SQLite-backed asset index with an LRU of recently looked up records.
+
+    Args:
+        path (str): Database file (default: DEFAULT_INDEX_PATH)
+        cache_size (int): Records kept in memory
+        recheck_interval (float): Seconds between checks for writes by other processes
+    """
+
+    def __init__(self, path=None, cache_size=DEFAULT_CACHE_SIZE, recheck_interval=1.0):
+        self.path = path or DEFAULT_INDEX_PATH
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self.cache_size = cache_size
+        self.recheck_interval = recheck_interval
+        self._db = sqlite3.connect(self.path, timeout=10.0)
+        # WAL lets the editor write while the command line tools read
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+        self._cache = collections.OrderedDict()
+        self._version = self._data_version()
+        self._checked = time.monotonic()
+
+    def _data_version(self):
+        return self._db.execute('PRAGMA data_version').fetchone()[0]
+
+    def _check_version(self):
+        now = time.monotonic()
+        if now - self._checked < self.recheck_interval:
+            return
+        self._checked = now
+        version = self._data_version()
+        if version != self._version:
+            self._version = version
+            self._cache.clear()
+
+    def get(self, path):
+        """
+        Look up an asset by its mesh or blueprint path.
+
+        Args:
+            path (str): /Game/... path of the mesh or blueprint, or a class path ending in _C
+
+        Returns:
+            dict or None: The record (see module docstring), or None if the asset is not indexed
+        """
+        self._check_version()
+        cache = self._cache
+        if path in cache:
+            cache.move_to_end(path)
+            return cache[path]
+        key = normalize_path(path)
+        row = self._db.execute(_BY_MESH, (key,)).fetchone()
+        if row is None:
+            row = self._db.execute(_BY_BLUEPRINT, (key,)).fetchone()
+        # Misses are cached too, so unindexed blueprints cost no query either
+        record = _record(row) if row is not None else None
+        cache[path] = record
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return record
+
+    def __contains__(self, path):
+        return self.get(path) is not None
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM assets').fetchone()[0]
+
+    def put_many(self, records):
+        """
+        Add or replace records in one transaction.
+
+        Args:
+            records (list): Records from describe_obj (or get)
+        """
+        with self._db:
+            self._db.executemany(_INSERT, [_row(record) for record in records])
+        self._cache.clear()
+
+    def put(self, record):
+        """Add or replace one record"""
+        self.put_many([record])
+
+    def remove(self, mesh_path):
+        """
+        Forget an asset.
+
+        Returns:
+            bool: True if the asset was indexed
+        """
+        with self._db:
+            removed = self._db.execute('DELETE FROM assets WHERE mesh_path = ?',
+                                       (normalize_path(mesh_path),)).rowcount
+        self._cache.clear()
+        return bool(removed)
+
+    def records(self):
+        """
+        Returns:
+            list: Every record, ordered by mesh path
+        """
+        return [_record(row) for row in self._db.execute(f"{_SELECT} ORDER BY mesh_path")]
+
+    def clear_cache(self):
+        """Drop the in-memory records, e.g. after another process rewrote the index"""
+        self._cache.clear()
+
+    def close(self):
+        """Close the database"""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_default_index():
+    """Return the process-wide index backed by DEFAULT_INDEX_PATH"""
+    global _default_index
+    if _default_index is None:
+        _default_index = AssetIndex()
+    return _default_index
+
+
+def lookup(path, index=None):
+    """
+    Look up an asset in the default index.
+
+    Args:
+        path (str): Mesh or blueprint path
+        index (AssetIndex): Index to use (default: get_default_index())
+
+    Returns:
+        dict or None: The record, or None if the asset is not indexed or the index cannot be opened
+    """
+    try:
+        return (index if index is not None else get_default_index()).get(path)
+    except INDEX_ERRORS:
+        return None
+
+
+def record_imports(imports, index=None):
+    """
+    Index freshly imported meshes. Meshes whose sources match their record are
+    not read again; only their blueprint path is updated.
+
+    Args:
+        imports (list): Dictionaries with mesh_path, obj_path and optionally
+            blueprint_path and files (the import manifest's file records)
+        index (AssetIndex): Index to update (default: get_default_index())
+
+    Returns:
+        int: Number of meshes that were (re)scanned
+    """
+    index = index if index is not None else get_default_index()
+    records = []
+    scanned = 0
+    for item in imports:
+        existing = index.get(item['mesh_path'])
+        # Hashing the files is much cheaper than parsing the OBJ again
+        files = item.get('files') or source_hashes(item['obj_path'])
+        blueprint_path = normalize_path(item['blueprint_path']) if item.get('blueprint_path') else None
+        if blueprint_path is None and existing is not None:
+            blueprint_path = existing['blueprint_path']
+        if existing is not None and existing['obj_path'] == os.path.abspath(item['obj_path']) and \
+                existing['content_hash'] == content_hash(item['obj_path'], files):
+            if blueprint_path and blueprint_path != existing['blueprint_path']:
+                records.append(dict(existing, blueprint_path=blueprint_path))
+            continue
+        records.append(describe_obj(item['obj_path'], item['mesh_path'], blueprint_path, files))
+        scanned += 1
+    if records:
+        index.put_many(records)
+    return scanned
+
+
+def suggested_scale(record, target_size=DEFAULT_TARGET_SIZE):
+    """
+    Args:
+        record (dict): Asset record
+        target_size (float): Wanted largest dimension in cm
+
+    Returns:
+        float: Uniform scale that gives the mesh that largest dimension
+    """
+    largest = max(record['size'])
+    return target_size / largest if largest > 0 else 1.0
+
+
+def world_bounds(record, scale=(1.0, 1.0, 1.0), rotation=None):
+    """
+    Args:
+        record (dict): Asset record
+        scale (tuple): Actor scale
+        rotation (tuple): Actor rotation (Pitch, Yaw, Roll) in degrees, or None
+
+    Returns:
+        tuple: ((min x, y, z), (max x, y, z)) relative to the actor origin, scaled
+            and rotated (the axis-aligned box around the rotated bounds)
+    """
+    return placement_index.transform_bounds(record['bounds'], rotation, scale)
+
+
+def resting_height(record, scale=(1.0, 1.0, 1.0), ground=0.0, rotation=None):
+    """
+    Args:
+        record (dict): Asset record
+        scale (tuple): Actor scale
+        ground (float): Height of the floor
+        rotation (tuple): Actor rotation (Pitch, Yaw, Roll) in degrees, or None
+
+    Returns:
+        float: Actor z at which the mesh stands on the floor
+    """
+    return ground - world_bounds(record, scale, rotation)[0][2]
+
+
+def scene_cost(asset_paths, index=None):
+    """
+    Rendering cost of a set of placed objects.
+
+    Args:
+        asset_paths (list): Blueprint or mesh path of every placed object
+        index (AssetIndex): Index to use (default: get_default_index())
+
+    Returns:
+        dict: objects, indexed (objects whose asset is in the index), triangles
+            (summed over objects) and texture_bytes (summed over distinct meshes,
+            since copies share their textures)
+    """
+    triangles = 0
+    indexed = 0
+    textures = {}
+    for path in asset_paths:
+        record = lookup(path, index)
+        if record is None:
+            continue
+        indexed += 1
+        triangles += record['triangle_count']
+        textures[record['mesh_path']] = record['texture_bytes']
+    return {'objects': len(asset_paths), 'indexed': indexed, 'triangles': triangles,
+            'texture_bytes': sum(textures.values())}
+
+
+def print_record(record):
+    """Print one record"""
+    size = ' x '.join(f"{v:.1f}" for v in record['size'])
+    print(f"{record['mesh_path']}")
+    print(f"  blueprint:  {record['blueprint_path'] or '-'}")
+    print(f"  source:     {record['obj_path']} ({record['content_hash'][:12]})")
+    print(f"  size:       {size} cm at scale 1 (suggested scale {suggested_scale(record):.3g})")
+    print(f"  pivot:      {', '.join(f'{v:.2f}' for v in record['pivot'])} from the bottom center")
+    print(f"  cost:       {record['vertex_count']} vertices, {record['triangle_count']} triangles, "
+          f"{record['texture_count']} textures ({record['texture_bytes'] / 1024:.0f} KB GPU)")
+
+
+def benchmark(count=100000, lookups=100000, seed=0):
+    """
+    Time lookups in an index of synthetic records.
+
+    Args:
+        count (int): Number of assets in the index
+        lookups (int): Lookups per measurement
+        seed (int): Random seed
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'asset_index.sqlite')
+        index = AssetIndex(path, cache_size=count)
+        start = time.perf_counter()
+        index.put_many(_record((f"/Game/Meshes/asset_{i:06d}/mesh", f"/Game/Meshes/asset_{i:06d}/MeshBP",
+                                f"/data/asset_{i:06d}/mesh.obj", f"{i:040x}", -1.0, -1.0, 0.0, 1.0, 1.0, 2.0,
+                                1000 + i, 2000 + i, 1 << 20, 1, 0.0)) for i in range(count))
+        print(f"Indexed {count} assets in {time.perf_counter() - start:.2f}s")
+
+        keys = [f"/Game/Meshes/asset_{rng.randrange(count):06d}/MeshBP.MeshBP_C" for _ in range(lookups)]
+        mesh_keys = [f"/Game/Meshes/asset_{rng.randrange(count):06d}/mesh" for _ in range(lookups)]
+        for label, batch in (('cold, by mesh path', mesh_keys), ('cold, by blueprint class path', keys),
+                             ('cached, by blueprint class path', keys)):
+            if label.startswith('cold'):
+                index.clear_cache()
+            start = time.perf_counter()
+            for key in batch:
+                index.get(key)
+            print(f"{label:<32} {(time.perf_counter() - start) / len(batch) * 1e6:8.2f} us per lookup")
+        index.close()
+
+
+def main():
+    """
+    Inspect, fill or benchmark the asset index.
+    """
+    parser = argparse.ArgumentParser(description='Asset metadata index for placement')
+    parser.add_argument('--index', type=str, default=None, help=f'Database file (default: {DEFAULT_INDEX_PATH})')
+    parser.add_argument('--list', action='store_true', help='List every indexed asset')
+    parser.add_argument('--show', type=str, metavar='PATH', help='Print the record of a mesh or blueprint path')
+    parser.add_argument('--add', type=str, metavar='OBJ', help='Index an OBJ that was imported outside these scripts')
+    parser.add_argument('--mesh_path', type=str, help='Mesh asset path for --add (default: /Game/Meshes/<file name>)')
+    parser.add_argument('--blueprint_path', type=str, help='Blueprint asset path for --add')
+    parser.add_argument('--from_manifest', type=str, metavar='MANIFEST',
+                        help="Index every asset of an import manifest (<Project>/Saved/HunYuan3D/import_manifest.json)")
+    parser.add_argument('--remove', type=str, metavar='PATH', help='Forget a mesh')
+    parser.add_argument('--benchmark', type=int, metavar='COUNT', help='Benchmark lookups with COUNT synthetic assets')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+
+    with AssetIndex(args.index) as index:
+        if args.add:
+            mesh_path = args.mesh_path or f"/Game/Meshes/{os.path.splitext(os.path.basename(args.add))[0]}"
+            try:
+                index.put(describe_obj(args.add, mesh_path, args.blueprint_path))
+            except (OSError, ValueError) as e:
+                print(f"Error indexing {args.add}: {e}")
+                return
+            print_record(index.get(mesh_path))
+        if args.from_manifest:
+            manifest = import_sources.ImportManifest(args.from_manifest)
+            assets = manifest.assets()
+            imports = [{'mesh_path': mesh_path, 'obj_path': entry['obj_path'], 'blueprint_path':
+                        entry.get('blueprint_path'), 'files': entry.get('files')}
+                       for mesh_path, entry in assets.items() if os.path.exists(entry['obj_path'])]
+            start = time.perf_counter()
+            scanned = record_imports(imports, index)
+            print(f"Indexed {len(imports)}/{len(assets)} assets ({scanned} scanned) "
+                  f"in {time.perf_counter() - start:.2f}s")
+        if args.remove:
+            print(f"Removed {args.remove}" if index.remove(args.remove) else f"{args.remove} is not indexed")
+        if args.show:
+            record = index.get(args.show)
+            if record is None:
+                print(f"{args.show} is not indexed")
+            else:
+                print_record(record)
+        if args.list:
+            print(f"{'Mesh':<48} {'Triangles':>10} {'Tex KB':>8} {'Size cm (scale 1)':>24}")
+            print("-" * 94)
+            records = index.records()
+            for record in records:
+                size = ' x '.join(f"{v:.1f}" for v in record['size'])
+                print(f"{record['mesh_path'][-48:]:<48} {record['triangle_count']:>10} "
+                      f"{record['texture_bytes'] / 1024:>8.0f} {size:>24}")
+            print("-" * 94)
+            print(f"{len(records)} assets in {index.path}")
+
+
+if __name__ == "__main__":
+    main()
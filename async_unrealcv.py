@@ -0,0 +1,268 @@
+"""
+Asyncio UnrealCV Client
+=======================
+
+An asyncio-native client for the UnrealCV wire protocol, for code that wants
+placement, transform updates and scene queries to overlap instead of blocking
+the whole process on each request:
+
+    async def main():
+        async with AsyncUnrealCVClient() as client:
+            objects, version = await asyncio.gather(
+                client.request('vget /objects'),
+                client.request('vget /unrealcv/version'),
+            )
+
+Every request is tagged with a message id and written to the socket as soon as
+a concurrency slot is free; a background reader task resolves the matching
+future when the reply arrives. Requests are written in the order they are
+issued, which UnrealCV also executes them in, so a spawn issued before its
+transform updates is still applied first.
+
+The frame format (magic number, payload size, "<id>:<command>" payload) is the
+same one used by the unrealcv package and the UnrealCV server plugin.
+"""
+import asyncio
+import struct
+import time
+
+import unrealcv_session
+
+MAGIC = 0x9E2B83C1
+HEADER = struct.Struct('<II')
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_REQUEST_TIMEOUT = 15.0
+
+
+def encode_frame(payload):
+    """
+    Wrap a payload in an UnrealCV frame.
+
+    Args:
+        payload (bytes): Message body
+
+    Returns:
+        bytes: Header followed by the payload
+    """
+    return HEADER.pack(MAGIC, len(payload)) + payload
+
+
+async def read_frame(reader):
+    """
+    Read one UnrealCV frame from a stream.
+
+    Args:
+        reader (asyncio.StreamReader): Stream to read from
+
+    Returns:
+        bytes: The frame payload
+
+    Raises:
+        ConnectionError: If the stream closed or the frame is malformed
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+        magic, size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ConnectionError(f"Malformed UnrealCV frame (magic {magic:#x})")
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError:
+        raise ConnectionError("UnrealCV connection closed")
+
+
+class AsyncUnrealCVClient:
+    """
+    A single asyncio connection to an UnrealCV server with bounded concurrency.
+    """
+
+    def __init__(self, endpoint=None, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 request_timeout=DEFAULT_REQUEST_TIMEOUT, verbose=True):
+        """
+        Args:
+            endpoint (tuple): (host, port) of the UnrealCV server
+                (default: unrealcv_session.DEFAULT_ENDPOINT)
+            max_concurrency (int): Maximum number of requests awaiting a reply
+            request_timeout (float): Default per-request timeout in seconds
+            verbose (bool): Print connection progress messages
+        """
+        self.endpoint = tuple(endpoint or unrealcv_session.DEFAULT_ENDPOINT)
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self.verbose = verbose
+        self.connect_latency = None
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._semaphore = None
+        self._pending = {}
+        self._next_id = 0
+
+    async def __aenter__(self):
+        if not await self.connect():
+            raise ConnectionError(f"Could not connect to UnrealCV at {self.endpoint[0]}:{self.endpoint[1]}")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def isconnected(self):
+        """Check whether the client has an open connection"""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def _open(self):
+        """Open the socket and wait for the server's connection confirmation"""
+        reader, writer = await asyncio.open_connection(*self.endpoint)
+        try:
+            greeting = await asyncio.wait_for(read_frame(reader), self.request_timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            writer.close()
+            return False
+        if not greeting.startswith(b'connected'):
+            writer.close()
+            return False
+        self._reader, self._writer = reader, writer
+        return True
+
+    async def connect(self, timeout=30.0, initial_delay=0.005, max_delay=1.0):
+        """
+        Connect to the server, retrying with exponential backoff.
+
+        Args:
+            timeout (float): Give up after this many seconds
+            initial_delay (float): Delay before the first retry, in seconds
+            max_delay (float): Upper bound for the delay between retries, in seconds
+
+        Returns:
+            bool: True if the connection was established
+        """
+        if self.isconnected():
+            return True
+
+        start = time.perf_counter()
+        delay = initial_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if await self._open():
+                    break
+            except OSError:
+                pass
+            elapsed = time.perf_counter() - start
+            if elapsed + delay > timeout:
+                return False
+            if self.verbose:
+                print(f"Waiting for UnrealCV connection... attempt {attempt} ({elapsed:.2f}s/{timeout:.0f}s)")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+        self.connect_latency = time.perf_counter() - start
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+        if self.verbose:
+            print(f"Connected to UnrealCV at {self.endpoint[0]}:{self.endpoint[1]} "
+                  f"in {self.connect_latency * 1000:.1f} ms (async)")
+        return True
+
+    async def _read_loop(self):
+        """Resolve pending requests as their replies arrive"""
+        error = ConnectionError("UnrealCV connection closed")
+        try:
+            while True:
+                payload = await read_frame(self._reader)
+                message_id, _, body = payload.partition(b':')
+                try:
+                    future = self._pending.pop(int(message_id))
+                except (ValueError, KeyError):
+                    # Reply to a request that already timed out
+                    continue
+                if not future.done():
+                    try:
+                        future.set_result(body.decode('utf-8'))
+                    except UnicodeDecodeError:
+                        future.set_result(body)
+        except ConnectionError as e:
+            error = e
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    def _send(self, command):
+        """Write one request frame and return the future for its reply"""
+        if not self.isconnected():
+            raise ConnectionError("Not connected to UnrealCV")
+        message_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        self._writer.write(encode_frame(f"{message_id}:{command}".encode('utf-8')))
+        return message_id, future
+
+    async def request(self, command, timeout=None):
+        """
+        Send a command and wait for its reply.
+
+        Args:
+            command (str): UnrealCV command, e.g. 'vget /objects'
+            timeout (float): Seconds to wait for the reply (default: request_timeout)
+
+        Returns:
+            str: The server response
+
+        Raises:
+            ConnectionError: If the connection is closed
+            asyncio.TimeoutError: If no reply arrived in time
+        """
+        if self._semaphore is None:
+            raise ConnectionError("Not connected to UnrealCV")
+        timeout = self.request_timeout if timeout is None else timeout
+        async with self._semaphore:
+            tracer = unrealcv_session.get_tracer()
+            start = time.perf_counter()
+            message_id, future = self._send(command)
+            response = None
+            try:
+                await self._writer.drain()
+                response = await asyncio.wait_for(future, timeout)
+                return response
+            finally:
+                self._pending.pop(message_id, None)
+                if tracer is not None:
+                    tracer.record(command, start, time.perf_counter() - start, response)
+
+    async def request_many(self, commands, timeout=None):
+        """
+        Send several commands concurrently and wait for all replies.
+
+        Args:
+            commands (list): UnrealCV command strings
+            timeout (float): Per-request timeout in seconds
+
+        Returns:
+            list: Responses in command order; failed requests are returned as
+                the exception that ended them
+        """
+        return await asyncio.gather(*(self.request(c, timeout) for c in commands), return_exceptions=True)
+
+    async def close(self):
+        """Close the connection and fail any outstanding requests"""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
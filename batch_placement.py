@@ -0,0 +1,447 @@
+"""
+Batch Runtime Placement
+=======================
+
+Spawns many blueprints in a running UE5 game from a manifest file in a single
+run. Every row becomes a spawn command followed by its transform commands, and
+the commands are streamed to UnrealCV in pipelined chunks over one connection
+instead of one blocking round trip per command.
+
+Manifest formats:
+
+JSONL, one object per line:
+    {"blueprint": "/Game/Meshes/MeshBP", "location": [0, 0, 100], "rotation": [0, 90, 0], "scale": [1, 1, 1], "name": "Chair_01"}
+
+JSON (.json), either the same lines or one array of those objects:
+    [{"blueprint": "/Game/Meshes/MeshBP", "location": [0, 0, 100]}, ...]
+
+CSV with a header row. Vectors can be given as "X,Y,Z" strings (quoted) or as
+separate x/y/z, pitch/yaw/roll and scale_x/scale_y/scale_z columns:
+    blueprint,x,y,z,pitch,yaw,roll,scale_x,scale_y,scale_z,name
+    /Game/Meshes/MeshBP,0,0,100,0,90,0,1,1,1,Chair_01
+
+Only the blueprint column is required. Rows without a name get a generated one,
+rows without a rotation or scale keep the blueprint defaults. Rows without a
+location are placed at the free spot nearest to 0,0,100 that overlaps neither
+the other rows nor the objects recorded in the scene index (see
+placement_index.py). Their bounds come from an obj_path column (relative to the
+manifest) or, for blueprints imported with unreal_engine_import.py, from the
+asset index, and are scaled and rotated by the row's transform; other rows are
+treated as a 1 m box.
+
+Example usage:
+python hunyuan3d_ue5_demo.py --action place-batch --manifest placements.jsonl
+"""
+import csv
+import json
+import os
+import time
+
+import asset_index
+import command_pipeline
+import placement_index
+import spawn_strategy
+import unrealcv_session
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def parse_vector(value, default=None):
+    """
+    Parse a 3-component vector from a manifest value.
+
+    Args:
+        value: A list/tuple of numbers, an "X,Y,Z" or "X Y Z" string, or None
+        default (tuple): Value returned when the field is missing
+
+    Returns:
+        tuple: Three floats, or the default
+    """
+    if value is None or value == '':
+        return default
+    if isinstance(value, str):
+        parts = value.replace(',', ' ').split()
+    else:
+        parts = list(value)
+    if len(parts) != 3:
+        raise ValueError(f"Expected 3 components, got {value!r}")
+    return tuple(float(p) for p in parts)
+
+
+def _row_vector(row, key, columns, default=None):
+    """Read a vector either from a single column or from three separate columns"""
+    if row.get(key) not in (None, ''):
+        return parse_vector(row[key], default)
+    if all(row.get(c) not in (None, '') for c in columns):
+        return tuple(float(row[c]) for c in columns)
+    return default
+
+
+def normalize_row(row):
+    """
+    Convert a raw manifest row into a placement dictionary.
+
+    Args:
+        row (dict): Row read from a JSONL or CSV manifest
+
+    Returns:
+        dict: Placement with blueprint, location (None if missing), rotation, scale,
+            name and obj_path keys
+    """
+    if not isinstance(row, dict):
+        raise ValueError(f"Expected an object, got {type(row).__name__} {row!r}")
+    blueprint = row.get('blueprint') or row.get('blueprint_path')
+    if not blueprint:
+        raise ValueError("Missing 'blueprint' field")
+    if not isinstance(blueprint, str):
+        raise ValueError(f"'blueprint' must be a string, got {blueprint!r}")
+    return {
+        'blueprint': blueprint.strip(),
+        'location': _row_vector(row, 'location', ('x', 'y', 'z')),
+        'rotation': _row_vector(row, 'rotation', ('pitch', 'yaw', 'roll')),
+        'scale': _row_vector(row, 'scale', ('scale_x', 'scale_y', 'scale_z')),
+        'name': str(row.get('name') or '').strip() or None,
+        'obj_path': str(row.get('obj_path') or '').strip() or None,
+    }
+
+
+def _read_json_rows(f, manifest_path, allow_array):
+    """Read JSONL rows, or a single JSON array when allow_array is set and the file starts with '['"""
+    text = f.read()
+    if allow_array and text.lstrip().startswith('['):
+        try:
+            rows = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"{manifest_path}: {e}")
+        if not isinstance(rows, list):
+            raise ValueError(f"{manifest_path}: expected a JSON array of placements")
+        return rows
+    rows = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        try:
+            rows.append(json.loads(line))
+        except ValueError as e:
+            raise ValueError(f"{manifest_path}: line {line_number}: {e}")
+    return rows
+
+
+def load_manifest(manifest_path):
+    """
+    Read a JSONL, JSON or CSV placement manifest.
+
+    Args:
+        manifest_path (str): Path to a .jsonl, .json (lines or one array) or .csv file
+
+    Returns:
+        list: Placement dictionaries as returned by normalize_row
+
+    Raises:
+        ValueError: If the file cannot be parsed or a row is invalid; the
+            message names the row
+    """
+    rows = []
+    extension = os.path.splitext(manifest_path)[1].lower()
+    with open(manifest_path, 'r', newline='') as f:
+        if extension == '.csv':
+            raw_rows = list(csv.DictReader(f))
+        else:
+            raw_rows = _read_json_rows(f, manifest_path, allow_array=extension == '.json')
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    for line_number, raw_row in enumerate(raw_rows, start=1):
+        try:
+            row = normalize_row(raw_row)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"{manifest_path}: row {line_number}: {e}")
+        if row['obj_path']:
+            row['obj_path'] = os.path.join(base_dir, row['obj_path'])
+        rows.append(row)
+    return rows
+
+
+def assign_locations(placements, index=None, near=placement_index.DEFAULT_LOCATION):
+    """
+    Fill in the location of every row that has none, avoiding all other rows.
+
+    Rows with a location are recorded in the index first, then the others are
+    placed one by one at the free spot nearest to near.
+
+    Args:
+        placements (list): Placement dictionaries (see load_manifest)
+        index (PlacementIndex): Objects already in the scene (default: empty)
+        near (tuple): Wanted location of the rows without one
+
+    Returns:
+        list: New placement dictionaries with a location and bounds each
+
+    Raises:
+        ValueError: If no free location is found for a row
+    """
+    index = index if index is not None else placement_index.PlacementIndex()
+    bounds_cache = {}
+
+    def bounds_of(placement):
+        # Bounds as placed: scaled and rotated like the actor
+        obj_path = placement.get('obj_path')
+        if obj_path:
+            if obj_path not in bounds_cache:
+                bounds_cache[obj_path] = placement_index.obj_bounds(obj_path)
+            return placement_index.transform_bounds(bounds_cache[obj_path], placement['rotation'],
+                                                    placement['scale'])
+        record = asset_index.lookup(placement['blueprint'])
+        if record is None:
+            return placement_index.DEFAULT_BOUNDS
+        return asset_index.world_bounds(record, placement['scale'] or (1.0, 1.0, 1.0), placement['rotation'])
+
+    resolved = [dict(placement, bounds=bounds_of(placement)) for placement in placements]
+    for number, placement in enumerate(resolved):
+        if placement['location'] is not None:
+            index.add(placement['name'] or f"row_{number}", placement['location'], placement['bounds'])
+    for number, placement in enumerate(resolved):
+        if placement['location'] is None:
+            location = index.find_free_location(placement['bounds'], near)
+            if location is None:
+                raise ValueError(f"No free location found for row {number + 1}")
+            index.add(placement['name'] or f"row_{number}", location, placement['bounds'])
+            placement['location'] = location
+    return resolved
+
+
+def record_placements(placements, results, scene_path):
+    """
+    Add the rows that were placed successfully to a scene index file.
+
+    Args:
+        placements (list): Placements returned by assign_locations
+        results (list): Results returned by place_batch, in the same order
+        scene_path (str): Index file (see placement_index.PlacementIndex.save)
+    """
+    scene = placement_index.PlacementIndex.load(scene_path)
+    for placement, result in zip(placements, results):
+        if result['ok']:
+            scene.add(result['name'], placement['location'], placement['bounds'])
+    scene.save(scene_path)
+
+
+def build_transform_commands(placement, name, strategy=None):
+    """
+    Build the UnrealCV commands that position a spawned object.
+
+    Args:
+        placement (dict): Placement with location, rotation and scale
+        name (str): Name the object is addressed with
+        strategy (SpawnStrategy): Strategy that spawned it; its location is not
+            set again if the spawn command already placed the object
+
+    Returns:
+        list: Command strings
+    """
+    strategy = strategy or spawn_strategy.STRATEGIES[0]
+    slots = spawn_strategy.transform_commands(strategy, name, placement['location'], placement['rotation'],
+                                              placement['scale'])
+    return [slot.command for slot in slots]
+
+
+def build_placement_commands(placement, strategy=None):
+    """
+    Build the UnrealCV commands that spawn and position one object.
+
+    Args:
+        placement (dict): Placement with a resolved 'name'
+        strategy (SpawnStrategy): Spawn command syntax that names objects as
+            requested (default: the first entry of spawn_strategy.STRATEGIES)
+
+    Returns:
+        list: Command strings, spawn first
+    """
+    strategy = strategy or spawn_strategy.STRATEGIES[0]
+    return ([strategy.command(placement['blueprint'], placement['name'], placement['location'])] +
+            build_transform_commands(placement, placement['name'], strategy))
+
+
+def _row_result(placement, ok, error, name=None):
+    return {
+        'name': name or placement['name'],
+        'blueprint': placement['blueprint'],
+        'location': placement['location'],
+        'ok': ok,
+        'error': error,
+    }
+
+
+def place_batch(placements, session, chunk_size=DEFAULT_CHUNK_SIZE, name_prefix=None, cache=None):
+    """
+    Spawn and position every placement, pipelining the commands in chunks.
+
+    Rows are placed one at a time through spawn_strategy.spawn_and_place until a
+    working spawn strategy is known (cached or freshly probed). The remaining rows
+    are then pipelined with that strategy. If the server names the spawned
+    objects itself, the spawns are pipelined first and the transforms follow in
+    a second pipelined flush, addressed by the returned names. If the objects
+    cannot be addressed at all, only their locations are applied and a warning
+    is printed.
+
+    Args:
+        placements (list): Placement dictionaries (see load_manifest)
+        session: A connected UnrealCVSession
+        chunk_size (int): Maximum number of commands in flight per batch
+        name_prefix (str): Prefix for generated object names
+        cache (SpawnStrategyCache): Spawn strategy cache (default: the shared on-disk cache)
+
+    Returns:
+        list: One result dictionary per placement with name, ok and error keys
+    """
+    name_prefix = name_prefix or f"BatchObject_{int(time.time())}"
+    named = []
+    for index, placement in enumerate(placements):
+        placement = dict(placement)
+        placement['name'] = placement.get('name') or f"{name_prefix}_{index:05d}"
+        named.append(placement)
+
+    results = []
+    strategy = None
+    remaining = iter(named)
+    for placement in remaining:
+        spawned = spawn_strategy.spawn_and_place(session, placement['blueprint'], placement['name'],
+                                                 placement['location'], placement['rotation'],
+                                                 placement['scale'], cache=cache)
+        failed = command_pipeline.errors(spawned.transforms)
+        if spawned.ok:
+            error = failed[0].error if failed else ''
+        else:
+            error = spawned.failures[-1][1] if spawned.failures else 'spawn failed'
+        results.append(_row_result(placement, spawned.ok and not failed, error, spawned.object_name))
+        if spawned.ok:
+            strategy = spawned.strategy
+            break
+
+    if strategy is None:
+        return results
+    if strategy.name_source == 'given':
+        return results + _place_named(named[len(results):], session, strategy, chunk_size)
+    return results + _place_unnamed(named[len(results):], session, strategy, chunk_size)
+
+
+def _place_named(placements, session, strategy, chunk_size):
+    """Pipeline the spawn and transform commands of rows whose objects get the requested names"""
+    pipeline = command_pipeline.CommandPipeline(session, max_in_flight=chunk_size)
+    rows = []
+    for placement in placements:
+        row_results = [pipeline.add(command, placement['name'])
+                       for command in build_placement_commands(placement, strategy)]
+        rows.append((placement, row_results))
+
+    pipeline.flush()
+
+    results = []
+    for placement, row_results in rows:
+        failed = command_pipeline.errors(row_results)
+        results.append(_row_result(placement, not failed, failed[0].error if failed else ''))
+    return results
+
+
+def _place_unnamed(placements, session, strategy, chunk_size):
+    """Pipeline the spawns of rows whose objects are named by the server, then their transforms"""
+    pipeline = command_pipeline.CommandPipeline(session, max_in_flight=chunk_size)
+    spawns = [(placement, pipeline.add(strategy.command(placement['blueprint'], placement['name'],
+                                                        placement['location']), placement['name'], 'spawn'))
+              for placement in placements]
+    pipeline.flush()
+
+    if strategy.name_source is None:
+        skipped = sum(1 for placement, _ in spawns
+                      if placement['rotation'] is not None or placement['scale'] is not None)
+        if skipped:
+            print(f"Warning: spawn strategy '{strategy.key}' cannot address the objects it spawns; "
+                  f"the rotation and scale of {skipped} rows were not applied")
+        return [_row_result(placement, spawn.ok, spawn.error) for placement, spawn in spawns]
+
+    rows = []
+    for placement, spawn in spawns:
+        name = strategy.object_name(placement['name'], spawn.response) if spawn.ok else None
+        commands = build_transform_commands(placement, name, strategy) if name else []
+        rows.append((placement, spawn, name, [pipeline.add(command, name) for command in commands]))
+    pipeline.flush()
+
+    results = []
+    for placement, spawn, name, row_results in rows:
+        failed = command_pipeline.errors([spawn] + row_results)
+        results.append(_row_result(placement, not failed, failed[0].error if failed else '', name))
+    return results
+
+
+def print_results(results, elapsed):
+    """
+    Print a per-row result table followed by the overall throughput.
+
+    Args:
+        results (list): Results returned by place_batch
+        elapsed (float): Wall-clock seconds spent placing
+    """
+    print(f"\n{'#':>5}  {'Name':<32} {'Location':<28} Result")
+    print("-" * 80)
+    for index, result in enumerate(results):
+        location = ','.join(f"{v:g}" for v in result['location'])
+        status = 'OK' if result['ok'] else f"FAILED: {result['error']}"
+        print(f"{index:>5}  {result['name']:<32} {location:<28} {status}")
+
+    succeeded = sum(1 for r in results if r['ok'])
+    rate = len(results) / elapsed if elapsed > 0 else float('inf')
+    print("-" * 80)
+    print(f"Placed {succeeded}/{len(results)} objects in {elapsed:.3f}s ({rate:.1f} objects/sec)")
+
+
+def run_batch_placement(manifest_path, chunk_size=DEFAULT_CHUNK_SIZE, scene_path=None):
+    """
+    Load a manifest, place every row in the running game and print the results.
+
+    Args:
+        manifest_path (str): Path to a JSONL or CSV manifest
+        chunk_size (int): Maximum number of commands in flight per batch
+        scene_path (str): Scene index file; rows without a location avoid the
+            objects in it, and every placed row is added to it
+
+    Returns:
+        bool: True if every row was placed successfully
+    """
+    try:
+        placements = load_manifest(manifest_path)
+        missing = sum(1 for p in placements if p['location'] is None)
+        placements = assign_locations(placements, placement_index.PlacementIndex.load(scene_path))
+    except (OSError, ValueError) as e:
+        print(f"Error reading manifest: {e}")
+        return False
+
+    if not placements:
+        print(f"Manifest {manifest_path} contains no placements")
+        return False
+    print(f"Loaded {len(placements)} placements from {manifest_path}"
+          + (f" ({missing} auto-placed)" if missing else ""))
+    cost = asset_index.scene_cost([p['blueprint'] for p in placements])
+    if cost['indexed']:
+        print(f"Scene cost of the {cost['indexed']} rows with indexed assets: {cost['triangles']} triangles, "
+              f"{cost['texture_bytes'] / 1024 ** 2:.1f} MB of textures")
+
+    print("Attempting to connect to UnrealCV...")
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return False
+
+    try:
+        start = time.perf_counter()
+        results = place_batch(placements, session, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+    except ConnectionError as e:
+        print(f"Batch placement aborted: {e}")
+        return False
+    finally:
+        pool.release(session)
+
+    print_results(results, elapsed)
+    if scene_path:
+        record_placements(placements, results, scene_path)
+    return all(r['ok'] for r in results)
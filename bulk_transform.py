@@ -0,0 +1,314 @@
+"""
+Bulk Transform Updates
+======================
+
+Moves many objects per frame from NumPy arrays. Every update is diffed against
+the transforms last sent for each object, and only the fields that changed by
+more than a tolerance are sent, pipelined through one CommandPipeline flush:
+
+    mover = BulkTransformer(session, names)
+    stats = mover.update(locations=positions)        # (N, 3) array, one row per name
+    stats = mover.update(locations=positions, rotations=rotations, scales=scales)
+
+run() calls a frame function at a fixed target rate (e.g. 30 Hz). When a frame
+takes longer than its time slot, the frames whose slot has already passed are
+dropped instead of queued, so the objects catch up with the latest state rather
+than lagging further and further behind. The achieved rate and the number of
+dropped frames are reported at the end.
+
+Commands that fail are not remembered as sent, so the next update retries them.
+
+Running this module directly spawns a grid of objects and sends a wave across
+it, which only moves the objects under the wave:
+python bulk_transform.py --blueprint_path /Game/Meshes/MeshBP --count 400 --rate 30 --duration 10
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+import command_pipeline
+import unrealcv_session
+
+FIELDS = ('location', 'rotation', 'scale')
+
+# Smallest change that is sent: centimetres, degrees, scale factor
+DEFAULT_TOLERANCE = {'location': 0.01, 'rotation': 0.01, 'scale': 0.0001}
+
+
+class BulkTransformer:
+    """
+    Sends the minimal set of transform commands for a fixed list of objects.
+
+    Args:
+        session: A connected UnrealCVSession
+        names (list): Object names; row i of every array belongs to names[i]
+        tolerance (dict): Per-field change below which an object is skipped
+            (default: DEFAULT_TOLERANCE)
+        max_in_flight (int): Pipelining window per flush
+    """
+
+    def __init__(self, session, names, tolerance=None,
+                 max_in_flight=command_pipeline.DEFAULT_MAX_IN_FLIGHT):
+        self.session = session
+        self.names = list(names)
+        self.tolerance = dict(DEFAULT_TOLERANCE, **(tolerance or {}))
+        self.max_in_flight = max_in_flight
+        # Last transform sent and acknowledged per object; NaN means unknown
+        self.sent = {field: np.full((len(self.names), 3), np.nan) for field in FIELDS}
+
+    def __len__(self):
+        return len(self.names)
+
+    def reset(self, field=None):
+        """
+        Forget what was sent, so that the next update sends every object again.
+
+        Args:
+            field (str): Only forget this field (default: all)
+        """
+        for name in FIELDS if field is None else (field,):
+            self.sent[name].fill(np.nan)
+
+    def diff(self, field, values):
+        """
+        Args:
+            field (str): 'location', 'rotation' or 'scale'
+            values (np.ndarray): (N, 3) array of new values
+
+        Returns:
+            np.ndarray: Indices of the objects whose value changed beyond the tolerance
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != (len(self.names), 3):
+            raise ValueError(f"{field} must have shape ({len(self.names)}, 3), got {values.shape}")
+        previous = self.sent[field]
+        # NaN in previous (never sent) compares as not-close, so those rows are sent
+        changed = ~(np.abs(values - previous) <= self.tolerance[field]).all(axis=1)
+        return np.flatnonzero(changed)
+
+    def update(self, locations=None, rotations=None, scales=None):
+        """
+        Send the transforms that changed since the last update.
+
+        Args:
+            locations (np.ndarray): (N, 3) X, Y, Z per object, or None to leave unchanged
+            rotations (np.ndarray): (N, 3) Pitch, Yaw, Roll per object, or None
+            scales (np.ndarray): (N, 3) X, Y, Z scale per object, or None
+
+        Returns:
+            dict: commands sent, objects moved, skipped (unchanged objects), errors and seconds
+
+        Raises:
+            ConnectionError: If the connection dropped; nothing from the failed
+                flush is remembered as sent
+        """
+        start = time.perf_counter()
+        pipeline = command_pipeline.CommandPipeline(self.session, max_in_flight=self.max_in_flight)
+        setters = {'location': pipeline.set_location, 'rotation': pipeline.set_rotation,
+                   'scale': pipeline.set_scale}
+        pending = []
+        moved = set()
+        for field, values in zip(FIELDS, (locations, rotations, scales)):
+            if values is None:
+                continue
+            values = np.asarray(values, dtype=np.float64)
+            indices = self.diff(field, values)
+            rows = values[indices].tolist()
+            for index, row in zip(indices.tolist(), rows):
+                pending.append((setters[field](self.names[index], row), field, index, row))
+            moved.update(indices.tolist())
+
+        errors = 0
+        if pending:
+            pipeline.flush()
+            for result, field, index, row in pending:
+                if result.ok:
+                    self.sent[field][index] = row
+                else:
+                    self.sent[field][index] = np.nan
+                    errors += 1
+        return {'commands': len(pending), 'moved': len(moved), 'skipped': len(self.names) - len(moved),
+                'errors': errors, 'seconds': time.perf_counter() - start}
+
+    def run(self, frame, rate=30.0, duration=None, frames=None, verbose=True):
+        """
+        Call frame() at a fixed rate and send its transforms.
+
+        A frame whose time slot has passed before it could start is dropped:
+        frame() is not called for it, and the next frame sends the latest state.
+
+        Args:
+            frame (callable): frame(index, seconds) -> dict with any of the
+                locations, rotations and scales arrays, or None to send nothing
+            rate (float): Target updates per second
+            duration (float): Stop after this many seconds
+            frames (int): Stop after this many frame slots (sent or dropped)
+            verbose (bool): Print the report at the end
+
+        Returns:
+            dict: Rate statistics (see print_report)
+        """
+        if duration is None and frames is None:
+            raise ValueError("run() needs a duration or a frame count")
+        period = 1.0 / rate
+        stats = {'target_rate': rate, 'frames': 0, 'dropped': 0, 'commands': 0, 'skipped': 0,
+                 'errors': 0, 'late': 0, 'update_seconds': []}
+        start = time.perf_counter()
+        slot = 0
+        try:
+            while True:
+                now = time.perf_counter() - start
+                if duration is not None and now >= duration:
+                    break
+                if frames is not None and slot >= frames:
+                    break
+                deadline = slot * period
+                if now < deadline:
+                    time.sleep(deadline - now)
+                    now = time.perf_counter() - start
+                # Skip the slots that are already over
+                behind = int((now - deadline) // period)
+                if behind:
+                    if frames is not None:
+                        behind = min(behind, frames - slot)
+                    stats['dropped'] += behind
+                    slot += behind
+                    if frames is not None and slot >= frames:
+                        break
+
+                transforms = frame(slot, slot * period) or {}
+                result = self.update(**transforms)
+                stats['frames'] += 1
+                stats['commands'] += result['commands']
+                stats['skipped'] += result['skipped']
+                stats['errors'] += result['errors']
+                stats['update_seconds'].append(result['seconds'])
+                if result['seconds'] > period:
+                    stats['late'] += 1
+                slot += 1
+        except KeyboardInterrupt:
+            print("\nStopped")
+        stats['seconds'] = time.perf_counter() - start
+        stats['achieved_rate'] = stats['frames'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+        if verbose:
+            print_report(stats, len(self.names))
+        return stats
+
+
+def print_report(stats, count):
+    """
+    Print the rate statistics of BulkTransformer.run.
+
+    Args:
+        stats (dict): Statistics returned by run()
+        count (int): Number of objects driven
+    """
+    frames = stats['frames']
+    seconds = sorted(stats['update_seconds'])
+    print(f"\nDrove {count} objects for {stats['seconds']:.2f}s")
+    print(f"  Rate:     {stats['achieved_rate']:.1f} Hz achieved of {stats['target_rate']:g} Hz target")
+    print(f"  Frames:   {frames} sent, {stats['dropped']} dropped, {stats['late']} took longer than their slot")
+    if frames:
+        print(f"  Commands: {stats['commands']} sent ({stats['commands'] / frames:.1f} per frame), "
+              f"{stats['skipped'] / frames:.1f} unchanged objects skipped per frame")
+        print(f"  Update:   {seconds[len(seconds) // 2] * 1000:.2f} ms median, "
+              f"{seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))] * 1000:.2f} ms p95")
+    if stats['errors']:
+        print(f"  Warning: {stats['errors']} commands returned errors and will be retried")
+
+
+def grid_locations(count, spacing=200.0, height=100.0):
+    """
+    Args:
+        count (int): Number of objects
+        spacing (float): Distance between neighbours in centimetres
+        height (float): Z of the grid
+
+    Returns:
+        np.ndarray: (count, 3) locations on a square grid centred on the origin
+    """
+    side = max(1, math.ceil(math.sqrt(count)))
+    index = np.arange(count)
+    offset = (side - 1) * spacing / 2.0
+    return np.stack([(index % side) * spacing - offset, (index // side) * spacing - offset,
+                     np.full(count, height)], axis=1)
+
+
+def wave(base, amplitude=150.0, width=400.0, speed=600.0):
+    """
+    Frame function that sends a bump travelling along X across the base locations.
+    Objects away from the bump keep their position and are skipped by the diff.
+
+    Args:
+        base (np.ndarray): (N, 3) resting locations
+        amplitude (float): Height of the bump in centimetres
+        width (float): Width of the bump in centimetres
+        speed (float): Centimetres per second
+
+    Returns:
+        callable: frame(index, seconds) for BulkTransformer.run
+    """
+    span = base[:, 0].max() - base[:, 0].min() + 2 * width
+
+    def frame(index, seconds):
+        front = base[:, 0].min() - width + (seconds * speed) % span
+        distance = np.abs(base[:, 0] - front)
+        lift = np.where(distance < width, amplitude * 0.5 * (1 + np.cos(np.pi * distance / width)), 0.0)
+        locations = base.copy()
+        locations[:, 2] += np.round(lift, 1)
+        return {'locations': locations}
+
+    return frame
+
+
+def main():
+    """
+    Spawn a grid of objects and drive a wave across it at a target rate.
+    """
+    parser = argparse.ArgumentParser(description='Move many UnrealCV objects per frame from NumPy arrays')
+    parser.add_argument('--blueprint_path', type=str, required=True,
+                        help='Blueprint to spawn (e.g., /Game/Meshes/MeshBP)')
+    parser.add_argument('--count', type=int, default=400, help='Number of objects to drive')
+    parser.add_argument('--rate', type=float, default=30.0, help='Target updates per second')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run')
+    parser.add_argument('--spacing', type=float, default=200.0, help='Grid spacing in centimetres')
+    parser.add_argument('--prefix', type=str, default=None, help='Object name prefix (default: BulkObject_<time>)')
+    args = parser.parse_args()
+
+    import batch_placement
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return
+
+    try:
+        prefix = args.prefix or f"BulkObject_{int(time.time())}"
+        base = grid_locations(args.count, args.spacing)
+        placements = [{'blueprint': args.blueprint_path, 'name': f"{prefix}_{i}", 'location': tuple(row),
+                       'rotation': None, 'scale': None} for i, row in enumerate(base.tolist())]
+        print(f"Spawning {args.count} objects...")
+        results = batch_placement.place_batch(placements, session)
+        names = [r['name'] for r in results if r['ok']]
+        if len(names) < len(placements):
+            print(f"Warning: {len(placements) - len(names)} objects failed to spawn and are not driven")
+        if not names:
+            return
+        keep = np.array([r['ok'] for r in results])
+
+        mover = BulkTransformer(session, names)
+        mover.update(locations=base[keep])
+        print(f"Driving a wave across {len(names)} objects at {args.rate:g} Hz for {args.duration:g}s "
+              f"(Ctrl+C to stop)")
+        mover.run(wave(base[keep]), rate=args.rate, duration=args.duration)
+    except ConnectionError as e:
+        print(f"UnrealCV request failed: {e}")
+    finally:
+        pool.release(session)
+
+
+if __name__ == "__main__":
+    main()
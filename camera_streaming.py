@@ -0,0 +1,541 @@
+"""
+Camera Streaming
+================
+
+Keeps only the placed objects near the camera spawned in a running UE5 game.
+A manifest of thousands of placements is loaded once; the controller then
+polls `vget /camera/0/location` at a fixed rate and
+
+- spawns the objects that come within the spawn radius of the camera, nearest
+  first, and
+- despawns (or hides) the objects that move beyond the larger despawn radius.
+
+The gap between the two radii is the hysteresis band: an object is neither
+spawned nor removed there, so a camera moving back and forth across one radius
+does not spawn and destroy the same objects every tick. Distances are measured
+horizontally (X and Y).
+
+The live actor count never exceeds max_live. Objects inside the spawn radius
+that do not fit wait, nearest first, until slots free up; at most
+max_spawns_per_tick are spawned per tick so that a fast camera does not stall
+a tick on one huge batch.
+
+Placements are kept in a uniform grid (placement_index.SpatialGrid). An object
+can only cross a radius if its distance lies within the distance the camera
+moved of that radius, so a tick only visits the grid cells overlapping those
+two rings. Its cost grows with the number of objects near the radii, not with
+the size of the manifest; a camera that did not move costs nothing. All spawn,
+transform, hide and destroy commands of a tick go out in one pipelined flush.
+
+In hide mode objects leaving the despawn radius are hidden
+(`vset /object/<name>/hide`) and shown again when they come back, which is
+cheaper than spawning them. Hidden actors still exist, so at most max_hidden of
+them are kept; beyond that the ones hidden longest ago are destroyed.
+Respawned objects get a numbered name (Chair_01_1, Chair_01_2, ...) because the
+engine can keep the name of a destroyed actor until its next garbage collection.
+
+Example usage:
+python camera_streaming.py --manifest placements.jsonl --spawn_radius 5000 --rate 10
+python camera_streaming.py --manifest placements.jsonl --mode hide --max_live 300 --duration 60
+python camera_streaming.py --benchmark 100000
+"""
+import argparse
+import collections
+import heapq
+import math
+import random
+import time
+
+import batch_placement
+import command_pipeline
+import placement_index
+import scene_mirror
+import spawn_strategy
+import unrealcv_session
+
+DEFAULT_SPAWN_RADIUS = 5000.0
+# Despawn radius as a multiple of the spawn radius
+DEFAULT_HYSTERESIS = 1.25
+DEFAULT_RATE = 10.0
+DEFAULT_MAX_LIVE = 500
+DEFAULT_MAX_SPAWNS_PER_TICK = 100
+# Camera moves shorter than this (cm) are not acted on until they add up
+DEFAULT_MIN_MOVE = 1.0
+MODES = ('destroy', 'hide')
+
+
+class StreamingController:
+    """
+    Spawns and removes placements as the camera moves.
+
+    Args:
+        session: A connected UnrealCVSession
+        placements (list): Placement dictionaries with a location (see
+            batch_placement.load_manifest and assign_locations)
+        spawn_radius (float): Objects closer than this to the camera are spawned
+        despawn_radius (float): Objects farther than this are removed
+            (default: DEFAULT_HYSTERESIS x spawn_radius)
+        mode (str): 'destroy' or 'hide'
+        max_live (int): Most objects spawned and visible at once
+        max_spawns_per_tick (int): Most objects spawned or shown per tick
+        max_hidden (int): Most hidden actors kept in hide mode (default: max_live)
+        camera_id (str): UnrealCV camera to follow
+        cell_size (float): Grid cell size (default: a quarter of the spawn radius)
+        min_move (float): Camera moves shorter than this are ignored until they add up
+        name_prefix (str): Prefix for the names of rows without one
+        cache (SpawnStrategyCache): Spawn strategy cache (default: the shared on-disk cache)
+        max_in_flight (int): Pipelining window per flush
+    """
+
+    def __init__(self, session, placements, spawn_radius=DEFAULT_SPAWN_RADIUS, despawn_radius=None,
+                 mode='destroy', max_live=DEFAULT_MAX_LIVE, max_spawns_per_tick=DEFAULT_MAX_SPAWNS_PER_TICK,
+                 max_hidden=None, camera_id='0', cell_size=None, min_move=DEFAULT_MIN_MOVE, name_prefix=None,
+                 cache=None, max_in_flight=command_pipeline.DEFAULT_MAX_IN_FLIGHT):
+        despawn_radius = DEFAULT_HYSTERESIS * spawn_radius if despawn_radius is None else despawn_radius
+        if spawn_radius <= 0 or despawn_radius < spawn_radius:
+            raise ValueError(f"Need 0 < spawn radius <= despawn radius, got {spawn_radius:g} and {despawn_radius:g}")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+        self.session = session
+        self.spawn_radius = float(spawn_radius)
+        self.despawn_radius = float(despawn_radius)
+        self.mode = mode
+        self.max_live = max_live
+        self.max_spawns_per_tick = max_spawns_per_tick
+        self.max_hidden = max_live if max_hidden is None else max_hidden
+        self.camera_id = camera_id
+        self.min_move = min_move
+        self.cache = cache
+        self.max_in_flight = max_in_flight
+
+        name_prefix = name_prefix or f"Streamed_{int(time.time())}"
+        self.placements = []
+        self.xy = []
+        self.grid = placement_index.SpatialGrid(cell_size or self.spawn_radius / 4.0)
+        for index, placement in enumerate(placements):
+            if placement.get('location') is None:
+                raise ValueError(f"Placement {index} has no location")
+            placement = dict(placement)
+            placement['name'] = placement.get('name') or f"{name_prefix}_{index:05d}"
+            x, y = float(placement['location'][0]), float(placement['location'][1])
+            self.placements.append(placement)
+            self.xy.append((x, y))
+            self.grid.insert(index, (x, y, 0.0), (x, y, 0.0))
+
+        self.live = {}
+        self.hidden = collections.OrderedDict()
+        self.pending = set()
+        self.failed = set()
+        self.recheck = set()
+        self.camera = None
+        self.strategy = None
+        self._spawn_counts = collections.Counter()
+
+    def __len__(self):
+        return len(self.live)
+
+    def _distance(self, index, camera):
+        x, y = self.xy[index]
+        return math.hypot(x - camera[0], y - camera[1])
+
+    def ring(self, camera, inner, outer):
+        """
+        Find the placements whose horizontal distance to the camera lies in a ring.
+
+        Only the grid cells overlapping the ring are visited.
+
+        Args:
+            camera (tuple): Camera location
+            inner (float): Smallest distance (inclusive)
+            outer (float): Largest distance (inclusive)
+
+        Returns:
+            tuple: (indices in the ring, number of placements examined)
+        """
+        size = self.grid.cell_size
+        cells = self.grid.cells
+        cx, cy = camera[0], camera[1]
+        found = []
+        examined = 0
+        for x in range(int(math.floor((cx - outer) / size)), int(math.floor((cx + outer) / size)) + 1):
+            low_x, high_x = x * size, (x + 1) * size
+            near_x = max(low_x - cx, 0.0, cx - high_x)
+            far_x = max(abs(cx - low_x), abs(cx - high_x))
+            for y in range(int(math.floor((cy - outer) / size)), int(math.floor((cy + outer) / size)) + 1):
+                keys = cells.get((x, y))
+                if not keys:
+                    continue
+                low_y, high_y = y * size, (y + 1) * size
+                near_y = max(low_y - cy, 0.0, cy - high_y)
+                far_y = max(abs(cy - low_y), abs(cy - high_y))
+                if math.hypot(near_x, near_y) > outer or math.hypot(far_x, far_y) < inner:
+                    continue
+                examined += len(keys)
+                for index in keys:
+                    if inner <= self._distance(index, camera) <= outer:
+                        found.append(index)
+        return found, examined
+
+    def poll_camera(self):
+        """
+        Returns:
+            tuple: The camera location, or None if the query failed
+        """
+        return scene_mirror.parse_vector(self.session.request(f"vget /camera/{self.camera_id}/location"))
+
+    def _actor_name(self, index):
+        count = self._spawn_counts[index]
+        self._spawn_counts[index] += 1
+        name = self.placements[index]['name']
+        return name if count == 0 else f"{name}_{count}"
+
+    def _spawn_first(self, index):
+        """Spawn one object through spawn_and_place to find a working spawn strategy"""
+        placement = self.placements[index]
+        result = spawn_strategy.spawn_and_place(self.session, placement['blueprint'], self._actor_name(index),
+                                                placement['location'], placement['rotation'],
+                                                placement['scale'], cache=self.cache)
+        if not result.ok:
+            self.failed.add(index)
+            return False
+        if result.strategy.name_source is None:
+            cache = self.cache or spawn_strategy.get_default_cache()
+            if cache.get(spawn_strategy.get_server_version(self.session)) is not result.strategy:
+                # Only this asset failed the addressable syntaxes; the others may still spawn
+                self.failed.add(index)
+                return False
+            raise ValueError(f"Spawn strategy '{result.strategy.key}' cannot address the objects it spawns, "
+                             f"so they could not be removed again")
+        self.strategy = result.strategy
+        self.live[index] = result.object_name
+        return True
+
+    def tick(self, camera=None):
+        """
+        Bring the spawned objects up to date with one camera position.
+
+        Args:
+            camera (tuple): Camera location (default: poll the game)
+
+        Returns:
+            dict: examined, spawned, shown, hidden, destroyed, errors, live,
+                actors, pending and seconds of this tick
+        """
+        start = time.perf_counter()
+        stats = {'examined': 0, 'spawned': 0, 'shown': 0, 'hidden': 0, 'destroyed': 0, 'errors': 0}
+        if camera is None:
+            camera = self.poll_camera()
+            if camera is None:
+                stats['errors'] += 1
+                return self._finish_stats(stats, start)
+
+        moved = math.inf if self.camera is None else math.hypot(camera[0] - self.camera[0],
+                                                                camera[1] - self.camera[1])
+        if moved < self.min_move and not self.pending and not self.recheck:
+            return self._finish_stats(stats, start)
+
+        # Live objects were all within the despawn radius at the last tick, so
+        # only those within `moved` outside it can have left
+        if moved >= self.despawn_radius:
+            candidates = list(self.live)
+        else:
+            candidates, examined = self.ring(camera, self.despawn_radius, self.despawn_radius + moved)
+            stats['examined'] += examined
+        candidates.extend(self.recheck)
+        self.recheck = set()
+        leaving = [i for i in set(candidates) if i in self.live and self._distance(i, camera) > self.despawn_radius]
+
+        # Objects that came within the spawn radius, plus the ones still waiting
+        entering, examined = self.ring(camera, max(0.0, self.spawn_radius - moved), self.spawn_radius)
+        stats['examined'] += examined + len(self.pending)
+        self.pending = {i for i in self.pending if self._distance(i, camera) <= self.spawn_radius}
+        self.pending.update(i for i in entering if i not in self.live and i not in self.failed)
+
+        pipeline = command_pipeline.CommandPipeline(self.session, max_in_flight=self.max_in_flight)
+        removals = []
+        for index in leaving:
+            name = self.live.pop(index)
+            if self.mode == 'hide':
+                self.hidden[index] = name
+                removals.append((index, name, 'hide', pipeline.add(f"vset /object/{name}/hide", name, 'hide')))
+            else:
+                removals.append((index, name, 'destroy', pipeline.add(f"vset /object/{name}/destroy", name, 'destroy')))
+        while len(self.hidden) > self.max_hidden:
+            index, name = self.hidden.popitem(last=False)
+            removals.append((index, name, 'destroy', pipeline.add(f"vset /object/{name}/destroy", name, 'destroy')))
+
+        slots = min(self.max_spawns_per_tick, self.max_live - len(self.live))
+        chosen = heapq.nsmallest(slots, self.pending, key=lambda i: self._distance(i, camera)) if slots > 0 else []
+        self.pending.difference_update(chosen)
+        while chosen and self.strategy is None:
+            # Without a strategy the others cannot be pipelined; spawn one by one until one works
+            index = chosen.pop(0)
+            stats['spawned' if self._spawn_first(index) else 'errors'] += 1
+
+        additions = []
+        for index in chosen:
+            name = self.hidden.pop(index, None)
+            if name is not None:
+                additions.append((index, name, [pipeline.add(f"vset /object/{name}/show", name, 'show')]))
+            elif self.strategy.name_source == 'given':
+                placement = dict(self.placements[index], name=self._actor_name(index))
+                results = [pipeline.add(command, placement['name'])
+                           for command in batch_placement.build_placement_commands(placement, self.strategy)]
+                additions.append((index, placement['name'], results))
+            else:
+                # The server names the objects, so each one needs its own round trip
+                stats['spawned' if self._spawn_first(index) else 'errors'] += 1
+
+        pipeline.flush()
+
+        for index, name, op, result in removals:
+            if result.ok:
+                stats['hidden' if op == 'hide' else 'destroyed'] += 1
+                continue
+            stats['errors'] += 1
+            if op == 'hide':
+                # Still visible: count it as live and look at it again next tick
+                self.hidden.pop(index, None)
+                self.live[index] = name
+                self.recheck.add(index)
+        for index, name, results in additions:
+            if results[0].ok:
+                self.live[index] = name
+                stats['shown' if results[0].op == 'show' else 'spawned'] += 1
+            elif results[0].op == 'show':
+                # The hidden actor is gone; spawn it again next tick
+                self.pending.add(index)
+            else:
+                self.failed.add(index)
+            stats['errors'] += len(command_pipeline.errors(results))
+
+        self.camera = tuple(camera)
+        return self._finish_stats(stats, start)
+
+    def _finish_stats(self, stats, start):
+        stats['live'] = len(self.live)
+        stats['actors'] = len(self.live) + len(self.hidden)
+        stats['pending'] = len(self.pending)
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    def clear(self):
+        """
+        Destroy every actor the controller spawned, visible or hidden.
+
+        Returns:
+            int: Number of actors destroyed
+        """
+        pipeline = command_pipeline.CommandPipeline(self.session, max_in_flight=self.max_in_flight)
+        names = list(self.live.values()) + list(self.hidden.values())
+        results = [pipeline.add(f"vset /object/{name}/destroy", name, 'destroy') for name in names]
+        pipeline.flush()
+        for index in list(self.live) + list(self.hidden):
+            self.pending.discard(index)
+        self.live.clear()
+        self.hidden.clear()
+        self.camera = None
+        return sum(1 for r in results if r.ok)
+
+    def run(self, rate=DEFAULT_RATE, duration=None, ticks=None, verbose=True):
+        """
+        Poll the camera and tick at a fixed rate.
+
+        A tick whose time slot has passed before it could start is dropped;
+        the next tick uses the latest camera position anyway.
+
+        Args:
+            rate (float): Camera polls per second
+            duration (float): Stop after this many seconds (default: until Ctrl+C)
+            ticks (int): Stop after this many tick slots (run or dropped)
+            verbose (bool): Print the report at the end
+
+        Returns:
+            dict: Totals (see print_report)
+        """
+        period = 1.0 / rate
+        totals = {'target_rate': rate, 'ticks': 0, 'dropped': 0, 'examined': 0, 'spawned': 0, 'shown': 0,
+                  'hidden': 0, 'destroyed': 0, 'errors': 0, 'peak_live': 0, 'peak_actors': 0, 'tick_seconds': []}
+        start = time.perf_counter()
+        slot = 0
+        try:
+            while duration is None or time.perf_counter() - start < duration:
+                if ticks is not None and slot >= ticks:
+                    break
+                now = time.perf_counter() - start
+                deadline = slot * period
+                if now < deadline:
+                    time.sleep(deadline - now)
+                    now = time.perf_counter() - start
+                behind = int((now - deadline) // period)
+                if behind:
+                    totals['dropped'] += behind
+                    slot += behind
+                    continue
+
+                stats = self.tick()
+                totals['ticks'] += 1
+                for key in ('examined', 'spawned', 'shown', 'hidden', 'destroyed', 'errors'):
+                    totals[key] += stats[key]
+                totals['peak_live'] = max(totals['peak_live'], stats['live'])
+                totals['peak_actors'] = max(totals['peak_actors'], stats['actors'])
+                totals['tick_seconds'].append(stats['seconds'])
+                slot += 1
+        except KeyboardInterrupt:
+            print("\nStopped")
+        totals['seconds'] = time.perf_counter() - start
+        totals['achieved_rate'] = totals['ticks'] / totals['seconds'] if totals['seconds'] > 0 else 0.0
+        if verbose:
+            print_report(totals, len(self.placements))
+        return totals
+
+
+def print_report(totals, count):
+    """
+    Print the totals of StreamingController.run.
+
+    Args:
+        totals (dict): Totals returned by run()
+        count (int): Number of placements streamed
+    """
+    ticks = totals['ticks']
+    seconds = sorted(totals['tick_seconds'])
+    print(f"\nStreamed {count} placements for {totals['seconds']:.2f}s")
+    print(f"  Rate:     {totals['achieved_rate']:.1f} Hz achieved of {totals['target_rate']:g} Hz target, "
+          f"{totals['dropped']} ticks dropped")
+    print(f"  Actors:   {totals['peak_live']} live at most, {totals['peak_actors']} including hidden")
+    print(f"  Changes:  {totals['spawned']} spawned, {totals['shown']} shown, {totals['hidden']} hidden, "
+          f"{totals['destroyed']} destroyed")
+    if ticks:
+        print(f"  Tick:     {seconds[len(seconds) // 2] * 1000:.2f} ms median, "
+              f"{seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))] * 1000:.2f} ms p95, "
+              f"{totals['examined'] / ticks:.1f} placements examined per tick")
+    if totals['errors']:
+        print(f"  Warning: {totals['errors']} commands or camera polls returned errors")
+
+
+def benchmark(count=100000, spacing=500.0, spawn_radius=DEFAULT_SPAWN_RADIUS, speed=500.0, ticks=200, seed=0):
+    """
+    Stream a scattered scene past a moving camera on a mock UnrealCV server.
+
+    The density is kept fixed (one object per spacing x spacing square), so the
+    number of objects near the camera does not depend on count; neither should
+    the tick time. The camera circles the middle of the scene, at least one
+    spawn radius away from its edges.
+
+    Args:
+        count (int): Placements in the scene
+        spacing (float): Average distance between objects in centimetres
+        spawn_radius (float): Spawn radius; the despawn radius is DEFAULT_HYSTERESIS times it
+        speed (float): Camera movement per tick in centimetres
+        ticks (int): Ticks to run
+        seed (int): Random seed
+
+    Returns:
+        dict: Median tick seconds, placements examined per tick and peak live count
+    """
+    import mock_unrealcv_server
+
+    rng = random.Random(seed)
+    side = spacing * math.sqrt(count)
+    placements = [{'blueprint': '/Game/Meshes/MeshBP', 'name': f"Bench_{i}",
+                   'location': (rng.uniform(-side / 2, side / 2), rng.uniform(-side / 2, side / 2), 0.0),
+                   'rotation': None, 'scale': None} for i in range(count)]
+    server = mock_unrealcv_server.MockUnrealCVServer(port=0).start()
+    session = unrealcv_session.UnrealCVSession(endpoint=server.endpoint, verbose=False)
+    try:
+        session.connect()
+        start = time.perf_counter()
+        controller = StreamingController(session, placements, spawn_radius, max_live=count,
+                                         max_spawns_per_tick=count)
+        build_seconds = time.perf_counter() - start
+        circle = max(side / 2 - 2 * spawn_radius, speed)
+        controller.tick((circle, 0.0, 200.0))
+        seconds = []
+        examined = 0
+        for step in range(1, ticks + 1):
+            angle = step * speed / circle
+            stats = controller.tick((circle * math.cos(angle), circle * math.sin(angle), 200.0))
+            seconds.append(stats['seconds'])
+            examined += stats['examined']
+        mock_objects = len(server.scene.objects)
+    finally:
+        session.disconnect()
+        server.stop()
+
+    seconds.sort()
+    median = seconds[len(seconds) // 2]
+    print(f"{count} placements: index built in {build_seconds:.2f}s; tick {median * 1000:.2f} ms median, "
+          f"{examined / ticks:.0f} examined per tick, {mock_objects} objects spawned at the end")
+    return {'tick': median, 'examined': examined / ticks, 'live': mock_objects}
+
+
+def main():
+    """
+    Stream the placements of a manifest around the camera of a running game.
+    """
+    parser = argparse.ArgumentParser(description='Spawn the placements near the UE5 camera and remove the far ones')
+    parser.add_argument('--manifest', type=str, help='JSONL or CSV placement manifest (see batch_placement.py)')
+    parser.add_argument('--spawn_radius', type=float, default=DEFAULT_SPAWN_RADIUS,
+                        help=f'Spawn objects within this many cm of the camera (default: {DEFAULT_SPAWN_RADIUS:g})')
+    parser.add_argument('--despawn_radius', type=float,
+                        help=f'Remove objects beyond this many cm (default: {DEFAULT_HYSTERESIS:g} x spawn radius)')
+    parser.add_argument('--mode', choices=MODES, default='destroy',
+                        help='Destroy objects that leave the despawn radius, or hide them (default: destroy)')
+    parser.add_argument('--max_live', type=int, default=DEFAULT_MAX_LIVE,
+                        help=f'Most objects spawned at once (default: {DEFAULT_MAX_LIVE})')
+    parser.add_argument('--max_spawns', type=int, default=DEFAULT_MAX_SPAWNS_PER_TICK,
+                        help=f'Most objects spawned per tick (default: {DEFAULT_MAX_SPAWNS_PER_TICK})')
+    parser.add_argument('--max_hidden', type=int, help='Most hidden actors kept in hide mode (default: --max_live)')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'Camera polls per second (default: {DEFAULT_RATE:g})')
+    parser.add_argument('--duration', type=float, help='Seconds to run (default: until Ctrl+C)')
+    parser.add_argument('--camera', type=str, default='0', help='UnrealCV camera id to follow (default: 0)')
+    parser.add_argument('--scene', type=str,
+                        help='Placement index file; manifest rows without a location avoid the objects in it')
+    parser.add_argument('--keep', action='store_true', help='Leave the streamed objects in the level on exit')
+    parser.add_argument('--benchmark', type=int, metavar='COUNT',
+                        help='Benchmark ticks on a mock server with COUNT and COUNT/10 placements')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        for count in (max(1, args.benchmark // 10), args.benchmark):
+            benchmark(count, spawn_radius=args.spawn_radius)
+        return
+    if not args.manifest:
+        parser.error("--manifest is required unless --benchmark is given")
+
+    try:
+        placements = batch_placement.load_manifest(args.manifest)
+        placements = batch_placement.assign_locations(placements, placement_index.PlacementIndex.load(args.scene))
+    except (OSError, ValueError) as e:
+        print(f"Error reading manifest: {e}")
+        return
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return
+
+    controller = None
+    try:
+        controller = StreamingController(session, placements, args.spawn_radius, args.despawn_radius, args.mode,
+                                         args.max_live, args.max_spawns, args.max_hidden, args.camera)
+        print(f"Streaming {len(placements)} placements within {controller.spawn_radius:g} cm of camera "
+              f"{args.camera} (removed beyond {controller.despawn_radius:g} cm, {args.mode} mode). "
+              f"Press Ctrl+C to stop.")
+        controller.run(args.rate, args.duration)
+    except ValueError as e:
+        print(f"Error: {e}")
+    except unrealcv_session.CONNECTION_ERRORS as e:
+        print(f"Lost the UnrealCV connection: {e}")
+        controller = None
+    finally:
+        if controller is not None and not args.keep:
+            print(f"Destroyed {controller.clear()} streamed objects")
+        pool.release(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+UnrealCV Command Pipeline
+=========================
+
+Queues UnrealCV commands for one or many objects and sends them without
+waiting for each reply. Placing an object normally takes four commands
+(spawn, location, rotation, scale); sent one by one that is four network round
+trips, pipelined it is roughly one.
+
+Responses come back in the order the commands were sent, so every queued
+command is matched with its response afterwards and per-command errors are
+reported on the result objects:
+
+    pipeline = CommandPipeline(session)
+    pipeline.spawn('/Game/Meshes/MeshBP.MeshBP_C', 'Chair_01')
+    pipeline.set_location('Chair_01', (0, 0, 100))
+    pipeline.set_rotation('Chair_01', (0, 90, 0))
+    for result in pipeline.flush():
+        if not result.ok:
+            print(result.command, result.response)
+
+Running this module directly benchmarks the serial path against the pipeline:
+python command_pipeline.py --blueprint_path /Game/Meshes/MeshBP --count 50
+"""
+import argparse
+import time
+
+import unrealcv_session
+
+DEFAULT_MAX_IN_FLIGHT = 256
+
+
+class CommandResult:
+    """
+    The outcome of one pipelined command.
+
+    Attributes:
+        command (str): The command that was sent
+        response (str): The server response, or None if it was never sent
+        obj (str): Name of the object the command targets, if any
+        op (str): Short label for the operation, e.g. 'spawn' or 'location'
+    """
+
+    __slots__ = ('command', 'response', 'obj', 'op')
+
+    def __init__(self, command, obj=None, op=None):
+        self.command = command
+        self.response = None
+        self.obj = obj
+        self.op = op
+
+    @property
+    def ok(self):
+        """True if the server answered without an error"""
+        return self.response is not None and not str(self.response).startswith('error')
+
+    @property
+    def error(self):
+        """The error message, or an empty string on success"""
+        if self.response is None:
+            return 'not sent'
+        return '' if self.ok else str(self.response)
+
+    def __repr__(self):
+        return f"CommandResult({self.command!r}, response={self.response!r})"
+
+
+class CommandPipeline:
+    """
+    Collects UnrealCV commands and sends them in pipelined batches.
+    """
+
+    def __init__(self, session, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """
+        Args:
+            session: A connected UnrealCVSession (or anything with request_batch)
+            max_in_flight (int): Maximum number of commands sent before reading replies
+        """
+        self.session = session
+        self.max_in_flight = max_in_flight
+        self._queued = []
+
+    def __len__(self):
+        return len(self._queued)
+
+    def add(self, command, obj=None, op=None):
+        """
+        Queue a raw UnrealCV command.
+
+        Args:
+            command (str): The command to send
+            obj (str): Object the command targets, used to group results
+            op (str): Short label for the operation
+
+        Returns:
+            CommandResult: The result slot that flush() fills in
+        """
+        result = CommandResult(command, obj, op)
+        self._queued.append(result)
+        return result
+
+    def spawn(self, class_path, name):
+        """Queue a spawn of class_path under the given object name"""
+        return self.add(f"vset /objects/spawn {class_path} {name}", name, 'spawn')
+
+    def set_location(self, name, location):
+        """Queue a location update from an (X, Y, Z) tuple"""
+        return self.add('vset /object/{}/location {} {} {}'.format(name, *location), name, 'location')
+
+    def set_rotation(self, name, rotation):
+        """Queue a rotation update from a (Pitch, Yaw, Roll) tuple"""
+        return self.add('vset /object/{}/rotation {} {} {}'.format(name, *rotation), name, 'rotation')
+
+    def set_scale(self, name, scale):
+        """Queue a scale update from an (X, Y, Z) tuple"""
+        return self.add('vset /object/{}/scale {} {} {}'.format(name, *scale), name, 'scale')
+
+    def flush(self):
+        """
+        Send every queued command and match the responses to their commands.
+
+        Commands are written in chunks of max_in_flight. The queue is emptied
+        before sending, so a failed flush is never replayed.
+
+        Returns:
+            list: The CommandResult of every command queued since the last flush
+
+        Raises:
+            ConnectionError: If the connection dropped. Results of the chunks that
+                did not complete keep response None.
+        """
+        queued, self._queued = self._queued, []
+        for start in range(0, len(queued), self.max_in_flight):
+            chunk = queued[start:start + self.max_in_flight]
+            responses = self.session.request_batch([r.command for r in chunk])
+            for result, response in zip(chunk, responses):
+                result.response = response
+        return queued
+
+
+def errors(results):
+    """
+    Args:
+        results (list): CommandResult objects returned by flush()
+
+    Returns:
+        list: The results that failed
+    """
+    return [r for r in results if not r.ok]
+
+
+def group_by_object(results):
+    """
+    Args:
+        results (list): CommandResult objects returned by flush()
+
+    Returns:
+        dict: Object name -> list of its CommandResult objects, in send order
+    """
+    grouped = {}
+    for result in results:
+        grouped.setdefault(result.obj, []).append(result)
+    return grouped
+
+
+def benchmark(session, class_path, count=50, location=(0, 0, 100), rotation=(0, 90, 0), scale=(1, 1, 1)):
+    """
+    Compare serial spawn + transform requests against the pipelined path.
+
+    Both paths spawn `count` objects and set their location, rotation and scale.
+
+    Args:
+        session: A connected UnrealCVSession
+        class_path (str): Blueprint class path to spawn, e.g. /Game/Meshes/MeshBP.MeshBP_C
+        count (int): Number of objects to place with each path
+
+    Returns:
+        dict: Seconds per placement for the serial and pipelined paths
+    """
+    prefix = f"PipelineBench_{int(time.time())}"
+
+    start = time.perf_counter()
+    for i in range(count):
+        name = f"{prefix}_serial_{i}"
+        session.request(f"vset /objects/spawn {class_path} {name}")
+        session.request('vset /object/{}/location {} {} {}'.format(name, *location))
+        session.request('vset /object/{}/rotation {} {} {}'.format(name, *rotation))
+        session.request('vset /object/{}/scale {} {} {}'.format(name, *scale))
+    serial = (time.perf_counter() - start) / count
+
+    pipeline = CommandPipeline(session)
+    start = time.perf_counter()
+    for i in range(count):
+        name = f"{prefix}_pipelined_{i}"
+        pipeline.spawn(class_path, name)
+        pipeline.set_location(name, location)
+        pipeline.set_rotation(name, rotation)
+        pipeline.set_scale(name, scale)
+    failed = errors(pipeline.flush())
+    pipelined = (time.perf_counter() - start) / count
+
+    return {'serial': serial, 'pipelined': pipelined, 'errors': len(failed)}
+
+
+def main():
+    """
+    Benchmark serial vs pipelined placement against a running UnrealCV server.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark pipelined UnrealCV placement commands')
+    parser.add_argument('--blueprint_path', type=str, required=True,
+                        help='Blueprint to spawn (e.g., /Game/Meshes/MeshBP)')
+    parser.add_argument('--count', type=int, default=50,
+                        help='Number of objects to place with each path')
+    args = parser.parse_args()
+
+    import spawn_strategy
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return
+
+    try:
+        result = benchmark(session, spawn_strategy.format_blueprint_class(args.blueprint_path), args.count)
+    finally:
+        pool.release(session)
+
+    print(f"Serial:    {result['serial'] * 1000:8.2f} ms per placement (4 round trips)")
+    print(f"Pipelined: {result['pipelined'] * 1000:8.2f} ms per placement")
+    if result['pipelined'] > 0:
+        print(f"Speedup:   {result['serial'] / result['pipelined']:8.1f}x")
+    if result['errors']:
+        print(f"Warning: {result['errors']} pipelined commands returned errors")
+
+
+if __name__ == "__main__":
+    main()
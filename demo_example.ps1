@@ -5,6 +5,10 @@ $REPO_PATH = "D:/ue5/mesh_runtime_placement"  # Path to this repository
 $ASSET_PATH = "/Game/LLMGenerated/Meshes"
 $MESH_NAME = "ChairBP"  # This will be the name of the blueprint
 $SPAWN_LOCATION = "0,0,100"  # X,Y,Z coordinates
+# Set to host:port (e.g. localhost:9100) to run the whole workflow through editor_job_server.py
+# without the prompts below; start the server first in UE5's Python console with:
+#   import editor_job_server; editor_job_server.start()
+$JOB_SERVER = ""
 
 Write-Host "========================================================"
 Write-Host "HunYuan3D-v2 to Unreal Engine 5 Runtime Mesh Placement Demo"
@@ -17,6 +21,14 @@ if (-not (Test-Path $SAMPLE_OBJ)) {
     exit 1
 }
 
+if ($JOB_SERVER) {
+    Write-Host "Importing, starting Play In Editor and placing through the editor job server at $JOB_SERVER"
+    Set-Location -Path $REPO_PATH
+    python hunyuan3d_ue5_demo.py --action full --obj_path "$SAMPLE_OBJ" --asset_path "$ASSET_PATH" `
+        --blueprint_name "$MESH_NAME" --location "$SPAWN_LOCATION" --job_server "$JOB_SERVER"
+    exit $LASTEXITCODE
+}
+
 Write-Host "Step 1: Import OBJ to UE5 and Create Blueprint"
 Write-Host "--------------------------------------------"
 Write-Host "Please run the following code in UE5's Python console:"
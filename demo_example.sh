@@ -8,6 +8,10 @@ UE5_PROJECT_PATH="D:/ue5/MyProject2/UnRealCVTest"  # Update this to your UE5 pro
 ASSET_PATH="/Game/LLMGenerated"
 BLUEPRINT_NAME="HunYuanMeshBP"
 SPAWN_LOCATION="0,0,100"  # X,Y,Z coordinates
+# Set to host:port (e.g. localhost:9100) to run the whole workflow through editor_job_server.py
+# without the prompts below; start the server first in UE5's Python console with:
+#   import editor_job_server; editor_job_server.start()
+JOB_SERVER=""
 
 echo "========================================================"
 echo "HunYuan3D-v2 to Unreal Engine 5 Workflow Demo"
@@ -20,6 +24,13 @@ if [ ! -f "$SAMPLE_OBJ" ]; then
     exit 1
 fi
 
+if [ -n "$JOB_SERVER" ]; then
+    echo "Importing, starting Play In Editor and placing through the editor job server at $JOB_SERVER"
+    python hunyuan3d_ue5_demo.py --action full --obj_path "$SAMPLE_OBJ" --asset_path "$ASSET_PATH" \
+        --blueprint_name "$BLUEPRINT_NAME" --location "$SPAWN_LOCATION" --job_server "$JOB_SERVER" || exit 1
+    exit 0
+fi
+
 echo "Step 1: Import OBJ to UE5"
 echo "-------------------------"
 echo "Please run the following code in UE5's Python console:"
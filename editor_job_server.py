@@ -0,0 +1,868 @@
+"""
+Editor Job Server
+=================
+
+Runs inside the UE5 editor's Python and executes import and blueprint jobs
+submitted from outside the editor, so the command line tools no longer print
+code for a human to paste into the Python console.
+
+Jobs arrive over a localhost socket (one JSON message per line) or as JSON
+files dropped into a spool directory. They wait in a FIFO queue and are run
+one per editor tick from a Slate post-tick callback, on the game thread where
+the unreal API has to be called. The editor keeps redrawing between jobs;
+while a job runs, client requests are answered once it has finished.
+
+Job kinds and their parameters:
+    import          obj_path [asset_path blueprint_name create_blueprint force instanced profile]
+    import_lods     manifest_path [asset_path blueprint_name profile]
+    import_batch    source [asset_path create_blueprints force profile]
+    blueprint       mesh_path [asset_path blueprint_name instanced]
+    play            start Play In Editor (for UnrealCV placement)
+
+Start the server in the UE5 Python console, or from a startup script:
+
+    import sys; sys.path.append('/path/to/repo')
+    import editor_job_server
+    editor_job_server.start()                     # localhost:9100; spool='/path/to/spool' also watches a folder
+
+A commandlet has no Slate tick, so there the server runs a blocking loop:
+UnrealEditor-Cmd MyProject.uproject -run=pythonscript -script="/path/to/editor_job_server.py --blocking"
+
+Submit jobs from outside the editor:
+
+    client = editor_job_server.JobClient()        # or JobClient(spool='/path/to/spool')
+    job = client.run('import', obj_path='/data/chair/mesh.obj', blueprint_name='ChairBP')
+    print(job['state'], job['result'])
+
+The server has no authentication and only listens on localhost by default.
+With --standin it runs outside the editor and serves the same protocol with
+handlers that check their input files and return the asset paths a real
+import would create, so the external side can be tested without UE5.
+
+Example usage:
+python editor_job_server.py --standin
+python editor_job_server.py --standin --port 9100 --spool /tmp/hunyuan3d_jobs --latency 200
+python editor_job_server.py --list
+"""
+import argparse
+import collections
+import contextlib
+import json
+import os
+import selectors
+import socket
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = int(os.environ.get('HUNYUAN3D_JOB_PORT', '9100'))
+DEFAULT_ENDPOINT = (DEFAULT_HOST, DEFAULT_PORT)
+DEFAULT_ASSET_PATH = '/Game/Meshes'
+DEFAULT_BLUEPRINT_NAME = 'MeshBP'
+
+# Required parameters per job kind
+JOB_PARAMETERS = {
+    'import': ('obj_path',),
+    'import_lods': ('manifest_path',),
+    'import_batch': ('source',),
+    'blueprint': ('mesh_path',),
+    'play': (),
+}
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+# Connections sending a line longer than this are dropped
+MAX_LINE_BYTES = 1 << 20
+SPOOL_SCAN_INTERVAL = 0.5
+
+_server = None
+_tick_handle = None
+
+
+def parse_endpoint(text):
+    """
+    Args:
+        text (str): 'host:port', 'port' or '' for the default endpoint
+
+    Returns:
+        tuple: (host, port)
+    """
+    if not text:
+        return DEFAULT_ENDPOINT
+    host, _, port = text.rpartition(':')
+    return (host or DEFAULT_HOST, int(port))
+
+
+def validate_job(kind, params, kinds=None):
+    """
+    Check a job before it is queued.
+
+    Args:
+        kind (str): Job kind
+        params (dict): Job parameters
+        kinds (iterable): Kinds the server can run (default: JOB_PARAMETERS)
+
+    Raises:
+        ValueError: If the kind is unknown or a required parameter is missing
+    """
+    kinds = JOB_PARAMETERS if kinds is None else kinds
+    if kind not in kinds:
+        raise ValueError(f"Unknown job kind: {kind} (choose from {', '.join(sorted(kinds))})")
+    if not isinstance(params, dict):
+        raise ValueError("Job parameters must be a JSON object")
+    missing = [name for name in JOB_PARAMETERS.get(kind, ()) if not params.get(name)]
+    if missing:
+        raise ValueError(f"Missing parameters for {kind} job: {', '.join(missing)}")
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _profiling(params):
+    """Profile the job's import phases if it has a profile report path (see import_profiler.py)"""
+    if not params.get('profile'):
+        return contextlib.nullcontext()
+    import import_profiler
+    return import_profiler.profiling(params['profile'])
+
+
+def _editor_import(params):
+    import unreal
+    import unreal_engine_import
+    with _profiling(params):
+        mesh_path, blueprint_path = unreal_engine_import.import_obj_to_uasset(
+            params['obj_path'], params.get('asset_path', DEFAULT_ASSET_PATH),
+            params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME), create_blueprint=params.get('create_blueprint', True),
+            incremental=not params.get('force', False), instanced=params.get('instanced', False))
+    if not unreal.EditorAssetLibrary.does_asset_exist(mesh_path):
+        raise RuntimeError(f"Importing {params['obj_path']} did not create {mesh_path}")
+    return {'mesh_path': mesh_path, 'blueprint_path': blueprint_path}
+
+
+def _editor_import_lods(params):
+    import unreal_engine_import
+    with _profiling(params):
+        mesh_path, blueprint_path = unreal_engine_import.import_lod_chain(
+            params['manifest_path'], params.get('asset_path', DEFAULT_ASSET_PATH),
+            params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME), create_blueprint=True)
+    return {'mesh_path': mesh_path, 'blueprint_path': blueprint_path}
+
+
+def _editor_import_batch(params):
+    import unreal_engine_import
+    with _profiling(params):
+        results = unreal_engine_import.import_obj_batch(
+            params['source'], params.get('asset_path', DEFAULT_ASSET_PATH),
+            create_blueprints=params.get('create_blueprints', True), incremental=not params.get('force', False))
+    return {'results': results}
+
+
+def _editor_blueprint(params):
+    import unreal_engine_import
+    blueprint_path = unreal_engine_import.create_simple_blueprint(
+        params['mesh_path'], params.get('asset_path', DEFAULT_ASSET_PATH),
+        params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME), instanced=params.get('instanced', False))
+    if not blueprint_path:
+        raise RuntimeError(f"Could not create a blueprint for {params['mesh_path']}")
+    return {'blueprint_path': blueprint_path}
+
+
+def _editor_play(params):
+    import unreal
+    subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+    if not subsystem.is_in_play_in_editor():
+        subsystem.editor_request_begin_play()
+    return {'playing': True}
+
+
+EDITOR_HANDLERS = {
+    'import': _editor_import,
+    'import_lods': _editor_import_lods,
+    'import_batch': _editor_import_batch,
+    'blueprint': _editor_blueprint,
+    'play': _editor_play,
+}
+
+
+def standin_handlers(latency=0.0):
+    """
+    Handlers for running the server outside the editor. They check that the
+    input files exist and return what the editor handlers would, without
+    importing anything.
+
+    Args:
+        latency (float): Seconds every job takes
+
+    Returns:
+        dict: Job kind -> handler
+    """
+    def check_file(path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No such file: {path}")
+        time.sleep(latency)
+
+    def import_mesh(params):
+        check_file(params['obj_path'])
+        asset_path = params.get('asset_path', DEFAULT_ASSET_PATH)
+        create_blueprint = params.get('create_blueprint', True)
+        return {'mesh_path': f"{asset_path}/{os.path.splitext(os.path.basename(params['obj_path']))[0]}",
+                'blueprint_path': f"{asset_path}/{params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME)}"
+                if create_blueprint else None}
+
+    def import_lods(params):
+        check_file(params['manifest_path'])
+        manifest_path = params['manifest_path']
+        if os.path.isdir(manifest_path):
+            import mesh_lod
+            manifest_path = os.path.join(manifest_path, mesh_lod.MANIFEST_NAME)
+        with open(manifest_path, 'r') as f:
+            name = json.load(f)['name']
+        asset_path = params.get('asset_path', DEFAULT_ASSET_PATH)
+        return {'mesh_path': f"{asset_path}/{name}",
+                'blueprint_path': f"{asset_path}/{params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME)}"}
+
+    def import_batch(params):
+        import import_sources
+        check_file(params['source'])
+        results = []
+        for entry in import_sources.find_import_sources(params['source'], params.get('asset_path', DEFAULT_ASSET_PATH)):
+            mesh_path = f"{entry['asset_path']}/{entry['asset_name']}"
+            results.append({'obj_path': entry['obj_path'], 'mesh_asset_path': mesh_path,
+                            'blueprint_path': f"{entry['asset_path']}/{entry['blueprint_name']}"
+                            if params.get('create_blueprints', True) else None,
+                            'ok': True, 'skipped': False, 'seconds': 0.0})
+        return {'results': results}
+
+    def blueprint(params):
+        time.sleep(latency)
+        return {'blueprint_path': f"{params.get('asset_path', DEFAULT_ASSET_PATH)}/"
+                                  f"{params.get('blueprint_name', DEFAULT_BLUEPRINT_NAME)}"}
+
+    def play(params):
+        time.sleep(latency)
+        return {'playing': True}
+
+    return {'import': import_mesh, 'import_lods': import_lods, 'import_batch': import_batch,
+            'blueprint': blueprint, 'play': play}
+
+
+class JobServer:
+    """
+    Job queue with a non-blocking socket and spool directory front end.
+
+    Nothing here blocks: tick() accepts connections, answers requests, picks up
+    spooled jobs and runs up to jobs_per_tick queued jobs, so it can be called
+    from the editor's tick.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port (0: pick a free port)
+        spool (str): Directory to watch for job files (default: none)
+        handlers (dict): Job kind -> function(params) returning a JSON-serializable result
+            (default: EDITOR_HANDLERS)
+        name (str): Server name reported to clients
+        jobs_per_tick (int): Jobs run per tick()
+        history (int): Finished jobs kept for status requests
+        verbose (bool): Print a line per job
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, spool=None, handlers=None, name='editor',
+                 jobs_per_tick=1, history=1000, verbose=True):
+        self.host = host
+        self.port = port
+        self.spool = spool
+        self.handlers = dict(EDITOR_HANDLERS if handlers is None else handlers)
+        self.name = name
+        self.jobs_per_tick = jobs_per_tick
+        self.history = history
+        self.verbose = verbose
+        self.jobs = {}
+        self.queue = collections.deque()
+        self._selector = None
+        self._listener = None
+        self._last_scan = 0.0
+        self._stopped = False
+
+    @property
+    def endpoint(self):
+        """(host, port) the server is listening on"""
+        return (self.host, self.port)
+
+    def start(self):
+        """
+        Open the listening socket and the spool directories.
+
+        Returns:
+            JobServer: self
+        """
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.port))
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self.port = self._listener.getsockname()[1]
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        if self.spool:
+            os.makedirs(os.path.join(self.spool, 'pending'), exist_ok=True)
+            os.makedirs(os.path.join(self.spool, 'status'), exist_ok=True)
+        self._stopped = False
+        return self
+
+    def submit(self, kind, params=None, job_id=None, source='socket'):
+        """
+        Queue a job.
+
+        Args:
+            kind (str): Job kind
+            params (dict): Job parameters
+            job_id (str): Id to use (default: a new one)
+            source (str): 'socket' or 'spool'
+
+        Returns:
+            dict: The job record
+
+        Raises:
+            ValueError: If the job is invalid or the id is taken
+        """
+        params = {} if params is None else params
+        validate_job(kind, params, self.handlers)
+        job_id = job_id or uuid.uuid4().hex[:12]
+        if job_id in self.jobs:
+            raise ValueError(f"Duplicate job id: {job_id}")
+        job = {'id': job_id, 'kind': kind, 'params': params, 'state': 'queued', 'source': source,
+               'submitted': time.time(), 'started': None, 'finished': None, 'seconds': None,
+               'result': None, 'error': None}
+        self.jobs[job_id] = job
+        self.queue.append(job_id)
+        self._publish(job)
+        self._trim_history()
+        return job
+
+    def get(self, job_id):
+        """Return the record of a job, or None"""
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job that has not started yet.
+
+        Returns:
+            dict: The job record
+
+        Raises:
+            ValueError: If the job is unknown or already running or finished
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job: {job_id}")
+        if job['state'] != 'queued':
+            raise ValueError(f"Job {job_id} is {job['state']} and cannot be cancelled")
+        self.queue.remove(job_id)
+        job['state'] = 'cancelled'
+        job['finished'] = time.time()
+        self._publish(job)
+        return job
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job['state'] in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self.jobs[job_id]
+
+    def _publish(self, job):
+        """Write the state of a spooled job to <spool>/status/<id>.json"""
+        if self.spool and job['source'] == 'spool':
+            _write_json(os.path.join(self.spool, 'status', f"{job['id']}.json"), job)
+
+    def process_next(self):
+        """
+        Run the next queued job.
+
+        Returns:
+            dict or None: The finished job record, or None if the queue was empty
+        """
+        if not self.queue:
+            return None
+        job = self.jobs[self.queue.popleft()]
+        job['state'] = 'running'
+        job['started'] = time.time()
+        self._publish(job)
+        if self.verbose:
+            print(f"Job {job['id']}: running {job['kind']}")
+        start = time.perf_counter()
+        try:
+            result = self.handlers[job['kind']](dict(job['params']))
+            # Round trip through JSON so results with unreal objects or tuples can be sent to clients
+            job['result'] = json.loads(json.dumps(result, default=str))
+            job['state'] = 'done'
+        except Exception as e:
+            job['error'] = f"{type(e).__name__}: {e}"
+            job['state'] = 'failed'
+        job['seconds'] = time.perf_counter() - start
+        job['finished'] = time.time()
+        self._publish(job)
+        if self.verbose:
+            print(f"Job {job['id']}: {job['kind']} {job['state']} in {job['seconds']:.2f}s"
+                  f"{' (' + job['error'] + ')' if job['error'] else ''}")
+        return job
+
+    def handle(self, message):
+        """
+        Answer one client request.
+
+        Args:
+            message (dict): Request with an 'op' of ping, submit, status, list or cancel
+
+        Returns:
+            dict: Response with 'ok' and either the requested data or 'error'
+        """
+        try:
+            op = message.get('op')
+            if op == 'ping':
+                return {'ok': True, 'server': self.name, 'kinds': sorted(self.handlers), 'queued': len(self.queue)}
+            if op == 'submit':
+                return {'ok': True, 'job': self.submit(message.get('kind'), message.get('params'))}
+            if op == 'status':
+                job = self.get(message.get('id'))
+                if job is None:
+                    return {'ok': False, 'error': f"Unknown job: {message.get('id')}"}
+                return {'ok': True, 'job': job}
+            if op == 'list':
+                return {'ok': True, 'jobs': list(self.jobs.values())}
+            if op == 'cancel':
+                return {'ok': True, 'job': self.cancel(message.get('id'))}
+            return {'ok': False, 'error': f"Unknown op: {op}"}
+        except (AttributeError, TypeError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}
+
+    def _close(self, conn):
+        with contextlib.suppress(KeyError, ValueError):
+            self._selector.unregister(conn)
+        conn.close()
+
+    def _service(self, conn, buffers, events):
+        if events & selectors.EVENT_READ:
+            try:
+                data = conn.recv(65536)
+            except BlockingIOError:
+                data = None
+            except OSError:
+                data = b''
+            if data == b'':
+                self._close(conn)
+                return
+            if data:
+                buffers['in'] += data
+                while b'\n' in buffers['in']:
+                    line, buffers['in'] = buffers['in'].split(b'\n', 1)
+                    if not line.strip():
+                        continue
+                    try:
+                        response = self.handle(json.loads(line))
+                    except ValueError as e:
+                        response = {'ok': False, 'error': f"Invalid JSON: {e}"}
+                    buffers['out'] += (json.dumps(response) + '\n').encode()
+                if len(buffers['in']) > MAX_LINE_BYTES:
+                    self._close(conn)
+                    return
+        if buffers['out']:
+            try:
+                sent = conn.send(buffers['out'])
+                buffers['out'] = buffers['out'][sent:]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._close(conn)
+                return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if buffers['out'] else 0)
+        if events != buffers['events']:
+            buffers['events'] = events
+            self._selector.modify(conn, events, buffers)
+
+    def _scan_spool(self):
+        """Queue the job files in <spool>/pending, oldest first"""
+        pending = os.path.join(self.spool, 'pending')
+        try:
+            names = [name for name in os.listdir(pending) if name.endswith('.json')]
+        except OSError:
+            return
+        paths = sorted((os.path.join(pending, name) for name in names), key=lambda p: (os.path.getmtime(p), p))
+        for path in paths:
+            job_id = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, 'r') as f:
+                    message = json.load(f)
+                os.remove(path)
+            except (OSError, ValueError) as e:
+                print(f"Skipping spooled job {path}: {e}")
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+                continue
+            try:
+                self.submit(message.get('kind'), message.get('params'), job_id=job_id, source='spool')
+            except (AttributeError, ValueError) as e:
+                _write_json(os.path.join(self.spool, 'status', f"{job_id}.json"),
+                            {'id': job_id, 'kind': message.get('kind') if isinstance(message, dict) else None,
+                             'state': 'failed', 'source': 'spool', 'error': str(e), 'result': None,
+                             'submitted': time.time(), 'finished': time.time()})
+
+    def poll(self, timeout=0.0):
+        """
+        Accept connections, answer requests and pick up spooled jobs.
+
+        Args:
+            timeout (float): Seconds to wait for socket activity
+        """
+        for key, events in self._selector.select(timeout):
+            if key.data is None:
+                try:
+                    conn, _ = self._listener.accept()
+                except BlockingIOError:
+                    continue
+                conn.setblocking(False)
+                self._selector.register(conn, selectors.EVENT_READ,
+                                        {'in': b'', 'out': b'', 'events': selectors.EVENT_READ})
+            else:
+                self._service(key.fileobj, key.data, events)
+        if self.spool and time.monotonic() - self._last_scan >= SPOOL_SCAN_INTERVAL:
+            self._last_scan = time.monotonic()
+            self._scan_spool()
+
+    def tick(self, delta_seconds=0.0):
+        """
+        Do one round of work; called from the editor's tick.
+
+        Args:
+            delta_seconds (float): Seconds since the last tick (unused)
+        """
+        self.poll()
+        ran = 0
+        while ran < self.jobs_per_tick and self.process_next() is not None:
+            ran += 1
+        if ran:
+            # Answer the requests that arrived during the jobs right away
+            self.poll()
+
+    def serve_forever(self, poll_interval=0.05):
+        """Tick until stop() is called or the process is interrupted"""
+        while not self._stopped:
+            self.poll(0.0 if self.queue else poll_interval)
+            self.process_next()
+
+    def stop(self):
+        """Close every connection and the listening socket"""
+        self._stopped = True
+        if self._selector is None:
+            return
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+        self._selector.close()
+        self._selector = None
+        self._listener = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _tick(delta_seconds):
+    try:
+        _server.tick(delta_seconds)
+    except Exception as e:
+        print(f"Editor job server error: {e}")
+
+
+def start(host=DEFAULT_HOST, port=DEFAULT_PORT, spool=None, jobs_per_tick=1):
+    """
+    Start the job server inside the editor, ticked by a Slate post-tick callback.
+    A server that is already running is stopped first.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port
+        spool (str): Directory to watch for job files (default: none)
+        jobs_per_tick (int): Jobs run per editor tick
+
+    Returns:
+        JobServer: The running server
+    """
+    global _server, _tick_handle
+    import unreal
+    stop()
+    _server = JobServer(host, port, spool=spool, jobs_per_tick=jobs_per_tick).start()
+    _tick_handle = unreal.register_slate_post_tick_callback(_tick)
+    print(f"Editor job server listening on {_server.host}:{_server.port}"
+          f"{', watching ' + spool if spool else ''}")
+    return _server
+
+
+def stop():
+    """Stop the job server started with start(), if any"""
+    global _server, _tick_handle
+    if _tick_handle is not None:
+        import unreal
+        unreal.unregister_slate_post_tick_callback(_tick_handle)
+        _tick_handle = None
+    if _server is not None:
+        _server.stop()
+        _server = None
+
+
+class JobClient:
+    """
+    Submits jobs to a JobServer and reads their status, over the socket or
+    through a spool directory.
+
+    Args:
+        endpoint (tuple): (host, port) of the server (default: DEFAULT_ENDPOINT)
+        spool (str): Use this spool directory instead of the socket
+        timeout (float): Seconds to wait for a response to one request
+    """
+
+    def __init__(self, endpoint=None, spool=None, timeout=30.0):
+        self.endpoint = tuple(endpoint or DEFAULT_ENDPOINT)
+        self.spool = spool
+        self.timeout = timeout
+        self._sock = None
+        self._buffer = b''
+
+    def request(self, message):
+        """
+        Send one request over the socket and return the response.
+
+        Raises:
+            ConnectionError: If the server cannot be reached
+            TimeoutError: If the server did not answer in time (it answers between jobs)
+            ValueError: If the server rejected the request
+        """
+        if self._sock is None:
+            try:
+                self._sock = socket.create_connection(self.endpoint, timeout=self.timeout)
+            except OSError as e:
+                raise ConnectionError(f"No editor job server at {self.endpoint[0]}:{self.endpoint[1]} ({e}). "
+                                      f"Start it in the UE5 Python console with: "
+                                      f"import editor_job_server; editor_job_server.start()")
+        try:
+            self._sock.sendall((json.dumps(message) + '\n').encode())
+            while b'\n' not in self._buffer:
+                data = self._sock.recv(65536)
+                if not data:
+                    raise ConnectionError("connection closed by the server")
+                self._buffer += data
+        except socket.timeout:
+            # A late response would be read as the answer to the next request, so start over
+            self.close()
+            raise TimeoutError(f"The editor job server did not answer within {self.timeout:.0f}s")
+        except OSError as e:
+            self.close()
+            raise ConnectionError(f"Lost the connection to the editor job server: {e}")
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise ValueError(response.get('error'))
+        return response
+
+    def _spool_path(self, folder, job_id):
+        return os.path.join(self.spool, folder, f"{job_id}.json")
+
+    def ping(self):
+        """
+        Returns:
+            dict: Server name, job kinds and queue length (spool: just the kinds)
+        """
+        if self.spool:
+            return {'ok': os.path.isdir(os.path.join(self.spool, 'pending')), 'server': 'spool',
+                    'kinds': sorted(JOB_PARAMETERS)}
+        return self.request({'op': 'ping'})
+
+    def submit(self, kind, **params):
+        """
+        Queue a job.
+
+        Args:
+            kind (str): Job kind, see JOB_PARAMETERS
+            **params: Job parameters
+
+        Returns:
+            dict: The job record, with its id
+        """
+        if not self.spool:
+            return self.request({'op': 'submit', 'kind': kind, 'params': params})['job']
+        validate_job(kind, params)
+        os.makedirs(os.path.join(self.spool, 'pending'), exist_ok=True)
+        job_id = uuid.uuid4().hex[:12]
+        _write_json(self._spool_path('pending', job_id), {'kind': kind, 'params': params})
+        return {'id': job_id, 'kind': kind, 'params': params, 'state': 'queued', 'source': 'spool',
+                'submitted': time.time(), 'result': None, 'error': None}
+
+    def status(self, job_id):
+        """
+        Returns:
+            dict: The job record
+
+        Raises:
+            ValueError: If the job is unknown
+        """
+        if not self.spool:
+            return self.request({'op': 'status', 'id': job_id})['job']
+        try:
+            with open(self._spool_path('status', job_id), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        if os.path.exists(self._spool_path('pending', job_id)):
+            return {'id': job_id, 'state': 'queued', 'source': 'spool', 'result': None, 'error': None}
+        raise ValueError(f"Unknown job: {job_id}")
+
+    def list(self):
+        """
+        Returns:
+            list: Job records known to the server, oldest first
+        """
+        if not self.spool:
+            return self.request({'op': 'list'})['jobs']
+        jobs = []
+        for folder in ('status', 'pending'):
+            directory = os.path.join(self.spool, folder)
+            names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+            for name in names:
+                if name.endswith('.json'):
+                    with contextlib.suppress(ValueError):
+                        jobs.append(self.status(os.path.splitext(name)[0]))
+        return sorted(jobs, key=lambda job: job.get('submitted') or 0.0)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job that has not started yet.
+
+        Returns:
+            dict: The job record
+
+        Raises:
+            ValueError: If the job is unknown or already started
+        """
+        if not self.spool:
+            return self.request({'op': 'cancel', 'id': job_id})['job']
+        try:
+            os.remove(self._spool_path('pending', job_id))
+        except OSError:
+            raise ValueError(f"Job {job_id} was already picked up by the server")
+        return {'id': job_id, 'state': 'cancelled', 'source': 'spool', 'result': None, 'error': None}
+
+    def wait(self, job_id, timeout=None, poll_interval=0.2):
+        """
+        Wait for a job to finish.
+
+        Args:
+            job_id (str): Job id
+            timeout (float): Give up after this many seconds (default: wait forever)
+            poll_interval (float): Seconds between status requests
+
+        Returns:
+            dict: The finished job record (state done, failed or cancelled)
+
+        Raises:
+            TimeoutError: If the job did not finish in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                job = self.status(job_id)
+                if job['state'] in FINISHED_STATES:
+                    return job
+            except TimeoutError:
+                # The server is busy with a long job; ask again
+                pass
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job {job_id} did not finish within {timeout:g}s")
+            time.sleep(poll_interval)
+
+    def run(self, kind, timeout=None, **params):
+        """
+        Submit a job and wait for it.
+
+        Returns:
+            dict: The finished job record
+        """
+        return self.wait(self.submit(kind, **params)['id'], timeout)
+
+    def close(self):
+        """Close the socket"""
+        if self._sock is not None:
+            with contextlib.suppress(OSError):
+                self._sock.close()
+            self._sock = None
+            self._buffer = b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_jobs(jobs):
+    """
+    Print one line per job.
+
+    Args:
+        jobs (list): Job records
+    """
+    print(f"{'Id':<14} {'Kind':<14} {'State':<10} {'Seconds':>8}  Result")
+    print("-" * 90)
+    for job in jobs:
+        seconds = f"{job['seconds']:8.2f}" if job.get('seconds') is not None else f"{'-':>8}"
+        outcome = job.get('error') or json.dumps(job.get('result'))
+        print(f"{job['id']:<14} {job.get('kind') or '-':<14} {job['state']:<10} {seconds}  {outcome[:60]}")
+
+
+def main():
+    """
+    Run the job server (in a commandlet or as a stand-in) or list its jobs.
+    """
+    parser = argparse.ArgumentParser(description='Run or query the editor import job server')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='Interface to listen on / server host')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Server port')
+    parser.add_argument('--spool', type=str, default=None, help='Also watch (or, with --list, read) this spool directory')
+    parser.add_argument('--standin', action='store_true',
+                        help='Run outside the editor with handlers that check inputs but import nothing')
+    parser.add_argument('--latency', type=float, default=0.0, help='Stand-in job duration in ms')
+    parser.add_argument('--blocking', action='store_true',
+                        help='In the editor, serve in a blocking loop instead of the Slate tick (for commandlets)')
+    parser.add_argument('--list', action='store_true', help='List the jobs of a running server')
+    args = parser.parse_args()
+
+    if args.list:
+        with JobClient((args.host, args.port), spool=args.spool) as client:
+            try:
+                print_jobs(client.list())
+            except (ConnectionError, TimeoutError, ValueError) as e:
+                print(f"Error: {e}")
+        return
+
+    if not args.standin and not args.blocking:
+        start(args.host, args.port, spool=args.spool)
+        return
+
+    handlers = standin_handlers(args.latency / 1000.0) if args.standin else None
+    server = JobServer(args.host, args.port, spool=args.spool, handlers=handlers,
+                       name='standin' if args.standin else 'editor').start()
+    print(f"{'Stand-in' if args.standin else 'Editor'} job server listening on {server.host}:{server.port}"
+          f"{', watching ' + args.spool if args.spool else ''} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
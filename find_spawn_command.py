@@ -2,42 +2,42 @@
 """
 UnrealCV Command Tester
 This script tries different command variations to find the right spawn command syntax.
+Pass --async to send all of the diagnostic commands concurrently.
 """
 
-import unrealcv
-import time
+import asyncio
 import sys
 
+import async_unrealcv
+import spawn_strategy
+import unrealcv_session
+
+BLUEPRINT_PATH = "/Game/LLMGenerated/Blueprints/HunYuanMeshBP.HunYuanMeshBP_C"
+
+def spawn_command_variants(blueprint_path, x, y, z):
+    """Return the spawn command syntaxes to try, most likely first"""
+    return [
+        f'vset /objects/spawn {blueprint_path} {x} {y} {z}',
+        f'vset /object/spawn {blueprint_path} {x} {y} {z}',
+        f'vset /actor/spawn {blueprint_path} {x} {y} {z}',
+        f'vrun SpawnActor {blueprint_path} {x} {y} {z}',
+        f'vset /objects/create {blueprint_path} {x} {y} {z}',
+        f'vset /scene/spawn {blueprint_path} {x} {y} {z}',
+        f'vspawn {blueprint_path} {x} {y} {z}',
+        f'vrun "SpawnActor {blueprint_path} Location=({x},{y},{z})"',
+        f'vrun "Spawn {blueprint_path} {x} {y} {z}"'
+    ]
+
 def test_commands():
-    # Connect to UnrealCV
-    client = unrealcv.Client(('localhost', 9000))
+    # Borrow a warm connection from the shared session pool
     print("Attempting to connect to UnrealCV...")
+    pool = unrealcv_session.get_pool()
+    client = pool.acquire()
     
-    # Try to connect for 30 seconds
-    timeout = 30
-    connected = False
-    
-    for i in range(timeout):
-        if client.isconnected():
-            connected = True
-            break
-        else:
-            try:
-                client.connect()
-                if client.isconnected():
-                    connected = True
-                    break
-            except:
-                pass
-            print(f"Waiting for UnrealCV connection... {i+1}/{timeout}")
-            time.sleep(1)
-    
-    if not connected:
+    if client is None:
         print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
         return
     
-    print("Connected to UnrealCV!")
-    
     # Get UnrealCV version and status
     print("\n--- UNREALCV INFO ---")
     try:
@@ -52,6 +52,18 @@ def test_commands():
     except:
         print("Could not get UnrealCV status")
     
+    # Show which spawn syntax placements will use for this server version
+    print("\n--- CACHED SPAWN STRATEGY ---")
+    try:
+        version = spawn_strategy.get_server_version(client)
+        cached = spawn_strategy.get_default_cache().get(version)
+        if cached:
+            print(f"Placements against UnrealCV {version} use '{cached.key}': {cached.template}")
+        else:
+            print(f"No spawn strategy cached for UnrealCV {version} yet; the next placement will probe for one")
+    except Exception as e:
+        print(f"Error reading spawn strategy cache: {e}")
+    
     # Try to get a list of available commands
     print("\n--- TRYING TO GET COMMAND LIST ---")
     try:
@@ -61,22 +73,12 @@ def test_commands():
         print(f"Error getting help: {e}")
     
     # Try different spawn command variations
-    blueprint_path = "/Game/LLMGenerated/Blueprints/HunYuanMeshBP.HunYuanMeshBP_C"
+    blueprint_path = BLUEPRINT_PATH
     location = "0,0,100"
     x, y, z = location.split(',')
     
     print("\n--- TESTING SPAWN COMMANDS ---")
-    spawn_commands = [
-        f'vset /objects/spawn {blueprint_path} {x} {y} {z}',
-        f'vset /object/spawn {blueprint_path} {x} {y} {z}',
-        f'vset /actor/spawn {blueprint_path} {x} {y} {z}',
-        f'vrun SpawnActor {blueprint_path} {x} {y} {z}',
-        f'vset /objects/create {blueprint_path} {x} {y} {z}',
-        f'vset /scene/spawn {blueprint_path} {x} {y} {z}',
-        f'vspawn {blueprint_path} {x} {y} {z}',
-        f'vrun "SpawnActor {blueprint_path} Location=({x},{y},{z})"',
-        f'vrun "Spawn {blueprint_path} {x} {y} {z}"'
-    ]
+    spawn_commands = spawn_command_variants(blueprint_path, x, y, z)
     
     for cmd in spawn_commands:
         print(f"\nTrying: {cmd}")
@@ -107,8 +109,51 @@ def test_commands():
         print(f"Error getting player location: {e}")
     
     print("\nDiagnostic tests completed. If any command succeeded, note it for future use.")
-    client.disconnect()
-    print("Disconnected from UnrealCV")
+    pool.release(client)
+    print("Released UnrealCV session")
+
+async def test_commands_async():
+    """
+    Run the same diagnostics with the asyncio client, sending every query and
+    spawn variant at once instead of waiting for each reply in turn.
+    """
+    client = async_unrealcv.AsyncUnrealCVClient()
+    print("Attempting to connect to UnrealCV (async)...")
+    if not await client.connect():
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return
+    
+    x, y, z = "0,0,100".split(',')
+    info_commands = ['vget /unrealcv/version', 'vget /unrealcv/status', 'vget /unrealcv/help']
+    spawn_commands = spawn_command_variants(BLUEPRINT_PATH, x, y, z)
+    scene_commands = ['vget /objects', 'vget /camera/0/location']
+    
+    try:
+        responses = await client.request_many(info_commands + spawn_commands + scene_commands)
+    finally:
+        await client.close()
+    
+    print("\n--- UNREALCV INFO ---")
+    for cmd, response in zip(info_commands, responses):
+        print(f"{cmd}: {response}")
+    
+    print("\n--- TESTING SPAWN COMMANDS ---")
+    for cmd, response in zip(spawn_commands, responses[len(info_commands):]):
+        print(f"\nTried: {cmd}")
+        print(f"Response: {response}")
+        if isinstance(response, str) and not response.startswith('error'):
+            print("✓ COMMAND SUCCEEDED!")
+        else:
+            print("✗ Command failed")
+    
+    print("\n--- SCENE ---")
+    for cmd, response in zip(scene_commands, responses[-len(scene_commands):]):
+        print(f"{cmd}: {response}")
+    
+    print("\nDiagnostic tests completed. If any command succeeded, note it for future use.")
 
 if __name__ == "__main__":
-    test_commands() 
\ No newline at end of file
+    if '--async' in sys.argv:
+        asyncio.run(test_commands_async())
+    else:
+        test_commands() 
\ No newline at end of file
@@ -23,16 +23,51 @@ python -c "import hunyuan3d_ue5_demo as demo; demo.import_to_ue5('/path/to/mesh.
 # Place an existing blueprint in runtime
 python hunyuan3d_ue5_demo.py --action place --blueprint_path /Game/Meshes/MeshBP
 
+# Place every object listed in a JSONL/CSV manifest in one run
+python hunyuan3d_ue5_demo.py --action place-batch --manifest placements.jsonl
+
+# Place the same manifest as InstancedStaticMesh instances, one actor per mesh (run the printed code in UE5)
+python hunyuan3d_ue5_demo.py --action place-instanced --manifest placements.jsonl
+
 # Full workflow (requires UE5 to be running)
 python hunyuan3d_ue5_demo.py --action full --obj_path /path/to/mesh.obj
+
+# Import a whole folder of HunYuan3D outputs in one batch (run the printed code in UE5)
+python hunyuan3d_ue5_demo.py --action import-batch --source /path/to/outputs
+
+# Build a LOD chain offline and import it as one mesh with LODs
+python hunyuan3d_ue5_demo.py --action import --obj_path /path/to/mesh.obj --lods
+
+# Decimate to a triangle budget before importing
+python hunyuan3d_ue5_demo.py --action import --obj_path /path/to/mesh.obj --target_triangles 5000
+
+# Downscale and compress the base color texture before importing
+python hunyuan3d_ue5_demo.py --action import --obj_path /path/to/mesh.obj --max_texture_size 512
+
+# Time every editor import phase per asset
+python hunyuan3d_ue5_demo.py --action import-batch --source /path/to/outputs --profile import_profile.json
+
+# Import, start Play In Editor and place without the Python console (needs editor_job_server running in UE5)
+python hunyuan3d_ue5_demo.py --action full --obj_path /path/to/mesh.obj --job_server
 """
 
 import os
 import sys
 import argparse
+import asyncio
+import contextlib
 import time
 import subprocess
 
+import asset_index
+import async_unrealcv
+import batch_placement
+import command_pipeline
+import editor_job_server
+import placement_index
+import spawn_strategy
+import unrealcv_session
+
 try:
     import unrealcv
 except ImportError:
@@ -50,13 +85,18 @@ def parse_arguments():
     - import: Import a mesh into UE5 (requires obj_path)
     - place: Place a blueprint in a running game (requires blueprint_path)
     - full: Complete workflow from import to placement (requires obj_path)
+    - place-batch: Place every row of a JSONL/CSV manifest in a running game (requires manifest)
+    - place-instanced: Place a manifest as instances of one actor per blueprint (requires manifest)
+    - import-batch: Import every OBJ in a folder or source manifest into UE5 at once (requires source)
     
     Returns:
         argparse.Namespace: The parsed command line arguments
     """
     parser = argparse.ArgumentParser(description='HunYuan3D-v2 to UE5 Import and Placement')
-    parser.add_argument('--action', type=str, choices=['import', 'place', 'full'], required=True,
-                        help='Action to perform: import, place, or full workflow')
+    parser.add_argument('--action', type=str, choices=['import', 'place', 'full', 'place-batch', 'place-instanced',
+                                                         'import-batch'], required=True,
+                        help='Action to perform: import, place, full workflow, place-batch, place-instanced '
+                             'or import-batch')
     parser.add_argument('--obj_path', type=str, 
                         help='Path to the OBJ mesh file (required for import and full actions)')
     parser.add_argument('--project_path', type=str,
@@ -67,12 +107,46 @@ def parse_arguments():
                         help='Name for the generated blueprint')
     parser.add_argument('--blueprint_path', type=str,
                         help='Full path to existing blueprint (for place action)')
-    parser.add_argument('--location', type=str, default='0,0,100',
-                        help='Location to place the object (X,Y,Z)')
+    parser.add_argument('--location', type=str,
+                        help='Location to place the object (X,Y,Z), or "auto" for the free spot nearest to 0,0,100 '
+                             '(default: standing on the floor at 0,0 if the asset is indexed, else 0,0,100)')
     parser.add_argument('--rotation', type=str, default='0,90,0',
                         help='Rotation of the object (Pitch,Yaw,Roll)')
-    parser.add_argument('--scale', type=str, default='100,100,100',
-                        help='Scale of the object (X,Y,Z)')
+    parser.add_argument('--scale', type=str,
+                        help='Scale of the object (X,Y,Z) (default: from the asset index and --target_size, '
+                             'else 100,100,100)')
+    parser.add_argument('--target_size', type=float, default=asset_index.DEFAULT_TARGET_SIZE,
+                        help='Largest dimension in cm that indexed assets are scaled to when --scale is not given')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use the asyncio UnrealCV client for the place and full actions')
+    parser.add_argument('--manifest', type=str,
+                        help='JSONL or CSV manifest of placements (required for place-batch and place-instanced actions)')
+    parser.add_argument('--scene', type=str,
+                        help='Placement index file of objects placed so far; --location auto and place-batch rows '
+                             'without a location avoid them, and new objects are added (place, full, place-batch)')
+    parser.add_argument('--source', type=str,
+                        help='Folder of OBJ files or manifest listing them (required for import-batch action)')
+    parser.add_argument('--target_triangles', type=int,
+                        help='Decimate the mesh to this many triangles before importing (import and full actions)')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Weld positions and reorder triangles for vertex cache efficiency before importing '
+                             '(import and full actions)')
+    parser.add_argument('--lods', action='store_true',
+                        help='Build a 100/50/25/10%% LOD chain offline and import it as the LODs of one mesh '
+                             '(import and full actions)')
+    parser.add_argument('--instanced', action='store_true',
+                        help='Also create an instanced blueprint for place-instanced (import and full actions)')
+    parser.add_argument('--max_texture_size', type=int,
+                        help='Downscale the base color texture to this power-of-two size, drop unused alpha and '
+                             'pre-build its mips as a compressed DDS before importing (import and full actions)')
+    parser.add_argument('--profile', type=str, metavar='REPORT',
+                        help='Time every editor import phase per asset and write a JSON report '
+                             '(import, full and import-batch actions)')
+    parser.add_argument('--job_server', type=str, nargs='?', const='', metavar='HOST:PORT',
+                        help='Run the import as a job on the editor job server (default: localhost:9100) instead of '
+                             'printing code for the UE5 Python console (import, full and import-batch actions)')
+    parser.add_argument('--spool', type=str,
+                        help='Like --job_server, but submit the job through this spool directory')
     
     args = parser.parse_args()
     
@@ -83,12 +157,25 @@ def parse_arguments():
     if args.action == 'place' and not args.blueprint_path:
         parser.error("--blueprint_path is required for place action")
     
+    if args.action in ['place-batch', 'place-instanced'] and not args.manifest:
+        parser.error(f"--manifest is required for {args.action} action")
+    
+    if args.action == 'import-batch' and not args.source:
+        parser.error("--source is required for import-batch action")
+    
     return args
 
-def import_to_ue5(obj_path, asset_path='/Game/Meshes', blueprint_name='MeshBP'):
+def import_to_ue5(obj_path, asset_path='/Game/Meshes', blueprint_name='MeshBP', force=False, instanced=False,
+                  profile=None):
     """
     This function should be run from within UE5's Python console.
     It imports an OBJ file and creates a blueprint with the mesh attached.
+    If the OBJ, MTL and textures are unchanged since the last import, the
+    existing mesh and blueprint are kept; pass force=True to re-import anyway.
+    With instanced=True an <blueprint_name>Instanced blueprint with an
+    InstancedStaticMeshComponent is created as well (see instanced_placement.py).
+    With profile set to a JSON path, every import phase is timed and written
+    there (see import_profiler.py).
     
     Returns the path to the created blueprint.
     """
@@ -104,11 +191,14 @@ def import_to_ue5(obj_path, asset_path='/Game/Meshes', blueprint_name='MeshBP'):
     sys.path.append(local_dir)
     
     try:
+        import import_profiler
         import unreal_engine_import
         # Import the mesh and create a blueprint with it
-        mesh_path, bp_path = unreal_engine_import.import_obj_to_uasset(
-            obj_path, asset_path, blueprint_name, create_blueprint=True
-        )
+        with import_profiler.profiling(profile) if profile else contextlib.nullcontext():
+            mesh_path, bp_path = unreal_engine_import.import_obj_to_uasset(
+                obj_path, asset_path, blueprint_name, create_blueprint=True, incremental=not force,
+                instanced=instanced
+            )
         print(f"Successfully imported {obj_path} to {mesh_path}")
         
         if bp_path:
@@ -121,7 +211,69 @@ def import_to_ue5(obj_path, asset_path='/Game/Meshes', blueprint_name='MeshBP'):
         print(f"Error importing mesh: {e}")
         return None
 
-def place_in_runtime(asset_path, location='0,0,100', rotation='0,0,0', scale='1,1,1'):
+def import_lods_to_ue5(lod_manifest_path, asset_path='/Game/Meshes', blueprint_name='MeshBP', profile=None):
+    """
+    This function should be run from within UE5's Python console.
+    It imports a LOD chain built by mesh_lod.py as one mesh with LODs and creates
+    a blueprint with that mesh attached. With profile set to a JSON path, every
+    import phase is timed and written there.
+    
+    Returns the path to the created blueprint.
+    """
+    try:
+        import unreal
+    except ImportError:
+        print("Error: This function must be run from within Unreal Engine's Python console")
+        return None
+    
+    local_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.append(local_dir)
+    
+    try:
+        import import_profiler
+        import unreal_engine_import
+        with import_profiler.profiling(profile) if profile else contextlib.nullcontext():
+            mesh_path, bp_path = unreal_engine_import.import_lod_chain(
+                lod_manifest_path, asset_path, blueprint_name, create_blueprint=True
+            )
+        print(f"Successfully imported the LOD chain {lod_manifest_path} to {mesh_path}")
+        
+        if bp_path:
+            print(f"Created blueprint at {bp_path}")
+            return bp_path
+        else:
+            print("Blueprint creation failed. Using the imported mesh directly.")
+            return mesh_path
+    except Exception as e:
+        print(f"Error importing LOD chain: {e}")
+        return None
+
+def import_batch_to_ue5(source, asset_path='/Game/Meshes', create_blueprints=True, force=False, profile=None):
+    """
+    This function should be run from within UE5's Python console.
+    It imports every OBJ in a folder or source manifest with a few import calls
+    and a single save, and creates a blueprint per mesh. Meshes that are
+    unchanged since the last import are skipped unless force=True. With profile
+    set to a JSON path, every import phase is timed per asset and written there.
+    
+    Returns the list of per-mesh results.
+    """
+    try:
+        import unreal
+    except ImportError:
+        print("Error: This function must be run from within Unreal Engine's Python console")
+        return None
+    
+    local_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.append(local_dir)
+    
+    import import_profiler
+    import unreal_engine_import
+    with import_profiler.profiling(profile) if profile else contextlib.nullcontext():
+        return unreal_engine_import.import_obj_batch(source, asset_path, create_blueprints=create_blueprints,
+                                                     incremental=not force)
+
+def place_in_runtime(asset_path, location='0,0,100', rotation='0,0,0', scale='1,1,1', interactive=True):
     """
     Places a static mesh in the running UE5 instance using UnrealCV.
     
@@ -133,9 +285,10 @@ def place_in_runtime(asset_path, location='0,0,100', rotation='0,0,0', scale='1,
         location (str): Location coordinates as "X,Y,Z" string (default: "0,0,100")
         rotation (str): Rotation angles as "Pitch,Yaw,Roll" string (default: "0,0,0")
         scale (str): Scale factors as "X,Y,Z" string (default: "1,1,1")
+        interactive (bool): Prompt for custom UnrealCV commands after placing
         
     Returns:
-        bool: True if the object was placed successfully, False otherwise
+        bool: True if the blueprint was placed, False otherwise (also when only a placeholder cube was)
     """
     try:
         import unrealcv
@@ -143,173 +296,287 @@ def place_in_runtime(asset_path, location='0,0,100', rotation='0,0,0', scale='1,
         print("Error: UnrealCV module not found. Install with: pip install unrealcv")
         return False
     
-    # Connect to UnrealCV
-    client = unrealcv.Client(('localhost', 9000))
-    
+    # Borrow a warm connection from the shared session pool
     print("Attempting to connect to UnrealCV...")
+    pool = unrealcv_session.get_pool()
+    client = pool.acquire()
     
-    # Try to connect for 30 seconds
-    timeout = 30
-    connected = False
-    
-    for i in range(timeout):
-        if client.isconnected():
-            connected = True
-            break
-        else:
-            try:
-                client.connect()
-                if client.isconnected():
-                    connected = True
-                    break
-            except:
-                pass
-            print(f"Waiting for UnrealCV connection... {i+1}/{timeout}")
-            time.sleep(1)
-    
-    if not connected:
+    if client is None:
         print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
         return False
     
-    print("Connected to UnrealCV!")
-    
-    # Parse location
-    x, y, z = map(float, location.split(','))
-    
-    # Parse rotation
-    pitch, yaw, roll = map(float, rotation.split(','))
-    
-    # Parse scale
-    scale_x, scale_y, scale_z = map(float, scale.split(','))
-    
-    # Format the blueprint path correctly for UnrealCV
-    print(f"Attempting to spawn blueprint: {asset_path}")
-    
-    # Ensure the blueprint path is in the correct format for UnrealCV
-    bp_path = asset_path
-    if not bp_path.endswith('_C'):
-        # Extract the blueprint name from the path
-        bp_name = bp_path.split('/')[-1]
-        # Add the class specifier
-        bp_path = f"{bp_path}.{bp_name}_C"
-    
-    print(f"Formatted blueprint path: {bp_path}")
-    
-    # Method 1: Try to spawn the blueprint using the correct UnrealCV command
-    print("Method 1: Trying to spawn blueprint with vset /objects/spawn...")
-    spawn_cmd = f'vset /objects/spawn {bp_path} SpawnedObject_{int(time.time())}'
-    response = client.request(spawn_cmd)
-    
-    if not response.startswith('error'):
-        object_name = f"SpawnedObject_{int(time.time())}"
-        print(f"Successfully spawned blueprint with name: {object_name}")
+    try:
+        try:
+            x, y, z = map(float, location.split(','))
+            pitch, yaw, roll = map(float, rotation.split(','))
+            scale_x, scale_y, scale_z = map(float, scale.split(','))
+        except ValueError:
+            print(f"Invalid transform: location {location}, rotation {rotation} and scale {scale} "
+                  f"must each be three comma-separated numbers")
+            return False
         
-        # Set its location
-        loc_cmd = f'vset /object/{object_name}/location {x} {y} {z}'
-        loc_response = client.request(loc_cmd)
-        print(f"Set location response: {loc_response}")
+        # Format the blueprint path correctly for UnrealCV
+        print(f"Attempting to spawn blueprint: {asset_path}")
+        bp_path = spawn_strategy.format_blueprint_class(asset_path)
+        alt_bp_path = asset_path[:-2] if asset_path.endswith('_C') else asset_path
+        print(f"Formatted blueprint path: {bp_path}")
+        
+        # Spawn with the strategy cached for this UnrealCV version. With a cached strategy
+        # the spawn and transform commands are pipelined into one round trip; otherwise the
+        # known spawn syntaxes are probed once and the winner is cached for later runs.
+        object_name = f"SpawnedObject_{time.time_ns()}"
+        placed = spawn_strategy.spawn_and_place(
+            client, asset_path, object_name, (x, y, z),
+            rotation=(pitch, yaw, roll) if rotation != '0,0,0' else None,
+            scale=(scale_x, scale_y, scale_z) if scale != '1,1,1' else None,
+        )
         
-        # Set its rotation if needed
-        if rotation != '0,0,0':
-            rot_cmd = f'vset /object/{object_name}/rotation {pitch} {yaw} {roll}'
-            rot_response = client.request(rot_cmd)
-            print(f"Set rotation response: {rot_response}")
+        if placed.ok:
+            print(f"Successfully spawned blueprint using '{placed.strategy.key}'"
+                  + (f" with name: {placed.object_name}" if placed.object_name else ""))
+            for result in placed.transforms:
+                print(f"Set {result.op} response: {result.response}")
+            
+            print(f"Object placed successfully at location {x}, {y}, {z}")
+            
+            try:
+                while interactive:
+                    command = input("\nEnter a custom UnrealCV command (or 'exit' to quit): ")
+                    if command.lower() == 'exit':
+                        break
+                    
+                    response = client.request(command)
+                    print(f"Response: {response}")
+            except KeyboardInterrupt:
+                print("\nExiting...")
+            
+            return True
         
-        # Set its scale if needed
-        if scale != '1,1,1':
-            scale_cmd = f'vset /object/{object_name}/scale {scale_x} {scale_y} {scale_z}'
-            scale_response = client.request(scale_cmd)
-            print(f"Set scale response: {scale_response}")
+        # Method 4: Fallback to cube as before, but with better error reporting
+        print("All blueprint spawn methods failed.")
+        print(f"Error responses:")
+        for command, response in placed.failures:
+            print(f"  {command}: {response}")
         
-        print(f"Object placed successfully at location {x}, {y}, {z}")
+        print("Falling back to spawning a placeholder cube...")
+        spawn_cube_cmd = f'vset /objects/spawn StaticMeshActor PlaceholderCube_{int(time.time())}'
+        response = client.request(spawn_cube_cmd)
         
-        try:
-            while True:
-                command = input("\nEnter a custom UnrealCV command (or 'exit' to quit): ")
-                if command.lower() == 'exit':
-                    break
-                
-                response = client.request(command)
-                print(f"Response: {response}")
-        except KeyboardInterrupt:
-            print("\nExiting...")
-        finally:
-            client.disconnect()
-            print("Disconnected from UnrealCV")
+        if not response.startswith('error'):
+            cube_name = f"PlaceholderCube_{int(time.time())}"
+            print(f"Spawned placeholder cube with name: {cube_name}")
+            
+            # Set its location
+            loc_cmd = f'vset /object/{cube_name}/location {x} {y} {z}'
+            client.request(loc_cmd)
+            
+            print(f"Placeholder cube placed at location {x}, {y}, {z}")
+            print(f"Your blueprint is available at: {asset_path}")
+            print("To manually spawn your blueprint, try these commands in the UnrealCV console:")
+            print(f"  vset /objects/spawn {bp_path} MyObject")
+            print(f"  vset /objects/spawn {alt_bp_path} MyObject")
+            
+            # The blueprint itself was not placed, so report the placement as failed
+            return False
         
-        return True
-    
-    # Method 2: Try alternative blueprint path formats
-    print("Method 1 failed. Trying alternative blueprint path formats...")
+        print("\nAll spawn methods failed. Please check:")
+        print("1. That the blueprint was created successfully in UE5")
+        print("2. That the blueprint path is correct")
+        print("3. That UnrealCV is properly connected")
+        return False
+    except unrealcv_session.CONNECTION_ERRORS as e:
+        print(f"UnrealCV request failed: {e}")
+        return False
+    finally:
+        pool.release(client)
+        print("Released UnrealCV session")
+
+async def async_place_in_runtime(asset_path, location='0,0,100', rotation='0,0,0', scale='1,1,1'):
+    """
+    Places a blueprint in the running UE5 instance using the asyncio UnrealCV client.
     
-    # Try without the _C suffix
-    alt_bp_path = asset_path
-    if alt_bp_path.endswith('_C'):
-        alt_bp_path = alt_bp_path[:-2]
+    Spawning goes through spawn_strategy.async_spawn_and_place, which shares the
+    strategy cache and probing with place_in_runtime; with a cached strategy the spawn
+    and transform commands are in flight at once. A `vget /objects` scene query then
+    confirms that the new object is in the level. Unlike place_in_runtime this path is
+    non-interactive.
     
-    spawn_cmd = f'vset /objects/spawn {alt_bp_path} SpawnedObject_{int(time.time())}'
-    print(f"Trying: {spawn_cmd}")
-    response = client.request(spawn_cmd)
+    Args:
+        asset_path (str): Path to the blueprint in UE5's content browser
+        location (str): Location coordinates as "X,Y,Z" string (default: "0,0,100")
+        rotation (str): Rotation angles as "Pitch,Yaw,Roll" string (default: "0,0,0")
+        scale (str): Scale factors as "X,Y,Z" string (default: "1,1,1")
+        
+    Returns:
+        bool: True if the object was placed successfully, False otherwise
+    """
+    client = async_unrealcv.AsyncUnrealCVClient()
+    print("Attempting to connect to UnrealCV (async)...")
+    if not await client.connect():
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return False
     
-    if not response.startswith('error'):
-        object_name = f"SpawnedObject_{int(time.time())}"
-        print(f"Successfully spawned blueprint with alternative path: {object_name}")
+    try:
+        x, y, z = map(float, location.split(','))
+        pitch, yaw, roll = map(float, rotation.split(','))
+        scale_x, scale_y, scale_z = map(float, scale.split(','))
+        
+        object_name = f"SpawnedObject_{time.time_ns()}"
+        placed = await spawn_strategy.async_spawn_and_place(
+            client, asset_path, object_name, (x, y, z),
+            rotation=(pitch, yaw, roll) if rotation != '0,0,0' else None,
+            scale=(scale_x, scale_y, scale_z) if scale != '1,1,1' else None,
+        )
+        
+        if not placed.ok:
+            print("All blueprint spawn methods failed.")
+            for command, response in placed.failures:
+                print(f"  {command}: {response}")
+            print(f"Check that the blueprint exists at {asset_path} and run find_spawn_command.py for diagnostics")
+            return False
         
-        # Set its location
-        loc_cmd = f'vset /object/{object_name}/location {x} {y} {z}'
-        client.request(loc_cmd)
+        print(f"Successfully spawned blueprint using '{placed.strategy.key}'"
+              + (f" with name: {placed.object_name}" if placed.object_name else ""))
+        for result in placed.transforms:
+            print(f"Set {result.op} response: {result.response}")
+        failed = command_pipeline.errors(placed.transforms)
+        if failed:
+            print(f"{len(failed)} transform command(s) failed; the object is not where it was asked to be")
+            return False
         
+        if placed.object_name:
+            objects = await client.request('vget /objects')
+            if placed.object_name in objects.split():
+                print(f"Confirmed {placed.object_name} is in the scene")
         print(f"Object placed successfully at location {x}, {y}, {z}")
-        client.disconnect()
         return True
+    except (ConnectionError, asyncio.TimeoutError) as e:
+        print(f"UnrealCV request failed: {e}")
+        return False
+    finally:
+        await client.close()
+
+def placement_defaults(asset_path, location=None, scale=None, target_size=asset_index.DEFAULT_TARGET_SIZE,
+                       rotation=None):
+    """
+    Fill in the location and scale that were not given, from the asset index.
     
-    # Method 3: Try using vrun to execute UE4 console commands
-    print("Method 2 failed. Trying UE4 console command...")
+    Indexed assets are scaled so that their largest dimension is target_size cm
+    and, as rotated, stand on the floor at 0,0. Assets that are not indexed get the old
+    defaults of 0,0,100 and 100,100,100.
     
-    # Try using UE4's built-in spawn command
-    ue4_spawn_cmd = f'vrun "SpawnActor {bp_path} Location=({x},{y},{z})"'
-    print(f"Trying: {ue4_spawn_cmd}")
-    response = client.request(ue4_spawn_cmd)
+    Args:
+        asset_path (str): Blueprint or mesh path
+        location (str): Location as "X,Y,Z", or None
+        scale (str): Scale as "X,Y,Z", or None
+        target_size (float): Largest dimension of the placed object in cm
+        rotation (str): Rotation as "Pitch,Yaw,Roll" the object is placed with, or None
     
-    if not response.startswith('error'):
-        print(f"Successfully spawned using UE4 console command")
-        print(f"Response: {response}")
-        client.disconnect()
-        return True
+    Returns:
+        tuple: (location, scale, asset record or None)
+    """
+    record = asset_index.lookup(asset_path)
+    if scale is None:
+        scale = ','.join([f"{asset_index.suggested_scale(record, target_size):g}"] * 3) if record else '100,100,100'
+    if location is None:
+        if record is None:
+            location = '0,0,100'
+        else:
+            z = asset_index.resting_height(record, tuple(float(v) for v in scale.split(',')),
+                                           rotation=tuple(float(v) for v in rotation.split(',')) if rotation else None)
+            location = f"0,0,{z:g}"
+    if record is not None:
+        print(f"{record['mesh_path']}: {' x '.join(f'{v:.1f}' for v in record['size'])} cm at scale 1, "
+              f"{record['triangle_count']} triangles; placing at {location} with scale {scale}")
+    return location, scale, record
+
+def plan_placement(asset_path, location, scale, rotation, target_size=asset_index.DEFAULT_TARGET_SIZE,
+                   scene_path=None, obj_path=None):
+    """
+    Resolve the location and scale of one placement and record it in the scene index.
     
-    # Method 4: Fallback to cube as before, but with better error reporting
-    print("All blueprint spawn methods failed.")
-    print(f"Error responses:")
-    print(f"  Method 1 response: {client.request(f'vset /objects/spawn {bp_path} TestObject')}")
-    print(f"  Method 2 response: {client.request(f'vset /objects/spawn {alt_bp_path} TestObject')}")
+    With location 'auto' the object goes to the free spot nearest to where
+    placement_defaults would put it, avoiding the objects in the scene index.
+    Either way the object is added to the index with its bounds scaled and
+    rotated like the actor; save the index once the placement succeeded.
     
-    print("Falling back to spawning a placeholder cube...")
-    spawn_cube_cmd = f'vset /objects/spawn StaticMeshActor PlaceholderCube_{int(time.time())}'
-    response = client.request(spawn_cube_cmd)
+    Args:
+        asset_path (str): Blueprint or mesh path
+        location (str): Location as "X,Y,Z", 'auto', or None for the default
+        scale (str): Scale as "X,Y,Z", or None for the default
+        rotation (str): Rotation as "Pitch,Yaw,Roll"
+        target_size (float): Largest dimension in cm for indexed assets without a scale
+        scene_path (str): Placement index file (see placement_index.PlacementIndex.save)
+        obj_path (str): Source OBJ, for the bounds of assets that are not indexed
     
-    if not response.startswith('error'):
-        cube_name = f"PlaceholderCube_{int(time.time())}"
-        print(f"Spawned placeholder cube with name: {cube_name}")
-        
-        # Set its location
-        loc_cmd = f'vset /object/{cube_name}/location {x} {y} {z}'
-        client.request(loc_cmd)
-        
-        print(f"Placeholder cube placed at location {x}, {y}, {z}")
-        print(f"Your blueprint is available at: {asset_path}")
-        print("To manually spawn your blueprint, try these commands in the UnrealCV console:")
-        print(f"  vset /objects/spawn {bp_path} MyObject")
-        print(f"  vset /objects/spawn {alt_bp_path} MyObject")
-        
-        client.disconnect()
-        return True
+    Returns:
+        tuple: (location, scale, PlacementIndex holding the object or None without scene_path)
     
-    print("\nAll spawn methods failed. Please check:")
-    print("1. That the blueprint was created successfully in UE5")
-    print("2. That the blueprint path is correct")
-    print("3. That UnrealCV is properly connected")
-    client.disconnect()
-    return False
+    Raises:
+        ValueError: If a transform is malformed or no free location is found for 'auto'
+    """
+    auto = location == 'auto'
+    location, scale, record = placement_defaults(asset_path, None if auto else location, scale, target_size,
+                                                 rotation)
+    if not auto and not scene_path:
+        return location, scale, None
+    
+    try:
+        scale_values, rotation_values = (tuple(float(v) for v in value.split(',')) for value in (scale, rotation))
+        location_values = None if auto else tuple(float(v) for v in location.split(','))
+        if len(scale_values) != 3 or len(rotation_values) != 3 or len(location_values or (0, 0, 0)) != 3:
+            raise ValueError("expected three comma-separated numbers")
+    except ValueError as e:
+        raise ValueError(f"Invalid transform: {e}")
+    # Index the object as placed: scaled and rotated like the actor
+    if record is not None:
+        bounds = asset_index.world_bounds(record, scale_values, rotation_values)
+    elif obj_path and os.path.exists(obj_path):
+        bounds = placement_index.transform_bounds(placement_index.obj_bounds(obj_path), rotation_values,
+                                                  scale_values)
+    else:
+        bounds = placement_index.DEFAULT_BOUNDS
+    scene = placement_index.PlacementIndex.load(scene_path)
+    if auto:
+        near = tuple(float(v) for v in location.split(',')) if record is not None else placement_index.DEFAULT_LOCATION
+        placed = scene.place(bounds=bounds, near=near, prefix='Placed')
+        if placed is None:
+            raise ValueError(f"No free location found near {','.join(f'{v:g}' for v in near)}")
+        location = ','.join(f"{v:g}" for v in placed['location'])
+        print(f"Auto-placing at {location} ({len(scene) - 1} objects in the scene index)")
+    else:
+        scene.add(scene.next_name('Placed'), location_values, bounds)
+    return location, scale, scene if scene_path else None
+
+def run_editor_job(kind, params, job_server=None, spool=None, timeout=None):
+    """
+    Run a job on the editor job server (see editor_job_server.py) and wait for it.
+    
+    Args:
+        kind (str): Job kind, e.g. 'import' or 'import_batch'
+        params (dict): Job parameters
+        job_server (str): 'host:port' of the server ('' or None: localhost:9100)
+        spool (str): Submit through this spool directory instead of the socket
+        timeout (float): Seconds to wait for the job (default: no limit)
+    
+    Returns:
+        dict: The job result, or None if the job could not be run or failed
+    """
+    endpoint = editor_job_server.parse_endpoint(job_server)
+    with editor_job_server.JobClient(endpoint, spool=spool) as client:
+        try:
+            job = client.submit(kind, **params)
+            print(f"Submitted {kind} job {job['id']} to the editor "
+                  f"{'spool ' + spool if spool else f'job server at {endpoint[0]}:{endpoint[1]}'}, waiting...")
+            job = client.wait(job['id'], timeout)
+        except (ConnectionError, TimeoutError, ValueError) as e:
+            print(f"Error: {e}")
+            return None
+    if job['state'] != 'done':
+        print(f"Job {job['id']} {job['state']}: {job.get('error')}")
+        return None
+    print(f"Job {job['id']} done in {job['seconds']:.2f}s")
+    return job['result']
 
 def main():
     """
@@ -321,21 +588,166 @@ def main():
        - import: Provides instructions for importing a mesh in UE5's Python console
        - place: Places a static mesh in a running UE5 game
        - full: Guides the user through the complete workflow
+       - place-batch: Places every object listed in a manifest in a running UE5 game
+       - place-instanced: Provides instructions for placing a manifest as instances in UE5
+       - import-batch: Provides instructions for importing a folder of meshes in one batch
+    With --job_server or --spool, the import, full and import-batch actions run
+    their imports on the editor job server instead of printing code to paste.
+    Exits with status 1 if an import, Play In Editor or placement step fails.
     """
     args = parse_arguments()
     
-    if args.action == 'import':
+    if args.action in ['import', 'full'] and args.target_triangles:
+        import mesh_decimation
+        print(f"Decimating {args.obj_path} to {args.target_triangles} triangles before import...")
+        args.obj_path, _ = mesh_decimation.decimate_obj(args.obj_path, target_faces=args.target_triangles)
+        print()
+    
+    if args.action in ['import', 'full'] and args.optimize and not args.lods:
+        import mesh_optimize
+        print(f"Optimizing {args.obj_path} for vertex cache efficiency before import...")
+        args.obj_path, _ = mesh_optimize.optimize_obj(args.obj_path)
+        print()
+    
+    if args.action in ['import', 'full'] and args.max_texture_size:
+        import texture_pipeline
+        print(f"Converting the textures of {args.obj_path} to at most {args.max_texture_size}px before import...")
+        try:
+            args.obj_path, _ = texture_pipeline.prepare_textures(args.obj_path, max_size=args.max_texture_size)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"Error converting textures: {e}")
+            sys.exit(1)
+        print()
+    
+    profile_arg = f", profile='{os.path.abspath(args.profile)}'" if args.profile else ''
+    import_call = (f"mesh_path = demo.import_to_ue5('{args.obj_path}', '{args.asset_path}'"
+                   f"{', instanced=True' if args.instanced else ''}{profile_arg})")
+    use_job_server = args.job_server is not None or bool(args.spool)
+    job_params = {'asset_path': args.asset_path, 'blueprint_name': args.blueprint_name}
+    if args.profile:
+        job_params['profile'] = os.path.abspath(args.profile)
+    import_job = ('import', dict(job_params, obj_path=os.path.abspath(args.obj_path or ''), instanced=args.instanced))
+    if args.action in ['import', 'full'] and args.lods:
+        import mesh_lod
+        print(f"Building the LOD chain for {args.obj_path}...")
+        lod_dir = mesh_lod.default_output_dir(args.obj_path)
+        mesh_lod.build_lod_chain(args.obj_path, lod_dir, optimize=args.optimize)
+        import_call = (f"mesh_path = demo.import_lods_to_ue5('{os.path.join(lod_dir, mesh_lod.MANIFEST_NAME)}', "
+                       f"'{args.asset_path}'{profile_arg})")
+        import_job = ('import_lods', dict(job_params, manifest_path=os.path.join(lod_dir, mesh_lod.MANIFEST_NAME)))
+        print()
+    
+    if args.action == 'import' and use_job_server:
+        result = run_editor_job(*import_job, job_server=args.job_server, spool=args.spool)
+        if result is None:
+            sys.exit(1)
+        print(f"Mesh: {result['mesh_path']}")
+        print(f"Blueprint: {result['blueprint_path']}")
+    
+    elif args.action == 'import':
         print("Note: This action should be run within Unreal Engine's Python console.")
         print("Please copy the following code and run it in the UE5 Python console:")
         print("\n" + "=" * 50)
         print(f"import sys")
         print(f"sys.path.append('{os.path.dirname(os.path.abspath(__file__))}')")
         print(f"import hunyuan3d_ue5_demo as demo")
-        print(f"mesh_path = demo.import_to_ue5('{args.obj_path}', '{args.asset_path}')")
+        print(import_call)
         print("=" * 50 + "\n")
     
     elif args.action == 'place':
-        place_in_runtime(args.blueprint_path, args.location, args.rotation, args.scale)
+        try:
+            args.location, args.scale, scene = plan_placement(args.blueprint_path, args.location, args.scale,
+                                                              args.rotation, args.target_size, args.scene,
+                                                              args.obj_path)
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        if args.use_async:
+            ok = asyncio.run(async_place_in_runtime(args.blueprint_path, args.location, args.rotation, args.scale))
+        else:
+            ok = place_in_runtime(args.blueprint_path, args.location, args.rotation, args.scale)
+        if not ok:
+            sys.exit(1)
+        if scene is not None:
+            scene.save(args.scene)
+    
+    elif args.action == 'place-batch':
+        if not batch_placement.run_batch_placement(args.manifest, scene_path=args.scene):
+            sys.exit(1)
+    
+    elif args.action == 'place-instanced':
+        print("Note: Instances are added through the editor's Python API, because UnrealCV cannot call")
+        print("component functions. Run the following in the UE5 Python console, during Play In Editor to")
+        print("place into the running game:")
+        print("\n" + "=" * 50)
+        print(f"import sys")
+        print(f"sys.path.append('{os.path.dirname(os.path.abspath(__file__))}')")
+        print(f"import instanced_placement")
+        print(f"results = instanced_placement.place_manifest_instanced('{os.path.abspath(args.manifest)}')")
+        print("=" * 50 + "\n")
+        print(f"Compare with per-actor spawning: python {__file__} --action place-batch --manifest {args.manifest}")
+    
+    elif args.action == 'import-batch' and use_job_server:
+        params = {'source': os.path.abspath(args.source), 'asset_path': args.asset_path, 'create_blueprints': True,
+                  'profile': job_params.get('profile')}
+        result = run_editor_job('import_batch', params, job_server=args.job_server, spool=args.spool)
+        if result is None:
+            sys.exit(1)
+        results = result['results']
+        skipped = sum(1 for r in results if r['skipped'])
+        failed = sum(1 for r in results if not r['ok'])
+        print(f"Imported {len(results) - skipped - failed} meshes, {skipped} unchanged, {failed} failed")
+        if failed:
+            sys.exit(1)
+    
+    elif args.action == 'import-batch':
+        import import_sources
+        try:
+            sources = import_sources.find_import_sources(args.source, args.asset_path)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {args.source}: {e}")
+            sys.exit(1)
+        print(f"Found {len(sources)} meshes in {args.source}")
+        print("Note: This action should be run within Unreal Engine's Python console.")
+        print("Please copy the following code and run it in the UE5 Python console:")
+        print("\n" + "=" * 50)
+        print(f"import sys")
+        print(f"sys.path.append('{os.path.dirname(os.path.abspath(__file__))}')")
+        print(f"import hunyuan3d_ue5_demo as demo")
+        print(f"results = demo.import_batch_to_ue5('{os.path.abspath(args.source)}', '{args.asset_path}'"
+              f"{profile_arg})")
+        print("=" * 50 + "\n")
+        print("Or run it headless for nightly ingestion:")
+        print(f"UnrealEditor-Cmd <Project>.uproject -run=pythonscript "
+              f"-script=\"{os.path.join(os.path.dirname(os.path.abspath(__file__)), 'unreal_engine_import.py')} "
+              f"--batch {os.path.abspath(args.source)} --asset_path {args.asset_path} --create_blueprints"
+              f"{' --profile ' + os.path.abspath(args.profile) if args.profile else ''}\"")
+    
+    elif args.action == 'full' and use_job_server:
+        print("Full workflow through the editor job server:")
+        result = run_editor_job(*import_job, job_server=args.job_server, spool=args.spool)
+        if result is None:
+            sys.exit(1)
+        print("Starting Play In Editor...")
+        if run_editor_job('play', {}, job_server=args.job_server, spool=args.spool) is None:
+            sys.exit(1)
+        # place_in_runtime keeps retrying the connection while the game starts up
+        blueprint_path = result['blueprint_path'] or result['mesh_path']
+        try:
+            args.location, args.scale, scene = plan_placement(blueprint_path, args.location, args.scale,
+                                                              args.rotation, args.target_size, args.scene,
+                                                              args.obj_path)
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        if args.use_async:
+            ok = asyncio.run(async_place_in_runtime(blueprint_path, args.location, args.rotation, args.scale))
+        else:
+            ok = place_in_runtime(blueprint_path, args.location, args.rotation, args.scale, interactive=False)
+        if not ok:
+            sys.exit(1)
+        if scene is not None:
+            scene.save(args.scene)
     
     elif args.action == 'full':
         print("Full workflow:")
@@ -344,18 +756,33 @@ def main():
         print(f"import sys")
         print(f"sys.path.append('{os.path.dirname(os.path.abspath(__file__))}')")
         print(f"import hunyuan3d_ue5_demo as demo")
-        print(f"mesh_path = demo.import_to_ue5('{args.obj_path}', '{args.asset_path}')")
+        print(import_call)
         print(f"print(f'Use this mesh path: {{mesh_path}}')")
         print("=" * 50 + "\n")
         
         print("2. After the import is complete, copy the mesh path and run:")
-        print(f"python {__file__} --action place --blueprint_path PASTE_MESH_PATH_HERE --location {args.location}")
+        print(f"python {__file__} --action place --blueprint_path PASTE_MESH_PATH_HERE"
+              f"{' --location ' + args.location if args.location else ''}")
         
         # Ask if user wants to attempt runtime placement now
         mesh_path = f"{args.asset_path}/{os.path.basename(args.obj_path).split('.')[0]}"
         response = input(f"\nDo you want to attempt runtime placement now with path {mesh_path}? (y/n): ")
         if response.lower() == 'y':
-            place_in_runtime(mesh_path, args.location, args.rotation, args.scale)
+            try:
+                args.location, args.scale, scene = plan_placement(mesh_path, args.location, args.scale,
+                                                                  args.rotation, args.target_size, args.scene,
+                                                                  args.obj_path)
+            except ValueError as e:
+                print(e)
+                sys.exit(1)
+            if args.use_async:
+                ok = asyncio.run(async_place_in_runtime(mesh_path, args.location, args.rotation, args.scale))
+            else:
+                ok = place_in_runtime(mesh_path, args.location, args.rotation, args.scale)
+            if not ok:
+                sys.exit(1)
+            if scene is not None:
+                scene.save(args.scene)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,402 @@
+"""
+Import Profiler
+===============
+
+Timing spans for the phases of the editor import pipeline (change check,
+import_asset_tasks, blueprint creation, compilation, saving), recorded per
+asset so that a slow batch can be broken down by asset and by phase. Uses only
+the standard library, so it runs inside the UE5 editor.
+
+The import functions in unreal_engine_import.py mark their phases with
+import_profiler.phase(); these are no-ops unless a profiler is active:
+
+    with import_profiler.profiling('import_profile.json', cprofile=True, memory=True):
+        unreal_engine_import.import_obj_batch('/data/hunyuan3d_outputs', create_blueprints=True)
+
+Optionally each asset is also run under cProfile (the slowest functions are
+kept in the report) and tracemalloc (peak and net Python allocations). Work
+that UE does for several assets in one call, such as a chunk of import tasks
+or the final save, is split evenly across those assets and has no per-asset
+cProfile data.
+
+The report is JSON with one entry per asset plus per-phase totals. Print the
+summary of one or more saved reports with:
+python import_profiler.py import_profile.json --top 20
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+DEFAULT_PROFILE_TOP = 25
+
+_active = None
+
+
+class ImportProfiler:
+    """
+    Collects phase timings per asset.
+
+    Args:
+        cprofile (bool): Run every asset under cProfile
+        memory (bool): Track Python allocations per asset with tracemalloc
+        profile_top (int): Functions kept per asset from the cProfile data
+    """
+
+    def __init__(self, cprofile=False, memory=False, profile_top=DEFAULT_PROFILE_TOP):
+        self.cprofile = cprofile
+        self.memory = memory
+        self.profile_top = profile_top
+        self.assets = {}
+        self.started = time.time()
+        self.seconds = 0.0
+        self._start = time.perf_counter()
+        self._current = None
+        self._started_tracemalloc = False
+
+    def _record(self, name):
+        record = self.assets.get(name)
+        if record is None:
+            record = self.assets[name] = {'name': name, 'seconds': 0.0, 'phases': {}, 'counts': {}, 'info': {}}
+        return record
+
+    @contextlib.contextmanager
+    def asset(self, name):
+        """
+        Attribute everything inside the block to one asset. Entering the same
+        asset again adds to its record.
+
+        Args:
+            name (str): Asset path, e.g. /Game/Meshes/chair_01/mesh
+        """
+        if self._current is not None:
+            # Nested asset blocks (e.g. a batch calling the single-asset import) stay with the outer asset
+            yield self._current
+            return
+        record = self._record(name)
+        self._current = record
+        profile = cProfile.Profile() if self.cprofile else None
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile is not None:
+                profile.disable()
+            record['seconds'] += time.perf_counter() - start
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['memory_peak_kb'] = max(record.get('memory_peak_kb', 0.0), (peak - memory_start) / 1024)
+                record['memory_net_kb'] = record.get('memory_net_kb', 0.0) + (current - memory_start) / 1024
+            if profile is not None:
+                record.setdefault('profile', []).extend(top_functions(profile, self.profile_top))
+            self._current = None
+
+    def add(self, asset, phase, seconds, count=1):
+        """
+        Add time to a phase of an asset directly.
+
+        Args:
+            asset (str): Asset name
+            phase (str): Phase name
+            seconds (float): Time to add
+            count (int): How many times the phase ran
+        """
+        record = self._record(asset)
+        record['phases'][phase] = record['phases'].get(phase, 0.0) + seconds
+        record['counts'][phase] = record['counts'].get(phase, 0) + count
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Time a phase of the current asset, or of '(no asset)' outside an asset block.
+
+        Args:
+            name (str): Phase name, e.g. 'blueprint_compile'
+        """
+        record = self._current
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(record['name'] if record is not None else '(no asset)', name, time.perf_counter() - start)
+
+    @contextlib.contextmanager
+    def shared_phase(self, name, assets):
+        """
+        Time one call that works on several assets and split it evenly across them.
+
+        Args:
+            name (str): Phase name
+            assets (list): Names of the assets the call works on
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            assets = list(assets)
+            if assets:
+                share = (time.perf_counter() - start) / len(assets)
+                for asset in assets:
+                    self.add(asset, name, share)
+                    self._record(asset)['seconds'] += share
+
+    def note(self, key, value):
+        """
+        Attach a value to the current asset's report entry, e.g. imported object counts.
+
+        Args:
+            key (str): Name of the value
+            value: JSON-serializable value
+        """
+        if self._current is not None:
+            self._current['info'][key] = value
+
+    def finish(self):
+        """Stop timing and tracemalloc (if this profiler started it)"""
+        self.seconds = time.perf_counter() - self._start
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def report(self):
+        """
+        Returns:
+            dict: started, seconds, options, assets (slowest first) and per-phase totals
+        """
+        assets = sorted(self.assets.values(), key=lambda r: r['seconds'], reverse=True)
+        for record in assets:
+            record['other'] = max(0.0, record['seconds'] - sum(record['phases'].values()))
+        return {
+            'started': self.started,
+            'seconds': self.seconds or time.perf_counter() - self._start,
+            'cprofile': self.cprofile,
+            'memory': self.memory,
+            'assets': assets,
+            'phases': phase_totals(assets),
+        }
+
+    def write(self, path):
+        """
+        Write report() as JSON.
+
+        Args:
+            path (str): Output file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def top_functions(profile, limit=DEFAULT_PROFILE_TOP):
+    """
+    Args:
+        profile (cProfile.Profile): A finished profile
+        limit (int): Number of functions to keep
+
+    Returns:
+        list: The functions with the highest cumulative time, as dictionaries
+    """
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({'function': f"{os.path.basename(filename)}:{line}({function})", 'calls': calls,
+                     'tottime': tottime, 'cumtime': cumtime})
+    rows.sort(key=lambda row: row['cumtime'], reverse=True)
+    return rows[:limit]
+
+
+def phase_totals(assets):
+    """
+    Args:
+        assets (list): Asset records from ImportProfiler.report
+
+    Returns:
+        dict: Phase name -> seconds, count and number of assets, including 'other'
+    """
+    totals = {}
+    for record in assets:
+        phases = dict(record['phases'])
+        phases['other'] = record.get('other', 0.0)
+        for phase, seconds in phases.items():
+            total = totals.setdefault(phase, {'seconds': 0.0, 'count': 0, 'assets': 0})
+            total['seconds'] += seconds
+            total['count'] += record['counts'].get(phase, 1 if phase == 'other' else 0)
+            total['assets'] += 1
+    return totals
+
+
+def print_summary(report, top=10):
+    """
+    Print the phases ranked by total time and the slowest assets.
+
+    Args:
+        report (dict): Report from ImportProfiler.report or a saved report file
+        top (int): Number of assets to list
+    """
+    phases = sorted(report['phases'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+    total = sum(p['seconds'] for _, p in phases) or 1.0
+    print(f"\n{'Phase':<24} {'Total s':>9} {'Share':>7} {'Count':>7} {'Mean ms':>9}")
+    print("-" * 60)
+    for name, phase in phases:
+        mean = phase['seconds'] / phase['count'] * 1000 if phase['count'] else 0.0
+        print(f"{name:<24} {phase['seconds']:>9.3f} {phase['seconds'] / total * 100:>6.1f}% "
+              f"{phase['count']:>7} {mean:>9.2f}")
+
+    assets = report['assets']
+    print(f"\n{'Asset':<48} {'Seconds':>8}  Slowest phase")
+    print("-" * 90)
+    for record in assets[:top]:
+        phases = dict(record['phases'], other=record.get('other', 0.0))
+        slowest = max(phases.items(), key=lambda item: item[1]) if phases else ('-', 0.0)
+        memory = f", peak {record['memory_peak_kb']:.0f} KB" if 'memory_peak_kb' in record else ''
+        print(f"{record['name'][-48:]:<48} {record['seconds']:>8.3f}  {slowest[0]} ({slowest[1]:.3f}s){memory}")
+    print("-" * 90)
+    print(f"{len(assets)} assets in {report['seconds']:.2f}s")
+
+
+def start(cprofile=False, memory=False, profile_top=DEFAULT_PROFILE_TOP):
+    """
+    Make a new profiler the active one; phase() and asset() record into it.
+
+    Returns:
+        ImportProfiler: The active profiler
+    """
+    global _active
+    _active = ImportProfiler(cprofile=cprofile, memory=memory, profile_top=profile_top)
+    return _active
+
+
+def stop():
+    """
+    Deactivate the current profiler.
+
+    Returns:
+        ImportProfiler or None: The profiler that was active
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.finish()
+    return profiler
+
+
+def active():
+    """Return the active profiler, or None"""
+    return _active
+
+
+@contextlib.contextmanager
+def profiling(report_path=None, cprofile=False, memory=False, top=10):
+    """
+    Profile the block, then print the summary and optionally write the report.
+
+    Args:
+        report_path (str): JSON report to write (default: none)
+        cprofile (bool): Run every asset under cProfile
+        memory (bool): Track Python allocations per asset with tracemalloc
+        top (int): Number of assets in the printed summary
+    """
+    profiler = start(cprofile=cprofile, memory=memory)
+    try:
+        yield profiler
+    finally:
+        stop()
+        print_summary(profiler.report(), top)
+        if report_path:
+            profiler.write(report_path)
+            print(f"Import profile written to {report_path}")
+
+
+def asset(name):
+    """Context manager: attribute the block to an asset of the active profiler (no-op if none)"""
+    return _active.asset(name) if _active is not None else contextlib.nullcontext()
+
+
+def phase(name):
+    """Context manager: time a phase with the active profiler (no-op if none)"""
+    return _active.phase(name) if _active is not None else contextlib.nullcontext()
+
+
+def shared_phase(name, assets):
+    """Context manager: time a call shared by several assets (no-op if no profiler is active)"""
+    return _active.shared_phase(name, assets) if _active is not None else contextlib.nullcontext()
+
+
+def note(key, value):
+    """Attach a value to the current asset of the active profiler (no-op if none)"""
+    if _active is not None:
+        _active.note(key, value)
+
+
+def merge_reports(reports):
+    """
+    Combine several reports (e.g. one per nightly chunk) into one.
+
+    Args:
+        reports (list): Report dictionaries
+
+    Returns:
+        dict: A report covering every asset of the inputs
+    """
+    assets = sorted((record for report in reports for record in report['assets']),
+                    key=lambda r: r['seconds'], reverse=True)
+    return {
+        'started': min(report['started'] for report in reports),
+        'seconds': sum(report['seconds'] for report in reports),
+        'cprofile': any(report.get('cprofile') for report in reports),
+        'memory': any(report.get('memory') for report in reports),
+        'assets': assets,
+        'phases': phase_totals(assets),
+    }
+
+
+def main():
+    """
+    Print the summary of saved import profiles.
+    """
+    parser = argparse.ArgumentParser(description='Summarize import profile reports')
+    parser.add_argument('reports', nargs='+', help='JSON reports written by an import with profiling enabled')
+    parser.add_argument('--top', type=int, default=20, help='Number of assets to list')
+    parser.add_argument('--functions', type=int, default=0,
+                        help='Also list the slowest functions of the top assets (needs a cProfile capture)')
+    args = parser.parse_args()
+
+    reports = []
+    for path in args.reports:
+        try:
+            with open(path, 'r') as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}")
+            return
+    report = reports[0] if len(reports) == 1 else merge_reports(reports)
+    print_summary(report, args.top)
+
+    if args.functions:
+        for record in report['assets'][:args.top]:
+            if not record.get('profile'):
+                continue
+            print(f"\n{record['name']}")
+            for row in sorted(record['profile'], key=lambda r: r['cumtime'], reverse=True)[:args.functions]:
+                print(f"  {row['cumtime']:8.3f}s cum {row['tottime']:8.3f}s own {row['calls']:>8} calls  "
+                      f"{row['function']}")
+
+
+if __name__ == "__main__":
+    main()
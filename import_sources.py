@@ -0,0 +1,471 @@
+"""
+Import Sources
+==============
+
+Finds the OBJ files to import in one batch, either by scanning a folder of
+HunYuan3D-v2 outputs or by reading a manifest, and works out where each mesh
+goes in the content browser. Also resolves the material libraries and
+textures an OBJ depends on and keeps the import manifest that lets
+unchanged meshes skip re-import. Uses only the standard library, so it runs
+both inside the UE5 editor and in a regular Python environment.
+
+Folder scan: every .obj below the folder is imported. HunYuan3D writes each
+result as <id>/mesh.obj, so the folder structure is mirrored under the
+destination path (/Game/Meshes/<id>/mesh) to keep the asset names unique.
+
+Manifest formats (paths are relative to the manifest):
+
+Text, one OBJ path per line:
+    chair_01/mesh.obj
+
+JSONL, one object per line; everything but obj_path is optional:
+    {"obj_path": "chair_01/mesh.obj", "asset_path": "/Game/Props", "asset_name": "Chair01", "blueprint_name": "Chair01BP"}
+
+A .json file holds either such lines or one JSON array of the same objects.
+
+CSV with a header row using the same column names.
+
+Example usage:
+python import_sources.py /data/hunyuan3d_outputs
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import time
+
+DEFAULT_ASSET_PATH = '/Game/Meshes'
+
+
+def iter_line_blocks(path, block_size=16 * 1024 * 1024):
+    """
+    Read a file in blocks that always end on a line boundary.
+
+    Args:
+        path (str): File to read
+        block_size (int): Approximate block size in bytes
+
+    Yields:
+        bytes: Blocks of complete lines
+    """
+    with open(path, 'rb') as f:
+        remainder = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = remainder + block
+            cut = block.rfind(b'\n') + 1
+            if cut:
+                yield block[:cut]
+            remainder = block[cut:]
+        if remainder:
+            yield remainder
+
+
+def parse_mtl(mtl_path):
+    """
+    Read a material library.
+
+    Args:
+        mtl_path (str): Path to the .mtl file
+
+    Returns:
+        dict: Material name -> {statement: value} (e.g. {'map_Kd': 'material_0.png'})
+    """
+    materials = {}
+    current = None
+    with open(mtl_path, 'r', errors='replace') as f:
+        for line in f:
+            parts = line.strip().split(None, 1)
+            if not parts or parts[0].startswith('#'):
+                continue
+            if parts[0] == 'newmtl':
+                current = materials.setdefault(parts[1] if len(parts) > 1 else '', {})
+            elif current is not None:
+                current[parts[0]] = parts[1] if len(parts) > 1 else ''
+    return materials
+
+
+def texture_paths(mtl_path):
+    """
+    List the texture files referenced by a material library.
+
+    Args:
+        mtl_path (str): Path to the .mtl file
+
+    Returns:
+        list: Absolute paths of every map_* / bump / disp / decal file, in order
+    """
+    base_dir = os.path.dirname(os.path.abspath(mtl_path))
+    paths = []
+    for statements in parse_mtl(mtl_path).values():
+        for key, value in statements.items():
+            if key.startswith('map_') or key in ('bump', 'disp', 'decal', 'refl'):
+                # Options such as "-bm 1.0" come before the file name
+                path = os.path.join(base_dir, value.split()[-1]) if value else None
+                if path and path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def material_files(obj_path):
+    """
+    Find the material libraries and textures an OBJ depends on.
+
+    Only the mtllib statements are read, so this is cheap even for large files.
+
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        tuple: (list of .mtl paths, list of texture paths); files that are
+            referenced but missing are included so callers can report them
+    """
+    base_dir = os.path.dirname(os.path.abspath(obj_path))
+    mtl_paths = []
+    for chunk in iter_line_blocks(obj_path):
+        for match in re.finditer(rb'^mtllib[ \t]+(.+?)\s*$', chunk, re.M):
+            for name in match.group(1).decode('utf-8', 'replace').split():
+                path = os.path.join(base_dir, name)
+                if path not in mtl_paths:
+                    mtl_paths.append(path)
+    textures = []
+    for mtl_path in mtl_paths:
+        if os.path.exists(mtl_path):
+            textures.extend(p for p in texture_paths(mtl_path) if p not in textures)
+    return mtl_paths, textures
+
+
+def source_files(obj_path, include_missing=False):
+    """
+    Args:
+        obj_path (str): Path to the .obj file
+        include_missing (bool): Also list referenced material files that do not exist
+
+    Returns:
+        list: Absolute paths of the OBJ and its material libraries and textures, OBJ first
+    """
+    mtl_paths, textures = material_files(obj_path)
+    return [os.path.abspath(obj_path)] + [p for p in mtl_paths + textures if include_missing or os.path.exists(p)]
+
+
+def file_hash(path):
+    """
+    Args:
+        path (str): File to hash
+
+    Returns:
+        str: Hex BLAKE2b digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_record(path):
+    """Hash and stat signature of a source file, or a marker for a missing one"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {'missing': True}
+    return {'hash': file_hash(path), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def file_records(obj_path):
+    """
+    Hash an OBJ and the material files it references, as ImportManifest records them.
+
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        dict: Absolute path -> {'hash', 'size', 'mtime_ns'}, or {'missing': True}
+            for a referenced file that does not exist
+    """
+    return {path: _file_record(path) for path in source_files(obj_path, include_missing=True)}
+
+
+def _stat_matches(path, record):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return record.get('missing', False)
+    return record.get('size') == st.st_size and record.get('mtime_ns') == st.st_mtime_ns
+
+
+class ImportManifest:
+    """
+    Records which source files (and which content hashes) each imported asset was built from.
+
+    Stored as JSON:
+        {"assets": {"/Game/Meshes/a1/mesh": {"obj_path": ..., "files": {path: {"hash", "size", "mtime_ns"}},
+                                             "blueprint_path": ..., "imported": ...}}}
+
+    A source whose files still have the recorded size and modification time is
+    unchanged without being read; otherwise its files are hashed and compared, so
+    touching a file without changing it does not trigger a re-import either.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): JSON file holding the manifest
+        """
+        self.path = path
+        self._assets = None
+
+    def _load(self):
+        if self._assets is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._assets = json.load(f).get('assets', {})
+            except (OSError, ValueError):
+                self._assets = {}
+        return self._assets
+
+    def get(self, asset):
+        """
+        Returns:
+            dict or None: The record of an asset path such as /Game/Meshes/mesh
+        """
+        return self._load().get(asset)
+
+    def assets(self):
+        """
+        Returns:
+            dict: Asset path -> record, for every asset in the manifest
+        """
+        return self._load()
+
+    def check(self, asset, obj_path, files=None):
+        """
+        Compare an OBJ and its material files against the record of an asset.
+
+        Args:
+            asset (str): Asset path, e.g. /Game/Meshes/mesh
+            obj_path (str): Source .obj file
+            files (dict): Records from file_records() computed earlier, e.g. by
+                ingest_pool; used instead of hashing the files again as long as
+                their sizes and modification times still match
+
+        Returns:
+            tuple: (changed, files) where files are the current file records to
+                pass to record() after a successful import
+        """
+        obj_path = os.path.abspath(obj_path)
+        entry = self.get(asset)
+        if entry is not None and entry.get('obj_path') == obj_path and \
+                all(_stat_matches(path, record) for path, record in entry['files'].items()):
+            return False, entry['files']
+
+        if not files or obj_path not in files or not all(_stat_matches(path, record) for path, record in files.items()):
+            files = file_records(obj_path)
+        if entry is None or entry.get('obj_path') != obj_path:
+            return True, files
+        hashes = {path: record.get('hash') for path, record in files.items()}
+        recorded = {path: record.get('hash') for path, record in entry['files'].items()}
+        return hashes != recorded, files
+
+    def record(self, asset, obj_path, files, blueprint_path=None):
+        """Remember the files an asset was imported from"""
+        self._load()[asset] = {
+            'obj_path': os.path.abspath(obj_path),
+            'files': files,
+            'blueprint_path': blueprint_path,
+            'imported': time.time(),
+        }
+
+    def remove(self, asset):
+        """Forget an asset, so that it is imported again next time"""
+        self._load().pop(asset, None)
+
+    def save(self):
+        """Write the manifest atomically"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'assets': self._load()}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def sanitize_asset_name(name):
+    """
+    Replace characters that UE5 does not allow in asset and folder names.
+
+    Args:
+        name (str): Proposed name
+
+    Returns:
+        str: Name made of letters, digits, '_' and '-'
+    """
+    name = re.sub(r'[^A-Za-z0-9_\-]', '_', name).strip('_')
+    if not name:
+        return 'Asset'
+    if name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def _source_entry(obj_path, asset_path, asset_name=None, blueprint_name=None):
+    asset_name = sanitize_asset_name(asset_name or os.path.splitext(os.path.basename(obj_path))[0])
+    return {
+        'obj_path': os.path.abspath(obj_path),
+        'asset_path': asset_path.rstrip('/'),
+        'asset_name': asset_name,
+        'blueprint_name': blueprint_name or f"{asset_name}BP",
+    }
+
+
+def scan_folder(folder, output_asset_path=DEFAULT_ASSET_PATH):
+    """
+    Find every OBJ below a folder.
+
+    Args:
+        folder (str): Folder to scan recursively
+        output_asset_path (str): Content browser path that mirrors the folder
+
+    Returns:
+        list: Source dictionaries with obj_path, asset_path, asset_name and blueprint_name
+    """
+    sources = []
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.lower().endswith('.obj'):
+                continue
+            relative = os.path.relpath(root, folder)
+            asset_path = output_asset_path.rstrip('/')
+            if relative != os.curdir:
+                asset_path += '/' + '/'.join(sanitize_asset_name(p) for p in relative.split(os.sep))
+            sources.append(_source_entry(os.path.join(root, filename), asset_path))
+    return sources
+
+
+def _manifest_rows(manifest_path):
+    """
+    Read the rows of a text, JSONL, JSON or CSV manifest.
+
+    Returns:
+        list: (where, row) pairs, where names the physical line (or the array
+            item) of the row for error messages
+    """
+    extension = os.path.splitext(manifest_path)[1].lower()
+    with open(manifest_path, 'r', newline='') as f:
+        if extension == '.csv':
+            reader = csv.DictReader(f)
+            return [(f"line {reader.line_num}", row) for row in reader]
+        text = f.read()
+
+    if extension == '.json' and text.lstrip().startswith('['):
+        try:
+            items = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"{manifest_path}: {e}")
+        if not isinstance(items, list):
+            raise ValueError(f"{manifest_path}: expected a JSON array of sources")
+        return [(f"item {number}", row) for number, row in enumerate(items, start=1)]
+
+    rows = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        where = f"line {line_number}"
+        if extension in ('.jsonl', '.json'):
+            try:
+                rows.append((where, json.loads(line)))
+            except ValueError as e:
+                raise ValueError(f"{manifest_path}: {where}: {e}")
+        else:
+            rows.append((where, {'obj_path': line.strip()}))
+    return rows
+
+
+def load_source_manifest(manifest_path, output_asset_path=DEFAULT_ASSET_PATH):
+    """
+    Read a text, JSONL, JSON or CSV manifest of OBJ files to import.
+
+    Args:
+        manifest_path (str): Path to a .txt, .jsonl, .json (lines or one array) or .csv file
+        output_asset_path (str): Content browser path for rows without asset_path
+
+    Returns:
+        list: Source dictionaries with obj_path, asset_path, asset_name and blueprint_name,
+            plus the file records of JSON rows that carry them (see ImportManifest.check)
+
+    Raises:
+        ValueError: If the file cannot be parsed or a row is invalid; the
+            message names the line
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    sources = []
+    for where, row in _manifest_rows(manifest_path):
+        if not isinstance(row, dict):
+            raise ValueError(f"{manifest_path}: {where}: expected an object, got {type(row).__name__}")
+        fields = {key: str(row.get(key) or '').strip()
+                  for key in ('obj_path', 'asset_path', 'asset_name', 'blueprint_name')}
+        if not fields['obj_path']:
+            raise ValueError(f"{manifest_path}: {where}: missing 'obj_path'")
+        entry = _source_entry(os.path.join(base_dir, fields['obj_path']), fields['asset_path'] or output_asset_path,
+                              fields['asset_name'] or None, fields['blueprint_name'] or None)
+        if isinstance(row.get('files'), dict):
+            entry['files'] = row['files']
+        sources.append(entry)
+    return sources
+
+
+def find_import_sources(source, output_asset_path=DEFAULT_ASSET_PATH):
+    """
+    Resolve a folder or manifest into the list of meshes to import.
+
+    Args:
+        source (str): Folder to scan, or a manifest file
+        output_asset_path (str): Destination content browser path
+
+    Returns:
+        list: Source dictionaries with obj_path, asset_path, asset_name and blueprint_name
+
+    Raises:
+        ValueError: If two sources would be imported to the same asset
+    """
+    if os.path.isdir(source):
+        sources = scan_folder(source, output_asset_path)
+    else:
+        sources = load_source_manifest(source, output_asset_path)
+
+    seen = {}
+    for entry in sources:
+        asset = f"{entry['asset_path']}/{entry['asset_name']}"
+        if asset in seen:
+            raise ValueError(f"{entry['obj_path']} and {seen[asset]} would both be imported as {asset}")
+        seen[asset] = entry['obj_path']
+    return sources
+
+
+def main():
+    """
+    Print the meshes a batch import would pick up and where they would go.
+    """
+    parser = argparse.ArgumentParser(description='List the OBJ files a batch import would import')
+    parser.add_argument('source', type=str, help='Folder to scan or manifest file')
+    parser.add_argument('--asset_path', type=str, default=DEFAULT_ASSET_PATH,
+                        help='Destination path in the UE5 content browser')
+    args = parser.parse_args()
+
+    try:
+        sources = find_import_sources(args.source, args.asset_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return
+    for entry in sources:
+        print(f"{entry['obj_path']} -> {entry['asset_path']}/{entry['asset_name']} ({entry['blueprint_name']})")
+    print(f"{len(sources)} meshes")
+
+
+if __name__ == "__main__":
+    main()
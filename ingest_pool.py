@@ -0,0 +1,447 @@
+"""
+Parallel Mesh Ingestion
+=======================
+
+Runs the CPU-side preprocessing of many HunYuan3D-v2 meshes outside Unreal,
+spread across all cores with a ProcessPoolExecutor, so that the editor only
+has to import finished files. Per mesh, a worker process:
+
+1. parses the OBJ (obj_loader),
+2. validates it (finite positions, indices in range, no degenerate faces),
+3. optionally decimates it (mesh_decimation) and optimizes it (mesh_optimize),
+4. writes the import-ready OBJ with its MTL and textures, optionally
+   downscaled and compressed (texture_pipeline),
+5. hashes the written files (import_sources.file_records).
+
+Meshes are submitted through a bounded window of in-flight jobs, so memory
+stays flat no matter how many files are queued, and progress is printed as
+jobs finish. The meshes that pass are listed in <output_dir>/ready.jsonl,
+a source manifest for the batch import inside UE5:
+
+    unreal_engine_import.import_obj_batch('<output_dir>/ready.jsonl')
+
+Each row carries the file hashes, so the incremental import checks the files
+against its import manifest without hashing them again in the editor.
+
+Meshes that fail validation are reported and left out of ready.jsonl.
+
+Example usage:
+python ingest_pool.py /data/hunyuan3d_outputs --output_dir /data/ready --target_triangles 5000 --optimize
+python ingest_pool.py /data/hunyuan3d_outputs --output_dir /data/ready --max_texture_size 512
+python ingest_pool.py data/result/mesh.obj --benchmark 16
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+import import_sources
+import mesh_decimation
+import mesh_optimize
+import obj_loader
+import texture_pipeline
+
+READY_MANIFEST_NAME = 'ready.jsonl'
+
+
+def validate_mesh(mesh):
+    """
+    Check a parsed mesh for problems that would break or spoil the import.
+
+    Args:
+        mesh (obj_loader.Mesh): The mesh
+
+    Returns:
+        tuple: (errors, warnings) as lists of strings; any error rejects the mesh
+    """
+    errors, warnings = [], []
+    if not mesh.face_count:
+        errors.append("no faces")
+        return errors, warnings
+    if not np.isfinite(mesh.vertices).all():
+        errors.append("non-finite vertex positions")
+    index_sets = [('position', mesh.faces, len(mesh.vertices)),
+                  ('texcoord', mesh.face_texcoords, len(mesh.texcoords)),
+                  ('normal', mesh.face_normals, len(mesh.normals))]
+    for name, indices, count in index_sets:
+        if indices is not None and len(indices) and (indices.min() < 0 or indices.max() >= count):
+            errors.append(f"{name} index out of range")
+
+    if not errors:
+        faces = mesh.faces
+        degenerate = np.count_nonzero((faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) |
+                                      (faces[:, 2] == faces[:, 0]))
+        if degenerate:
+            warnings.append(f"{degenerate} degenerate faces")
+    return errors, warnings
+
+
+def process_mesh(job):
+    """
+    Preprocess one mesh; runs in a worker process.
+
+    Args:
+        job (dict): Source dictionary from import_sources plus 'output_path',
+            'target_triangles', 'ratio', 'optimize', 'max_texture_size' and
+            'texture_format'
+
+    Returns:
+        dict: The job's source fields plus ok, errors, warnings, triangles,
+            output_path, files (import_sources.file_records of the output),
+            texture_bytes (GPU bytes before and after) and per-stage seconds
+    """
+    result = dict(job)
+    result.update({'ok': False, 'errors': [], 'warnings': [], 'stages': {}})
+    stages = result['stages']
+    start = time.perf_counter()
+    try:
+        stage_start = time.perf_counter()
+        mesh = obj_loader.load_obj(job['obj_path'])
+        stages['parse'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        result['errors'], result['warnings'] = validate_mesh(mesh)
+        stages['validate'] = time.perf_counter() - stage_start
+        if result['errors']:
+            return result
+
+        if job.get('target_triangles') or job.get('ratio'):
+            stage_start = time.perf_counter()
+            mesh, _ = mesh_decimation.decimate(mesh, target_faces=job.get('target_triangles'), ratio=job.get('ratio'))
+            stages['decimate'] = time.perf_counter() - stage_start
+
+        if job.get('optimize'):
+            stage_start = time.perf_counter()
+            mesh, _ = mesh_optimize.optimize(mesh)
+            stages['optimize'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        obj_loader.save_obj(mesh, job['output_path'], copy_materials=False)
+        output_dir = os.path.dirname(job['output_path'])
+        if job.get('max_texture_size'):
+            textures = texture_pipeline.prepare_materials(job['obj_path'], output_dir, job['max_texture_size'],
+                                                          job.get('texture_format', texture_pipeline.DEFAULT_FORMAT))
+            missing = textures['missing']
+            result['texture_bytes'] = (textures['source_gpu_bytes'], textures['output_gpu_bytes'])
+        else:
+            missing = obj_loader.copy_material_files(job['obj_path'], output_dir)
+        result['warnings'].extend(f"missing {os.path.basename(path)}" for path in missing)
+        stages['write'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        result['files'] = import_sources.file_records(job['output_path'])
+        stages['hash'] = time.perf_counter() - stage_start
+
+        result['triangles'] = mesh.face_count
+        result['ok'] = True
+    except Exception as e:
+        # A bug or a malformed file must fail this mesh, not the whole batch
+        result['errors'].append(f"{type(e).__name__}: {e}")
+    finally:
+        result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def build_jobs(sources, output_dir, target_triangles=None, ratio=None, optimize=False, max_texture_size=None,
+               texture_format=texture_pipeline.DEFAULT_FORMAT):
+    """
+    Turn import sources into worker jobs with one output folder per mesh.
+
+    Args:
+        sources (list): Source dictionaries from import_sources.find_import_sources
+        output_dir (str): Root folder for the import-ready files
+        target_triangles (int): Decimate to this many triangles (optional)
+        ratio (float): Decimate to this fraction of triangles (optional)
+        optimize (bool): Weld and reorder for vertex cache efficiency
+        max_texture_size (int): Convert base color textures to at most this size (optional)
+        texture_format (str): 'dds' or 'png' for converted textures
+
+    Returns:
+        list: Job dictionaries for process_mesh
+    """
+    jobs = []
+    for index, source in enumerate(sources):
+        job = dict(source)
+        # The asset path is unique per mesh, so it also names the output folder
+        folder = import_sources.sanitize_asset_name(f"{source['asset_path']}/{source['asset_name']}")
+        job['output_path'] = os.path.join(output_dir, f"{index:05d}_{folder}",
+                                          os.path.basename(source['obj_path']))
+        job.update({'target_triangles': target_triangles, 'ratio': ratio, 'optimize': optimize,
+                    'max_texture_size': max_texture_size, 'texture_format': texture_format})
+        jobs.append(job)
+    return jobs
+
+
+def run_pool(jobs, workers=None, max_pending=None, verbose=True):
+    """
+    Process jobs in a pool of worker processes with a bounded number in flight.
+
+    Args:
+        jobs (list): Job dictionaries from build_jobs
+        workers (int): Worker processes (default: all cores); 0 runs serially in this process
+        max_pending (int): Jobs submitted but not finished (default: 2 per worker)
+        verbose (bool): Print a progress line per finished mesh
+
+    Returns:
+        list: Results of process_mesh in job order
+    """
+    results = [None] * len(jobs)
+    start = time.perf_counter()
+
+    def report(index, result):
+        results[index] = result
+        if verbose:
+            done = sum(1 for r in results if r is not None)
+            rate = done / (time.perf_counter() - start)
+            status = 'OK' if result['ok'] else f"FAILED: {'; '.join(result['errors'])}"
+            print(f"[{done}/{len(jobs)}] {os.path.basename(os.path.dirname(result['output_path']))}: {status} "
+                  f"({result['seconds']:.2f}s, {rate:.2f} meshes/s)")
+
+    if workers == 0:
+        for index, job in enumerate(jobs):
+            report(index, process_mesh(job))
+        return results
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    queued = list(enumerate(jobs))[::-1]
+    suspects = []
+    while queued or suspects:
+        if suspects:
+            # Only a mesh that breaks a pool on its own is failed; the others were bystanders
+            index, job = suspects.pop(0)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+                try:
+                    result = executor.submit(process_mesh, job).result()
+                except BrokenProcessPool as e:
+                    result = _failed_result(job, f"BrokenProcessPool: a worker process died while "
+                                                 f"processing this mesh ({e})")
+            report(index, result)
+            continue
+
+        # A worker that dies (segfault, out of memory) breaks the whole executor: the
+        # meshes in flight are retried one by one and the rest continue in a fresh pool
+        broken = False
+        crashed = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            while True:
+                while queued and not broken and len(pending) < max_pending:
+                    index, job = queued[-1]
+                    try:
+                        pending[executor.submit(process_mesh, job)] = index
+                    except BrokenProcessPool:
+                        broken = True
+                        break
+                    queued.pop()
+                if not pending:
+                    break
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        report(index, future.result())
+                    except BrokenProcessPool:
+                        broken = True
+                        crashed.append(index)
+        if len(crashed) == 1:
+            # Nothing else was in flight, so this mesh is the one that killed the worker
+            report(crashed[0], _failed_result(jobs[crashed[0]], "BrokenProcessPool: a worker process died "
+                                                                 "while processing this mesh"))
+        else:
+            suspects = [(index, jobs[index]) for index in sorted(crashed)]
+        if broken and (suspects or queued) and verbose:
+            print(f"A worker process died; retrying {len(suspects)} in-flight meshes one at a time, "
+                  f"then restarting the pool for the remaining {len(queued)}")
+    return results
+
+
+def _failed_result(job, error):
+    """A process_mesh result for a job whose worker never returned"""
+    result = dict(job)
+    result.update({'ok': False, 'errors': [error], 'warnings': [], 'stages': {}, 'seconds': 0.0})
+    return result
+
+
+def write_ready_manifest(results, output_dir):
+    """
+    List the meshes that passed in a source manifest for the batch import.
+
+    Args:
+        results (list): Results of run_pool
+        output_dir (str): Folder holding the import-ready files
+
+    Returns:
+        str: Path of ready.jsonl
+    """
+    manifest_path = os.path.join(output_dir, READY_MANIFEST_NAME)
+    with open(manifest_path, 'w') as f:
+        for result in results:
+            if not result['ok']:
+                continue
+            f.write(json.dumps({
+                'obj_path': os.path.relpath(result['output_path'], output_dir),
+                'asset_path': result['asset_path'],
+                'asset_name': result['asset_name'],
+                'blueprint_name': result['blueprint_name'],
+                'source_obj_path': result['obj_path'],
+                'triangles': result['triangles'],
+                'files': result['files'],
+            }) + '\n')
+    return manifest_path
+
+
+def ingest(source, output_dir, workers=None, target_triangles=None, ratio=None, optimize=False,
+           asset_path=import_sources.DEFAULT_ASSET_PATH, max_texture_size=None,
+           texture_format=texture_pipeline.DEFAULT_FORMAT, verbose=True):
+    """
+    Preprocess every mesh in a folder or source manifest in parallel.
+
+    Args:
+        source (str): Folder of OBJ files or source manifest
+        output_dir (str): Root folder for the import-ready files
+        workers (int): Worker processes (default: all cores)
+        target_triangles (int): Decimate to this many triangles (optional)
+        ratio (float): Decimate to this fraction of triangles (optional)
+        optimize (bool): Weld and reorder for vertex cache efficiency
+        asset_path (str): Destination path in the UE5 content browser
+        max_texture_size (int): Convert base color textures to at most this size (optional)
+        texture_format (str): 'dds' or 'png' for converted textures
+        verbose (bool): Print progress and a summary
+
+    Returns:
+        tuple: (results, path of ready.jsonl)
+    """
+    sources = import_sources.find_import_sources(source, asset_path)
+    jobs = build_jobs(sources, output_dir, target_triangles, ratio, optimize, max_texture_size, texture_format)
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = run_pool(jobs, workers, verbose=verbose)
+    elapsed = time.perf_counter() - start
+    manifest_path = write_ready_manifest(results, output_dir)
+
+    if verbose:
+        ready = sum(1 for r in results if r['ok'])
+        for result in results:
+            for warning in result['warnings']:
+                print(f"Warning: {result['obj_path']}: {warning}")
+        texture_bytes = [r['texture_bytes'] for r in results if r.get('texture_bytes')]
+        if texture_bytes:
+            before, after = sum(b[0] for b in texture_bytes), sum(b[1] for b in texture_bytes)
+            print(f"Texture memory: {before / 2 ** 20:.1f} MB -> {after / 2 ** 20:.1f} MB "
+                  f"(saved {(before - after) / 2 ** 20:.1f} MB)")
+        print(f"{ready}/{len(results)} meshes ready in {elapsed:.2f}s "
+              f"({len(results) / elapsed if elapsed else 0:.2f} meshes/s); import list: {manifest_path}")
+    return results, manifest_path
+
+
+def make_synthetic_set(obj_path, count, folder, seed=0):
+    """
+    Write jittered copies of a mesh, each in its own <id>/ folder like HunYuan3D output.
+
+    Args:
+        obj_path (str): Mesh to copy
+        count (int): Number of copies
+        folder (str): Destination folder
+        seed (int): Random seed for the jitter
+
+    Returns:
+        str: The folder
+    """
+    mesh = obj_loader.load_obj(obj_path)
+    rng = np.random.default_rng(seed)
+    low, high = mesh.bounds()
+    jitter = float(np.linalg.norm(high - low)) * 1e-3
+    for index in range(count):
+        copy = obj_loader.Mesh(mesh.vertices + rng.normal(0, jitter, mesh.vertices.shape), mesh.faces,
+                               texcoords=mesh.texcoords, normals=mesh.normals,
+                               face_texcoords=mesh.face_texcoords, face_normals=mesh.face_normals,
+                               face_materials=mesh.face_materials, material_names=mesh.material_names,
+                               mtllibs=mesh.mtllibs, source_path=mesh.source_path)
+        obj_loader.save_obj(copy, os.path.join(folder, f"mesh_{index:04d}", os.path.basename(obj_path)))
+    return folder
+
+
+def benchmark(obj_path, count=16, workers=None, target_triangles=None, ratio=0.25, optimize=False):
+    """
+    Compare the serial path with the process pool on synthetic copies of a mesh.
+
+    Args:
+        obj_path (str): Mesh to derive the synthetic set from
+        count (int): Number of synthetic meshes
+        workers (int): Worker processes for the parallel run (default: all cores)
+        target_triangles (int): Decimation budget per mesh (optional)
+        ratio (float): Decimation ratio per mesh, used if target_triangles is None
+        optimize (bool): Run the optimization stage as well
+
+    Returns:
+        dict: Seconds and meshes/sec of the 'serial' and 'parallel' runs
+    """
+    workers = workers or os.cpu_count() or 1
+    root = tempfile.mkdtemp(prefix='hunyuan3d_ingest_')
+    try:
+        print(f"Writing {count} synthetic meshes derived from {obj_path}...")
+        source = make_synthetic_set(obj_path, count, os.path.join(root, 'source'))
+        timings = {}
+        for name, pool_workers in [('serial', 0), ('parallel', workers)]:
+            sources = import_sources.find_import_sources(source)
+            jobs = build_jobs(sources, os.path.join(root, name), target_triangles, ratio, optimize)
+            start = time.perf_counter()
+            results = run_pool(jobs, pool_workers, verbose=False)
+            elapsed = time.perf_counter() - start
+            failed = sum(1 for r in results if not r['ok'])
+            timings[name] = {'seconds': elapsed, 'meshes_per_second': count / elapsed, 'failed': failed}
+            label = 'serial' if pool_workers == 0 else f"{pool_workers} workers"
+            print(f"{label:>12}: {elapsed:7.2f}s  {count / elapsed:6.2f} meshes/s  ({failed} failed)")
+        print(f"Speedup: {timings['serial']['seconds'] / timings['parallel']['seconds']:.2f}x "
+              f"on {os.cpu_count()} cores")
+        return timings
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    """
+    Preprocess a folder of meshes in parallel, or benchmark the pool.
+    """
+    parser = argparse.ArgumentParser(description='Preprocess many meshes in parallel before importing them into UE5')
+    parser.add_argument('source', type=str,
+                        help='Folder of OBJ files or source manifest (an OBJ file with --benchmark)')
+    parser.add_argument('--output_dir', type=str, help='Folder for the import-ready files')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores)')
+    parser.add_argument('--target_triangles', type=int, help='Decimate every mesh to this many triangles')
+    parser.add_argument('--ratio', type=float, help='Decimate every mesh to this fraction of triangles')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Weld positions and reorder triangles for vertex cache efficiency')
+    parser.add_argument('--max_texture_size', type=int,
+                        help='Downscale base color textures to this power-of-two size and drop unused alpha')
+    parser.add_argument('--texture_format', choices=texture_pipeline.FORMATS, default=texture_pipeline.DEFAULT_FORMAT,
+                        help='Format of converted textures (default: dds with pre-built mips)')
+    parser.add_argument('--asset_path', type=str, default=import_sources.DEFAULT_ASSET_PATH,
+                        help='Destination path in the UE5 content browser')
+    parser.add_argument('--benchmark', type=int, metavar='COUNT',
+                        help='Compare serial and parallel preprocessing on COUNT synthetic copies of the source OBJ')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.source, args.benchmark, args.workers, args.target_triangles,
+                  args.ratio if args.ratio or args.target_triangles else 0.25, args.optimize)
+        return
+    if not args.output_dir:
+        parser.error("--output_dir is required unless --benchmark is given")
+    try:
+        ingest(args.source, args.output_dir, args.workers, args.target_triangles, args.ratio, args.optimize,
+               args.asset_path, args.max_texture_size, args.texture_format)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
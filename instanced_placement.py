@@ -0,0 +1,207 @@
+"""
+Instanced Placement
+===================
+
+Places many copies of the same mesh as instances of one
+InstancedStaticMeshComponent instead of one actor per copy. 500 copies placed
+with place-batch are 500 actors, each its own draw call source; placed here
+they are one actor whose instances are drawn together.
+
+Instanced blueprints are created at import time with
+import_obj_to_uasset(..., instanced=True) (or demo.import_to_ue5(..., instanced=True)),
+which adds <BlueprintName>Instanced next to the regular blueprint.
+
+UnrealCV can only call functions on actors, not on their components, so the
+instances are added through the editor's Python API: run this in the UE5
+Python console while the game is running in the editor (Play In Editor) to
+place into the running game, or without PIE to place into the editor level.
+It reads the same JSONL/CSV manifests as place-batch; rows are grouped by
+blueprint, each group spawns one actor and all of its transforms are added in
+a single add_instances call. A row's blueprint may be the regular blueprint
+(its Instanced sibling is used) or an instanced blueprint.
+
+Usage in the UE5 Python console:
+    import instanced_placement
+    instanced_placement.place_manifest_instanced('/path/to/placements.jsonl')
+
+Compare with per-actor spawning of the same manifest:
+python hunyuan3d_ue5_demo.py --action place-batch --manifest placements.jsonl
+"""
+import unreal
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import batch_placement
+import unreal_engine_import
+
+
+def target_world():
+    """
+    Returns:
+        tuple: (world, True if it is the running PIE game world)
+    """
+    subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+    world = subsystem.get_game_world()
+    if world is not None:
+        return world, True
+    return subsystem.get_editor_world(), False
+
+
+def resolve_instanced_blueprint(blueprint_path):
+    """
+    Find the instanced blueprint for a manifest row.
+
+    Args:
+        blueprint_path (str): Regular or instanced blueprint path, with or without the _C class suffix
+
+    Returns:
+        str: Asset path of the instanced blueprint
+    """
+    blueprint_path = blueprint_path.split('.')[0]
+    if blueprint_path.endswith('_C'):
+        blueprint_path = blueprint_path[:-2]
+    if blueprint_path.endswith(unreal_engine_import.INSTANCED_SUFFIX):
+        return blueprint_path
+    instanced_path = unreal_engine_import.instanced_blueprint_name(blueprint_path)
+    if unreal.EditorAssetLibrary.does_asset_exist(instanced_path):
+        return instanced_path
+    return blueprint_path
+
+
+def make_transform(placement):
+    """
+    Args:
+        placement (dict): Placement from batch_placement.load_manifest
+
+    Returns:
+        unreal.Transform: The placement's location, rotation and scale
+    """
+    pitch, yaw, roll = placement['rotation'] or (0.0, 0.0, 0.0)
+    scale = placement['scale'] or (1.0, 1.0, 1.0)
+    return unreal.Transform(location=unreal.Vector(*placement['location']),
+                            rotation=unreal.Rotator(roll=roll, pitch=pitch, yaw=yaw),
+                            scale=unreal.Vector(*scale))
+
+
+def _spawn_actor(world, actor_class, in_game):
+    """Spawn an actor at the origin of the editor level or the running game"""
+    if in_game:
+        transform = unreal.Transform()
+        actor = unreal.GameplayStatics.begin_deferred_actor_spawn_from_class(world, actor_class, transform)
+        return unreal.GameplayStatics.finish_spawning_actor(actor, transform) if actor else None
+    return unreal.get_editor_subsystem(unreal.EditorActorSubsystem).spawn_actor_from_class(
+        actor_class, unreal.Vector(0, 0, 0))
+
+
+def place_instances(blueprint_path, placements, label=None):
+    """
+    Spawn one actor of an instanced blueprint and add every placement as an instance.
+
+    Args:
+        blueprint_path (str): Instanced blueprint asset path
+        placements (list): Placement dictionaries (see batch_placement.load_manifest)
+        label (str): Actor label in the editor level (default: <blueprint>_Instances)
+
+    Returns:
+        dict: blueprint, actor (name or None), instances, ok, error and seconds
+    """
+    result = {'blueprint': blueprint_path, 'actor': None, 'instances': 0, 'ok': False, 'error': '', 'seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        actor_class = unreal.EditorAssetLibrary.load_blueprint_class(blueprint_path)
+        if actor_class is None:
+            result['error'] = f"blueprint {blueprint_path} not found"
+            return result
+
+        world, in_game = target_world()
+        actor = _spawn_actor(world, actor_class, in_game)
+        if actor is None:
+            result['error'] = "spawn failed"
+            return result
+        component = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+        if component is None:
+            actor.destroy_actor()
+            result['error'] = ("blueprint has no InstancedStaticMeshComponent; import with instanced=True "
+                               "to create one")
+            return result
+        if not in_game:
+            actor.set_actor_label(label or f"{blueprint_path.rsplit('/', 1)[-1]}_Instances")
+
+        # One call for every transform instead of one per instance
+        component.add_instances([make_transform(p) for p in placements], False)
+        result.update({'actor': actor.get_name(), 'instances': component.get_instance_count(), 'ok': True})
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def print_results(results, elapsed):
+    """
+    Print one line per instanced actor followed by the overall throughput.
+
+    Args:
+        results (list): Results returned by place_instances
+        elapsed (float): Wall-clock seconds spent placing
+    """
+    print(f"\n{'Blueprint':<48} {'Actor':<32} {'Instances':>9} {'Time':>9}  Result")
+    print("-" * 110)
+    for result in results:
+        status = 'OK' if result['ok'] else f"FAILED: {result['error']}"
+        print(f"{result['blueprint']:<48} {result['actor'] or '-':<32} {result['instances']:>9} "
+              f"{result['seconds']:>8.3f}s  {status}")
+    instances = sum(r['instances'] for r in results)
+    actors = sum(1 for r in results if r['ok'])
+    rate = instances / elapsed if elapsed > 0 else float('inf')
+    print("-" * 110)
+    print(f"Placed {instances} instances with {actors} actors in {elapsed:.3f}s ({rate:.1f} instances/sec)")
+
+
+def place_manifest_instanced(manifest_path):
+    """
+    Place every row of a placement manifest as an instance, one actor per blueprint.
+
+    Args:
+        manifest_path (str): Path to a JSONL or CSV manifest (same format as place-batch)
+
+    Returns:
+        list: Results of place_instances, one per blueprint
+    """
+    try:
+        placements = batch_placement.assign_locations(batch_placement.load_manifest(manifest_path))
+    except (OSError, ValueError) as e:
+        print(f"Error reading manifest: {e}")
+        return []
+    if not placements:
+        print(f"Manifest {manifest_path} contains no placements")
+        return []
+
+    groups = {}
+    for placement in placements:
+        groups.setdefault(resolve_instanced_blueprint(placement['blueprint']), []).append(placement)
+    world, in_game = target_world()
+    print(f"Placing {len(placements)} instances of {len(groups)} blueprints into the "
+          f"{'running game' if in_game else 'editor level'} ({world.get_name()})")
+
+    start = time.perf_counter()
+    results = [place_instances(blueprint_path, group) for blueprint_path, group in groups.items()]
+    print_results(results, time.perf_counter() - start)
+    return results
+
+
+def main():
+    """
+    Place a manifest as instances; for UnrealEditor-Cmd -run=pythonscript.
+    """
+    parser = argparse.ArgumentParser(description='Place a manifest as InstancedStaticMesh instances')
+    parser.add_argument('manifest', type=str, help='JSONL or CSV placement manifest')
+    args = parser.parse_args()
+    place_manifest_instanced(args.manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Binary Mesh Cache
+=================
+
+Stores parsed OBJ meshes as .npy arrays on disk so that repeat loads of the
+same HunYuan3D result skip text parsing entirely. Entries are keyed by a
+content hash of the .obj file together with its .mtl files and textures, and
+are loaded with np.load(mmap_mode='r'): the arrays are memory-mapped, so a
+cache hit costs a few file opens rather than a copy of the data.
+
+To avoid re-reading every source file on each lookup, the last known
+(size, mtime) of the inputs is remembered per path; the content hash is only
+recomputed when one of them changes.
+
+The cache lives in ~/.cache/hunyuan3d_ue5/meshes (set HUNYUAN3D_CACHE_DIR to
+move it) and is bounded in size; the least recently used entries are evicted
+first.
+
+Example usage:
+python mesh_cache.py data/result/mesh.obj --benchmark
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+import import_sources
+import obj_loader
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('HUNYUAN3D_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'hunyuan3d_ue5')),
+    'meshes')
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+ARRAY_NAMES = ('vertices', 'texcoords', 'normals', 'faces', 'face_texcoords', 'face_normals', 'face_materials')
+FORMAT_VERSION = 1
+
+
+def content_hash(paths):
+    """
+    Hash the contents of several files into one key.
+
+    Args:
+        paths (list): Files to hash; the OBJ must come first
+
+    Returns:
+        str: Hex digest that changes whenever any file's bytes change
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"format{FORMAT_VERSION}".encode())
+    for index, path in enumerate(paths):
+        # Sidecar files are identified by name, since the OBJ/MTL refer to them by name
+        digest.update(b'\0' + (b'obj' if index == 0 else os.path.basename(path).encode('utf-8')) + b'\0')
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _stat_signature(paths):
+    signature = []
+    for path in paths:
+        st = os.stat(path)
+        signature.append([path, st.st_size, st.st_mtime_ns])
+    return signature
+
+
+def _directory_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+class MeshCache:
+    """
+    A size-bounded, memory-mapped on-disk cache of parsed meshes.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_bytes (int): Evict least recently used entries above this total size
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._index_path = os.path.join(cache_dir, 'index.json')
+        self._index = None
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(self._index_path, 'r') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def key_for(self, obj_path):
+        """
+        Get the content key of an OBJ and its material files.
+
+        Args:
+            obj_path (str): Path to the .obj file
+
+        Returns:
+            str: The cache key
+        """
+        obj_path = os.path.abspath(obj_path)
+        entry = self._load_index().get(obj_path)
+        if entry is not None:
+            try:
+                if _stat_signature([s[0] for s in entry['files']]) == entry['files']:
+                    return entry['key']
+            except OSError:
+                pass
+
+        paths = import_sources.source_files(obj_path)
+        key = content_hash(paths)
+        self._index[obj_path] = {'key': key, 'files': _stat_signature(paths)}
+        try:
+            self._save_index()
+        except OSError:
+            pass
+        return key
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key):
+        """
+        Load a cached mesh with memory-mapped arrays.
+
+        Args:
+            key (str): Cache key from key_for()
+
+        Returns:
+            obj_loader.Mesh or None: The mesh, or None on a cache miss
+        """
+        entry_dir = self._entry_dir(key)
+        meta_path = os.path.join(entry_dir, 'meta.json')
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            arrays = {name: np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode='r')
+                      for name in meta['arrays']}
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Record the access for LRU eviction
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return obj_loader.Mesh(material_names=meta['material_names'], mtllibs=meta['mtllibs'],
+                               source_path=meta['source_path'], **arrays)
+
+    def put(self, key, mesh):
+        """
+        Store a mesh under a key, then evict old entries if the cache is too large.
+
+        Args:
+            key (str): Cache key from key_for()
+            mesh (obj_loader.Mesh): The parsed mesh
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_dir = self._entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir)
+        stored = []
+        for name in ARRAY_NAMES:
+            array = getattr(mesh, name)
+            if array is not None:
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(array))
+                stored.append(name)
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump({
+                'arrays': stored,
+                'material_names': mesh.material_names,
+                'mtllibs': mesh.mtllibs,
+                'source_path': mesh.source_path,
+                'created': time.time(),
+            }, f)
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict()
+
+    def load(self, obj_path):
+        """
+        Load an OBJ through the cache, parsing and storing it on a miss.
+
+        Args:
+            obj_path (str): Path to the .obj file
+
+        Returns:
+            obj_loader.Mesh: The mesh; arrays are read-only memory maps, unless the
+                mesh alone is larger than max_bytes and is not kept in the cache
+        """
+        key = self.key_for(obj_path)
+        mesh = self.get(key)
+        if mesh is None:
+            parsed = obj_loader.load_obj(obj_path)
+            self.put(key, parsed)
+            # put() evicts down to max_bytes, which can take the entry it just wrote
+            mesh = self.get(key)
+            if mesh is None:
+                mesh = parsed
+        return mesh
+
+    def entries(self):
+        """
+        Returns:
+            list: (last access time, size in bytes, key) of every entry, oldest first
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for key in os.listdir(self.cache_dir):
+            entry_dir = self._entry_dir(key)
+            meta_path = os.path.join(entry_dir, 'meta.json')
+            if key.startswith('.') or not os.path.exists(meta_path):
+                continue
+            entries.append((os.path.getmtime(meta_path), _directory_size(entry_dir), key))
+        return sorted(entries)
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries removed
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Delete every cache entry and the path index"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._index = None
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """Return the process-wide cache backed by DEFAULT_CACHE_DIR"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MeshCache()
+    return _default_cache
+
+
+def load_mesh_cached(obj_path, cache=None):
+    """
+    Load an OBJ, reusing the parsed arrays from a previous run when possible.
+
+    Args:
+        obj_path (str): Path to the .obj file
+        cache (MeshCache): Cache to use (default: the shared on-disk cache)
+
+    Returns:
+        obj_loader.Mesh: The mesh; arrays are read-only memory maps
+    """
+    return (cache or get_default_cache()).load(obj_path)
+
+
+def main():
+    """
+    Load an OBJ through the cache and optionally compare against text parsing.
+    """
+    parser = argparse.ArgumentParser(description='Load an OBJ through the binary mesh cache')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    parser.add_argument('--cache_dir', type=str, default=DEFAULT_CACHE_DIR,
+                        help='Cache directory')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare a warm cache load against parsing the text')
+    parser.add_argument('--clear', action='store_true',
+                        help='Delete the cache before loading')
+    args = parser.parse_args()
+
+    cache = MeshCache(args.cache_dir)
+    if args.clear:
+        cache.clear()
+
+    start = time.perf_counter()
+    mesh = cache.load(args.obj_path)
+    print(f"{mesh} loaded in {(time.perf_counter() - start) * 1000:.2f} ms")
+    print(f"Cache: {len(cache.entries())} entries in {cache.cache_dir}")
+
+    if args.benchmark:
+        repeat = 5
+        parse_time = min(_timed(obj_loader.load_obj, args.obj_path) for _ in range(repeat))
+        # A fresh MeshCache each time, like a new process, but with the path index on disk
+        cached_time = min(_timed(lambda p: MeshCache(args.cache_dir).load(p), args.obj_path) for _ in range(repeat))
+        print(f"Text parse:  {parse_time * 1000:8.2f} ms")
+        print(f"Cache hit:   {cached_time * 1000:8.2f} ms  ({parse_time / cached_time:.1f}x faster)")
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
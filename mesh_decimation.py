@@ -0,0 +1,592 @@
+"""
+Mesh Decimation
+===============
+
+Reduces a HunYuan3D-v2 mesh to a triangle budget before it is imported into
+UE5, using quadric error metric (QEM) edge collapses. The bundled 40k-triangle
+result is far more detail than a prop spawned dozens of times at runtime needs.
+
+Collapses are half-edge collapses (a vertex is merged into one of its
+neighbours, which keeps its position and UV), so no new attribute values are
+ever invented. UV seams are preserved:
+
+- A vertex that lies on a seam or open border only collapses along that seam,
+  and every copy of it on the other side of the seam collapses into the
+  matching copy of the target in the same step, so the seam stays closed.
+- Seam and border edges add constraint planes to the quadrics so that their
+  shape is kept as well.
+- Vertices on material borders or non-manifold edges are never moved.
+
+The collapses are applied in passes. Each pass scores every candidate with
+NumPy, then applies the cheapest collapses whose neighbourhoods do not
+overlap, all at once. Two errors are reported: the RMS distance of each
+remaining vertex to the original triangle planes merged into it, and the
+distance of each original vertex to the reduced surface around the vertex it
+was merged into.
+
+Example usage:
+python mesh_decimation.py data/result/mesh.obj --target_triangles 5000
+python mesh_decimation.py data/result/mesh.obj --ratio 0.25 --output data/result/mesh_lod.obj
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+import mesh_cache
+import obj_loader
+
+# Weight of the constraint planes along seams and open borders, relative to face quadrics
+BOUNDARY_WEIGHT = 10.0
+# Fraction of the cheapest candidates considered in each pass; lower is closer to a
+# strictly greedy order, higher needs fewer passes
+POOL_FRACTION = 0.25
+MIN_POOL = 64
+# Reject collapses that turn a neighbouring face's normal by more than ~80 degrees
+MIN_NORMAL_COS = 0.2
+
+
+def _plane_quadrics(normals, points, weights):
+    """Build one 4x4 quadric per plane n.x + d = 0, scaled by weight"""
+    planes = np.concatenate([normals, -np.einsum('ij,ij->i', normals, points)[:, None]], axis=1)
+    return weights[:, None, None] * planes[:, :, None] * planes[:, None, :]
+
+
+def _quadric_error(quadrics, points):
+    """Evaluate p^T Q p for homogeneous points"""
+    homogeneous = np.concatenate([points, np.ones((len(points), 1))], axis=1)
+    return np.maximum(np.einsum('ni,nij,nj->n', homogeneous, quadrics, homogeneous), 0.0)
+
+
+def _face_normals(points):
+    """Unnormalized normals of (F, 3, 3) triangles"""
+    return np.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0])
+
+
+def _point_triangle_distance(points, triangles):
+    """
+    Distance from each point to the matching (3, 3) triangle.
+
+    Finds the closest point by the barycentric region tests from Ericson,
+    Real-Time Collision Detection, section 5.1.5, for all pairs at once.
+    """
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac, ap = b - a, c - a, points - a
+    bp, cp = points - b, points - c
+
+    def dot(u, v):
+        return np.einsum('ij,ij->i', u, v)
+
+    d1, d2 = dot(ab, ap), dot(ac, ap)
+    d3, d4 = dot(ab, bp), dot(ac, bp)
+    d5, d6 = dot(ab, cp), dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Inside the face by default
+        denominator = va + vb + vc
+        v = vb / denominator
+        w = vc / denominator
+        closest = a + ab * v[:, None] + ac * w[:, None]
+
+        regions = [
+            (d1 <= 0) & (d2 <= 0), a,
+            (d3 >= 0) & (d4 <= d3), b,
+            (d6 >= 0) & (d5 <= d6), c,
+        ]
+        edge_ab = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        edge_ac = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        edge_bc = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        on_ab = a + ab * (d1 / (d1 - d3))[:, None]
+        on_ac = a + ac * (d2 / (d2 - d6))[:, None]
+        on_bc = b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, None]
+
+    # Later assignments win, so the vertex regions are applied last
+    for mask, point in [(edge_bc, on_bc), (edge_ac, on_ac), (edge_ab, on_ab)] + \
+            [(regions[i], regions[i + 1]) for i in (4, 2, 0)]:
+        closest[mask] = point[mask]
+    distance = np.linalg.norm(points - closest, axis=1)
+    # Degenerate triangles: fall back to the nearest corner
+    corners = np.min(np.linalg.norm(points[:, None] - triangles, axis=2), axis=1)
+    return np.where(np.isfinite(distance), distance, corners)
+
+
+def _signed_uv_area(uvs):
+    """Twice the signed area of (F, 3, 2) UV triangles"""
+    first, second = uvs[:, 1] - uvs[:, 0], uvs[:, 2] - uvs[:, 0]
+    return first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]
+
+
+class _Decimator:
+    """State of one decimation run; vertex ids are render vertices, groups are distinct positions"""
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.corners, faces = obj_loader.render_vertices(mesh)
+        self.vertex_count = len(self.corners)
+
+        # Seam copies of a vertex share a position group
+        positions, group_of_v = np.unique(np.asarray(mesh.vertices, np.float64), axis=0, return_inverse=True)
+        self.group = group_of_v.reshape(-1)[self.corners[:, 0]]
+        self.group_positions = positions
+        self.group_count = len(positions)
+        self.uvs = None
+        if mesh.face_texcoords is not None:
+            self.uvs = np.asarray(mesh.texcoords, np.float64)[self.corners[:, 1]]
+
+        # Drop faces that are already degenerate
+        keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+        self.faces = faces[keep]
+        self.materials = np.asarray(mesh.face_materials)[keep]
+
+        self.locked = self._locked_groups()
+        self.quadrics, self.plain_quadrics, self.plane_counts = self._initial_quadrics()
+        self.group_map = np.arange(self.group_count)
+
+    def _edges(self):
+        """
+        Returns:
+            tuple: (unique undirected edges (E, 2), faces per edge, edge index of each face side (F, 3))
+        """
+        faces = self.faces
+        sides = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+        keys = np.sort(sides, axis=1)
+        keys = keys[:, 0] * self.vertex_count + keys[:, 1]
+        unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        edges = np.stack([unique // self.vertex_count, unique % self.vertex_count], axis=1)
+        return edges, counts, inverse.reshape(-1, 3)
+
+    def _locked_groups(self):
+        """Lock positions on material borders and non-manifold edges"""
+        locked = np.zeros(self.group_count, bool)
+        edges, counts, _ = self._edges()
+        locked[self.group[edges[counts > 2].ravel()]] = True
+
+        if len(self.materials) and self.materials.min() != self.materials.max():
+            corner_groups = self.group[self.faces.ravel()]
+            corner_materials = np.repeat(self.materials.astype(np.int64), 3)
+            low = np.full(self.group_count, np.iinfo(np.int64).max)
+            high = np.full(self.group_count, -1)
+            np.minimum.at(low, corner_groups, corner_materials)
+            np.maximum.at(high, corner_groups, corner_materials)
+            locked |= (high >= 0) & (low != high)
+        return locked
+
+    def _initial_quadrics(self):
+        points = self.group_positions[self.group[self.faces]]
+        normals = _face_normals(points)
+        lengths = np.linalg.norm(normals, axis=1)
+        valid = lengths > 0
+        unit = np.zeros_like(normals)
+        unit[valid] = normals[valid] / lengths[valid, None]
+
+        # Area-weighted quadrics drive the collapse order
+        face_q = _plane_quadrics(unit, points[:, 0], lengths * 0.5)
+        quadrics = np.zeros((self.group_count, 4, 4))
+        for corner in range(3):
+            np.add.at(quadrics, self.group[self.faces[:, corner]], face_q)
+
+        # Unweighted planes measure the RMS distance to the original surface
+        plain_q = _plane_quadrics(unit, points[:, 0], valid.astype(np.float64))
+        plain_quadrics = np.zeros((self.group_count, 4, 4))
+        plane_counts = np.zeros(self.group_count)
+        for corner in range(3):
+            np.add.at(plain_quadrics, self.group[self.faces[:, corner]], plain_q)
+            np.add.at(plane_counts, self.group[self.faces[:, corner]], valid)
+
+        # Constraint planes through seam and border edges, perpendicular to their face
+        edges, counts, side_edges = self._edges()
+        border = counts[side_edges] == 1
+        face_index, side = np.nonzero(border)
+        if len(face_index):
+            start = self.group_positions[self.group[self.faces[face_index, side]]]
+            end = self.group_positions[self.group[self.faces[face_index, (side + 1) % 3]]]
+            direction = end - start
+            perpendicular = np.cross(direction, unit[face_index])
+            length = np.linalg.norm(perpendicular, axis=1)
+            ok = length > 0
+            perpendicular[ok] /= length[ok, None]
+            weights = BOUNDARY_WEIGHT * np.einsum('ij,ij->i', direction, direction) * ok
+            edge_q = _plane_quadrics(perpendicular, start, weights)
+            np.add.at(quadrics, self.group[self.faces[face_index, side]], edge_q)
+            np.add.at(quadrics, self.group[self.faces[face_index, (side + 1) % 3]], edge_q)
+        return quadrics, plain_quadrics, plane_counts
+
+    def _candidates(self):
+        """
+        Find valid group collapses gA -> gB and pick the cheapest target for each gA.
+
+        Returns:
+            tuple: (half-edges (a, b) per render vertex, pair id per half-edge,
+                source groups, target groups and costs of the chosen pairs)
+        """
+        edges, counts, _ = self._edges()
+        n = self.vertex_count
+        on_border = np.zeros(n, bool)
+        on_border[edges[counts == 1].ravel()] = True
+
+        a = np.concatenate([edges[:, 0], edges[:, 1]])
+        b = np.concatenate([edges[:, 1], edges[:, 0]])
+        edge_counts = np.concatenate([counts, counts])
+        ga, gb = self.group[a], self.group[b]
+
+        # A seam or border vertex may only slide along a seam or border edge
+        valid = ~self.locked[ga] & (ga != gb) & (edge_counts <= 2)
+        valid &= ~on_border[a] | (edge_counts == 1)
+
+        # Each copy of gA needs exactly one neighbour in gB to merge into
+        vertex_target, per_vertex = np.unique(a * self.group_count + gb, return_inverse=True, return_counts=True)[1:]
+        valid &= per_vertex[vertex_target] == 1
+
+        alive = np.zeros(n, bool)
+        alive[self.faces.ravel()] = True
+        group_sizes = np.bincount(self.group[alive], minlength=self.group_count)
+
+        pair_keys, pair_of_he = np.unique(ga * self.group_count + gb, return_inverse=True)
+        pair_total = np.bincount(pair_of_he)
+        pair_valid = np.bincount(pair_of_he, weights=valid)
+        pair_a = pair_keys // self.group_count
+        pair_b = pair_keys % self.group_count
+        ok = (pair_valid == pair_total) & (pair_total == group_sizes[pair_a])
+
+        pair_ids = np.flatnonzero(ok)
+        costs = _quadric_error(self.quadrics[pair_a[pair_ids]] + self.quadrics[pair_b[pair_ids]],
+                               self.group_positions[pair_b[pair_ids]])
+        # Keep only the cheapest target of each source group
+        order = np.lexsort((costs, pair_a[pair_ids]))
+        first = np.ones(len(order), bool)
+        first[1:] = pair_a[pair_ids[order[1:]]] != pair_a[pair_ids[order[:-1]]]
+        chosen = pair_ids[order[first]]
+        chosen_costs = costs[order[first]]
+        return a, b, pair_of_he, chosen, pair_a[chosen], pair_b[chosen], chosen_costs
+
+    def _rejected(self, source, dest, member_a, member_b, member_candidate):
+        """
+        Check the link condition of the group collapses source -> dest and the face
+        flips caused by their render-level collapses a -> b.
+
+        Returns:
+            np.ndarray: True for every candidate that must not be collapsed this pass
+        """
+        n = self.vertex_count
+        rejected = np.zeros(len(source), bool)
+        target = np.full(n, -1)
+        target[member_a] = member_b
+        candidate_of = np.full(n, -1)
+        candidate_of[member_a] = member_candidate
+
+        # Link condition, checked on positions so that the other side of a seam counts
+        # too: gA and gB may only share the neighbours opposite their common edge
+        g = self.group_count
+        group_faces = self.group[self.faces]
+        sides = np.stack([group_faces, np.roll(group_faces, -1, axis=1)], axis=2).reshape(-1, 2)
+        sides = np.sort(sides, axis=1)
+        edge_keys, shared = np.unique(sides[:, 0] * g + sides[:, 1], return_counts=True)
+        src = np.concatenate([edge_keys // g, edge_keys % g])
+        dst = np.concatenate([edge_keys % g, edge_keys // g])
+        directed_keys = np.sort(src * g + dst)
+        group_target = np.full(g, -1)
+        group_target[source] = dest
+        from_source = group_target[src] >= 0
+        probe = group_target[src[from_source]] * g + dst[from_source]
+        found = directed_keys[np.minimum(np.searchsorted(directed_keys, probe), len(directed_keys) - 1)] == probe
+        common = np.bincount(src[from_source][found], minlength=g)[source]
+        expected = shared[np.searchsorted(edge_keys, np.minimum(source, dest) * g + np.maximum(source, dest))]
+        rejected[common != expected] = True
+
+        # Faces around a that survive the collapse must not flip, in 3D or in UV space
+        face_index, corner = np.nonzero(target[self.faces] >= 0)
+        faces = self.faces[face_index]
+        moved_to = target[faces[np.arange(len(faces)), corner]]
+        survives = ~np.any(faces == moved_to[:, None], axis=1)
+        face_index, corner, faces, moved_to = (face_index[survives], corner[survives], faces[survives],
+                                               moved_to[survives])
+        owner = candidate_of[faces[np.arange(len(faces)), corner]]
+        new_faces = faces.copy()
+        new_faces[np.arange(len(faces)), corner] = moved_to
+
+        before = _face_normals(self.group_positions[self.group[faces]])
+        after = _face_normals(self.group_positions[self.group[new_faces]])
+        before_length = np.linalg.norm(before, axis=1)
+        after_length = np.linalg.norm(after, axis=1)
+        cos = np.einsum('ij,ij->i', before, after) / np.maximum(before_length * after_length, 1e-300)
+        flipped = (before_length > 0) & (cos < MIN_NORMAL_COS)
+
+        if self.uvs is not None:
+            uv_before, uv_after = self.uvs[faces], self.uvs[new_faces]
+            area_before = _signed_uv_area(uv_before)
+            area_after = _signed_uv_area(uv_after)
+            flipped |= (area_before != 0) & (area_before * area_after <= 0)
+        rejected[owner[flipped]] = True
+        return rejected
+
+    def run_pass(self, faces_to_remove):
+        """
+        Apply one round of non-overlapping collapses.
+
+        Args:
+            faces_to_remove (int): Stop once this many faces have been removed
+
+        Returns:
+            int: Number of position groups collapsed
+        """
+        a, b, pair_of_he, chosen, source, dest, costs = self._candidates()
+        if not len(chosen):
+            return 0
+
+        # Only the cheapest part of the candidates competes in this pass
+        order = np.argsort(costs, kind='stable')
+        pool = order[:max(MIN_POOL, int(np.ceil(len(order) * POOL_FRACTION)))]
+        candidate_count = len(pool)
+        pool_pairs = np.full(pair_of_he.max() + 1, -1)
+        pool_pairs[chosen[pool]] = np.arange(candidate_count)
+        member = pool_pairs[pair_of_he]
+        in_pool = member >= 0
+        member_a, member_b, member_candidate = a[in_pool], b[in_pool], member[in_pool]
+
+        rejected = self._rejected(source[pool], dest[pool], member_a, member_b, member_candidate)
+
+        # Rank is the priority; a candidate wins if it has the best rank on every
+        # position touched by the faces around its vertices
+        n = self.vertex_count
+        candidate_of = np.full(n, -1)
+        candidate_of[member_a] = member_candidate
+        face_index, corner = np.nonzero(candidate_of[self.faces] >= 0)
+        owner = candidate_of[self.faces[face_index, corner]]
+        touched_groups = self.group[self.faces[face_index]]
+        owners = np.repeat(owner, 3)
+        touched = touched_groups.ravel()
+        live = ~rejected[owners]
+        rank = np.arange(candidate_count)
+        best = np.full(self.group_count, candidate_count)
+        np.minimum.at(best, touched[live], rank[owners[live]])
+        losing = np.zeros(candidate_count, bool)
+        losing[owners[best[touched] != owners]] = True
+        selected = ~rejected & ~losing
+
+        # Faces removed by each collapse: the ones containing both a and b
+        target = np.full(n, -1)
+        target[member_a] = member_b
+        removed = np.any(self.faces[face_index] == target[self.faces[face_index, corner]][:, None], axis=1)
+        removed_per_candidate = np.bincount(owner[removed], minlength=candidate_count)
+
+        winners = np.flatnonzero(selected)
+        cumulative = np.cumsum(removed_per_candidate[winners])
+        winners = winners[:np.searchsorted(cumulative, faces_to_remove) + 1]
+        if not len(winners):
+            return 0
+
+        apply = np.isin(member_candidate, winners)
+        remap = np.arange(n)
+        remap[member_a[apply]] = member_b[apply]
+        faces = remap[self.faces]
+        keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+        self.faces = faces[keep]
+        self.materials = self.materials[keep]
+
+        group_a, group_b = source[pool[winners]], dest[pool[winners]]
+        self.quadrics[group_b] += self.quadrics[group_a]
+        self.plain_quadrics[group_b] += self.plain_quadrics[group_a]
+        self.plane_counts[group_b] += self.plane_counts[group_a]
+        self.group_map[group_a] = group_b
+        return len(winners)
+
+    def result(self):
+        """
+        Compact the surviving render vertices back into an OBJ-style Mesh.
+
+        Returns:
+            obj_loader.Mesh: The decimated mesh
+        """
+        mesh = self.mesh
+        corners = self.corners[self.faces.ravel()]
+
+        def compact(column, values):
+            used, inverse = np.unique(corners[:, column], return_inverse=True)
+            return np.asarray(values)[used], inverse.reshape(-1, 3).astype(np.int32)
+
+        vertices, faces = compact(0, mesh.vertices)
+        texcoords, face_texcoords, normals, face_normals = None, None, None, None
+        column = 1
+        if mesh.face_texcoords is not None:
+            texcoords, face_texcoords = compact(column, mesh.texcoords)
+            column += 1
+        if mesh.face_normals is not None:
+            normals, face_normals = compact(column, mesh.normals)
+        return obj_loader.Mesh(vertices, faces, texcoords=texcoords, normals=normals,
+                               face_texcoords=face_texcoords, face_normals=face_normals,
+                               face_materials=self.materials.astype(np.int16),
+                               material_names=mesh.material_names, mtllibs=mesh.mtllibs,
+                               source_path=mesh.source_path)
+
+    def errors(self):
+        """
+        Returns:
+            tuple: (RMS plane distance per surviving position, distance of every
+                original position to the decimated triangles around the vertex it
+                was merged into)
+        """
+        alive = np.unique(self.group[self.faces.ravel()])
+        rms = np.sqrt(_quadric_error(self.plain_quadrics[alive], self.group_positions[alive]) /
+                      np.maximum(self.plane_counts[alive], 1))
+
+        final = self.group_map.copy()
+        while True:
+            resolved = final[final]
+            if np.array_equal(resolved, final):
+                break
+            final = resolved
+
+        # Pair every original position with each face around its final position
+        group_faces = self.group[self.faces]
+        corner_groups = group_faces.ravel()
+        by_group = np.argsort(corner_groups, kind='stable')
+        per_group = np.bincount(corner_groups, minlength=self.group_count)
+        group_start = np.concatenate([[0], np.cumsum(per_group)[:-1]])
+        original = np.flatnonzero(self.plane_counts > 0)
+        reps = final[original]
+        counts = per_group[reps]
+        query = np.repeat(np.arange(len(original)), counts)
+        offset = np.arange(len(query)) - np.repeat(np.cumsum(counts) - counts, counts)
+        face = by_group[group_start[reps][query] + offset] // 3
+
+        triangles = self.group_positions[group_faces[face]]
+        distance = _point_triangle_distance(self.group_positions[original[query]], triangles)
+        deviation = np.full(len(original), np.inf)
+        np.minimum.at(deviation, query, distance)
+        return rms, deviation[np.isfinite(deviation)]
+
+
+def decimate(mesh, target_faces=None, ratio=None, verbose=False):
+    """
+    Reduce a mesh to a triangle budget with seam-preserving QEM edge collapses.
+
+    Args:
+        mesh (obj_loader.Mesh): The mesh to decimate
+        target_faces (int): Triangle budget
+        ratio (float): Fraction of the input triangles to keep (used if target_faces is None)
+        verbose (bool): Print progress after every pass
+
+    Returns:
+        tuple: (decimated obj_loader.Mesh, stats dictionary)
+    """
+    if target_faces is None:
+        if ratio is None:
+            raise ValueError("Either target_faces or ratio is required")
+        if not 0 < ratio <= 1:
+            raise ValueError(f"ratio must be in (0, 1], got {ratio}")
+        target_faces = int(round(mesh.face_count * ratio))
+    target_faces = max(int(target_faces), 1)
+
+    start = time.perf_counter()
+    decimator = _Decimator(mesh)
+    passes = collapses = 0
+    while len(decimator.faces) > target_faces:
+        collapsed = decimator.run_pass(len(decimator.faces) - target_faces)
+        if not collapsed:
+            break
+        passes += 1
+        collapses += collapsed
+        if verbose:
+            print(f"Pass {passes}: {len(decimator.faces)} faces")
+
+    result = decimator.result()
+    rms, deviation = decimator.errors()
+    low, high = mesh.bounds()
+    diagonal = float(np.linalg.norm(np.asarray(high, np.float64) - low))
+    stats = {
+        'input_faces': mesh.face_count,
+        'output_faces': result.face_count,
+        'target_faces': target_faces,
+        'input_vertices': mesh.vertex_count,
+        'output_vertices': result.vertex_count,
+        'locked_positions': int(decimator.locked.sum()),
+        'passes': passes,
+        'collapses': collapses,
+        'max_error': float(rms.max()) if len(rms) else 0.0,
+        'mean_error': float(rms.mean()) if len(rms) else 0.0,
+        'max_deviation': float(deviation.max()) if len(deviation) else 0.0,
+        'mean_deviation': float(deviation.mean()) if len(deviation) else 0.0,
+        'bbox_diagonal': diagonal,
+        'seconds': time.perf_counter() - start,
+    }
+    return result, stats
+
+
+def print_report(stats):
+    """
+    Print the outcome of decimate() including the error relative to the mesh size.
+
+    Args:
+        stats (dict): Stats returned by decimate()
+    """
+    diagonal = stats['bbox_diagonal'] or 1.0
+    print(f"Triangles: {stats['input_faces']} -> {stats['output_faces']} (target {stats['target_faces']})")
+    print(f"Vertices:  {stats['input_vertices']} -> {stats['output_vertices']}")
+    print(f"Collapses: {stats['collapses']} in {stats['passes']} passes, {stats['seconds']:.2f}s")
+    print(f"RMS plane error: max {stats['max_error']:.6f} ({stats['max_error'] / diagonal:.4%} of bbox diagonal), "
+          f"mean {stats['mean_error']:.6f}")
+    print(f"Surface deviation: max {stats['max_deviation']:.6f} "
+          f"({stats['max_deviation'] / diagonal:.4%} of bbox diagonal), mean {stats['mean_deviation']:.6f}")
+    if stats['output_faces'] > stats['target_faces']:
+        print(f"Warning: stopped above the target; the remaining collapses would break seams, "
+              f"material borders or the mesh topology")
+
+
+def default_output_path(obj_path, target_faces):
+    """
+    Returns:
+        str: e.g. mesh_5000tris.obj next to the source mesh
+    """
+    root, extension = os.path.splitext(obj_path)
+    return f"{root}_{target_faces}tris{extension or '.obj'}"
+
+
+def decimate_obj(obj_path, output_path=None, target_faces=None, ratio=None, verbose=True):
+    """
+    Decimate an OBJ file and write the reduced mesh next to its materials.
+
+    Args:
+        obj_path (str): Source .obj file
+        output_path (str): Destination .obj (default: <name>_<N>tris.obj next to the source)
+        target_faces (int): Triangle budget
+        ratio (float): Fraction of triangles to keep (used if target_faces is None)
+        verbose (bool): Print the decimation report
+
+    Returns:
+        tuple: (path of the written OBJ, stats dictionary)
+    """
+    mesh = mesh_cache.load_mesh_cached(obj_path)
+    result, stats = decimate(mesh, target_faces=target_faces, ratio=ratio)
+    output_path = output_path or default_output_path(obj_path, stats['target_faces'])
+    obj_loader.save_obj(result, output_path)
+    if verbose:
+        print_report(stats)
+        print(f"Wrote {output_path}")
+    return output_path, stats
+
+
+def main():
+    """
+    Decimate an OBJ mesh to a triangle budget or ratio.
+    """
+    parser = argparse.ArgumentParser(description='Decimate an OBJ mesh before importing it into UE5')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    budget = parser.add_mutually_exclusive_group(required=True)
+    budget.add_argument('--target_triangles', type=int, help='Triangle budget')
+    budget.add_argument('--ratio', type=float, help='Fraction of triangles to keep, e.g. 0.25')
+    parser.add_argument('--output', type=str,
+                        help='Output .obj path (default: <name>_<N>tris.obj next to the input)')
+    args = parser.parse_args()
+
+    try:
+        decimate_obj(args.obj_path, args.output, target_faces=args.target_triangles, ratio=args.ratio)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,8 @@ import sys
 import unreal
 import argparse
 import time
-import unrealcv
+
+import unrealcv_session
 
 # Define command line arguments
 parser = argparse.ArgumentParser(description='Import OBJ mesh to UE5 and place it at runtime')
@@ -136,34 +137,14 @@ def runtime_placement_with_unrealcv():
     """
     print("Connecting to UnrealCV for runtime placement...")
     
-    # Connect to UnrealCV
-    client = unrealcv.Client(('localhost', 9000))
-    
-    # Try to connect for 30 seconds
-    timeout = 30
-    connected = False
-    
-    for i in range(timeout):
-        if client.isconnected():
-            connected = True
-            break
-        else:
-            try:
-                client.connect()
-                if client.isconnected():
-                    connected = True
-                    break
-            except:
-                pass
-            print(f"Waiting for UnrealCV connection... {i+1}/{timeout}")
-            time.sleep(1)
+    # Borrow a warm connection from the shared session pool
+    pool = unrealcv_session.get_pool()
+    client = pool.acquire()
     
-    if not connected:
+    if client is None:
         print("Failed to connect to UnrealCV")
         return False
     
-    print("Connected to UnrealCV")
-    
     # Parse location
     x, y, z = map(float, args.location.split(','))
     
@@ -181,7 +162,7 @@ def runtime_placement_with_unrealcv():
             time.sleep(1)
     except KeyboardInterrupt:
         print("Exiting...")
-        client.disconnect()
+        pool.release(client)
     
     return True
 
@@ -0,0 +1,159 @@
+"""
+LOD Chain Builder
+=================
+
+Builds a chain of levels of detail for a HunYuan3D-v2 mesh outside of Unreal,
+so that every placed instance can drop to a lighter mesh as it gets smaller on
+screen. Each level is decimated from the source mesh with mesh_decimation and
+written as its own OBJ, together with a lod_stats.json manifest:
+
+    {
+      "source": "/abs/path/mesh.obj",
+      "lods": [
+        {"lod": 0, "path": "mesh_LOD0.obj", "ratio": 1.0, "triangles": 40000, "screen_size": 1.0, ...},
+        {"lod": 1, "path": "mesh_LOD1.obj", "ratio": 0.5, "triangles": 20000, "screen_size": 0.5, ...},
+        ...
+      ]
+    }
+
+The manifest is what unreal_engine_import.import_lod_chain reads inside UE5 to
+import the files as the LODs of one StaticMesh with these screen sizes.
+
+Example usage:
+python mesh_lod.py data/result/mesh.obj
+python mesh_lod.py data/result/mesh.obj --ratios 1,0.5,0.25,0.1 --screen_sizes 1,0.5,0.25,0.1 --output_dir /tmp/mesh_lods
+"""
+import argparse
+import json
+import os
+import time
+
+import mesh_cache
+import mesh_decimation
+import mesh_optimize
+import obj_loader
+
+DEFAULT_RATIOS = (1.0, 0.5, 0.25, 0.1)
+DEFAULT_SCREEN_SIZES = (1.0, 0.5, 0.25, 0.1)
+MANIFEST_NAME = 'lod_stats.json'
+
+
+def parse_float_list(value):
+    """
+    Args:
+        value (str): Comma separated numbers, e.g. "1,0.5,0.25"
+
+    Returns:
+        tuple: The numbers as floats
+    """
+    return tuple(float(v) for v in value.split(',') if v.strip())
+
+
+def default_output_dir(obj_path):
+    """
+    Returns:
+        str: e.g. data/result/mesh_lods for data/result/mesh.obj
+    """
+    root = os.path.splitext(os.path.abspath(obj_path))[0]
+    return f"{root}_lods"
+
+
+def build_lod_chain(obj_path, output_dir=None, ratios=DEFAULT_RATIOS, screen_sizes=DEFAULT_SCREEN_SIZES,
+                    optimize=False, verbose=True):
+    """
+    Write one OBJ per LOD level and a manifest describing the chain.
+
+    Args:
+        obj_path (str): Source .obj file (LOD0 unless the first ratio is below 1)
+        output_dir (str): Directory for the LOD files (default: <name>_lods next to the source)
+        ratios (tuple): Fraction of the source triangles kept at each level, decreasing
+        screen_sizes (tuple): Screen size below which UE switches to the next level,
+            one per ratio, decreasing
+        optimize (bool): Weld and reorder every level with mesh_optimize
+        verbose (bool): Print a line per level
+
+    Returns:
+        dict: The manifest that was written to <output_dir>/lod_stats.json
+    """
+    if not ratios:
+        raise ValueError("At least one LOD ratio is required")
+    if len(ratios) != len(screen_sizes):
+        raise ValueError(f"Got {len(ratios)} ratios but {len(screen_sizes)} screen sizes")
+    if any(not 0 < r <= 1 for r in ratios):
+        raise ValueError(f"LOD ratios must be in (0, 1], got {list(ratios)}")
+    if list(ratios) != sorted(ratios, reverse=True) or list(screen_sizes) != sorted(screen_sizes, reverse=True):
+        raise ValueError("LOD ratios and screen sizes must decrease from LOD0 onwards")
+
+    output_dir = output_dir or default_output_dir(obj_path)
+    os.makedirs(output_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(obj_path))[0]
+    mesh = mesh_cache.load_mesh_cached(obj_path)
+
+    lods = []
+    start = time.perf_counter()
+    for index, (ratio, screen_size) in enumerate(zip(ratios, screen_sizes)):
+        level_start = time.perf_counter()
+        if ratio >= 1.0:
+            result, stats = mesh, {'max_error': 0.0, 'mean_error': 0.0, 'max_deviation': 0.0}
+        else:
+            result, stats = mesh_decimation.decimate(mesh, ratio=ratio)
+        if optimize:
+            result, _ = mesh_optimize.optimize(result)
+        filename = f"{name}_LOD{index}.obj"
+        # Materials are copied once, next to the first level
+        obj_loader.save_obj(result, os.path.join(output_dir, filename), copy_materials=index == 0)
+
+        lods.append({
+            'lod': index,
+            'path': filename,
+            'ratio': ratio,
+            'screen_size': screen_size,
+            'triangles': result.face_count,
+            'vertices': result.vertex_count,
+            'max_error': stats['max_error'],
+            'mean_error': stats['mean_error'],
+            'max_deviation': stats['max_deviation'],
+            'seconds': time.perf_counter() - level_start,
+        })
+        if verbose:
+            print(f"LOD{index}: {result.face_count:>7} triangles ({ratio:.0%}), screen size {screen_size:g}, "
+                  f"max deviation {stats['max_deviation']:.6f} -> {filename}")
+
+    manifest = {
+        'source': os.path.abspath(obj_path),
+        'name': name,
+        'lods': lods,
+        'seconds': time.perf_counter() - start,
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    if verbose:
+        print(f"Wrote {len(lods)} LODs and {manifest_path} in {manifest['seconds']:.2f}s")
+    return manifest
+
+
+def main():
+    """
+    Build LOD OBJ files and lod_stats.json for a mesh.
+    """
+    parser = argparse.ArgumentParser(description='Build a LOD chain of OBJ files for import into UE5')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    parser.add_argument('--output_dir', type=str,
+                        help='Directory for the LOD files (default: <name>_lods next to the input)')
+    parser.add_argument('--ratios', type=parse_float_list, default=DEFAULT_RATIOS,
+                        help='Fraction of triangles kept per LOD (default: 1,0.5,0.25,0.1)')
+    parser.add_argument('--screen_sizes', type=parse_float_list, default=DEFAULT_SCREEN_SIZES,
+                        help='Screen size threshold per LOD (default: 1,0.5,0.25,0.1)')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Weld positions and reorder each level for vertex cache efficiency')
+    args = parser.parse_args()
+
+    try:
+        build_lod_chain(args.obj_path, args.output_dir, args.ratios, args.screen_sizes, args.optimize)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
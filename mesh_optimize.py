@@ -0,0 +1,368 @@
+"""
+Mesh Optimization
+=================
+
+Prepares a mesh's index buffer for the GPU before it is imported into UE5:
+
+1. Weld: positions closer than an epsilon are merged with a spatial hash.
+   Trimesh-style exports such as data/result/mesh.obj duplicate every
+   position along a UV seam; after welding, the seam only splits the UVs
+   (which the GPU needs) and no longer the positions.
+2. Triangle order: triangles are reordered for post-transform vertex cache
+   locality with Tipsify (Sander, Nehab and Barczak, "Fast Triangle Reordering
+   for Vertex Locality and Reduced Overdraw", 2007). Each material keeps its
+   own contiguous block of triangles.
+3. Vertex order: positions, UVs and normals are renumbered in order of first
+   use, so vertex fetches walk memory forwards.
+
+Cache efficiency is reported as ACMR (average cache miss ratio: transformed
+vertices per triangle, 0.5 is ideal for large regular meshes, 3.0 is the worst)
+measured with a FIFO cache over render vertices, i.e. distinct (v, vt, vn)
+corners, which is what the imported vertex buffer holds.
+
+The result is a regular OBJ that import_obj_to_uasset takes as is.
+
+Example usage:
+python mesh_optimize.py data/result/mesh.obj
+python mesh_optimize.py data/result/mesh.obj --epsilon 1e-5 --cache_size 32 --output /tmp/mesh_opt.obj
+"""
+import argparse
+import collections
+import os
+import time
+
+import numpy as np
+
+import mesh_cache
+import obj_loader
+
+DEFAULT_EPSILON = 1e-6
+DEFAULT_CACHE_SIZE = 16
+
+
+def weld_positions(vertices, epsilon=DEFAULT_EPSILON):
+    """
+    Merge positions that lie within epsilon of each other.
+
+    Positions are hashed into a grid of epsilon-sized cells; only pairs in the
+    same or adjacent cells are compared. Merging is transitive, so a chain of
+    positions each within epsilon of the next collapses to one.
+
+    Args:
+        vertices (np.ndarray): (N, 3) positions
+        epsilon (float): Merge distance; 0 merges exact duplicates only
+
+    Returns:
+        tuple: ((M, 3) welded positions, (N,) index of each input position in them)
+    """
+    vertices = np.asarray(vertices, np.float64)
+    count = len(vertices)
+    if count == 0 or epsilon <= 0:
+        welded, remap = np.unique(vertices, axis=0, return_inverse=True)
+        return welded.astype(np.float32), remap.reshape(-1)
+
+    cells = np.floor(vertices / epsilon).astype(np.int64)
+    cells -= cells.min(axis=0)
+    extent = cells.max(axis=0) + 3
+
+    def cell_keys(c):
+        return (c[:, 0] * extent[1] + c[:, 1]) * extent[2] + c[:, 2]
+
+    order = np.argsort(cell_keys(cells), kind='stable')
+    sorted_keys = cell_keys(cells)[order]
+
+    # Half of the 27 neighbouring cells (plus the own cell) finds every pair once
+    offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+               if (dx, dy, dz) >= (0, 0, 0)]
+    first, second = [], []
+    for offset in offsets:
+        neighbour = cell_keys(cells + np.array(offset))
+        low = np.searchsorted(sorted_keys, neighbour, side='left')
+        high = np.searchsorted(sorted_keys, neighbour, side='right')
+        counts = high - low
+        if not counts.any():
+            continue
+        point = np.repeat(np.arange(count), counts)
+        other = order[np.repeat(low, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)]
+        keep = point != other
+        if offset == (0, 0, 0):
+            keep &= point < other
+        point, other = point[keep], other[keep]
+        close = np.einsum('ij,ij->i', vertices[point] - vertices[other], vertices[point] - vertices[other]) \
+            <= epsilon * epsilon
+        first.append(point[close])
+        second.append(other[close])
+
+    # Connected components by label propagation with pointer jumping
+    labels = np.arange(count)
+    if first:
+        first, second = np.concatenate(first), np.concatenate(second)
+        while True:
+            previous = labels.copy()
+            np.minimum.at(labels, first, labels[second])
+            np.minimum.at(labels, second, labels[first])
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                break
+
+    representatives, remap = np.unique(labels, return_inverse=True)
+    return vertices[representatives].astype(np.float32), remap
+
+
+def acmr(indices, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Simulate a FIFO post-transform vertex cache over an index buffer.
+
+    Args:
+        indices (np.ndarray): (F, 3) vertex indices in draw order
+        cache_size (int): Number of cache entries
+
+    Returns:
+        float: Average number of cache misses per triangle
+    """
+    if not len(indices):
+        return 0.0
+    cache = collections.deque()
+    cached = set()
+    misses = 0
+    for index in np.asarray(indices).ravel().tolist():
+        if index in cached:
+            continue
+        misses += 1
+        cache.append(index)
+        cached.add(index)
+        if len(cache) > cache_size:
+            cached.discard(cache.popleft())
+    return misses / len(indices)
+
+
+def tipsify(indices, vertex_count, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Reorder triangles for vertex cache locality with the Tipsify algorithm.
+
+    Args:
+        indices (np.ndarray): (F, 3) vertex indices
+        vertex_count (int): Number of vertices referenced by indices
+        cache_size (int): Target cache size
+
+    Returns:
+        np.ndarray: (F,) new triangle order
+    """
+    indices = np.asarray(indices, np.int64)
+    face_count = len(indices)
+    if face_count == 0:
+        return np.zeros(0, np.int64)
+
+    # Vertex -> triangle adjacency in CSR form
+    corner_vertex = indices.ravel()
+    by_vertex = np.argsort(corner_vertex, kind='stable')
+    adjacency = (by_vertex // 3).tolist()
+    live = np.bincount(corner_vertex, minlength=vertex_count)
+    starts = np.concatenate([[0], np.cumsum(live)]).tolist()
+    live = live.tolist()
+    triangles = indices.tolist()
+
+    timestamps = [0] * vertex_count
+    emitted = [False] * face_count
+    dead_end = []
+    output = []
+    time_now = cache_size + 1
+    cursor = 0
+    fanning = 0
+    while fanning >= 0:
+        candidates = []
+        for triangle in adjacency[starts[fanning]:starts[fanning + 1]]:
+            if emitted[triangle]:
+                continue
+            emitted[triangle] = True
+            output.append(triangle)
+            for vertex in triangles[triangle]:
+                dead_end.append(vertex)
+                candidates.append(vertex)
+                live[vertex] -= 1
+                if time_now - timestamps[vertex] > cache_size:
+                    timestamps[vertex] = time_now
+                    time_now += 1
+
+        # Next fanning vertex: the candidate that stays in the cache longest
+        # after its remaining triangles are emitted
+        fanning = -1
+        best = -1
+        for vertex in candidates:
+            if live[vertex] <= 0:
+                continue
+            priority = 0
+            if time_now - timestamps[vertex] + 2 * live[vertex] <= cache_size:
+                priority = time_now - timestamps[vertex]
+            if priority > best:
+                best = priority
+                fanning = vertex
+
+        if fanning < 0:
+            while dead_end:
+                vertex = dead_end.pop()
+                if live[vertex] > 0:
+                    fanning = vertex
+                    break
+        if fanning < 0:
+            while cursor < vertex_count:
+                if live[cursor] > 0:
+                    fanning = cursor
+                    break
+                cursor += 1
+    return np.array(output, np.int64)
+
+
+def _first_use_order(indices, count):
+    """
+    Returns:
+        tuple: (old index of each new slot, new index of each old slot) for the
+            indices used, numbered by first appearance
+    """
+    flat = np.asarray(indices).ravel()
+    used, first = np.unique(flat, return_index=True)
+    old_of_new = used[np.argsort(first, kind='stable')]
+    new_of_old = np.full(count, -1, np.int64)
+    new_of_old[old_of_new] = np.arange(len(old_of_new))
+    return old_of_new, new_of_old
+
+
+def optimize(mesh, epsilon=DEFAULT_EPSILON, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Weld positions, then reorder triangles and vertices for GPU cache locality.
+
+    Args:
+        mesh (obj_loader.Mesh): The mesh to optimize
+        epsilon (float): Position weld distance (None to skip welding)
+        cache_size (int): Vertex cache size the triangle order is tuned for
+
+    Returns:
+        tuple: (optimized obj_loader.Mesh, stats dictionary)
+    """
+    start = time.perf_counter()
+    _, render_faces = obj_loader.render_vertices(mesh)
+    acmr_before = acmr(render_faces, cache_size)
+
+    # 1. Weld positions and drop the triangles that collapse
+    vertices, faces = mesh.vertices, np.asarray(mesh.faces, np.int64)
+    if epsilon is not None:
+        vertices, remap = weld_positions(mesh.vertices, epsilon)
+        faces = remap[faces]
+    keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+    welded = obj_loader.Mesh(vertices, faces[keep], texcoords=mesh.texcoords, normals=mesh.normals,
+                             face_texcoords=None if mesh.face_texcoords is None else mesh.face_texcoords[keep],
+                             face_normals=None if mesh.face_normals is None else mesh.face_normals[keep],
+                             face_materials=np.asarray(mesh.face_materials)[keep],
+                             material_names=mesh.material_names, mtllibs=mesh.mtllibs,
+                             source_path=mesh.source_path)
+
+    # 2. Reorder triangles per material, on render vertices
+    corners, render_faces = obj_loader.render_vertices(welded)
+    materials = welded.face_materials
+    face_order = []
+    for material in np.unique(materials):
+        section = np.flatnonzero(materials == material)
+        section_faces = render_faces[section]
+        used, local = np.unique(section_faces, return_inverse=True)
+        face_order.append(section[tipsify(local.reshape(-1, 3), len(used), cache_size)])
+    face_order = np.concatenate(face_order) if face_order else np.zeros(0, np.int64)
+    acmr_after = acmr(render_faces[face_order], cache_size)
+
+    # 3. Renumber every attribute by first use in the new triangle order
+    def reorder(values, face_indices):
+        old_of_new, new_of_old = _first_use_order(face_indices, len(values))
+        return np.asarray(values)[old_of_new], new_of_old[face_indices].astype(np.int32)
+
+    ordered = {'face_materials': materials[face_order]}
+    ordered['vertices'], ordered['faces'] = reorder(welded.vertices, welded.faces[face_order])
+    if welded.face_texcoords is not None:
+        ordered['texcoords'], ordered['face_texcoords'] = reorder(welded.texcoords,
+                                                                  welded.face_texcoords[face_order])
+    if welded.face_normals is not None:
+        ordered['normals'], ordered['face_normals'] = reorder(welded.normals, welded.face_normals[face_order])
+    result = obj_loader.Mesh(material_names=mesh.material_names, mtllibs=mesh.mtllibs,
+                             source_path=mesh.source_path, **ordered)
+
+    stats = {
+        'input_vertices': mesh.vertex_count,
+        'output_vertices': result.vertex_count,
+        'input_faces': mesh.face_count,
+        'output_faces': result.face_count,
+        'render_vertices': len(corners),
+        'acmr_before': acmr_before,
+        'acmr_after': acmr_after,
+        'atvr_after': acmr_after * result.face_count / max(len(corners), 1),
+        'cache_size': cache_size,
+        'seconds': time.perf_counter() - start,
+    }
+    return result, stats
+
+
+def print_report(stats):
+    """
+    Print the outcome of optimize().
+
+    Args:
+        stats (dict): Stats returned by optimize()
+    """
+    print(f"Positions: {stats['input_vertices']} -> {stats['output_vertices']} after welding "
+          f"({stats['render_vertices']} render vertices)")
+    if stats['output_faces'] != stats['input_faces']:
+        print(f"Triangles: {stats['input_faces']} -> {stats['output_faces']} (degenerate after welding)")
+    print(f"ACMR ({stats['cache_size']}-entry FIFO): {stats['acmr_before']:.3f} -> {stats['acmr_after']:.3f} "
+          f"(ATVR {stats['atvr_after']:.3f})")
+    print(f"Optimized in {stats['seconds']:.2f}s")
+
+
+def default_output_path(obj_path):
+    """
+    Returns:
+        str: e.g. mesh_opt.obj next to the source mesh
+    """
+    root, extension = os.path.splitext(obj_path)
+    return f"{root}_opt{extension or '.obj'}"
+
+
+def optimize_obj(obj_path, output_path=None, epsilon=DEFAULT_EPSILON, cache_size=DEFAULT_CACHE_SIZE, verbose=True):
+    """
+    Optimize an OBJ file and write the result next to its materials.
+
+    Args:
+        obj_path (str): Source .obj file
+        output_path (str): Destination .obj (default: <name>_opt.obj next to the source)
+        epsilon (float): Position weld distance
+        cache_size (int): Vertex cache size the triangle order is tuned for
+        verbose (bool): Print the optimization report
+
+    Returns:
+        tuple: (path of the written OBJ, stats dictionary)
+    """
+    mesh = mesh_cache.load_mesh_cached(obj_path)
+    result, stats = optimize(mesh, epsilon, cache_size)
+    output_path = output_path or default_output_path(obj_path)
+    obj_loader.save_obj(result, output_path)
+    if verbose:
+        print_report(stats)
+        print(f"Wrote {output_path}")
+    return output_path, stats
+
+
+def main():
+    """
+    Weld and reorder an OBJ mesh for vertex cache efficiency.
+    """
+    parser = argparse.ArgumentParser(description='Weld and reorder an OBJ mesh before importing it into UE5')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    parser.add_argument('--epsilon', type=float, default=DEFAULT_EPSILON,
+                        help='Weld positions closer than this distance (default: 1e-6, 0 for exact duplicates)')
+    parser.add_argument('--cache_size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help='Vertex cache size to optimize for (default: 16)')
+    parser.add_argument('--output', type=str,
+                        help='Output .obj path (default: <name>_opt.obj next to the input)')
+    args = parser.parse_args()
+
+    optimize_obj(args.obj_path, args.output, args.epsilon, args.cache_size)
+
+
+if __name__ == "__main__":
+    main()
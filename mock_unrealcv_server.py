@@ -0,0 +1,398 @@
+"""
+Mock UnrealCV Server
+====================
+
+A local stand-in for a UE5 game running the UnrealCV plugin, for testing and
+benchmarking the runtime placement code without a GPU. It speaks the UnrealCV
+wire protocol (framed "<id>:<command>" messages and a "connected" greeting), so
+the unrealcv client, UnrealCVSession, the command pipeline and the asyncio
+client connect to it unchanged.
+
+Objects, their transforms and the camera are kept in memory. Supported commands:
+
+    vget /unrealcv/version | status | help | commands
+    vget /objects
+    vset /objects/spawn <class> [name]          (replies with the object name)
+    vset /objects/spawn <class> <x> <y> <z>     (replies with a generated name)
+    vget|vset /object/<name>/location|rotation|scale
+    vset /object/<name>/destroy
+    vset /object/<name>/hide | show
+    vget|vset /camera/<id>/location|rotation
+    vbp <name> <function> [args]                 (acknowledged, no effect)
+    vrun <console command>                       (acknowledged, no effect)
+
+Anything else gets the same "error ..." reply a real server sends for an
+unknown command. Blueprint classes must be given as class paths ending in _C
+(/Game/Meshes/MeshBP.MeshBP_C); a few engine classes such as StaticMeshActor
+are accepted by name.
+
+Latency is modelled as network round-trip time: a reply is sent `latency` (+/-
+`jitter`) after its request arrived, and replies keep their order, so
+pipelined requests overlap as they would over a real connection. `error_rate`
+makes that fraction of commands fail with an error reply instead of being
+applied; /unrealcv/ queries are never failed so that version-keyed caches stay
+valid. Unlike the real plugin, several clients may be connected at once.
+
+Example usage:
+python mock_unrealcv_server.py
+python mock_unrealcv_server.py --port 9000 --latency 5 --jitter 2 --error_rate 0.01
+
+    server = MockUnrealCVServer(port=0).start()    # port 0: pick a free port
+    session = unrealcv_session.UnrealCVSession(endpoint=server.endpoint)
+    ...
+    server.stop()
+"""
+import argparse
+import queue
+import random
+import socket
+import socketserver
+import threading
+import time
+
+import async_unrealcv
+
+DEFAULT_VERSION = 'v1.0.0'
+ENGINE_CLASSES = ('StaticMeshActor', 'PointLight', 'CameraActor', 'Actor')
+UNKNOWN_COMMAND = 'error Can not find a handler for this request'
+
+COMMAND_TEMPLATES = [
+    'vget /unrealcv/version', 'vget /unrealcv/status', 'vget /unrealcv/help', 'vget /unrealcv/commands',
+    'vget /objects',
+    'vset /objects/spawn [class]', 'vset /objects/spawn [class] [name]',
+    'vset /objects/spawn [class] [x] [y] [z]',
+    'vget /object/[name]/location', 'vset /object/[name]/location [x] [y] [z]',
+    'vget /object/[name]/rotation', 'vset /object/[name]/rotation [pitch] [yaw] [roll]',
+    'vget /object/[name]/scale', 'vset /object/[name]/scale [x] [y] [z]',
+    'vset /object/[name]/destroy', 'vset /object/[name]/hide', 'vset /object/[name]/show',
+    'vget /camera/[id]/location', 'vset /camera/[id]/location [x] [y] [z]',
+    'vget /camera/[id]/rotation', 'vset /camera/[id]/rotation [pitch] [yaw] [roll]',
+]
+
+
+def _format_vector(values):
+    return ' '.join(f"{v:.3f}" for v in values)
+
+
+def _parse_vector(args):
+    if len(args) != 3:
+        raise ValueError(f"expected 3 values, got {len(args)}")
+    return tuple(float(v) for v in args)
+
+
+class MockScene:
+    """
+    In-memory level: objects with transforms and cameras.
+
+    Commands are applied under a lock, in the order they arrive, so several
+    connections can share one scene.
+    """
+
+    def __init__(self, version=DEFAULT_VERSION):
+        self.version = version
+        self.objects = {}
+        self.cameras = {'0': {'location': (0.0, 0.0, 200.0), 'rotation': (0.0, 0.0, 0.0)}}
+        self.commands = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def handle(self, command):
+        """
+        Args:
+            command (str): One UnrealCV command
+
+        Returns:
+            str: The reply a server would send
+        """
+        with self._lock:
+            self.commands += 1
+            parts = command.split()
+            if len(parts) < 2:
+                return UNKNOWN_COMMAND
+            verb, path, args = parts[0], parts[1], parts[2:]
+            try:
+                if verb in ('vget', 'vset'):
+                    return self._handle_path(verb, path, args)
+                if verb == 'vbp':
+                    return 'ok' if path in self.objects else f"error Can not find object {path}"
+                if verb == 'vrun':
+                    return 'ok'
+            except ValueError as e:
+                return f"error {e}"
+            return UNKNOWN_COMMAND
+
+    def _handle_path(self, verb, path, args):
+        segments = path.strip('/').split('/')
+        if segments[0] == 'unrealcv' and verb == 'vget' and len(segments) == 2:
+            return self._unrealcv_info(segments[1])
+        if segments == ['objects'] and verb == 'vget':
+            return ' '.join(self.objects)
+        if segments == ['objects', 'spawn'] and verb == 'vset':
+            return self._spawn(args)
+        if segments[0] == 'object' and len(segments) == 3:
+            name, field = segments[1], segments[2]
+            entry = self.objects.get(name)
+            if entry is None:
+                return f"error Can not find object {name}"
+            if field == 'destroy' and verb == 'vset':
+                del self.objects[name]
+                return 'ok'
+            if field in ('hide', 'show') and verb == 'vset':
+                entry['hidden'] = field == 'hide'
+                return 'ok'
+            return self._transform(entry, verb, field, args, ('location', 'rotation', 'scale'))
+        if segments[0] == 'camera' and len(segments) == 3:
+            camera = self.cameras.get(segments[1])
+            if camera is None:
+                return f"error Can not find camera {segments[1]}"
+            return self._transform(camera, verb, segments[2], args, ('location', 'rotation'))
+        return UNKNOWN_COMMAND
+
+    def _transform(self, entry, verb, field, args, fields):
+        if field not in fields:
+            return UNKNOWN_COMMAND
+        if verb == 'vget':
+            return _format_vector(entry[field])
+        entry[field] = _parse_vector(args)
+        return 'ok'
+
+    def _unrealcv_info(self, topic):
+        if topic == 'version':
+            return self.version
+        if topic == 'status':
+            return (f"Is Listening\nClient Connected\n9000\nConfiguration\n"
+                    f"Mock UnrealCV server {self.version}, {len(self.objects)} objects")
+        if topic in ('help', 'commands'):
+            return '\n'.join(COMMAND_TEMPLATES)
+        return UNKNOWN_COMMAND
+
+    def _spawn(self, args):
+        if not args:
+            raise ValueError("spawn needs a class")
+        class_path = args[0]
+        if not (class_path.startswith('/') and class_path.endswith('_C')) and class_path not in ENGINE_CLASSES:
+            return f"error Can not find class {class_path}"
+        location = (0.0, 0.0, 0.0)
+        if len(args) == 4:
+            location = _parse_vector(args[1:])
+            name = None
+        elif len(args) == 2:
+            name = args[1]
+        elif len(args) == 1:
+            name = None
+        else:
+            raise ValueError(f"unexpected spawn arguments: {' '.join(args[1:])}")
+        if name is None:
+            base = class_path.split('.')[-1].split('/')[-1]
+            base = base[:-2] if base.endswith('_C') else base
+            while name is None or name in self.objects:
+                name = f"{base}_{self._counter}"
+                self._counter += 1
+        elif name in self.objects:
+            return f"error Object {name} already exists"
+        self.objects[name] = {'class': class_path, 'location': location,
+                              'rotation': (0.0, 0.0, 0.0), 'scale': (1.0, 1.0, 1.0), 'hidden': False}
+        return name
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """One client connection: reads framed requests, replies after the injected latency"""
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.replies = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _write_loop(self):
+        while True:
+            item = self.replies.get()
+            if item is None:
+                return
+            send_at, frame = item
+            delay = send_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self.request.sendall(frame)
+            except OSError:
+                return
+
+    def _read_exact(self, size):
+        chunks = []
+        while size:
+            chunk = self.request.recv(size)
+            if not chunk:
+                return None
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def handle(self):
+        server = self.server.mock
+        self.request.sendall(async_unrealcv.encode_frame(b'connected to Mock UnrealCV server'))
+        server.connections += 1
+        last_send = 0.0
+        while not server.stopping:
+            try:
+                header = self._read_exact(async_unrealcv.HEADER.size)
+            except OSError:
+                break
+            if header is None:
+                break
+            magic, size = async_unrealcv.HEADER.unpack(header)
+            if magic != async_unrealcv.MAGIC:
+                break
+            payload = self._read_exact(size)
+            if payload is None:
+                break
+            received = time.perf_counter()
+            message_id, _, body = payload.partition(b':')
+            command = body.decode('utf-8', errors='replace')
+            response = server.respond(command)
+            if server.verbose:
+                print(f"{command} -> {response}")
+            # Replies keep request order even when jitter would reorder them
+            last_send = max(last_send, received + server.delay())
+            self.replies.put((last_send, async_unrealcv.encode_frame(message_id + b':' + response.encode('utf-8'))))
+
+    def finish(self):
+        self.replies.put(None)
+        self.writer.join(timeout=2.0)
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class MockUnrealCVServer:
+    """
+    Threaded TCP server answering UnrealCV commands from a MockScene.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): Port to listen on; 0 picks a free port (see endpoint)
+        latency (float): Round-trip delay added to every reply, in seconds
+        jitter (float): Uniform +/- variation of the delay, in seconds
+        error_rate (float): Fraction of commands (0-1) that fail with an injected error
+        seed (int): Random seed for jitter and errors
+        version (str): Reply to vget /unrealcv/version
+        verbose (bool): Print every command and reply
+    """
+
+    def __init__(self, host='localhost', port=9000, latency=0.0, jitter=0.0, error_rate=0.0, seed=None,
+                 version=DEFAULT_VERSION, verbose=False):
+        self.scene = MockScene(version)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self.injected_errors = 0
+        self.connections = 0
+        self.stopping = False
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _Handler, bind_and_activate=True)
+        self._server.mock = self
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        """(host, port) the server is listening on"""
+        return self._server.server_address[:2]
+
+    def delay(self):
+        """Seconds to hold the next reply for"""
+        if not self.jitter:
+            return self.latency
+        with self._random_lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def respond(self, command):
+        """
+        Args:
+            command (str): One UnrealCV command
+
+        Returns:
+            str: The reply, or an injected error
+        """
+        if self.error_rate and '/unrealcv/' not in command:
+            with self._random_lock:
+                failed = self._random.random() < self.error_rate
+            if failed:
+                self.injected_errors += 1
+                return 'error Injected failure'
+        return self.scene.handle(command)
+
+    def start(self):
+        """
+        Serve in a background thread.
+
+        Returns:
+            MockUnrealCVServer: self
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until stop() or Ctrl+C"""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        self.stopping = True
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    """
+    Run the mock server until Ctrl+C.
+    """
+    parser = argparse.ArgumentParser(description='Local stand-in for a UE5 game running UnrealCV')
+    parser.add_argument('--host', type=str, default='localhost', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=9000, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Round-trip latency in milliseconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Latency jitter (+/-) in milliseconds')
+    parser.add_argument('--error_rate', type=float, default=0.0,
+                        help='Fraction of commands (0-1) that fail with an injected error')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for jitter and errors')
+    parser.add_argument('--version', type=str, default=DEFAULT_VERSION, help='Reported UnrealCV version')
+    parser.add_argument('--verbose', action='store_true', help='Print every command and reply')
+    args = parser.parse_args()
+
+    try:
+        server = MockUnrealCVServer(args.host, args.port, latency=args.latency / 1000.0,
+                                    jitter=args.jitter / 1000.0, error_rate=args.error_rate, seed=args.seed,
+                                    version=args.version, verbose=args.verbose)
+    except OSError as e:
+        print(f"Could not listen on {args.host}:{args.port}: {e}")
+        return
+
+    host, port = server.endpoint
+    print(f"Mock UnrealCV server {args.version} listening on {host}:{port} "
+          f"(latency {args.latency:g} ms +/- {args.jitter:g} ms, error rate {args.error_rate:g})")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nExiting...")
+    finally:
+        scene = server.scene
+        server.stop()
+        print(f"Served {scene.commands} commands on {server.connections} connections; "
+              f"{len(scene.objects)} objects in the scene, {server.injected_errors} injected errors")
+
+
+if __name__ == "__main__":
+    main()
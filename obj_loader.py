@@ -0,0 +1,539 @@
+"""
+OBJ Mesh Loader
+===============
+
+Parses Wavefront OBJ files, such as the HunYuan3D-v2 output in
+data/result/mesh.obj, into contiguous NumPy arrays so that every offline
+preprocessing stage works on arrays instead of Python lists.
+
+The file is read in one pass (or in fixed-size chunks for very large files,
+by import_sources.iter_line_blocks, the reader the editor-side code uses).
+Lines are only sorted by their keyword in Python; all number conversion is
+done by NumPy on the joined text of each line type. `v`, `vt`, `vn`, `f`,
+`usemtl` and `mtllib` are supported, including `v`, `v/vt`, `v//vn` and
+`v/vt/vn` face corners. Polygons are fan-triangulated.
+
+Example usage:
+python obj_loader.py data/result/mesh.obj
+python obj_loader.py data/result/mesh.obj --benchmark
+"""
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+
+# The file reading and material library helpers only need the standard library,
+# so they live in import_sources where the UE5 editor can use them too
+from import_sources import iter_line_blocks, material_files
+
+# Read the whole file at once below this size; larger files are parsed in chunks
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class Mesh:
+    """
+    A triangle mesh stored as NumPy arrays.
+
+    Attributes:
+        vertices (np.ndarray): (N, 3) float32 positions
+        texcoords (np.ndarray): (T, 2) float32 UVs, possibly empty
+        normals (np.ndarray): (K, 3) float32 normals, possibly empty
+        faces (np.ndarray): (F, 3) int32 zero-based position indices
+        face_texcoords (np.ndarray): (F, 3) int32 UV indices, or None
+        face_normals (np.ndarray): (F, 3) int32 normal indices, or None
+        face_materials (np.ndarray): (F,) int16 index into material_names per face
+        material_names (list): Material names in order of first use
+        mtllibs (list): Material library file names referenced by the OBJ
+        source_path (str): The file the mesh was loaded from, if any
+    """
+
+    __slots__ = ('vertices', 'texcoords', 'normals', 'faces', 'face_texcoords', 'face_normals',
+                 'face_materials', 'material_names', 'mtllibs', 'source_path')
+
+    def __init__(self, vertices, faces, texcoords=None, normals=None, face_texcoords=None, face_normals=None,
+                 face_materials=None, material_names=None, mtllibs=None, source_path=None):
+        self.vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        self.faces = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+        self.texcoords = np.zeros((0, 2), np.float32) if texcoords is None else np.asarray(texcoords, np.float32)
+        self.normals = np.zeros((0, 3), np.float32) if normals is None else np.asarray(normals, np.float32)
+        self.face_texcoords = face_texcoords
+        self.face_normals = face_normals
+        if face_materials is None:
+            face_materials = np.zeros(len(self.faces), np.int16)
+        self.face_materials = face_materials
+        self.material_names = list(material_names or [])
+        self.mtllibs = list(mtllibs or [])
+        self.source_path = source_path
+
+    @property
+    def vertex_count(self):
+        return len(self.vertices)
+
+    @property
+    def face_count(self):
+        return len(self.faces)
+
+    @property
+    def nbytes(self):
+        """Total size of the array data in bytes"""
+        arrays = (self.vertices, self.texcoords, self.normals, self.faces, self.face_texcoords,
+                  self.face_normals, self.face_materials)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def bounds(self):
+        """
+        Returns:
+            tuple: (min, max) corners of the axis-aligned bounding box as float arrays
+        """
+        if not len(self.vertices):
+            return np.zeros(3, np.float32), np.zeros(3, np.float32)
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+    def __repr__(self):
+        return (f"Mesh({self.vertex_count} vertices, {len(self.texcoords)} uvs, {len(self.normals)} normals, "
+                f"{self.face_count} faces, {len(self.material_names)} materials)")
+
+
+def render_vertices(mesh):
+    """
+    Split a mesh into render vertices: one per distinct (v, vt, vn) corner, which
+    is how a GPU vertex buffer (and the UE5 importer) sees the mesh.
+
+    Args:
+        mesh (Mesh): The mesh
+
+    Returns:
+        tuple: ((R, k) position/texcoord/normal indices of each render vertex, with
+            one column per attribute the faces use, and (F, 3) render vertex faces)
+    """
+    columns = [mesh.faces]
+    if mesh.face_texcoords is not None:
+        columns.append(mesh.face_texcoords)
+    if mesh.face_normals is not None:
+        columns.append(mesh.face_normals)
+    corners = np.stack([np.asarray(c, np.int64).ravel() for c in columns], axis=1)
+    unique, inverse = np.unique(corners, axis=0, return_inverse=True)
+    return unique, inverse.reshape(-1, 3)
+
+
+def _corner_layout(token):
+    """
+    Work out which attributes a face corner such as b'1/2/3' or b'1//3' carries.
+
+    Returns:
+        tuple: (has_texcoord, has_normal)
+    """
+    parts = token.split(b'/')
+    has_texcoord = len(parts) > 1 and parts[1] != b''
+    has_normal = len(parts) > 2 and parts[2] != b''
+    return has_texcoord, has_normal
+
+
+def _check_layout(text, layout, f_lines):
+    """
+    Check that every face corner has the layout of the first face.
+
+    The slashes of each whitespace-separated token are counted with NumPy, so
+    the check costs a few passes over the bytes instead of a loop over corners.
+    Relies on the caller having replaced tabs with spaces.
+
+    Raises:
+        ValueError: Naming the first face line whose corners differ
+    """
+    has_texcoord, has_normal = layout
+    buf = np.frombuffer(text, np.uint8)
+    blank = buf <= 32
+    starts = np.flatnonzero(blank[:-1] & ~blank[1:]) + 1
+    if len(buf) and not blank[0]:
+        starts = np.concatenate(([0], starts))
+    # One sum per token counts both: a slash weighs 1, a slash right after another
+    # one weighs 1 + 8, and no valid corner has eight slashes
+    weight = (buf == 47).view(np.uint8)
+    weight[1:] += (weight[1:] & weight[:-1]) << 3
+    per_token = np.add.reduceat(weight, starts, dtype=np.int32) if len(starts) else np.zeros(0, np.int32)
+    expected = (2 if has_normal else int(has_texcoord)) + 8 * (has_normal and not has_texcoord)
+    bad = np.flatnonzero(per_token != expected)
+    if len(bad):
+        line = int(np.count_nonzero(buf[:starts[bad[0]]] == 10))
+        raise ValueError(f"Face 'f {f_lines[line].decode('utf-8', 'replace').strip()}' does not match "
+                         f"the corner layout of the first face")
+
+
+def _fix_indices(indices, count):
+    """
+    Convert one-based (or negative, relative) OBJ indices to zero-based indices.
+
+    Args:
+        indices (np.ndarray): Indices as written in the file
+        count: Number of elements defined before each face; a scalar or an array
+            that broadcasts against indices
+    """
+    indices = indices.astype(np.int64)
+    return np.where(indices < 0, indices + count, indices - 1).astype(np.int32)
+
+
+def _parse_rows(lines, width):
+    """
+    Parse the numbers of v, vt or vn lines into a (len(lines), width) float32 array.
+
+    All lines are converted by one np.fromstring call; lines with extra components
+    (w or vertex colours) or trailing comments fall back to a loop over the lines.
+    """
+    try:
+        values = np.fromstring(b'\n'.join(lines), dtype=np.float32, sep=' ')
+    except ValueError:
+        values = None
+    if values is None or values.size != width * len(lines):
+        values = np.array([l.split(b'#', 1)[0].split()[:width] for l in lines], dtype=np.float32)
+    return values.reshape(-1, width)
+
+
+class _ObjParser:
+    """Accumulates arrays across chunks of an OBJ file"""
+
+    def __init__(self):
+        self.vertices = []
+        self.texcoords = []
+        self.normals = []
+        self.corners = []
+        self.face_materials = []
+        self.material_names = []
+        self.mtllibs = []
+        self.layout = None
+        self.vertex_count = 0
+        self.texcoord_count = 0
+        self.normal_count = 0
+        self.current_material = 0
+
+    def feed(self, data):
+        """Parse a block of complete lines"""
+        before = (self.vertex_count, self.texcoord_count, self.normal_count)
+        v_lines, vt_lines, vn_lines, f_lines = [], [], [], []
+        # (face line count at which each material starts, material index)
+        material_starts = []
+
+        for line in data.replace(b'\t', b' ').split(b'\n'):
+            head = line[:3]
+            if head[:2] == b'v ':
+                v_lines.append(line[2:])
+            elif head == b'vt ':
+                vt_lines.append(line[3:])
+            elif head[:2] == b'f ':
+                f_lines.append(line[2:])
+            elif head == b'vn ':
+                vn_lines.append(line[3:])
+            elif line.startswith(b'usemtl '):
+                name = line[7:].strip().decode('utf-8', 'replace')
+                if name not in self.material_names:
+                    self.material_names.append(name)
+                material_starts.append((len(f_lines), self.material_names.index(name)))
+            elif line.startswith(b'mtllib '):
+                self.mtllibs.extend(line[7:].strip().decode('utf-8', 'replace').split())
+
+        if v_lines:
+            self.vertices.append(_parse_rows(v_lines, 3))
+            self.vertex_count += len(v_lines)
+        if vt_lines:
+            self.texcoords.append(_parse_rows(vt_lines, 2))
+            self.texcoord_count += len(vt_lines)
+        if vn_lines:
+            self.normals.append(_parse_rows(vn_lines, 3))
+            self.normal_count += len(vn_lines)
+        if f_lines:
+            self._feed_faces(f_lines, material_starts, data, before)
+        elif material_starts:
+            self.current_material = material_starts[-1][1]
+
+    @staticmethod
+    def _counts_at_faces(data, before):
+        """
+        The (v, vt, vn) counts in effect at every face line of a block.
+
+        Relative indices refer to the elements defined above their own face line,
+        which only matters when v and f lines are interleaved, so this second pass
+        over the block runs only when negative indices appear.
+        """
+        counts = list(before)
+        rows = []
+        for line in data.replace(b'\t', b' ').split(b'\n'):
+            head = line[:3]
+            if head[:2] == b'v ':
+                counts[0] += 1
+            elif head == b'vt ':
+                counts[1] += 1
+            elif head[:2] == b'f ':
+                rows.append(tuple(counts))
+            elif head == b'vn ':
+                counts[2] += 1
+        return np.array(rows, np.int64).reshape(-1, 3)
+
+    def _feed_faces(self, f_lines, material_starts, data, before):
+        text = b'\n'.join(f_lines)
+        if b'#' in text:
+            # Trailing comments such as 'f 1 2 3 # first' would stop np.fromstring
+            f_lines = [line.split(b'#', 1)[0] for line in f_lines]
+            text = b'\n'.join(f_lines)
+        if self.layout is None:
+            self.layout = _corner_layout(f_lines[0].split(None, 1)[0])
+        has_texcoord, has_normal = self.layout
+        width = 1 + has_texcoord + has_normal
+
+        _check_layout(text, self.layout, f_lines)
+        values = np.fromstring(text.replace(b'/', b' '), dtype=np.int64, sep=' ')
+        if values.size == 3 * width * len(f_lines):
+            # Fast path: every face is a triangle
+            corners = values.reshape(-1, 3, width)
+            line_of_triangle = np.arange(len(f_lines))
+        else:
+            # Polygons: fan-triangulate each face around its first corner
+            counts = np.array([len(l.split()) for l in f_lines])
+            values = values.reshape(-1, width)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            triangles_per_line = np.maximum(counts - 2, 0)
+            line_of_triangle = np.repeat(np.arange(len(f_lines)), triangles_per_line)
+            offset = np.arange(len(line_of_triangle)) - np.repeat(np.cumsum(triangles_per_line) - triangles_per_line,
+                                                                   triangles_per_line)
+            first = starts[line_of_triangle]
+            corners = np.stack([values[first], values[first + offset + 1], values[first + offset + 2]], axis=1)
+
+        if (corners < 0).any():
+            counts = self._counts_at_faces(data, before)[line_of_triangle][:, None, :]
+        else:
+            counts = np.array([self.vertex_count, self.texcoord_count, self.normal_count])
+        fixed = np.empty(corners.shape, np.int32)
+        fixed[..., 0] = _fix_indices(corners[..., 0], counts[..., 0])
+        column = 1
+        if has_texcoord:
+            fixed[..., column] = _fix_indices(corners[..., column], counts[..., 1])
+            column += 1
+        if has_normal:
+            fixed[..., column] = _fix_indices(corners[..., column], counts[..., 2])
+        self.corners.append(fixed)
+
+        # Material of every face line, then of every triangle
+        line_materials = np.full(len(f_lines), self.current_material, np.int16)
+        for start, material in material_starts:
+            line_materials[start:] = material
+        if material_starts:
+            self.current_material = material_starts[-1][1]
+        self.face_materials.append(line_materials[line_of_triangle])
+
+    def build(self, source_path=None):
+        has_texcoord, has_normal = self.layout or (False, False)
+        corners = np.concatenate(self.corners) if self.corners else np.zeros((0, 3, 1), np.int32)
+        column = 1
+        face_texcoords = face_normals = None
+        if has_texcoord:
+            face_texcoords = np.ascontiguousarray(corners[..., column])
+            column += 1
+        if has_normal:
+            face_normals = np.ascontiguousarray(corners[..., column])
+        return Mesh(
+            vertices=np.concatenate(self.vertices) if self.vertices else None,
+            faces=np.ascontiguousarray(corners[..., 0]),
+            texcoords=np.concatenate(self.texcoords) if self.texcoords else None,
+            normals=np.concatenate(self.normals) if self.normals else None,
+            face_texcoords=face_texcoords,
+            face_normals=face_normals,
+            face_materials=np.concatenate(self.face_materials) if self.face_materials else None,
+            material_names=self.material_names,
+            mtllibs=self.mtllibs,
+            source_path=source_path,
+        )
+
+
+def load_obj(obj_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load an OBJ file into a Mesh.
+
+    Args:
+        obj_path (str): Path to the .obj file
+        chunk_size (int): Parse the file in blocks of about this many bytes, cut at
+            line boundaries
+
+    Returns:
+        Mesh: The parsed mesh
+    """
+    parser = _ObjParser()
+    for chunk in iter_line_blocks(obj_path, chunk_size):
+        parser.feed(chunk)
+    return parser.build(source_path=os.path.abspath(obj_path))
+
+
+def _format_rows(fmt, array):
+    """Format every row of a 2D array with a printf-style template, one line each"""
+    if not len(array):
+        return ''
+    return '\n'.join(map(fmt.__mod__, map(tuple, array.tolist()))) + '\n'
+
+
+def copy_material_files(source_obj_path, output_dir):
+    """
+    Copy the material libraries and textures of an OBJ next to a derived OBJ.
+
+    Args:
+        source_obj_path (str): The original .obj file
+        output_dir (str): Directory of the derived .obj file
+
+    Returns:
+        list: Referenced files that do not exist and could not be copied
+    """
+    missing = []
+    mtl_paths, textures = material_files(source_obj_path)
+    for path in mtl_paths + textures:
+        target = os.path.join(output_dir, os.path.basename(path))
+        if not os.path.exists(path):
+            missing.append(path)
+        elif os.path.abspath(path) != os.path.abspath(target):
+            shutil.copy2(path, target)
+    return missing
+
+
+def save_obj(mesh, obj_path, copy_materials=True):
+    """
+    Write a Mesh as an OBJ file that the UE5 importer can read.
+
+    Args:
+        mesh (Mesh): The mesh to write
+        obj_path (str): Output .obj path
+        copy_materials (bool): Copy the source mesh's .mtl and textures next to
+            the output so the mtllib references keep working
+
+    Returns:
+        str: The output path
+    """
+    output_dir = os.path.dirname(os.path.abspath(obj_path))
+    os.makedirs(output_dir, exist_ok=True)
+    if copy_materials and mesh.source_path and os.path.exists(mesh.source_path):
+        for path in copy_material_files(mesh.source_path, output_dir):
+            print(f"Warning: {os.path.basename(mesh.source_path)} references missing file {path}")
+
+    columns = [mesh.faces + 1]
+    corner = '%d'
+    if mesh.face_texcoords is not None:
+        columns.append(mesh.face_texcoords + 1)
+        corner += '/%d'
+    if mesh.face_normals is not None:
+        if mesh.face_texcoords is None:
+            corner += '/'
+        columns.append(mesh.face_normals + 1)
+        corner += '/%d'
+    # Interleave the index columns so each row reads v/vt/vn for the three corners
+    face_rows = np.stack(columns, axis=2).reshape(len(mesh.faces), -1)
+    face_fmt = 'f ' + ' '.join([corner] * 3)
+
+    with open(obj_path, 'w') as f:
+        f.write("# Written by obj_loader.py\n")
+        for mtllib in mesh.mtllibs:
+            f.write(f"mtllib {mtllib}\n")
+        f.write(_format_rows('v %.8f %.8f %.8f', mesh.vertices))
+        f.write(_format_rows('vt %.8f %.8f', mesh.texcoords))
+        f.write(_format_rows('vn %.8f %.8f %.8f', mesh.normals))
+
+        # Start a usemtl group wherever the material changes
+        materials = np.asarray(mesh.face_materials)
+        if mesh.material_names and len(materials):
+            breaks = np.flatnonzero(np.diff(materials)) + 1
+            starts = np.concatenate(([0], breaks))
+            ends = np.concatenate((breaks, [len(materials)]))
+        else:
+            starts, ends = [0], [len(face_rows)]
+        for start, end in zip(starts, ends):
+            if mesh.material_names:
+                f.write(f"usemtl {mesh.material_names[materials[start]]}\n")
+            f.write(_format_rows(face_fmt, face_rows[start:end]))
+    return obj_path
+
+
+def load_obj_naive(obj_path):
+    """
+    Reference line-by-line parser, kept for benchmarking load_obj.
+
+    Args:
+        obj_path (str): Path to the .obj file
+
+    Returns:
+        Mesh: The parsed mesh (triangles only, no materials)
+    """
+    vertices, texcoords, normals, faces, face_texcoords, face_normals = [], [], [], [], [], []
+    with open(obj_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == 'v':
+                vertices.append([float(p) for p in parts[1:4]])
+            elif parts[0] == 'vt':
+                texcoords.append([float(p) for p in parts[1:3]])
+            elif parts[0] == 'vn':
+                normals.append([float(p) for p in parts[1:4]])
+            elif parts[0] == 'f':
+                corners = [p.split('/') for p in parts[1:4]]
+                faces.append([int(c[0]) - 1 for c in corners])
+                if len(corners[0]) > 1 and corners[0][1]:
+                    face_texcoords.append([int(c[1]) - 1 for c in corners])
+                if len(corners[0]) > 2 and corners[0][2]:
+                    face_normals.append([int(c[2]) - 1 for c in corners])
+    return Mesh(vertices, faces,
+                texcoords=np.array(texcoords, np.float32).reshape(-1, 2),
+                normals=np.array(normals, np.float32).reshape(-1, 3),
+                face_texcoords=np.array(face_texcoords, np.int32) if face_texcoords else None,
+                face_normals=np.array(face_normals, np.int32) if face_normals else None,
+                source_path=os.path.abspath(obj_path))
+
+
+def benchmark(obj_path, repeat=3):
+    """
+    Compare load_obj against the naive line-by-line parser.
+
+    Args:
+        obj_path (str): OBJ file to parse
+        repeat (int): Number of runs per parser; the fastest run is reported
+
+    Returns:
+        dict: Best time in seconds for 'naive', 'vectorized' and 'chunked' parsing
+    """
+    timings = {}
+    parsers = {
+        'naive': load_obj_naive,
+        'vectorized': load_obj,
+        'chunked': lambda path: load_obj(path, chunk_size=256 * 1024),
+    }
+    for name, parse in parsers.items():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(obj_path)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+
+def main():
+    """
+    Load an OBJ file and print a summary, optionally benchmarking the parser.
+    """
+    parser = argparse.ArgumentParser(description='Parse an OBJ mesh into NumPy arrays')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare against a naive line-by-line parser')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    mesh = load_obj(args.obj_path)
+    elapsed = time.perf_counter() - start
+    low, high = mesh.bounds()
+    print(f"{mesh} loaded in {elapsed * 1000:.1f} ms ({mesh.nbytes / 1e6:.2f} MB of arrays)")
+    print(f"Bounds: min {low.tolist()} max {high.tolist()}")
+    print(f"Materials: {mesh.material_names}  Libraries: {mesh.mtllibs}")
+
+    if args.benchmark:
+        timings = benchmark(args.obj_path)
+        for name, seconds in timings.items():
+            print(f"{name:>10}: {seconds * 1000:8.1f} ms  ({timings['naive'] / seconds:5.1f}x vs naive)")
+
+
+if __name__ == "__main__":
+    main()
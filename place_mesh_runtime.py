@@ -15,9 +15,9 @@ Requirements:
 Example usage:
 python place_mesh_runtime.py --blueprint_path /Game/Meshes/MeshBP --location 0,0,100
 """
-import unrealcv
 import argparse
-import time
+
+import unrealcv_session
 
 def main():
     """
@@ -45,36 +45,15 @@ def main():
                         help='Scale of the object (X,Y,Z)')
     args = parser.parse_args()
 
-    # Connect to UnrealCV
-    client = unrealcv.Client(('localhost', 9000))
-    
+    # Borrow a warm connection from the shared session pool
     print("Attempting to connect to UnrealCV...")
+    pool = unrealcv_session.get_pool()
+    client = pool.acquire()
     
-    # Try to connect for 30 seconds
-    timeout = 30
-    connected = False
-    
-    for i in range(timeout):
-        if client.isconnected():
-            connected = True
-            break
-        else:
-            try:
-                client.connect()
-                if client.isconnected():
-                    connected = True
-                    break
-            except:
-                pass
-            print(f"Waiting for UnrealCV connection... {i+1}/{timeout}")
-            time.sleep(1)
-    
-    if not connected:
+    if client is None:
         print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
         return
     
-    print("Connected to UnrealCV!")
-    
     # Parse location
     x, y, z = map(float, args.location.split(','))
     
@@ -104,7 +83,7 @@ def main():
     
     if response.startswith('error'):
         print(f"Error spawning object: {response}")
-        client.disconnect()
+        pool.release(client)
         return
     
     print(f"Object spawned with ID: {response}")
@@ -142,8 +121,8 @@ def main():
     except KeyboardInterrupt:
         print("\nExiting...")
     finally:
-        client.disconnect()
-        print("Disconnected from UnrealCV")
+        pool.release(client)
+        print("Released UnrealCV session")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,408 @@
+"""
+Placement Benchmark
+===================
+
+Measures connect time, spawn round trips and end-to-end placement throughput
+against an UnrealCV endpoint, records p50/p95/p99 latencies and throughput to
+JSON, and compares them with a stored baseline. Any regression beyond the
+tolerance makes the run exit with status 1.
+
+Scenarios:
+    connect             open a new session (greeting included) and close it again
+    single_spawn        one full hunyuan3d_ue5_demo.place_in_runtime call per sample
+    serial_transforms   location, rotation and scale set one request at a time on a spawned object
+    batch_placement     batch_placement.place_batch of --batch_size objects per sample
+    reconnect           break the session's socket, then time the request that has to recover
+
+The placement scenarios call the same functions the demo uses, not copies of
+them, so changes to the placement path show up here. Objects spawned by the
+benchmark are left in the level.
+
+Example usage:
+python placement_benchmark.py --output results.json
+python placement_benchmark.py --save_baseline baseline.json
+python placement_benchmark.py --baseline baseline.json --tolerance 0.25
+python placement_benchmark.py --mock --mock_latency 2 --samples 100
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import time
+
+import batch_placement
+import hunyuan3d_ue5_demo
+import unrealcv_session
+
+DEFAULT_BLUEPRINT = '/Game/Meshes/MeshBP'
+DEFAULT_TOLERANCE = 0.25
+# Latency changes smaller than this are noise, whatever the relative change
+MIN_LATENCY_DELTA_MS = 0.5
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, pct):
+    """
+    Args:
+        values (list): Sorted values
+        pct (float): Percentile, 0-100
+
+    Returns:
+        float: Nearest-rank percentile, or None for an empty list
+    """
+    if not values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(values) + 0.4999)))
+    return values[min(rank, len(values)) - 1]
+
+
+def summarize(latencies, units, seconds, errors=0, unit='ops'):
+    """
+    Args:
+        latencies (list): Seconds per sample
+        units (int): Work done (operations or objects) over all samples
+        seconds (float): Wall-clock seconds for all samples
+        errors (int): Samples that failed
+        unit (str): Name of the throughput unit
+
+    Returns:
+        dict: samples, errors, mean/p50/p95/p99 in milliseconds, throughput per second
+    """
+    ordered = sorted(latencies)
+    result = {'samples': len(ordered), 'errors': errors,
+              'mean_ms': sum(ordered) / len(ordered) * 1000 if ordered else None}
+    for pct in PERCENTILES:
+        value = percentile(ordered, pct)
+        result[f'p{pct}_ms'] = value * 1000 if value is not None else None
+    result['throughput'] = units / seconds if seconds > 0 else None
+    result['unit'] = f"{unit}/s"
+    return result
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Hide the progress output of the placement code while timing it"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _timed(samples, run):
+    """Call run() `samples` times; return the latencies, error count and total seconds"""
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(samples):
+        sample_start = time.perf_counter()
+        try:
+            ok = run()
+        except ConnectionError:
+            ok = False
+        if ok:
+            latencies.append(time.perf_counter() - sample_start)
+        else:
+            errors += 1
+    return latencies, errors, time.perf_counter() - start
+
+
+def bench_connect(endpoint, samples, **_):
+    """Open and close a fresh session per sample"""
+    def run():
+        session = unrealcv_session.UnrealCVSession(endpoint, connect_timeout=5.0, verbose=False)
+        with _quiet():
+            ok = session.connect()
+            session.disconnect()
+        return ok
+
+    latencies, errors, seconds = _timed(samples, run)
+    return summarize(latencies, len(latencies), seconds, errors, 'connects')
+
+
+def bench_single_spawn(endpoint, samples, blueprint, **_):
+    """Place one object per sample through the demo's place_in_runtime"""
+    def run():
+        with _quiet():
+            return hunyuan3d_ue5_demo.place_in_runtime(blueprint, '0,0,100', '0,90,0', '1,1,1',
+                                                       interactive=False)
+
+    # The first placement may probe for the spawn syntax; keep it out of the numbers
+    run()
+    latencies, errors, seconds = _timed(samples, run)
+    return summarize(latencies, len(latencies), seconds, errors, 'objects')
+
+
+def bench_serial_transforms(endpoint, samples, blueprint, session, **_):
+    """Set location, rotation and scale one request at a time on a placed object"""
+    name = f"BenchTransform_{time.time_ns()}"
+    placements = [{'blueprint': blueprint, 'name': name, 'location': (0, 0, 100), 'rotation': None, 'scale': None}]
+    with _quiet():
+        if not batch_placement.place_batch(placements, session)[0]['ok']:
+            return summarize([], 0, 0.0, samples, 'requests')
+
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for i in range(samples):
+        for command in (f"vset /object/{name}/location {i} 0 100", f"vset /object/{name}/rotation 0 {i % 360} 0",
+                        f"vset /object/{name}/scale 1 1 {1 + i % 3}"):
+            request_start = time.perf_counter()
+            try:
+                response = session.request(command)
+            except ConnectionError:
+                response = None
+            if response is None or str(response).startswith('error'):
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - request_start)
+    return summarize(latencies, len(latencies), time.perf_counter() - start, errors, 'requests')
+
+
+def bench_batch_placement(endpoint, samples, blueprint, session, batch_size=100, **_):
+    """Place batch_size objects per sample through batch_placement.place_batch"""
+    prefix = f"BenchBatch_{time.time_ns()}"
+    failed_objects = 0
+
+    def run():
+        nonlocal failed_objects
+        placements = [{'blueprint': blueprint, 'name': None, 'location': (i * 100.0, 0.0, 100.0),
+                       'rotation': (0.0, 90.0, 0.0), 'scale': None} for i in range(batch_size)]
+        with _quiet():
+            results = batch_placement.place_batch(placements, session, name_prefix=f"{prefix}_{time.time_ns()}")
+        failed_objects += sum(1 for r in results if not r['ok'])
+        return all(r['ok'] for r in results)
+
+    latencies, errors, seconds = _timed(samples, run)
+    result = summarize(latencies, samples * batch_size - failed_objects, seconds, errors, 'objects')
+    result['batch_size'] = batch_size
+    return result
+
+
+def bench_reconnect(endpoint, samples, **_):
+    """Break the socket under a live session, then time the request that recovers from it"""
+    session = unrealcv_session.UnrealCVSession(endpoint, connect_timeout=5.0, verbose=False)
+    with _quiet():
+        if not session.connect():
+            return summarize([], 0, 0.0, samples, 'recoveries')
+
+    def run():
+        sock = getattr(session.client, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        with _quiet():
+            return not str(session.request('vget /unrealcv/version')).startswith('error')
+
+    try:
+        latencies, errors, seconds = _timed(samples, run)
+    finally:
+        with _quiet():
+            session.disconnect()
+    return summarize(latencies, len(latencies), seconds, errors, 'recoveries')
+
+
+SCENARIOS = {
+    'connect': bench_connect,
+    'single_spawn': bench_single_spawn,
+    'serial_transforms': bench_serial_transforms,
+    'batch_placement': bench_batch_placement,
+    'reconnect': bench_reconnect,
+}
+
+
+def run_benchmarks(endpoint, scenarios=None, samples=50, blueprint=DEFAULT_BLUEPRINT, batch_size=100, verbose=True):
+    """
+    Run the benchmark scenarios against an endpoint.
+
+    Args:
+        endpoint (tuple): (host, port) of the UnrealCV server
+        scenarios (list): Scenario names (default: all of SCENARIOS)
+        samples (int): Samples per scenario (batches for batch_placement)
+        blueprint (str): Blueprint asset path to spawn
+        batch_size (int): Objects per batch_placement sample
+
+    Returns:
+        dict: endpoint, time, settings and per-scenario results
+
+    Raises:
+        ConnectionError: If the endpoint cannot be reached
+    """
+    scenarios = list(scenarios or SCENARIOS)
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    # place_in_runtime uses the shared pool for the default endpoint
+    unrealcv_session.set_default_endpoint(endpoint)
+    pool = unrealcv_session.get_pool(endpoint)
+    with _quiet():
+        session = pool.acquire()
+    if session is None:
+        raise ConnectionError(f"Could not connect to UnrealCV at {endpoint[0]}:{endpoint[1]}")
+
+    report = {'endpoint': f"{endpoint[0]}:{endpoint[1]}", 'time': time.time(), 'samples': samples,
+              'blueprint': blueprint, 'scenarios': {}}
+    try:
+        for name in scenarios:
+            if verbose:
+                print(f"Running {name}...")
+            # Scenarios that go through the pool must be able to borrow the session
+            if name == 'single_spawn':
+                pool.release(session)
+                session = None
+            try:
+                report['scenarios'][name] = SCENARIOS[name](endpoint=endpoint, samples=samples, blueprint=blueprint,
+                                                            session=session, batch_size=batch_size)
+            finally:
+                if session is None:
+                    with _quiet():
+                        session = pool.acquire()
+                    if session is None:
+                        raise ConnectionError(f"Lost the connection to UnrealCV at {endpoint[0]}:{endpoint[1]}")
+    finally:
+        if session is not None:
+            pool.release(session)
+    return report
+
+
+def print_report(report):
+    """
+    Print one row per scenario.
+
+    Args:
+        report (dict): Report returned by run_benchmarks
+    """
+    def ms(value):
+        return f"{value:9.2f}" if value is not None else f"{'-':>9}"
+
+    print(f"\nUnrealCV endpoint {report['endpoint']}, {report['samples']} samples per scenario")
+    print(f"{'Scenario':<20} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9} {'Throughput':>20} {'Errors':>7}")
+    print("-" * 90)
+    for name, result in report['scenarios'].items():
+        throughput = (f"{result['throughput']:.1f} {result['unit']}" if result['throughput'] is not None else '-')
+        print(f"{name:<20} {ms(result['p50_ms'])} {ms(result['p95_ms'])} {ms(result['p99_ms'])} "
+              f"{ms(result['mean_ms'])} {throughput:>20} {result['errors']:>7}")
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE, min_delta_ms=MIN_LATENCY_DELTA_MS):
+    """
+    Compare a report with a baseline report.
+
+    A latency percentile regresses when it is more than `tolerance` (relative)
+    and more than `min_delta_ms` (absolute) above the baseline. Throughput
+    regresses when it drops by more than `tolerance`. New errors in a scenario
+    that had none are a regression too.
+
+    Args:
+        report (dict): Report returned by run_benchmarks
+        baseline (dict): An earlier report
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%
+        min_delta_ms (float): Latency changes below this are ignored
+
+    Returns:
+        list: Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for name, result in report['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if base is None:
+            continue
+        for pct in PERCENTILES:
+            key = f'p{pct}_ms'
+            current, previous = result.get(key), base.get(key)
+            if current is None or previous is None:
+                continue
+            if current > previous * (1 + tolerance) and current - previous > min_delta_ms:
+                regressions.append(f"{name} {key}: {previous:.2f} -> {current:.2f} ms "
+                                   f"(+{(current / previous - 1) * 100 if previous else float('inf'):.0f}%)")
+        current, previous = result.get('throughput'), base.get('throughput')
+        if current is not None and previous and current < previous / (1 + tolerance):
+            regressions.append(f"{name} throughput: {previous:.1f} -> {current:.1f} {result['unit']} "
+                               f"({(current / previous - 1) * 100:.0f}%)")
+        if result.get('errors') and not base.get('errors'):
+            regressions.append(f"{name}: {result['errors']} failed samples (baseline had none)")
+    return regressions
+
+
+def _write_json(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    """
+    Run the benchmark, write the results and check them against a baseline.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark UnrealCV placement latency and throughput')
+    parser.add_argument('--host', type=str, default=unrealcv_session.DEFAULT_HOST, help='UnrealCV host')
+    parser.add_argument('--port', type=int, default=unrealcv_session.DEFAULT_PORT, help='UnrealCV port')
+    parser.add_argument('--mock', action='store_true',
+                        help='Benchmark against an in-process mock_unrealcv_server instead of a game')
+    parser.add_argument('--mock_latency', type=float, default=0.0, help='Mock server round-trip latency in ms')
+    parser.add_argument('--mock_jitter', type=float, default=0.0, help='Mock server latency jitter in ms')
+    parser.add_argument('--blueprint_path', type=str, default=DEFAULT_BLUEPRINT, help='Blueprint to spawn')
+    parser.add_argument('--scenarios', type=str, default=','.join(SCENARIOS),
+                        help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})")
+    parser.add_argument('--samples', type=int, default=50, help='Samples per scenario')
+    parser.add_argument('--batch_size', type=int, default=100, help='Objects per batch_placement sample')
+    parser.add_argument('--output', type=str, default=None, help='Write the results to this JSON file')
+    parser.add_argument('--baseline', type=str, default=None, help='Compare with this baseline JSON file')
+    parser.add_argument('--save_baseline', type=str, default=None, help='Write the results as a new baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed relative regression before failing (default: 0.25)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading baseline {args.baseline}: {e}")
+            sys.exit(2)
+
+    server = None
+    endpoint = (args.host, args.port)
+    if args.mock:
+        import mock_unrealcv_server
+        server = mock_unrealcv_server.MockUnrealCVServer(port=0, latency=args.mock_latency / 1000.0,
+                                                         jitter=args.mock_jitter / 1000.0).start()
+        endpoint = server.endpoint
+        print(f"Started mock UnrealCV server on {endpoint[0]}:{endpoint[1]}")
+
+    try:
+        report = run_benchmarks(endpoint, [s.strip() for s in args.scenarios.split(',') if s.strip()],
+                                args.samples, args.blueprint_path, args.batch_size)
+    except (ConnectionError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    finally:
+        unrealcv_session.close_all_pools()
+        if server is not None:
+            server.stop()
+
+    print_report(report)
+    for path in (args.output, args.save_baseline):
+        if path:
+            _write_json(path, report)
+            print(f"Results written to {path}")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\nREGRESSION against {args.baseline} (tolerance {args.tolerance * 100:.0f}%):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,694 @@
+"""
+Placement Index
+===============
+
+Client-side spatial index of the objects placed in a UE5 scene, used to pick
+locations that do not overlap anything placed before. Every object is kept as
+an axis-aligned bounding box in a uniform 2D grid (a dictionary of cells), so
+an overlap query only looks at the few cells the box touches. This stays well
+under a millisecond with tens of thousands of objects.
+
+Object bounds come from the OBJ that was imported. UE's importer turns the
+OBJ's Y-up axes into Z-up (OBJ x, y, z -> UE x, -z, y) and, with the default
+import settings, keeps 1 OBJ unit = 1 UE unit (cm). Use import_scale if the
+meshes were imported with a different uniform scale.
+
+On top of the free-location search there are three layouts over a region:
+- scatter: uniformly random positions, rejecting overlaps
+- grid: regular rows and columns, skipping occupied cells
+- poisson: Poisson-disk samples (Bridson's algorithm), evenly spread with a
+  minimum distance between objects
+
+Objects rest on the region's ground height. The index can be saved to a
+JSON file and loaded again to keep placing into the same scene across runs.
+
+Example usage:
+python placement_index.py --layout poisson --count 500 --region=-5000,-5000,5000,5000 \\
+    --blueprint /Game/Meshes/MeshBP --obj_path data/result/mesh.obj --import_scale 100 --output placements.jsonl
+python placement_index.py --benchmark 20000
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+DEFAULT_BOUNDS = ((-50.0, -50.0, 0.0), (50.0, 50.0, 100.0))
+DEFAULT_LOCATION = (0.0, 0.0, 100.0)
+LAYOUTS = ('scatter', 'grid', 'poisson')
+# Boxes covering more grid cells than this are kept in SpatialGrid.large
+DEFAULT_MAX_CELLS = 64
+
+
+def obj_bounds(obj_path, import_scale=1.0):
+    """
+    Local bounds of a mesh as it ends up in UE after import.
+
+    Args:
+        obj_path (str): Path to the .obj file
+        import_scale (float): Uniform scale the mesh was imported with
+
+    Returns:
+        tuple: ((min x, y, z), (max x, y, z)) relative to the actor origin, in UE units
+    """
+    import mesh_cache
+    low, high = (tuple(float(v) for v in corner) for corner in mesh_cache.load_mesh_cached(obj_path).bounds())
+    # OBJ z points towards the viewer; it becomes UE -Y, so its min and max swap
+    ue_low = (low[0], -high[2], low[1])
+    ue_high = (high[0], -low[2], high[1])
+    return (tuple(v * import_scale for v in ue_low), tuple(v * import_scale for v in ue_high))
+
+
+def transform_bounds(bounds, rotation=None, scale=None):
+    """
+    Local bounds of a mesh after the actor's scale and rotation are applied.
+
+    The box is scaled, rotated the way UE rotates actors (roll about X, then
+    pitch about Y, then yaw about Z) and replaced by the axis-aligned box
+    around the rotated one, which is what the index stores.
+
+    Args:
+        bounds (tuple): ((min x, y, z), (max x, y, z)) from obj_bounds
+        rotation (tuple): Actor rotation (Pitch, Yaw, Roll) in degrees, or None
+        scale (tuple): Actor scale (X, Y, Z), or None
+
+    Returns:
+        tuple: ((min x, y, z), (max x, y, z)) relative to the actor origin
+    """
+    low, high = bounds
+    if scale is not None:
+        # A negative scale mirrors the box, so its min and max swap
+        scaled = [(low[i] * scale[i], high[i] * scale[i]) for i in range(3)]
+        low, high = tuple(min(pair) for pair in scaled), tuple(max(pair) for pair in scaled)
+    if rotation is None or not any(rotation):
+        return (tuple(low), tuple(high))
+    pitch, yaw, roll = (math.radians(v) for v in rotation)
+    sp, cp = math.sin(pitch), math.cos(pitch)
+    sy, cy = math.sin(yaw), math.cos(yaw)
+    sr, cr = math.sin(roll), math.cos(roll)
+    # Where the local X, Y and Z axes point in the world (FRotationMatrix rows)
+    axes = ((cp * cy, cp * sy, sp),
+            (sr * sp * cy - cr * sy, sr * sp * sy + cr * cy, -sr * cp),
+            (-(cr * sp * cy + sr * sy), cy * sr - cr * sp * sy, cr * cp))
+    new_low, new_high = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+    for local in range(3):
+        for axis in range(3):
+            a, b = low[local] * axes[local][axis], high[local] * axes[local][axis]
+            new_low[axis] += min(a, b)
+            new_high[axis] += max(a, b)
+    return (tuple(new_low), tuple(new_high))
+
+
+def parse_region(value):
+    """
+    Args:
+        value (str): "min_x,min_y,max_x,max_y" with an optional ",ground_z"
+
+    Returns:
+        tuple: (min_x, min_y, max_x, max_y, ground_z)
+    """
+    parts = [float(v) for v in value.replace(' ', '').split(',') if v]
+    if len(parts) not in (4, 5):
+        raise ValueError(f"Expected min_x,min_y,max_x,max_y[,ground_z], got {value!r}")
+    min_x, min_y, max_x, max_y = parts[:4]
+    if max_x < min_x or max_y < min_y:
+        raise ValueError(f"Empty region {value!r}")
+    return (min_x, min_y, max_x, max_y, parts[4] if len(parts) == 5 else 0.0)
+
+
+class SpatialGrid:
+    """
+    Uniform 2D grid of axis-aligned boxes.
+
+    Each box is registered in every (x, y) cell its footprint touches; a query
+    collects the boxes registered in the cells its own box touches and tests
+    them exactly, in 3D. Scenes spread out sideways rather than up, so the grid
+    has no Z cells. A box that would cover more than max_cells cells is kept in
+    a short list of large boxes that every query checks instead, so one huge
+    object cannot flood the grid with cells.
+    """
+
+    def __init__(self, cell_size, max_cells=DEFAULT_MAX_CELLS):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+        self.max_cells = max_cells
+        self.cells = {}
+        self.boxes = {}
+        self.large = set()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def __contains__(self, key):
+        return key in self.boxes
+
+    def _cell_range(self, low, high):
+        size = self.cell_size
+        return [range(int(math.floor(low[axis] / size)), int(math.floor(high[axis] / size)) + 1)
+                for axis in range(2)]
+
+    def insert(self, key, low, high):
+        """
+        Add or move a box.
+
+        Args:
+            key: Identifier of the box (e.g. the object name)
+            low (tuple): Minimum corner
+            high (tuple): Maximum corner
+        """
+        if key in self.boxes:
+            self.remove(key)
+        low, high = tuple(map(float, low)), tuple(map(float, high))
+        self.boxes[key] = (low, high)
+        range_x, range_y = self._cell_range(low, high)
+        if len(range_x) * len(range_y) > self.max_cells:
+            self.large.add(key)
+            return
+        for x in range_x:
+            for y in range_y:
+                self.cells.setdefault((x, y), []).append(key)
+
+    def remove(self, key):
+        """
+        Remove a box; unknown keys are ignored.
+
+        Args:
+            key: Identifier of the box
+        """
+        box = self.boxes.pop(key, None)
+        if box is None:
+            return
+        if key in self.large:
+            self.large.remove(key)
+            return
+        range_x, range_y = self._cell_range(*box)
+        for x in range_x:
+            for y in range_y:
+                keys = self.cells.get((x, y))
+                if keys is not None:
+                    keys.remove(key)
+                    if not keys:
+                        del self.cells[(x, y)]
+
+    def rebuild(self, cell_size):
+        """
+        Register every box again for a new cell size.
+
+        Args:
+            cell_size (float): The new cell size
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        boxes = self.boxes
+        self.cell_size = float(cell_size)
+        self.cells, self.boxes, self.large = {}, {}, set()
+        for key, (low, high) in boxes.items():
+            self.insert(key, low, high)
+
+    def query(self, low, high, first=False):
+        """
+        Find the boxes overlapping a box. Boxes that only touch do not overlap.
+
+        Args:
+            low (tuple): Minimum corner
+            high (tuple): Maximum corner
+            first (bool): Stop at the first overlap
+
+        Returns:
+            list: Keys of the overlapping boxes
+        """
+        found = []
+        seen = set()
+        cells = self.cells
+        boxes = self.boxes
+        range_x, range_y = self._cell_range(low, high)
+        if len(range_x) * len(range_y) <= len(cells):
+            groups = [cells.get((x, y), ()) for x in range_x for y in range_y]
+        else:
+            # A query larger than the occupied area walks the occupied cells instead
+            groups = [keys for (x, y), keys in cells.items() if x in range_x and y in range_y]
+        groups.append(self.large)
+        for keys in groups:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                other_low, other_high = boxes[key]
+                if (low[0] < other_high[0] and other_low[0] < high[0] and
+                        low[1] < other_high[1] and other_low[1] < high[1] and
+                        low[2] < other_high[2] and other_low[2] < high[2]):
+                    found.append(key)
+                    if first:
+                        return found
+        return found
+
+
+class PlacementIndex:
+    """
+    The objects placed in a scene and where new ones can go.
+
+    Args:
+        cell_size (float): Grid cell size; by default twice the largest side of
+            the first object's footprint, which keeps queries to a handful of
+            cells, grown later if most objects turn out to be much larger
+        padding (float): Extra clearance kept around every object
+    """
+
+    def __init__(self, cell_size=None, padding=0.0):
+        self.padding = float(padding)
+        self.grid = SpatialGrid(cell_size) if cell_size else None
+        self.objects = {}
+        self._counter = 0
+        self._auto_cell_size = not cell_size
+        self._large_checked = 0
+
+    def __len__(self):
+        return len(self.objects)
+
+    def _world_box(self, location, bounds, padding=0.0):
+        (low, high) = bounds
+        return (tuple(location[i] + low[i] - padding for i in range(3)),
+                tuple(location[i] + high[i] + padding for i in range(3)))
+
+    def _ensure_grid(self, bounds):
+        if self.grid is None:
+            low, high = bounds
+            largest = max(high[i] - low[i] for i in range(2)) + 2 * self.padding
+            self.grid = SpatialGrid(2.0 * largest if largest > 0 else 100.0)
+
+    def _resize_grid(self):
+        # Large boxes are checked by every query; once they are a good share of the
+        # scene, grow the automatic cell size to twice the median footprint. The
+        # median is only recomputed when the number of large boxes has doubled.
+        grid = self.grid
+        if not self._auto_cell_size or len(grid.large) <= max(16, len(grid) // 4, 2 * self._large_checked):
+            return
+        sides = sorted(max(high[0] - low[0], high[1] - low[1]) for low, high in grid.boxes.values())
+        cell_size = 2.0 * (sides[len(sides) // 2] + 2 * self.padding)
+        if cell_size >= 2.0 * grid.cell_size:
+            grid.rebuild(cell_size)
+        self._large_checked = len(grid.large)
+
+    def add(self, name, location, bounds=DEFAULT_BOUNDS):
+        """
+        Record a placed object.
+
+        Args:
+            name (str): Object name (re-adding a name moves the object)
+            location (tuple): Actor location (X, Y, Z)
+            bounds (tuple): Local bounds from obj_bounds
+
+        Returns:
+            tuple: The object's world-space box (min corner, max corner)
+        """
+        self._ensure_grid(bounds)
+        location = tuple(float(v) for v in location)
+        self.objects[name] = {'location': location, 'bounds': [list(bounds[0]), list(bounds[1])]}
+        box = self._world_box(location, bounds)
+        self.grid.insert(name, *box)
+        self._resize_grid()
+        return box
+
+    def remove(self, name):
+        """
+        Forget a placed object.
+
+        Args:
+            name (str): Object name
+        """
+        if self.objects.pop(name, None) is not None:
+            self.grid.remove(name)
+
+    def is_free(self, location, bounds=DEFAULT_BOUNDS):
+        """
+        Args:
+            location (tuple): Candidate actor location
+            bounds (tuple): Local bounds of the object to place
+
+        Returns:
+            bool: True if the object would not overlap anything placed so far
+        """
+        if self.grid is None or not len(self.grid):
+            return True
+        return not self.grid.query(*self._world_box(location, bounds, self.padding), first=True)
+
+    def overlapping(self, location, bounds=DEFAULT_BOUNDS):
+        """
+        Returns:
+            list: Names of the placed objects an object at this location would overlap
+        """
+        if self.grid is None:
+            return []
+        return self.grid.query(*self._world_box(location, bounds, self.padding))
+
+    def _footprint(self, bounds):
+        low, high = bounds
+        return (high[0] - low[0] + self.padding, high[1] - low[1] + self.padding)
+
+    def next_name(self, prefix):
+        """
+        Returns:
+            str: An unused object name such as Placed_00003
+        """
+        while True:
+            name = f"{prefix}_{self._counter:05d}"
+            self._counter += 1
+            if name not in self.objects:
+                return name
+
+    def find_free_location(self, bounds=DEFAULT_BOUNDS, near=DEFAULT_LOCATION, max_rings=256, step=None):
+        """
+        Find the free location closest to a wanted one.
+
+        Candidates are tried on square rings around the wanted location, one
+        object footprint apart, nearest ring first.
+
+        Args:
+            bounds (tuple): Local bounds of the object to place
+            near (tuple): Wanted actor location; its Z is kept
+            max_rings (int): How many rings to search before giving up
+            step (float): Distance between candidates (default: the object's footprint)
+
+        Returns:
+            tuple: A free location, or None if none was found
+        """
+        near = tuple(float(v) for v in near)
+        if self.is_free(near, bounds):
+            return near
+        step_x, step_y = (step, step) if step else self._footprint(bounds)
+        step_x, step_y = max(step_x, 1e-6), max(step_y, 1e-6)
+        for ring in range(1, max_rings + 1):
+            candidates = []
+            for offset in range(-ring, ring + 1):
+                candidates.extend([(offset, -ring), (offset, ring)])
+                if abs(offset) != ring:
+                    candidates.extend([(-ring, offset), (ring, offset)])
+            candidates.sort(key=lambda c: c[0] * c[0] * step_x * step_x + c[1] * c[1] * step_y * step_y)
+            for i, j in candidates:
+                location = (near[0] + i * step_x, near[1] + j * step_y, near[2])
+                if self.is_free(location, bounds):
+                    return location
+        return None
+
+    def place(self, name=None, bounds=DEFAULT_BOUNDS, near=DEFAULT_LOCATION, prefix='Object'):
+        """
+        Find a free location near a wanted one and record the object there.
+
+        Returns:
+            dict: name and location, or None if no free location was found
+        """
+        location = self.find_free_location(bounds, near)
+        if location is None:
+            return None
+        name = name or self.next_name(prefix)
+        self.add(name, location, bounds)
+        return {'name': name, 'location': location}
+
+    def _ground_location(self, x, y, bounds, region):
+        # Put the bottom of the bounds on the ground
+        return (x, y, region[4] - bounds[0][2])
+
+    def _fits_region(self, x, y, bounds, region):
+        low, high = bounds
+        return (x + low[0] >= region[0] and x + high[0] <= region[2] and
+                y + low[1] >= region[1] and y + high[1] <= region[3])
+
+    def _accept(self, x, y, bounds, region, prefix, placed):
+        if not self._fits_region(x, y, bounds, region):
+            return False
+        location = self._ground_location(x, y, bounds, region)
+        if not self.is_free(location, bounds):
+            return False
+        name = self.next_name(prefix)
+        self.add(name, location, bounds)
+        placed.append({'name': name, 'location': location})
+        return True
+
+    def scatter(self, count, region, bounds=DEFAULT_BOUNDS, seed=None, max_attempts=30, prefix='Scatter'):
+        """
+        Place objects at uniformly random free positions in a region.
+
+        Args:
+            count (int): Number of objects
+            region (tuple): (min_x, min_y, max_x, max_y, ground_z), see parse_region
+            bounds (tuple): Local bounds of the object
+            seed (int): Random seed
+            max_attempts (int): Rejected positions per object before giving up on it
+            prefix (str): Prefix of the generated object names
+
+        Returns:
+            list: Placed objects as dicts with name and location (may be fewer than count)
+        """
+        rng = random.Random(seed)
+        placed = []
+        for _ in range(count):
+            for _ in range(max_attempts):
+                if self._accept(rng.uniform(region[0], region[2]), rng.uniform(region[1], region[3]),
+                                bounds, region, prefix, placed):
+                    break
+        return placed
+
+    def grid_layout(self, count, region, bounds=DEFAULT_BOUNDS, spacing=None, prefix='Grid'):
+        """
+        Place objects in rows and columns, skipping cells that are occupied.
+
+        Args:
+            count (int): Number of objects
+            region (tuple): (min_x, min_y, max_x, max_y, ground_z), see parse_region
+            bounds (tuple): Local bounds of the object
+            spacing (float): Distance between neighbours (default: the object's footprint)
+            prefix (str): Prefix of the generated object names
+
+        Returns:
+            list: Placed objects as dicts with name and location, row by row
+        """
+        step_x, step_y = (spacing, spacing) if spacing else self._footprint(bounds)
+        low, _ = bounds
+        placed = []
+        y = region[1] - low[1]
+        while len(placed) < count and y <= region[3]:
+            x = region[0] - low[0]
+            while len(placed) < count and x <= region[2]:
+                self._accept(x, y, bounds, region, prefix, placed)
+                x += step_x
+            y += step_y
+        return placed
+
+    def poisson_disk(self, region, bounds=DEFAULT_BOUNDS, radius=None, count=None, seed=None, k=30,
+                     prefix='Poisson'):
+        """
+        Place objects at Poisson-disk samples of a region (Bridson, 2007).
+
+        Samples are at least radius apart, so the layout looks natural without
+        clumps; samples that would overlap objects already in the index are
+        skipped.
+
+        Args:
+            region (tuple): (min_x, min_y, max_x, max_y, ground_z), see parse_region
+            bounds (tuple): Local bounds of the object
+            radius (float): Minimum distance between objects (default: the footprint diagonal)
+            count (int): Stop after this many objects (default: fill the region)
+            seed (int): Random seed
+            k (int): Candidates tried around each active sample
+            prefix (str): Prefix of the generated object names
+
+        Returns:
+            list: Placed objects as dicts with name and location
+        """
+        rng = random.Random(seed)
+        radius = radius or math.hypot(*self._footprint(bounds))
+        cell = radius / math.sqrt(2)
+        width, height = region[2] - region[0], region[3] - region[1]
+        columns, rows = int(width / cell) + 1, int(height / cell) + 1
+        samples = {}
+        active = []
+        placed = []
+
+        def too_close(x, y):
+            col, row = int((x - region[0]) / cell), int((y - region[1]) / cell)
+            for other_row in range(max(row - 2, 0), min(row + 3, rows)):
+                for other_col in range(max(col - 2, 0), min(col + 3, columns)):
+                    other = samples.get((other_col, other_row))
+                    if other and (other[0] - x) ** 2 + (other[1] - y) ** 2 < radius * radius:
+                        return True
+            return False
+
+        def add_sample(x, y):
+            samples[(int((x - region[0]) / cell), int((y - region[1]) / cell))] = (x, y)
+            active.append((x, y))
+            self._accept(x, y, bounds, region, prefix, placed)
+
+        # Samples over occupied areas are kept for spacing but not placed, so growth continues past them
+        add_sample(rng.uniform(region[0], region[2]), rng.uniform(region[1], region[3]))
+        while active and (count is None or len(placed) < count):
+            index = rng.randrange(len(active))
+            x, y = active[index]
+            for _ in range(k):
+                angle = rng.uniform(0, 2 * math.pi)
+                distance = rng.uniform(radius, 2 * radius)
+                new_x, new_y = x + distance * math.cos(angle), y + distance * math.sin(angle)
+                if region[0] <= new_x <= region[2] and region[1] <= new_y <= region[3] and \
+                        not too_close(new_x, new_y):
+                    add_sample(new_x, new_y)
+                    break
+            else:
+                active[index] = active[-1]
+                active.pop()
+        return placed[:count] if count is not None else placed
+
+    def layout(self, mode, count, region, bounds=DEFAULT_BOUNDS, seed=None, spacing=None, prefix=None):
+        """
+        Run one of the layouts by name ('scatter', 'grid' or 'poisson').
+
+        Returns:
+            list: Placed objects as dicts with name and location
+        """
+        if mode == 'scatter':
+            return self.scatter(count, region, bounds, seed, prefix=prefix or 'Scatter')
+        if mode == 'grid':
+            return self.grid_layout(count, region, bounds, spacing, prefix=prefix or 'Grid')
+        if mode == 'poisson':
+            return self.poisson_disk(region, bounds, spacing, count, seed, prefix=prefix or 'Poisson')
+        raise ValueError(f"Unknown layout '{mode}', expected one of {', '.join(LAYOUTS)}")
+
+    def save(self, path):
+        """
+        Write the placed objects to a JSON file.
+
+        Args:
+            path (str): Destination path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        # An automatic cell size is derived again from the objects on load
+        cell_size = None if self._auto_cell_size or self.grid is None else self.grid.cell_size
+        with open(temp_path, 'w') as f:
+            json.dump({'cell_size': cell_size, 'padding': self.padding, 'objects': self.objects}, f)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path, padding=None):
+        """
+        Read an index written by save(); a missing file gives an empty index.
+
+        Args:
+            path (str): Path of the JSON file
+            padding (float): Override the saved clearance
+
+        Returns:
+            PlacementIndex: The index
+        """
+        if not path or not os.path.exists(path):
+            return cls(padding=padding or 0.0)
+        with open(path, 'r') as f:
+            data = json.load(f)
+        index = cls(data.get('cell_size'), data.get('padding', 0.0) if padding is None else padding)
+        for name, entry in data.get('objects', {}).items():
+            index.add(name, entry['location'], (tuple(entry['bounds'][0]), tuple(entry['bounds'][1])))
+        return index
+
+
+def benchmark(count=20000, queries=10000, seed=0):
+    """
+    Time inserts and free-location queries on a scene with many objects.
+
+    Args:
+        count (int): Objects to place first
+        queries (int): Free-location checks to time afterwards
+        seed (int): Random seed
+
+    Returns:
+        dict: Seconds per insert and per query
+    """
+    # Not the scatter seed, or the queries would replay the positions just placed
+    rng = random.Random(seed + 1)
+    side = 200.0 * math.sqrt(count)
+    region = (-side / 2, -side / 2, side / 2, side / 2, 0.0)
+    index = PlacementIndex()
+
+    start = time.perf_counter()
+    placed = index.scatter(count, region, seed=seed)
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    free = 0
+    for _ in range(queries):
+        location = (rng.uniform(region[0], region[2]), rng.uniform(region[1], region[3]), 0.0)
+        free += index.is_free(location)
+    query_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(min(queries, 1000)):
+        index.find_free_location(near=(rng.uniform(region[0], region[2]), rng.uniform(region[1], region[3]), 0.0))
+    search_seconds = time.perf_counter() - start
+    searches = min(queries, 1000)
+
+    print(f"Placed {len(placed)} objects by scatter in {insert_seconds:.2f}s "
+          f"({insert_seconds / max(len(placed), 1) * 1e6:.1f} us per object incl. rejections)")
+    print(f"Overlap query:      {query_seconds / queries * 1e6:.1f} us ({free}/{queries} free)")
+    print(f"Free-location find: {search_seconds / searches * 1e6:.1f} us")
+    return {'insert': insert_seconds / max(len(placed), 1), 'query': query_seconds / queries,
+            'find_free': search_seconds / searches}
+
+
+def main():
+    """
+    Generate a collision-free placement manifest, or benchmark the index.
+    """
+    parser = argparse.ArgumentParser(description='Generate collision-free placements for place-batch')
+    parser.add_argument('--layout', choices=LAYOUTS, help='Layout to generate')
+    parser.add_argument('--count', type=int, default=100, help='Number of objects (default: 100)')
+    parser.add_argument('--region', type=parse_region, default=parse_region('-5000,-5000,5000,5000'),
+                        help='min_x,min_y,max_x,max_y[,ground_z] in UE units, e.g. --region=-5000,-5000,5000,5000 (default)')
+    parser.add_argument('--blueprint', type=str, default='/Game/Meshes/MeshBP', help='Blueprint of every row')
+    parser.add_argument('--obj_path', type=str,
+                        help='OBJ the blueprint was imported from, for its bounds (default: the asset index entry '
+                             'of --blueprint, if any)')
+    parser.add_argument('--import_scale', type=float, default=1.0,
+                        help='Uniform scale the mesh was imported with (default: 1)')
+    parser.add_argument('--spacing', type=float, help='Grid spacing or Poisson-disk radius (default: from the bounds)')
+    parser.add_argument('--padding', type=float, default=0.0, help='Clearance around every object')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    parser.add_argument('--scene', type=str,
+                        help='Index file of objects already placed; new objects avoid them and are added to it')
+    parser.add_argument('--output', type=str, help='Manifest to write (default: print JSONL to stdout)')
+    parser.add_argument('--benchmark', type=int, metavar='COUNT', help='Benchmark the index with COUNT objects')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.layout:
+        parser.error("--layout is required unless --benchmark is given")
+
+    bounds = DEFAULT_BOUNDS
+    if args.obj_path:
+        bounds = obj_bounds(args.obj_path, args.import_scale)
+    else:
+        import asset_index
+        record = asset_index.lookup(args.blueprint)
+        if record is not None:
+            bounds = asset_index.world_bounds(record, (args.import_scale,) * 3)
+    index = PlacementIndex.load(args.scene, args.padding)
+    start = time.perf_counter()
+    placed = index.layout(args.layout, args.count, args.region, bounds, args.seed, args.spacing)
+    elapsed = time.perf_counter() - start
+
+    rows = [json.dumps({'blueprint': args.blueprint, 'location': [round(v, 3) for v in p['location']],
+                        'name': p['name']}) for p in placed]
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write('\n'.join(rows) + ('\n' if rows else ''))
+    else:
+        print('\n'.join(rows))
+    if args.scene:
+        index.save(args.scene)
+    if args.output:
+        print(f"{args.layout}: placed {len(placed)}/{args.count} objects in {elapsed:.3f}s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Scene Mirror
+============
+
+An in-memory copy of the objects in a running UE5 level and their transforms,
+kept in sync with few UnrealCV requests. Instead of polling every object, the
+mirror:
+
+1. takes one snapshot: `vget /objects` plus a location, rotation and scale
+   query per object, all pipelined,
+2. listens to every command sent through the same UnrealCVSession (see
+   UnrealCVSession.add_listener), so spawns, transform updates and destroys
+   made by our own placement code update it without being queried back, and
+3. re-queries only what may have diverged: objects whose transform command
+   failed, objects touched by commands it cannot interpret (vbp), objects
+   spawned without a known transform, and new names found by sync().
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    mirror = SceneMirror(session)
+    mirror.snapshot()
+    batch_placement.place_batch(placements, session)   # tracked, no re-query
+    mirror.sync()                                      # 1 request + re-queries of unknowns only
+    mirror.find(prefix='BatchObject', within=((-500, -500, 0), (500, 500, 500)))
+
+Changes made behind the mirror's back (by the game itself, or by clients
+on other connections) are only picked up by sync() as added or removed names;
+call invalidate() to re-query the transforms of objects that may have moved.
+
+Example usage:
+python scene_mirror.py
+python scene_mirror.py --watch 2
+"""
+import argparse
+import re
+import threading
+import time
+
+import command_pipeline
+import unrealcv_session
+
+FIELDS = ('location', 'rotation', 'scale')
+
+_OBJECT_COMMAND = re.compile(r'^v(set|get) /object/([^/\s]+)/(\w+)\s*(.*)$')
+_SPAWN_COMMAND = re.compile(r'^vset /objects/spawn\s+(\S+)\s*(.*)$')
+_DESTROY_OPS = ('destroy', 'delete')
+
+
+def parse_vector(response):
+    """
+    Args:
+        response (str): UnrealCV reply such as "10.000 20.000 100.000"
+
+    Returns:
+        tuple: Three floats, or None if the reply is not a vector
+    """
+    try:
+        values = tuple(float(v) for v in str(response).replace(',', ' ').split())
+    except ValueError:
+        return None
+    return values if len(values) == 3 else None
+
+
+def _is_error(response):
+    return response is None or str(response).startswith('error')
+
+
+class SceneMirror:
+    """
+    Queryable view of the objects in the level, updated from session traffic.
+
+    Args:
+        session: A connected UnrealCVSession; the mirror listens to it until close()
+        max_in_flight (int): Pipelining window for the mirror's own queries
+    """
+
+    def __init__(self, session, max_in_flight=command_pipeline.DEFAULT_MAX_IN_FLIGHT):
+        self.session = session
+        self.max_in_flight = max_in_flight
+        self.objects = {}
+        self.names_stale = True
+        self.queries = 0
+        self.tracked = 0
+        self.last_sync = None
+        self._lock = threading.RLock()
+        session.add_listener(self._on_command)
+
+    def close(self):
+        """Stop listening to the session"""
+        self.session.remove_listener(self._on_command)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __contains__(self, name):
+        return name in self.objects
+
+    def _entry(self, name):
+        entry = self.objects.get(name)
+        if entry is None:
+            entry = {field: None for field in FIELDS}
+            entry['updated'] = None
+            self.objects[name] = entry
+        return entry
+
+    def _set_field(self, name, field, value):
+        entry = self._entry(name)
+        entry[field] = value
+        entry['updated'] = time.time()
+
+    def _on_command(self, command, response):
+        """Session listener: fold one answered command into the mirror"""
+        command = command.strip()
+        with self._lock:
+            match = _OBJECT_COMMAND.match(command)
+            if match:
+                verb, name, op, args = match.groups()
+                if op in FIELDS:
+                    if verb == 'get':
+                        self._set_field(name, op, None if _is_error(response) else parse_vector(response))
+                    elif _is_error(response):
+                        # The command may have half-applied or the object may be gone
+                        if name in self.objects:
+                            self.objects[name][op] = None
+                    else:
+                        self._set_field(name, op, parse_vector(args))
+                    self.tracked += verb == 'set'
+                elif op in _DESTROY_OPS and verb == 'set' and not _is_error(response):
+                    self.objects.pop(name, None)
+                    self.tracked += 1
+                return
+
+            if command == 'vget /objects':
+                if not _is_error(response):
+                    self._reconcile(str(response).split())
+                return
+
+            match = _SPAWN_COMMAND.match(command)
+            if match:
+                if _is_error(response):
+                    return
+                args = match.group(2).split()
+                location = parse_vector(' '.join(args)) if len(args) == 3 else None
+                name = str(response).strip() if location else (args[0] if args else None)
+                if not name or name == 'ok':
+                    self.names_stale = True
+                    return
+                self.objects[name] = {field: None for field in FIELDS}
+                self.objects[name]['updated'] = None
+                if location:
+                    self._set_field(name, 'location', location)
+                self.tracked += 1
+                return
+
+            if command.startswith('vbp '):
+                parts = command.split()
+                if len(parts) > 1 and parts[1] in self.objects:
+                    self.invalidate(parts[1])
+            elif command.startswith('vrun ') and 'spawn' in command.lower():
+                self.names_stale = True
+
+    def _reconcile(self, names):
+        names = set(names)
+        for name in list(self.objects):
+            if name not in names:
+                del self.objects[name]
+        for name in names:
+            self._entry(name)
+        self.names_stale = False
+
+    def _query(self, commands):
+        """Send the mirror's own queries; the listener applies the replies"""
+        pipeline = command_pipeline.CommandPipeline(self.session, max_in_flight=self.max_in_flight)
+        for command in commands:
+            pipeline.add(command)
+        self.queries += len(commands)
+        return pipeline.flush()
+
+    def invalidate(self, name=None, fields=FIELDS):
+        """
+        Forget transforms so that the next refresh() or sync() queries them again.
+
+        Args:
+            name (str): Object to invalidate (default: every object)
+            fields (tuple): Which transform fields to forget
+        """
+        with self._lock:
+            if name is None:
+                entries = list(self.objects.values())
+            else:
+                entries = [self.objects[name]] if name in self.objects else []
+            for entry in entries:
+                for field in fields:
+                    entry[field] = None
+
+    def unknown(self):
+        """
+        Returns:
+            list: (name, field) pairs whose value is not known
+        """
+        with self._lock:
+            return [(name, field) for name, entry in self.objects.items() for field in FIELDS
+                    if entry[field] is None]
+
+    def refresh(self, names=None):
+        """
+        Query the unknown transform fields, and nothing else.
+
+        Args:
+            names (list): Only refresh these objects (default: all)
+
+        Returns:
+            int: Number of queries sent
+        """
+        wanted = None if names is None else set(names)
+        commands = [f"vget /object/{name}/{field}" for name, field in self.unknown()
+                    if wanted is None or name in wanted]
+        if commands:
+            self._query(commands)
+        return len(commands)
+
+    def snapshot(self):
+        """
+        Read every object and its full transform from the server.
+
+        Returns:
+            int: Number of objects in the level
+        """
+        self._query(['vget /objects'])
+        self.invalidate()
+        self.refresh()
+        self.last_sync = time.time()
+        return len(self.objects)
+
+    def sync(self, check_names=True):
+        """
+        Catch up with the level in as few requests as possible.
+
+        Args:
+            check_names (bool): Re-list the object names (one request) to find
+                objects added or removed by others; skipped if False and the
+                names are not known to be stale
+
+        Returns:
+            int: Number of queries sent
+        """
+        sent = 0
+        if check_names or self.names_stale:
+            self._query(['vget /objects'])
+            sent += 1
+        sent += self.refresh()
+        self.last_sync = time.time()
+        return sent
+
+    def get(self, name):
+        """
+        Args:
+            name (str): Object name
+
+        Returns:
+            dict: Copy of the object's location, rotation, scale and updated
+                time (None for unknown fields), or None if the object is not in the level
+        """
+        with self._lock:
+            entry = self.objects.get(name)
+            return dict(entry) if entry is not None else None
+
+    def names(self):
+        """
+        Returns:
+            list: Sorted object names
+        """
+        with self._lock:
+            return sorted(self.objects)
+
+    def find(self, prefix=None, within=None):
+        """
+        Find objects by name prefix and/or location.
+
+        Args:
+            prefix (str): Only names starting with this prefix
+            within (tuple): ((min x, y, z), (max x, y, z)); objects with an
+                unknown location are left out
+
+        Returns:
+            list: Sorted names of the matching objects
+        """
+        found = []
+        with self._lock:
+            for name, entry in self.objects.items():
+                if prefix and not name.startswith(prefix):
+                    continue
+                if within is not None:
+                    location = entry['location']
+                    if location is None or not all(within[0][i] <= location[i] <= within[1][i] for i in range(3)):
+                        continue
+                found.append(name)
+        return sorted(found)
+
+
+def _format_vector(value):
+    return ','.join(f"{v:g}" for v in value) if value is not None else '?'
+
+
+def print_scene(mirror):
+    """
+    Print one row per mirrored object.
+
+    Args:
+        mirror (SceneMirror): The mirror
+    """
+    print(f"\n{'Name':<40} {'Location':<28} {'Rotation':<20} Scale")
+    print("-" * 100)
+    for name in mirror.names():
+        entry = mirror.get(name)
+        print(f"{name:<40} {_format_vector(entry['location']):<28} {_format_vector(entry['rotation']):<20} "
+              f"{_format_vector(entry['scale'])}")
+    print("-" * 100)
+    print(f"{len(mirror)} objects, {mirror.queries} queries sent by the mirror, "
+          f"{mirror.tracked} changes tracked from other commands")
+
+
+def main():
+    """
+    Snapshot the level and optionally keep the mirror in sync.
+    """
+    parser = argparse.ArgumentParser(description='Mirror the objects of a running UE5 level through UnrealCV')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help='Keep syncing at this interval and print added and removed objects')
+    args = parser.parse_args()
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV. Make sure your UE5 game is running with UnrealCV enabled.")
+        return
+
+    mirror = SceneMirror(session)
+    try:
+        start = time.perf_counter()
+        mirror.snapshot()
+        print(f"Snapshot of {len(mirror)} objects with {mirror.queries} queries "
+              f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print_scene(mirror)
+        if args.watch:
+            previous = set(mirror.names())
+            while True:
+                time.sleep(args.watch)
+                start = time.perf_counter()
+                sent = mirror.sync()
+                current = set(mirror.names())
+                for name in sorted(current - previous):
+                    print(f"+ {name} at {_format_vector(mirror.get(name)['location'])}")
+                for name in sorted(previous - current):
+                    print(f"- {name}")
+                print(f"Synced {len(current)} objects with {sent} queries in "
+                      f"{(time.perf_counter() - start) * 1000:.1f} ms")
+                previous = current
+    except KeyboardInterrupt:
+        print("\nExiting...")
+    except ConnectionError as e:
+        print(f"UnrealCV request failed: {e}")
+    finally:
+        mirror.close()
+        pool.release(session)
+
+
+if __name__ == "__main__":
+    main()
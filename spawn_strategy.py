@@ -0,0 +1,434 @@
+"""
+Spawn Strategy Probing
+======================
+
+UnrealCV builds differ in which spawn command they understand and in whether
+they want the blueprint class path (/Game/Meshes/MeshBP.MeshBP_C) or the plain
+asset path. Instead of trying every syntax on every placement, the first
+placement against a server probes the known strategies in order and the winner
+is cached on disk, keyed by the server's `vget /unrealcv/version`. Later
+placements go straight to the cached command. When the cached strategy starts
+failing with a reply that says the server does not understand it, it is
+dropped and the probe runs again. Other failures (an unknown class, a name
+that is already taken) say nothing about the syntax: a strategy that names
+its objects retries once with a fresh name, and the cache is kept.
+
+Probing never spawns extra objects: a strategy that fails returns an error and
+spawns nothing, and the first one that succeeds is the placement itself.
+
+The cache lives in ~/.cache/hunyuan3d_ue5/spawn_strategy.json; set
+HUNYUAN3D_CACHE_DIR to move it.
+"""
+import json
+import os
+import time
+
+import command_pipeline
+
+DEFAULT_CACHE_DIR = os.environ.get('HUNYUAN3D_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'hunyuan3d_ue5'))
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'spawn_strategy.json')
+
+# Replies that mean the server did not understand a command, rather than rejected its arguments
+SYNTAX_ERRORS = ('can not find a handler', 'unknown command', 'unexpected', 'usage:', 'invalid syntax')
+
+
+def format_blueprint_class(blueprint_path):
+    """
+    Convert a blueprint asset path into the class path UnrealCV expects.
+
+    Args:
+        blueprint_path (str): e.g. /Game/Meshes/MeshBP
+
+    Returns:
+        str: e.g. /Game/Meshes/MeshBP.MeshBP_C
+    """
+    if blueprint_path.endswith('_C'):
+        return blueprint_path
+    if '.' in blueprint_path.split('/')[-1]:
+        return f"{blueprint_path}_C"
+    bp_name = blueprint_path.split('/')[-1]
+    return f"{blueprint_path}.{bp_name}_C"
+
+
+def is_syntax_error(response):
+    """
+    Args:
+        response (str): A reply to a failed command
+
+    Returns:
+        bool: True if the server did not understand the command, False if it
+            rejected its arguments (an unknown class, a taken name)
+    """
+    text = str(response).lower()
+    return any(marker in text for marker in SYNTAX_ERRORS)
+
+
+class SpawnStrategy:
+    """
+    One way of spawning a blueprint through UnrealCV.
+
+    Attributes:
+        key (str): Stable identifier stored in the cache
+        template (str): Command template with {class_path}, {asset_path}, {name}, {x}, {y}, {z}
+        name_source (str): 'given' if the object gets the name we pass, 'response'
+            if the server replies with the object name, None if the object
+            cannot be addressed afterwards
+        sets_location (bool): True if the command already places the object
+    """
+
+    def __init__(self, key, template, name_source='given', sets_location=False):
+        self.key = key
+        self.template = template
+        self.name_source = name_source
+        self.sets_location = sets_location
+
+    def command(self, asset_path, name, location=(0.0, 0.0, 0.0)):
+        """
+        Build the spawn command for an asset.
+
+        Args:
+            asset_path (str): Blueprint asset or class path
+            name (str): Requested object name
+            location (tuple): (X, Y, Z) spawn location
+
+        Returns:
+            str: The UnrealCV command
+        """
+        x, y, z = location
+        plain_path = asset_path.split('.')[0]
+        if plain_path.endswith('_C'):
+            plain_path = plain_path[:-2]
+        return self.template.format(class_path=format_blueprint_class(asset_path), asset_path=plain_path,
+                                    name=name, x=x, y=y, z=z)
+
+    def object_name(self, name, response):
+        """
+        Args:
+            name (str): The name passed to command()
+            response (str): The server's reply to the spawn command
+
+        Returns:
+            str: Name to address the spawned object with, or None
+        """
+        if self.name_source == 'given':
+            return name
+        if self.name_source == 'response':
+            return str(response).strip() or None
+        return None
+
+
+# Probe order: the commands most likely to work on current UnrealCV builds first
+STRATEGIES = [
+    SpawnStrategy('objects_spawn_class', 'vset /objects/spawn {class_path} {name}'),
+    SpawnStrategy('objects_spawn_asset', 'vset /objects/spawn {asset_path} {name}'),
+    SpawnStrategy('objects_spawn_class_at', 'vset /objects/spawn {class_path} {x} {y} {z}',
+                  name_source='response', sets_location=True),
+    SpawnStrategy('vrun_spawnactor', 'vrun "SpawnActor {class_path} Location=({x},{y},{z})"',
+                  name_source=None, sets_location=True),
+]
+STRATEGIES_BY_KEY = {s.key: s for s in STRATEGIES}
+
+
+class SpawnStrategyCache:
+    """
+    On-disk map of UnrealCV server version -> winning spawn strategy key.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        """
+        Args:
+            path (str): JSON file holding the cache
+        """
+        self.path = path
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not write spawn strategy cache {self.path}: {e}")
+
+    def get(self, version):
+        """
+        Returns:
+            SpawnStrategy or None: The cached winner for a server version
+        """
+        entry = self._load().get(version)
+        return STRATEGIES_BY_KEY.get(entry['strategy']) if entry else None
+
+    def set(self, version, strategy):
+        """Remember the winning strategy for a server version"""
+        self._load()[version] = {'strategy': strategy.key, 'updated': time.time()}
+        self._save()
+
+    def invalidate(self, version):
+        """Forget the cached strategy for a server version"""
+        if self._load().pop(version, None) is not None:
+            self._save()
+
+
+_default_cache = None
+_server_versions = {}
+
+
+def get_default_cache():
+    """Return the process-wide cache backed by DEFAULT_CACHE_PATH"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SpawnStrategyCache()
+    return _default_cache
+
+
+def get_server_version(session, refresh=False):
+    """
+    Query (once per endpoint) the UnrealCV server version used as cache key.
+
+    Args:
+        session: A connected UnrealCVSession
+        refresh (bool): Query again even if the version is known
+
+    Returns:
+        str: The version string, or 'unknown' if the server did not report one
+    """
+    endpoint = getattr(session, 'endpoint', None)
+    if refresh or endpoint not in _server_versions:
+        return _run(session, _query_version(endpoint))
+    return _server_versions[endpoint]
+
+
+class SpawnResult:
+    """
+    Outcome of a placement through spawn_and_place().
+
+    Attributes:
+        ok (bool): True if the object was spawned
+        object_name (str): Name to address the object with, or None
+        strategy (SpawnStrategy): The strategy that spawned it
+        transforms (list): CommandResult of every transform command sent
+        failures (list): (command, response) of every strategy that failed
+        probed (bool): True if the probe ran instead of the cached strategy
+    """
+
+    def __init__(self):
+        self.ok = False
+        self.object_name = None
+        self.strategy = None
+        self.transforms = []
+        self.failures = []
+        self.probed = False
+
+
+def transform_commands(strategy, name, location, rotation=None, scale=None):
+    """
+    Build the commands that position an object after its spawn.
+
+    Args:
+        strategy (SpawnStrategy): Strategy that spawned the object; its location is
+            not set again if the spawn command already placed it
+        name (str): Name the object is addressed with
+        location (tuple): (X, Y, Z) location
+        rotation (tuple): (Pitch, Yaw, Roll), or None to keep the default
+        scale (tuple): (X, Y, Z) scale, or None to keep the default
+
+    Returns:
+        list: Unsent CommandResult slots, in send order
+    """
+    results = []
+    if not strategy.sets_location:
+        results.append(command_pipeline.CommandResult(
+            'vset /object/{}/location {} {} {}'.format(name, *location), name, 'location'))
+    if rotation is not None:
+        results.append(command_pipeline.CommandResult(
+            'vset /object/{}/rotation {} {} {}'.format(name, *rotation), name, 'rotation'))
+    if scale is not None:
+        results.append(command_pipeline.CommandResult(
+            'vset /object/{}/scale {} {} {}'.format(name, *scale), name, 'scale'))
+    return results
+
+
+def spawn_and_place(session, asset_path, name, location=(0.0, 0.0, 100.0), rotation=None, scale=None, cache=None):
+    """
+    Spawn a blueprint and apply its transform, probing spawn strategies if needed.
+
+    With a cached strategy that keeps the given name, the spawn and transform
+    commands are pipelined into a single round trip. Other strategies get their
+    transform in a second round trip, addressed by the name the server returned.
+    Without a cached strategy, or when the server no longer understands the
+    cached one, every strategy is tried in order and the first that works is
+    cached for this server version. A strategy whose objects cannot be addressed
+    is only cached if the server understood none of the others.
+
+    Args:
+        session: A connected UnrealCVSession
+        asset_path (str): Blueprint asset or class path
+        name (str): Requested object name
+        location (tuple): (X, Y, Z) location
+        rotation (tuple): (Pitch, Yaw, Roll), or None to keep the default
+        scale (tuple): (X, Y, Z) scale, or None to keep the default
+        cache (SpawnStrategyCache): Strategy cache (default: the shared on-disk cache)
+
+    Returns:
+        SpawnResult: The outcome, including the errors of failed strategies
+    """
+    steps = _spawn_steps(asset_path, name, location, rotation, scale, cache or get_default_cache(),
+                         getattr(session, 'endpoint', None))
+    return _run(session, steps)
+
+
+async def async_spawn_and_place(client, asset_path, name, location=(0.0, 0.0, 100.0), rotation=None, scale=None,
+                                cache=None):
+    """
+    spawn_and_place() for an async_unrealcv.AsyncUnrealCVClient.
+
+    The probing, the cache and the commands are the same; commands that would be
+    pipelined on a session are sent concurrently.
+
+    Args:
+        client: A connected AsyncUnrealCVClient
+        asset_path (str): Blueprint asset or class path
+        name (str): Requested object name
+        location (tuple): (X, Y, Z) location
+        rotation (tuple): (Pitch, Yaw, Roll), or None to keep the default
+        scale (tuple): (X, Y, Z) scale, or None to keep the default
+        cache (SpawnStrategyCache): Strategy cache (default: the shared on-disk cache)
+
+    Returns:
+        SpawnResult: The outcome, including the errors of failed strategies
+
+    Raises:
+        ConnectionError: If the connection is closed
+        asyncio.TimeoutError: If a reply did not arrive in time
+    """
+    steps = _spawn_steps(asset_path, name, location, rotation, scale, cache or get_default_cache(),
+                         getattr(client, 'endpoint', None))
+    try:
+        while True:
+            slots = next(steps)
+            responses = await client.request_many([slot.command for slot in slots])
+            for slot, response in zip(slots, responses):
+                if isinstance(response, BaseException):
+                    raise response
+                slot.response = response
+    except StopIteration as done:
+        return done.value
+
+
+def _run(session, steps):
+    """Drive a step generator over a synchronous session"""
+    try:
+        while True:
+            slots = next(steps)
+            if len(slots) == 1:
+                slots[0].response = session.request(slots[0].command)
+            else:
+                for slot, response in zip(slots, session.request_batch([slot.command for slot in slots])):
+                    slot.response = response
+    except StopIteration as done:
+        return done.value
+
+
+def _query_version(endpoint):
+    query = command_pipeline.CommandResult('vget /unrealcv/version')
+    yield [query]
+    _server_versions[endpoint] = str(query.response).strip() if query.ok else 'unknown'
+    return _server_versions[endpoint]
+
+
+def _spawn_steps(asset_path, name, location, rotation, scale, cache, endpoint):
+    """
+    The placement flow shared by the sync and async entry points.
+
+    Yields lists of unsent CommandResult slots. The driver sends each list in
+    order, fills in the responses and resumes the generator, which finally
+    returns the SpawnResult.
+    """
+    version = _server_versions.get(endpoint)
+    if version is None:
+        version = yield from _query_version(endpoint)
+    result = SpawnResult()
+
+    known = cache.get(version)
+    if known is not None:
+        spawn = command_pipeline.CommandResult(known.command(asset_path, name, location), name, 'spawn')
+        transforms = None
+        if known.name_source == 'given':
+            transforms = transform_commands(known, name, location, rotation, scale)
+        yield [spawn] + (transforms or [])
+        if spawn.ok:
+            return (yield from _finish(result, known, name, spawn.response, location, rotation, scale, transforms))
+        result.failures.append((spawn.command, spawn.response))
+
+        if known.name_source == 'given' and not is_syntax_error(spawn.response):
+            # The name may already be taken in the level; try once more under a fresh one
+            retry_name = f"{name}_{time.time_ns()}"
+            spawn = command_pipeline.CommandResult(known.command(asset_path, retry_name, location), retry_name,
+                                                   'spawn')
+            yield [spawn]
+            if spawn.ok:
+                return (yield from _finish(result, known, retry_name, spawn.response, location, rotation, scale))
+            result.failures.append((spawn.command, spawn.response))
+        if not is_syntax_error(spawn.response):
+            # The server understood the command, so the asset is at fault, not the cached syntax
+            return result
+
+        print(f"Cached spawn strategy '{known.key}' is not understood by UnrealCV {version}, probing again...")
+        cache.invalidate(version)
+        version = yield from _query_version(endpoint)
+
+    result.probed = True
+    understood = False
+    for strategy in STRATEGIES:
+        if strategy is known:
+            continue
+        spawn = command_pipeline.CommandResult(strategy.command(asset_path, name, location), name, 'spawn')
+        yield [spawn]
+        if not spawn.ok:
+            result.failures.append((spawn.command, spawn.response))
+            understood = understood or not is_syntax_error(spawn.response)
+            continue
+        if strategy.name_source is None and (known is not None or understood):
+            # Such commands answer ok whatever they are asked to spawn, so they only
+            # win when the server understood none of the addressable syntaxes
+            print(f"Spawn strategy '{strategy.key}' answered for UnrealCV {version}; not caching it because "
+                  f"its objects cannot be addressed")
+        else:
+            cache.set(version, strategy)
+            print(f"Spawn strategy '{strategy.key}' works for UnrealCV {version}; cached for later placements")
+        return (yield from _finish(result, strategy, name, spawn.response, location, rotation, scale))
+
+    # Nothing works, so the asset is more likely at fault than the cached syntax
+    if known is not None:
+        cache.set(version, known)
+    return result
+
+
+def _finish(result, strategy, name, response, location, rotation, scale, transforms=None):
+    """Apply the transform by the resolved name unless it went out with the spawn"""
+    result.ok = True
+    result.strategy = strategy
+    result.object_name = strategy.object_name(name, response)
+    if result.object_name is None:
+        if rotation is not None or scale is not None:
+            print(f"Warning: objects spawned with '{strategy.key}' cannot be addressed; "
+                  f"rotation and scale were not applied")
+        return result
+    if transforms is None:
+        transforms = transform_commands(strategy, result.object_name, location, rotation, scale)
+        if transforms:
+            yield transforms
+    result.transforms = transforms
+    return result
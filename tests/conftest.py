@@ -0,0 +1,52 @@
+"""
+Shared fixtures. The scripts live at the repository root, and every on-disk
+cache (spawn strategies, mesh cache, asset index) is redirected to a
+temporary folder before they are imported.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ['HUNYUAN3D_CACHE_DIR'] = tempfile.mkdtemp(prefix='hunyuan3d_test_cache_')
+
+import pytest
+
+import mock_unrealcv_server
+import spawn_strategy
+import unrealcv_session
+
+
+@pytest.fixture
+def mock_server():
+    server = mock_unrealcv_server.MockUnrealCVServer(port=0).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def session(mock_server):
+    session = unrealcv_session.UnrealCVSession(endpoint=mock_server.endpoint, connect_timeout=5.0, verbose=False)
+    assert session.connect()
+    yield session
+    session.disconnect()
+
+
+@pytest.fixture
+def pool(mock_server, monkeypatch):
+    """The shared session pool of the scripts, pointed at the mock server"""
+    monkeypatch.setattr(unrealcv_session, 'DEFAULT_ENDPOINT', mock_server.endpoint)
+    yield unrealcv_session.get_pool()
+    unrealcv_session.close_all_pools()
+
+
+@pytest.fixture
+def strategy_cache(tmp_path):
+    return spawn_strategy.SpawnStrategyCache(str(tmp_path / 'spawn_strategy.json'))
+
+
+def write_file(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+    return str(path)
@@ -0,0 +1,136 @@
+import struct
+import subprocess
+import sys
+
+import pytest
+
+import asset_index
+import import_sources
+import texture_pipeline
+from conftest import ROOT, write_file
+
+# A 2 m long, 10 cm thick plank with its pivot at the bottom center
+PLANK = {'bounds': ((-100.0, -5.0, 0.0), (100.0, 5.0, 10.0)), 'min_z': 0.0, 'size': (200.0, 10.0, 10.0)}
+
+
+def test_world_bounds_scale_and_rotation():
+    assert asset_index.world_bounds(PLANK, (2.0, 1.0, 1.0)) == ((-200.0, -5.0, 0.0), (200.0, 5.0, 10.0))
+    low, high = asset_index.world_bounds(PLANK, rotation=(0.0, 90.0, 0.0))
+    assert low == pytest.approx((-5.0, -100.0, 0.0)) and high == pytest.approx((5.0, 100.0, 10.0))
+
+
+def test_resting_height_follows_rotation():
+    assert asset_index.resting_height(PLANK, (1.0, 1.0, 3.0), ground=50.0) == 50.0
+    # Pitched upright, half the plank would be below the floor at z = 0
+    assert asset_index.resting_height(PLANK, rotation=(90.0, 0.0, 0.0)) == pytest.approx(100.0)
+    assert asset_index.resting_height(PLANK, (0.5, 1.0, 1.0), rotation=(90.0, 0.0, 0.0)) == pytest.approx(50.0)
+
+
+# OBJ y is up and z points at the viewer; UE z is up and y points the other way
+OBJ = 'mtllib box.mtl\nv -50 0 -10\nv 50 0 -10\nv 50 100 10\nv -50 100 10\nf 1 2 3 4\nf 1/1 3/3 2/2\n'
+
+
+def _png_header(width, height, color_type):
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sIIBB', 13, b'IHDR', width, height, 8, color_type) + b'\0' * 8
+
+
+def _box(tmp_path, text=OBJ):
+    write_file(tmp_path / 'box.mtl', 'newmtl m\nmap_Kd albedo.png\n')
+    with open(tmp_path / 'albedo.png', 'wb') as f:
+        f.write(_png_header(256, 256, 2))
+    return write_file(tmp_path / 'box.obj', text)
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    def no_default_index():
+        raise AssertionError('used the default index')
+
+    monkeypatch.setattr(asset_index, 'get_default_index', no_default_index)
+    with asset_index.AssetIndex(str(tmp_path / 'index.sqlite'), recheck_interval=0.0) as index:
+        yield index
+
+
+def test_scan_obj_counts_and_converts_axes(tmp_path):
+    stats = asset_index.scan_obj(_box(tmp_path))
+    assert (stats['vertex_count'], stats['triangle_count']) == (4, 3)
+    assert stats['bounds'] == ((-50.0, -10.0, 0.0), (50.0, 10.0, 100.0))
+    with pytest.raises(ValueError, match='No vertices'):
+        asset_index.scan_obj(write_file(tmp_path / 'empty.obj', '# nothing\n'))
+
+
+def test_image_info_reads_headers(tmp_path):
+    headers = {
+        'rgba.png': _png_header(64, 32, 6),
+        'dxt5.dds': b'DDS ' + struct.pack('<IIII', 124, 0, 16, 8) + b'\0' * 64 + b'DXT5' + b'\0' * 40,
+        # SOI, an APP0 segment to skip, then SOF0 with height 20 and width 30
+        'photo.jpg': b'\xff\xd8\xff\xe0\x00\x04\0\0\xff\xc0\x00\x11\x08\x00\x14\x00\x1e' + b'\0' * 12,
+        'alpha.tga': b'\0' * 12 + struct.pack('<HHB', 8, 4, 32) + b'\0',
+        'notes.txt': b'hello',
+    }
+    for name, header in headers.items():
+        with open(tmp_path / name, 'wb') as f:
+            f.write(header)
+    info = {name: asset_index.image_info(str(tmp_path / name)) for name in headers}
+    assert info == {'rgba.png': (64, 32, True, False), 'dxt5.dds': (8, 16, True, True),
+                    'photo.jpg': (30, 20, False, False), 'alpha.tga': (8, 4, True, False), 'notes.txt': None}
+
+
+def test_put_get_remove(tmp_path, index):
+    record = asset_index.describe_obj(_box(tmp_path), '/Game/Meshes/box.box', '/Game/Meshes/BoxBP')
+    assert record['mesh_path'] == '/Game/Meshes/box' and record['texture_count'] == 1
+    assert record['pivot'] == (0.0, 0.0, 0.0) and record['size'] == (100.0, 20.0, 100.0)
+    index.put(record)
+    assert len(index) == 1 and '/Game/Meshes/box' in index
+    assert index.get('/Game/Meshes/BoxBP.BoxBP_C')['mesh_path'] == '/Game/Meshes/box'
+    assert [r['mesh_path'] for r in index.records()] == ['/Game/Meshes/box']
+    assert index.remove('/Game/Meshes/box') and not index.remove('/Game/Meshes/box')
+    assert index.get('/Game/Meshes/BoxBP') is None and len(index) == 0
+
+
+def test_misses_are_cached_until_another_connection_writes(tmp_path, index):
+    record = asset_index.describe_obj(_box(tmp_path), '/Game/Meshes/box')
+    index.recheck_interval = 3600.0
+    assert index.get('/Game/Meshes/box') is None
+    with asset_index.AssetIndex(index.path) as editor:
+        editor.put(record)
+    # Within the recheck interval the cached miss stands; PRAGMA data_version then reveals the write
+    assert index.get('/Game/Meshes/box') is None
+    index.recheck_interval = 0.0
+    assert index.get('/Game/Meshes/box')['obj_path'] == record['obj_path']
+
+
+def test_record_imports_skips_unchanged_sources(tmp_path, index):
+    obj_path = _box(tmp_path)
+    item = {'mesh_path': '/Game/Meshes/box', 'obj_path': obj_path}
+    # An empty index is still the one to write to
+    assert asset_index.record_imports([item], index=index) == 1
+    assert asset_index.record_imports([item], index=index) == 0
+    assert asset_index.lookup('/Game/Meshes/box', index=index) is not None
+
+    files = import_sources.ImportManifest(str(tmp_path / 'manifest.json')).check('/Game/Meshes/box', obj_path)[1]
+    assert asset_index.record_imports([dict(item, blueprint_path='/Game/Meshes/BoxBP', files=files)], index) == 0
+    assert index.get('/Game/Meshes/BoxBP')['mesh_path'] == '/Game/Meshes/box'
+
+    write_file(tmp_path / 'box.obj', OBJ + 'f 2 3 4\n')
+    assert asset_index.record_imports([item], index=index) == 1
+    record = index.get('/Game/Meshes/box')
+    assert record['triangle_count'] == 4 and record['blueprint_path'] == '/Game/Meshes/BoxBP'
+
+
+def test_scene_cost_counts_textures_once_per_mesh(tmp_path, index):
+    index.put(asset_index.describe_obj(_box(tmp_path), '/Game/Meshes/box', '/Game/Meshes/BoxBP'))
+    cost = asset_index.scene_cost(['/Game/Meshes/BoxBP.BoxBP_C', '/Game/Meshes/box', '/Game/Other/ChairBP'],
+                                  index=index)
+    texture_bytes = index.get('/Game/Meshes/box')['texture_bytes']
+    assert cost == {'objects': 3, 'indexed': 2, 'triangles': 6, 'texture_bytes': texture_bytes}
+    assert texture_bytes == asset_index.texture_stats(str(tmp_path / 'box.obj'))[0] > 0
+
+
+def test_index_works_without_numpy(tmp_path):
+    # As inside the editor, whose Python may not have NumPy
+    obj_path = _box(tmp_path)
+    code = ("import sys; sys.modules['numpy'] = None; sys.path.insert(0, sys.argv[1]); import asset_index; "
+            "print(asset_index.texture_stats(sys.argv[2]))")
+    process = subprocess.run([sys.executable, '-c', code, ROOT, obj_path], capture_output=True, text=True, timeout=60)
+    assert process.stdout.strip() == f"({texture_pipeline.gpu_bytes(256, 256, 'DXT1')}, 1)", process.stderr
@@ -0,0 +1,105 @@
+import pytest
+
+import batch_placement
+import spawn_strategy
+from conftest import write_file
+
+
+def test_parse_vector():
+    assert batch_placement.parse_vector('1, 2, 3') == (1.0, 2.0, 3.0)
+    assert batch_placement.parse_vector([1, 2, 3]) == (1.0, 2.0, 3.0)
+    assert batch_placement.parse_vector('', (0, 0, 0)) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        batch_placement.parse_vector('1 2')
+
+
+def test_load_jsonl_manifest(tmp_path):
+    path = write_file(tmp_path / 'm.jsonl',
+                      '# comment\n'
+                      '{"blueprint": "/Game/A", "location": [0, 0, 100], "rotation": "0,90,0", "name": "A1"}\n'
+                      '\n'
+                      '{"blueprint": "/Game/B", "obj_path": "b/mesh.obj"}\n')
+    rows = batch_placement.load_manifest(path)
+    assert [r['blueprint'] for r in rows] == ['/Game/A', '/Game/B']
+    assert rows[0]['location'] == (0.0, 0.0, 100.0) and rows[0]['rotation'] == (0.0, 90.0, 0.0)
+    assert rows[1]['location'] is None
+    assert rows[1]['obj_path'] == str(tmp_path / 'b' / 'mesh.obj')
+
+
+def test_load_csv_manifest(tmp_path):
+    path = write_file(tmp_path / 'm.csv',
+                      'blueprint,x,y,z,scale,name\n'
+                      '/Game/A,1,2,3,"2,2,2",A1\n'
+                      '/Game/B,,,,,\n')
+    rows = batch_placement.load_manifest(path)
+    assert rows[0]['location'] == (1.0, 2.0, 3.0) and rows[0]['scale'] == (2.0, 2.0, 2.0)
+    assert rows[1]['location'] is None and rows[1]['name'] is None
+
+
+def test_missing_blueprint_names_the_row(tmp_path):
+    path = write_file(tmp_path / 'm.jsonl', '{"blueprint": "/Game/A"}\n{"location": [0, 0, 0]}\n')
+    with pytest.raises(ValueError, match='row 2'):
+        batch_placement.load_manifest(path)
+
+
+def test_assign_locations_avoids_rows(tmp_path):
+    rows = [{'blueprint': '/Game/A', 'location': (0.0, 0.0, 100.0), 'rotation': None, 'scale': None,
+             'name': 'fixed', 'obj_path': None}]
+    rows += [dict(rows[0], location=None, name=None) for _ in range(5)]
+    placed = batch_placement.assign_locations(rows)
+    locations = [p['location'] for p in placed]
+    assert locations[0] == (0.0, 0.0, 100.0)
+    assert len(set(locations)) == 6
+
+
+def test_assign_locations_uses_row_scale_and_rotation(tmp_path):
+    obj_path = write_file(tmp_path / 'plank.obj', 'v -1 0 -0.1\nv 1 0 -0.1\nv 1 0.2 0.1\nf 1 2 3\n')
+    row = {'blueprint': '/Game/Plank', 'location': (0.0, 0.0, 0.0), 'rotation': (0.0, 90.0, 0.0),
+           'scale': (100.0, 100.0, 100.0), 'name': 'plank', 'obj_path': obj_path}
+    placed = batch_placement.assign_locations([row, dict(row, location=None, name=None)], near=(0.0, 0.0, 0.0))
+    low, high = placed[0]['bounds']
+    # 200 cm along X before the yaw, so 200 cm along Y after it
+    assert low == pytest.approx((-10.0, -100.0, 0.0)) and high == pytest.approx((10.0, 100.0, 20.0))
+    assert abs(placed[1]['location'][0]) >= 20.0 or abs(placed[1]['location'][1]) >= 200.0
+
+
+def test_load_json_array_manifest(tmp_path):
+    path = write_file(tmp_path / 'm.json', '[\n  {"blueprint": "/Game/A", "location": [1, 2, 3]},\n'
+                                           '  {"blueprint": "/Game/B"}\n]\n')
+    rows = batch_placement.load_manifest(path)
+    assert [r['blueprint'] for r in rows] == ['/Game/A', '/Game/B']
+    assert rows[0]['location'] == (1.0, 2.0, 3.0)
+
+
+def test_json_lines_still_read_from_json_file(tmp_path):
+    path = write_file(tmp_path / 'm.json', '{"blueprint": "/Game/A"}\n{"blueprint": "/Game/B"}\n')
+    assert len(batch_placement.load_manifest(path)) == 2
+
+
+@pytest.mark.parametrize('filename, text', [
+    ('m.json', '[{"blueprint": "/Game/A"}, "just a string"]'),
+    ('m.jsonl', '{"blueprint": "/Game/A"}\n42\n'),
+    ('m.jsonl', '{"blueprint": "/Game/A"}\n{"blueprint": 7}\n'),
+])
+def test_non_object_rows_are_rejected_with_row_number(tmp_path, filename, text):
+    with pytest.raises(ValueError, match='row 2'):
+        batch_placement.load_manifest(write_file(tmp_path / filename, text))
+
+
+def test_bad_json_names_the_line(tmp_path):
+    path = write_file(tmp_path / 'm.jsonl', '{"blueprint": "/Game/A"}\n\n{"blueprint": \n')
+    with pytest.raises(ValueError, match='line 3'):
+        batch_placement.load_manifest(path)
+
+
+def test_build_placement_commands():
+    placement = {'blueprint': '/Game/A', 'name': 'A1', 'location': (1.0, 2.0, 3.0), 'rotation': (0.0, 90.0, 0.0),
+                 'scale': None}
+    assert batch_placement.build_placement_commands(placement) == [
+        'vset /objects/spawn /Game/A.A_C A1',
+        'vset /object/A1/location 1.0 2.0 3.0',
+        'vset /object/A1/rotation 0.0 90.0 0.0',
+    ]
+    class_at = spawn_strategy.STRATEGIES_BY_KEY['objects_spawn_class_at']
+    assert batch_placement.build_transform_commands(placement, 'A_7', class_at) == \
+        ['vset /object/A_7/rotation 0.0 90.0 0.0']
@@ -0,0 +1,98 @@
+import time
+
+import numpy as np
+import pytest
+
+import bulk_transform
+
+MESH = '/Game/Meshes/MeshBP.MeshBP_C'
+
+
+@pytest.fixture
+def mover(mock_server, session):
+    names = [session.request(f"vset /objects/spawn {MESH} Obj{i}") for i in range(4)]
+    return bulk_transform.BulkTransformer(session, names)
+
+
+def test_diff_uses_the_tolerance(mover):
+    mover.sent['location'][:] = 0.0
+    mover.sent['location'][3] = np.nan
+    values = np.zeros((4, 3))
+    values[1, 0] = 0.005
+    values[2, 2] = 0.5
+    assert mover.diff('location', values).tolist() == [2, 3]
+    with pytest.raises(ValueError, match=r'shape \(4, 3\)'):
+        mover.diff('location', np.zeros((3, 3)))
+
+
+def test_update_sends_only_changes(mock_server, mover):
+    locations = bulk_transform.grid_locations(4, spacing=100.0)
+    stats = mover.update(locations=locations, scales=np.ones((4, 3)))
+    assert (stats['commands'], stats['moved'], stats['skipped'], stats['errors']) == (8, 4, 0, 0)
+    assert mock_server.scene.objects['Obj3']['location'] == tuple(locations[3])
+
+    assert mover.update(locations=locations)['commands'] == 0
+    locations[1, 2] += 10
+    stats = mover.update(locations=locations, rotations=np.zeros((4, 3)))
+    assert (stats['commands'], stats['moved'], stats['skipped']) == (5, 4, 0)
+    assert mock_server.scene.objects['Obj1']['location'][2] == locations[1, 2]
+
+    mover.reset('location')
+    assert mover.update(locations=locations, rotations=np.zeros((4, 3)))['commands'] == 4
+
+
+def test_failed_commands_are_retried(mock_server, mover):
+    handle = mock_server.scene.handle
+    failing = {'Obj2'}
+
+    def flaky(command):
+        if any(f"/object/{name}/" in command for name in failing):
+            return 'error Injected failure'
+        return handle(command)
+
+    mock_server.scene.handle = flaky
+    locations = np.ones((4, 3))
+    assert mover.update(locations=locations)['errors'] == 1
+    assert np.isnan(mover.sent['location'][2]).all()
+
+    failing.clear()
+    stats = mover.update(locations=locations)
+    assert (stats['commands'], stats['errors']) == (1, 0)
+    assert mock_server.scene.objects['Obj2']['location'] == (1.0, 1.0, 1.0)
+
+
+class _DroppedSession:
+    def request_batch(self, commands):
+        raise ConnectionError('connection lost')
+
+
+def test_dropped_connection_remembers_nothing():
+    mover = bulk_transform.BulkTransformer(_DroppedSession(), ['A', 'B'])
+    with pytest.raises(ConnectionError):
+        mover.update(locations=np.zeros((2, 3)))
+    assert np.isnan(mover.sent['location']).all()
+
+
+def test_run_drops_frames_that_are_over(mover):
+    calls = []
+
+    def frame(index, seconds):
+        calls.append(index)
+        if index == 1:
+            time.sleep(0.35)
+        return {'locations': np.full((4, 3), float(index))}
+
+    stats = mover.run(frame, rate=10.0, frames=8, verbose=False)
+    assert stats['frames'] + stats['dropped'] == 8 and stats['dropped'] >= 2
+    assert calls[:2] == [0, 1] and calls[2] >= 4 and calls[-1] == 7
+    assert stats['errors'] == 0
+    with pytest.raises(ValueError):
+        mover.run(frame)
+
+
+def test_wave_only_lifts_objects_under_it():
+    base = bulk_transform.grid_locations(9, spacing=1000.0)
+    assert base.shape == (9, 3) and np.allclose(base[:, :2].mean(axis=0), 0)
+    locations = bulk_transform.wave(base, width=400.0, speed=1000.0)(0, 0.4)['locations']
+    lifted = locations[:, 2] > base[:, 2]
+    assert lifted.tolist() == [True, False, False] * 3
@@ -0,0 +1,60 @@
+import pytest
+
+import command_pipeline
+
+
+class _RecordingSession:
+    """Answers 'ok' to every command and remembers the batch sizes; fails from the given batch on"""
+
+    def __init__(self, fail_from=None):
+        self.batches = []
+        self.fail_from = fail_from
+
+    def request_batch(self, commands):
+        if self.fail_from is not None and len(self.batches) >= self.fail_from:
+            raise ConnectionError('connection lost')
+        self.batches.append(list(commands))
+        return ['error Can not find object' if 'Missing' in c else 'ok' for c in commands]
+
+
+def test_command_result_states():
+    result = command_pipeline.CommandResult('vget /objects')
+    assert not result.ok and result.error == 'not sent'
+    result.response = 'error Can not find a handler'
+    assert not result.ok and result.error == 'error Can not find a handler'
+    result.response = 'Chair'
+    assert result.ok and result.error == ''
+
+
+def test_flush_sends_in_chunks_and_matches_responses():
+    session = _RecordingSession()
+    pipeline = command_pipeline.CommandPipeline(session, max_in_flight=3)
+    pipeline.spawn('/Game/A.A_C', 'Chair')
+    pipeline.set_location('Chair', (1, 2, 3))
+    pipeline.set_rotation('Chair', (0, 90, 0))
+    pipeline.set_scale('Chair', (2, 2, 2))
+    pipeline.set_location('Missing', (0, 0, 0))
+    assert len(pipeline) == 5
+    results = pipeline.flush()
+    assert [len(batch) for batch in session.batches] == [3, 2]
+    assert session.batches[0][1] == 'vset /object/Chair/location 1 2 3'
+    assert [r.op for r in command_pipeline.errors(results)] == ['location']
+    grouped = command_pipeline.group_by_object(results)
+    assert [r.op for r in grouped['Chair']] == ['spawn', 'location', 'rotation', 'scale']
+    assert len(pipeline) == 0 and pipeline.flush() == []
+
+
+def test_failed_flush_is_not_replayed():
+    session = _RecordingSession(fail_from=1)
+    pipeline = command_pipeline.CommandPipeline(session, max_in_flight=2)
+    results = [pipeline.set_location(f"Obj{i}", (i, 0, 0)) for i in range(4)]
+    with pytest.raises(ConnectionError):
+        pipeline.flush()
+    assert [r.response for r in results] == ['ok', 'ok', None, None]
+    assert len(pipeline) == 0
+
+
+def test_benchmark_against_mock(mock_server, session):
+    result = command_pipeline.benchmark(session, '/Game/Meshes/MeshBP.MeshBP_C', count=5)
+    assert result['serial'] > 0 and result['pipelined'] > 0 and result['errors'] == 0
+    assert len(mock_server.scene.objects) == 10
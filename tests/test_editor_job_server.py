@@ -0,0 +1,107 @@
+"""JobClient against a stand-in JobServer, over the socket and through a spool"""
+import contextlib
+import json
+import os
+import threading
+
+import pytest
+
+import editor_job_server
+from conftest import write_file
+
+TRIANGLE = 'v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n'
+
+
+@contextlib.contextmanager
+def _serving(server):
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server._stopped = True
+        thread.join(5.0)
+        server.stop()
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = editor_job_server.JobServer(port=0, spool=str(tmp_path / 'spool'),
+                                         handlers=editor_job_server.standin_handlers(latency=0.2), verbose=False)
+    return server.start()
+
+
+@pytest.fixture
+def client(server):
+    with editor_job_server.JobClient(server.endpoint, timeout=5.0) as client:
+        yield client
+
+
+@pytest.fixture
+def spool_client(server):
+    return editor_job_server.JobClient(spool=server.spool)
+
+
+def test_run_import_over_socket(tmp_path, server, client):
+    obj_path = write_file(tmp_path / 'chair.obj', TRIANGLE)
+    with _serving(server):
+        assert client.ping()['kinds'] == sorted(editor_job_server.JOB_PARAMETERS)
+        job = client.run('import', timeout=5.0, obj_path=obj_path, blueprint_name='ChairBP')
+        assert job['state'] == 'done' and job['source'] == 'socket'
+        assert job['result'] == {'mesh_path': '/Game/Meshes/chair', 'blueprint_path': '/Game/Meshes/ChairBP'}
+        assert client.status(job['id'])['state'] == 'done'
+
+
+def test_failed_job_and_unknown_kind_over_socket(tmp_path, server, client):
+    with _serving(server):
+        job = client.run('import', timeout=5.0, obj_path=str(tmp_path / 'missing.obj'))
+        assert job['state'] == 'failed' and job['error'].startswith('FileNotFoundError')
+        with pytest.raises(ValueError, match='Unknown job kind: explode'):
+            client.submit('explode')
+        with pytest.raises(ValueError, match='Missing parameters for import job: obj_path'):
+            client.submit('import')
+        with pytest.raises(ValueError, match='Unknown job'):
+            client.status('nope')
+
+
+def test_cancel_over_socket(server, client):
+    running = server.submit('play')
+    queued = server.submit('play')
+    with _serving(server):
+        # The server answers between jobs, so the second one has not started yet
+        assert client.cancel(queued['id'])['state'] == 'cancelled'
+        assert client.wait(running['id'], timeout=5.0)['state'] == 'done'
+        assert client.status(queued['id'])['state'] == 'cancelled'
+        with pytest.raises(ValueError, match='cannot be cancelled'):
+            client.cancel(running['id'])
+
+
+def test_run_through_spool(tmp_path, server, spool_client):
+    obj_path = write_file(tmp_path / 'lamp.obj', TRIANGLE)
+    cancelled = spool_client.submit('play')
+    assert spool_client.status(cancelled['id'])['state'] == 'queued'
+    assert spool_client.cancel(cancelled['id'])['state'] == 'cancelled'
+    with pytest.raises(ValueError, match='Unknown job'):
+        spool_client.status(cancelled['id'])
+    with pytest.raises(ValueError, match='Unknown job kind'):
+        spool_client.submit('explode')
+
+    with _serving(server):
+        job = spool_client.run('import', timeout=5.0, obj_path=obj_path, create_blueprint=False)
+        assert job['state'] == 'done' and job['source'] == 'spool'
+        assert job['result'] == {'mesh_path': '/Game/Meshes/lamp', 'blueprint_path': None}
+        blueprint = spool_client.run('blueprint', timeout=5.0, mesh_path='/Game/Meshes/lamp', blueprint_name='LampBP')
+        assert blueprint['result'] == {'blueprint_path': '/Game/Meshes/LampBP'}
+        with pytest.raises(ValueError, match='already picked up'):
+            spool_client.cancel(job['id'])
+        assert [j['id'] for j in spool_client.list()] == [job['id'], blueprint['id']]
+
+
+def test_spooled_job_failures_are_reported(tmp_path, server, spool_client):
+    pending = os.path.join(server.spool, 'pending')
+    write_file(os.path.join(pending, 'unknown.json'), json.dumps({'kind': 'explode', 'params': {}}))
+    job = spool_client.submit('import', obj_path=str(tmp_path / 'missing.obj'))
+    with _serving(server):
+        assert spool_client.wait('unknown', timeout=5.0, poll_interval=0.05)['error'].startswith('Unknown job kind')
+        job = spool_client.wait(job['id'], timeout=5.0, poll_interval=0.05)
+        assert job['state'] == 'failed' and job['error'].startswith('FileNotFoundError')
@@ -0,0 +1,22 @@
+import asyncio
+
+import find_spawn_command
+
+
+def test_commands_against_mock(mock_server, pool, capsys):
+    find_spawn_command.test_commands()
+    out = capsys.readouterr().out
+    assert 'UnrealCV Version: v1.0.0' in out
+    assert 'No spawn strategy cached for UnrealCV v1.0.0 yet' in out
+    # The first variant is the syntax the mock understands; vrun is acknowledged without effect
+    assert out.count('COMMAND SUCCEEDED') == 4
+    (name, entry), = mock_server.scene.objects.items()
+    assert entry['location'] == (0.0, 0.0, 100.0) and f"Objects in scene: {name}" in out
+    assert pool._idle.qsize() == 1
+
+
+def test_commands_async_against_mock(mock_server, pool, capsys):
+    asyncio.run(find_spawn_command.test_commands_async())
+    out = capsys.readouterr().out
+    assert 'vget /unrealcv/version: v1.0.0' in out and out.count('COMMAND SUCCEEDED') == 4
+    assert len(mock_server.scene.objects) == 1
@@ -0,0 +1,82 @@
+import sys
+
+import pytest
+
+import hunyuan3d_ue5_demo
+import placement_index
+import spawn_strategy
+
+BLUEPRINT = '/Game/Meshes/MeshBP'
+
+
+def test_place_in_runtime(mock_server, pool):
+    assert hunyuan3d_ue5_demo.place_in_runtime(BLUEPRINT, '1,2,3', '0,90,0', '2,2,2', interactive=False)
+    entry = next(iter(mock_server.scene.objects.values()))
+    assert entry['location'] == (1.0, 2.0, 3.0) and entry['scale'] == (2.0, 2.0, 2.0)
+    assert pool._idle.qsize() == 1
+
+
+def test_malformed_location_releases_the_session(mock_server, pool, capsys):
+    assert not hunyuan3d_ue5_demo.place_in_runtime(BLUEPRINT, '1,2', interactive=False)
+    assert 'Invalid transform' in capsys.readouterr().out
+    assert pool._idle.qsize() == 1 and not mock_server.scene.objects
+
+
+def test_connection_error_fails_the_placement(pool, monkeypatch, capsys):
+    def lose_connection(*args, **kwargs):
+        raise ConnectionError('connection reset')
+
+    monkeypatch.setattr(spawn_strategy, 'spawn_and_place', lose_connection)
+    assert not hunyuan3d_ue5_demo.place_in_runtime(BLUEPRINT, interactive=False)
+    assert 'UnrealCV request failed: connection reset' in capsys.readouterr().out
+    assert pool._idle.qsize() == 1
+
+
+def _run_main(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['hunyuan3d_ue5_demo.py', *argv])
+    hunyuan3d_ue5_demo.main()
+
+
+def test_place_instanced_prints_the_console_code(monkeypatch, capsys, tmp_path):
+    manifest = str(tmp_path / 'placements.jsonl')
+    _run_main(monkeypatch, '--action', 'place-instanced', '--manifest', manifest)
+    out = capsys.readouterr().out
+    assert f"results = instanced_placement.place_manifest_instanced('{manifest}')" in out
+    assert '--action place-batch' in out
+
+    with pytest.raises(SystemExit):
+        _run_main(monkeypatch, '--action', 'place-instanced')
+    assert '--manifest is required for place-instanced action' in capsys.readouterr().err
+
+
+def test_import_instanced_passes_the_flag(monkeypatch, capsys):
+    _run_main(monkeypatch, '--action', 'import', '--obj_path', 'mesh.obj', '--instanced')
+    assert "demo.import_to_ue5('mesh.obj', '/Game/Meshes', instanced=True)" in capsys.readouterr().out
+
+
+def test_place_records_explicit_locations_in_the_scene(mock_server, pool, monkeypatch, capsys, tmp_path):
+    scene_path = str(tmp_path / 'scene.json')
+    monkeypatch.setattr('builtins.input', lambda prompt: 'exit')
+    _run_main(monkeypatch, '--action', 'place', '--blueprint_path', BLUEPRINT, '--location', '0,0,100',
+              '--scene', scene_path)
+    scene = placement_index.PlacementIndex.load(scene_path)
+    assert list(scene.objects) == ['Placed_00000']
+    assert scene.objects['Placed_00000']['location'] == (0.0, 0.0, 100.0)
+
+    # An automatic placement then avoids the object placed by hand
+    _run_main(monkeypatch, '--action', 'place', '--blueprint_path', BLUEPRINT, '--location', 'auto',
+              '--scene', scene_path)
+    assert 'Auto-placing at' in capsys.readouterr().out
+    scene = placement_index.PlacementIndex.load(scene_path)
+    assert len(scene) == len(mock_server.scene.objects) == 2
+    assert scene.objects['Placed_00001']['location'] != (0.0, 0.0, 100.0)
+
+
+def test_plan_placement_resolves_auto(tmp_path, capsys):
+    scene_path = str(tmp_path / 'scene.json')
+    assert hunyuan3d_ue5_demo.plan_placement(BLUEPRINT, '5,5,5', '1,1,1', '0,0,0') == ('5,5,5', '1,1,1', None)
+    location, scale, scene = hunyuan3d_ue5_demo.plan_placement(BLUEPRINT, 'auto', '1,1,1', '0,0,0',
+                                                               scene_path=scene_path)
+    assert location != 'auto' and len(scene) == 1
+    with pytest.raises(ValueError, match='Invalid transform'):
+        hunyuan3d_ue5_demo.plan_placement(BLUEPRINT, '1,2', None, '0,0,0', scene_path=scene_path)
@@ -0,0 +1,101 @@
+import json
+import sys
+import time
+
+import pytest
+
+import import_profiler
+
+
+def _busy(name):
+    """A function to find in the cProfile data"""
+    return sum(range(20000))
+
+
+def test_phases_are_recorded_per_asset():
+    profiler = import_profiler.ImportProfiler()
+    with profiler.asset('/Game/Meshes/a'):
+        with profiler.phase('import'):
+            time.sleep(0.02)
+        # A nested asset block stays with the outer asset
+        with profiler.asset('/Game/Meshes/inner'):
+            with profiler.phase('blueprint_compile'):
+                pass
+        profiler.note('objects', 1)
+    with profiler.asset('/Game/Meshes/a'):
+        with profiler.phase('import'):
+            pass
+    with profiler.shared_phase('save', ['/Game/Meshes/a', '/Game/Meshes/b']):
+        time.sleep(0.02)
+    with profiler.phase('cleanup'):
+        pass
+    profiler.note('ignored', True)
+    profiler.finish()
+
+    report = profiler.report()
+    assets = {record['name']: record for record in report['assets']}
+    assert sorted(assets) == ['(no asset)', '/Game/Meshes/a', '/Game/Meshes/b']
+    a = assets['/Game/Meshes/a']
+    assert a['counts'] == {'import': 2, 'blueprint_compile': 1, 'save': 1}
+    assert a['phases']['import'] >= 0.02 and a['info'] == {'objects': 1}
+    assert a['phases']['save'] == pytest.approx(assets['/Game/Meshes/b']['phases']['save'])
+    assert a['other'] >= 0.0 and report['assets'][0]['name'] == '/Game/Meshes/a'
+    assert report['phases']['import']['count'] == 2 and report['phases']['save']['assets'] == 2
+
+
+def test_cprofile_and_memory_per_asset():
+    profiler = import_profiler.ImportProfiler(cprofile=True, memory=True, profile_top=50)
+    with profiler.asset('/Game/Meshes/a'):
+        _busy('a')
+        kept = [bytearray(1024) for _ in range(100)]
+    profiler.finish()
+    record = profiler.report()['assets'][0]
+    assert any('_busy' in row['function'] for row in record['profile'])
+    assert record['memory_peak_kb'] >= 100 and record['memory_net_kb'] >= 100
+    assert len(kept) == 100
+
+
+def test_module_helpers_are_no_ops_without_a_profiler():
+    assert import_profiler.active() is None
+    with import_profiler.asset('/Game/Meshes/a'), import_profiler.phase('import'), \
+            import_profiler.shared_phase('save', ['/Game/Meshes/a']):
+        import_profiler.note('objects', 1)
+    assert import_profiler.stop() is None
+
+
+def test_profiling_writes_the_report(tmp_path, capsys):
+    path = str(tmp_path / 'profiles' / 'import_profile.json')
+    with import_profiler.profiling(path) as profiler:
+        assert import_profiler.active() is profiler
+        with import_profiler.asset('/Game/Meshes/a'), import_profiler.phase('import'):
+            pass
+    assert import_profiler.active() is None
+    out = capsys.readouterr().out
+    assert '1 assets in' in out and f"Import profile written to {path}" in out
+    with open(path) as f:
+        assert json.load(f)['assets'][0]['name'] == '/Game/Meshes/a'
+
+
+def test_merge_reports_and_main(tmp_path, monkeypatch, capsys):
+    paths = []
+    for index, name in enumerate(('/Game/Meshes/a', '/Game/Meshes/b')):
+        profiler = import_profiler.ImportProfiler(cprofile=index == 1)
+        with profiler.asset(name), profiler.phase('import'):
+            _busy(name)
+        profiler.finish()
+        paths.append(str(tmp_path / f"chunk{index}.json"))
+        profiler.write(paths[-1])
+
+    reports = []
+    for path in paths:
+        with open(path) as f:
+            reports.append(json.load(f))
+    merged = import_profiler.merge_reports(reports)
+    assert sorted(record['name'] for record in merged['assets']) == ['/Game/Meshes/a', '/Game/Meshes/b']
+    assert merged['cprofile'] and merged['phases']['import']['count'] == 2
+    assert merged['seconds'] == pytest.approx(sum(report['seconds'] for report in reports))
+
+    monkeypatch.setattr(sys, 'argv', ['import_profiler.py', *paths, '--functions', '3'])
+    import_profiler.main()
+    out = capsys.readouterr().out
+    assert '2 assets in' in out and '_busy' in out
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+import import_sources
+from conftest import write_file
+
+
+def test_load_text_manifest(tmp_path):
+    path = write_file(tmp_path / 'm.txt', '# outputs\nchair_01/mesh.obj\n\nlamp.obj\n')
+    sources = import_sources.load_source_manifest(path)
+    assert [s['obj_path'] for s in sources] == [str(tmp_path / 'chair_01' / 'mesh.obj'), str(tmp_path / 'lamp.obj')]
+    assert sources[0]['asset_path'] == '/Game/Meshes' and sources[0]['blueprint_name'] == 'meshBP'
+
+
+def test_load_jsonl_and_csv_manifests(tmp_path):
+    jsonl = write_file(tmp_path / 'm.jsonl', '{"obj_path": "a.obj", "asset_path": "/Game/Props", '
+                                             '"asset_name": "Chair 01", "blueprint_name": "ChairBP"}\n')
+    csv_path = write_file(tmp_path / 'm.csv', 'obj_path,asset_name\na.obj,Chair 01\n')
+    for path in (jsonl, csv_path):
+        source = import_sources.load_source_manifest(path)[0]
+        assert source['asset_name'] == 'Chair_01'
+    assert import_sources.load_source_manifest(jsonl)[0]['asset_path'] == '/Game/Props'
+    assert import_sources.load_source_manifest(csv_path)[0]['blueprint_name'] == 'Chair_01BP'
+
+
+def test_load_json_array_manifest(tmp_path):
+    path = write_file(tmp_path / 'm.json', '[\n  {"obj_path": "a.obj"},\n  {"obj_path": "b.obj", "asset_name": "B"}\n]\n')
+    sources = import_sources.load_source_manifest(path)
+    assert [s['asset_name'] for s in sources] == ['a', 'B']
+
+
+@pytest.mark.parametrize('filename, text, where', [
+    ('m.jsonl', '# header\n\n{"obj_path": "a.obj"}\n["b.obj"]\n', 'line 4'),
+    ('m.jsonl', '{"obj_path": "a.obj"}\n"b.obj"\n', 'line 2'),
+    ('m.json', '[{"obj_path": "a.obj"}, "b.obj"]', 'item 2'),
+    ('m.jsonl', '\n{"obj_path": "a.obj"}\n\n{"asset_name": "B"}\n', 'line 4'),
+    ('m.csv', 'obj_path,asset_name\na.obj,A\n\n,B\n', 'line 4'),
+    ('m.jsonl', '{"obj_path": "a.obj"}\n\n{"obj_path": \n', 'line 3'),
+])
+def test_bad_rows_name_their_line(tmp_path, filename, text, where):
+    with pytest.raises(ValueError, match=where):
+        import_sources.load_source_manifest(write_file(tmp_path / filename, text))
+
+
+def test_find_import_sources_rejects_duplicate_assets(tmp_path):
+    path = write_file(tmp_path / 'm.txt', 'a/mesh.obj\nb/mesh.obj\n')
+    with pytest.raises(ValueError, match='/Game/Meshes/mesh'):
+        import_sources.find_import_sources(path)
+
+
+def test_scan_folder_mirrors_subfolders(tmp_path):
+    for name in ('01', 'b c'):
+        os.makedirs(tmp_path / 'out' / name)
+        write_file(tmp_path / 'out' / name / 'mesh.obj', 'v 0 0 0\n')
+    sources = import_sources.find_import_sources(str(tmp_path / 'out'))
+    assert [s['asset_path'] for s in sources] == ['/Game/Meshes/_01', '/Game/Meshes/b_c']
+
+
+def test_material_files_reads_mtllib_and_maps(tmp_path):
+    write_file(tmp_path / 'mesh.mtl', 'newmtl m\nmap_Kd -bm 1.0 albedo.png\nbump normal.png\n')
+    obj_path = write_file(tmp_path / 'mesh.obj', 'mtllib mesh.mtl\nv 0 0 0\n')
+    mtl_paths, textures = import_sources.material_files(obj_path)
+    assert mtl_paths == [str(tmp_path / 'mesh.mtl')]
+    assert textures == [str(tmp_path / 'albedo.png'), str(tmp_path / 'normal.png')]
+    assert import_sources.source_files(obj_path) == [obj_path, str(tmp_path / 'mesh.mtl')]
+
+
+def test_iter_line_blocks_ends_blocks_on_lines(tmp_path):
+    path = write_file(tmp_path / 'lines.txt', ''.join(f"line {n}\n" for n in range(100)) + 'last')
+    blocks = list(import_sources.iter_line_blocks(path, block_size=16))
+    assert all(block.endswith(b'\n') for block in blocks[:-1])
+    assert b''.join(blocks).decode().splitlines()[-1] == 'last'
+
+
+def test_import_manifest_tracks_source_changes(tmp_path, monkeypatch):
+    write_file(tmp_path / 'mesh.mtl', 'newmtl m\nmap_Kd albedo.png\n')
+    texture = write_file(tmp_path / 'albedo.png', 'png')
+    obj_path = write_file(tmp_path / 'mesh.obj', 'mtllib mesh.mtl\nv 0 0 0\n')
+    manifest_path = str(tmp_path / 'saved' / 'import_manifest.json')
+    manifest = import_sources.ImportManifest(manifest_path)
+    changed, files = manifest.check('/Game/Meshes/mesh', obj_path)
+    assert changed and sorted(files) == sorted(import_sources.source_files(obj_path))
+    manifest.record('/Game/Meshes/mesh', obj_path, files, blueprint_path='/Game/Meshes/meshBP')
+    manifest.save()
+
+    # Unchanged stat signatures skip hashing altogether
+    manifest = import_sources.ImportManifest(manifest_path)
+    assert manifest.get('/Game/Meshes/mesh')['blueprint_path'] == '/Game/Meshes/meshBP'
+    with monkeypatch.context() as patch:
+        patch.setattr(import_sources, 'file_hash', None)
+        assert not manifest.check('/Game/Meshes/mesh', obj_path)[0]
+
+    os.utime(texture, ns=(1, 1))
+    assert not manifest.check('/Game/Meshes/mesh', obj_path)[0]
+    write_file(tmp_path / 'albedo.png', 'repainted')
+    assert manifest.check('/Game/Meshes/mesh', obj_path)[0]
+    os.remove(texture)
+    changed, files = manifest.check('/Game/Meshes/mesh', obj_path)
+    assert changed and files[texture] == {'missing': True}
+    # The same record under another asset path, or for another OBJ, is a new import
+    assert manifest.check('/Game/Props/mesh', obj_path)[0]
+    assert manifest.check('/Game/Meshes/mesh', write_file(tmp_path / 'other.obj', 'v 0 0 0\n'))[0]
+
+    manifest.remove('/Game/Meshes/mesh')
+    manifest.save()
+    assert import_sources.ImportManifest(manifest_path).assets() == {}
+
+
+def test_import_manifest_starts_empty_on_a_corrupt_file(tmp_path):
+    manifest = import_sources.ImportManifest(write_file(tmp_path / 'import_manifest.json', '{"assets": '))
+    assert manifest.assets() == {} and manifest.get('/Game/Meshes/mesh') is None
@@ -0,0 +1,116 @@
+import json
+import os
+
+import import_sources
+import ingest_pool
+import obj_loader
+from conftest import write_file
+
+TRIANGLE = 'v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n'
+
+
+def _job(tmp_path, text, name='mesh'):
+    obj_path = write_file(tmp_path / f"{name}.obj", text)
+    return {'obj_path': obj_path, 'output_path': str(tmp_path / 'out' / name / f"{name}.obj"),
+            'asset_path': '/Game/Meshes', 'asset_name': name, 'blueprint_name': f"{name}BP"}
+
+
+def test_process_mesh_writes_output(tmp_path):
+    result = ingest_pool.process_mesh(_job(tmp_path, TRIANGLE))
+    assert result['ok'], result['errors']
+    assert result['triangles'] == 1
+    assert obj_loader.load_obj(result['output_path']).face_count == 1
+
+
+def test_validation_errors_reject_mesh(tmp_path):
+    result = ingest_pool.process_mesh(_job(tmp_path, TRIANGLE + 'f 1 2 9\n'))
+    assert not result['ok']
+    assert 'position index out of range' in result['errors']
+
+
+def test_missing_file_is_reported(tmp_path):
+    job = _job(tmp_path, TRIANGLE)
+    job['obj_path'] = str(tmp_path / 'missing.obj')
+    result = ingest_pool.process_mesh(job)
+    assert not result['ok'] and result['errors']
+
+
+def test_run_pool_serial_keeps_order(tmp_path):
+    jobs = [_job(tmp_path, TRIANGLE, 'a'), _job(tmp_path, 'v 0 0 0\n', 'b')]
+    results = ingest_pool.run_pool(jobs, workers=0, verbose=False)
+    assert [r['ok'] for r in results] == [True, False]
+
+
+def test_unexpected_exception_fails_only_that_mesh(tmp_path, monkeypatch):
+    def broken_decimate(mesh, target_faces=None, ratio=None):
+        raise IndexError('boom')
+
+    monkeypatch.setattr(ingest_pool.mesh_decimation, 'decimate', broken_decimate)
+    job = _job(tmp_path, TRIANGLE)
+    job['ratio'] = 0.5
+    result = ingest_pool.process_mesh(job)
+    assert not result['ok']
+    assert result['errors'] == ['IndexError: boom']
+
+
+def test_run_pool_survives_a_dead_worker(tmp_path, monkeypatch):
+    load_obj = obj_loader.load_obj
+
+    def crash_on_marker(path, *args, **kwargs):
+        if 'crash' in os.path.basename(path):
+            os._exit(1)
+        return load_obj(path, *args, **kwargs)
+
+    # Workers are forked, so they inherit the patched loader
+    monkeypatch.setattr(obj_loader, 'load_obj', crash_on_marker)
+    jobs = [_job(tmp_path, TRIANGLE, name) for name in ('a', 'crash', 'b', 'c')]
+    results = ingest_pool.run_pool(jobs, workers=1, max_pending=1, verbose=False)
+    assert [r['ok'] for r in results] == [True, False, True, True]
+    assert results[1]['errors'][0].startswith('BrokenProcessPool')
+
+
+def test_dead_worker_spares_the_other_meshes_in_flight(tmp_path, monkeypatch):
+    load_obj = obj_loader.load_obj
+
+    def crash_on_marker(path, *args, **kwargs):
+        if 'crash' in os.path.basename(path):
+            os._exit(1)
+        return load_obj(path, *args, **kwargs)
+
+    monkeypatch.setattr(obj_loader, 'load_obj', crash_on_marker)
+    jobs = [_job(tmp_path, TRIANGLE, name) for name in ('a', 'crash', 'b', 'c', 'd', 'e')]
+    results = ingest_pool.run_pool(jobs, workers=2, verbose=False)
+    assert [r['ok'] for r in results] == [True, False, True, True, True, True]
+    assert results[1]['errors'][0].startswith('BrokenProcessPool')
+
+
+def test_ready_manifest_lists_passing_meshes(tmp_path):
+    jobs = [_job(tmp_path, TRIANGLE, 'a'), _job(tmp_path, 'v 0 0 0\n', 'b')]
+    results = ingest_pool.run_pool(jobs, workers=0, verbose=False)
+    manifest_path = ingest_pool.write_ready_manifest(results, str(tmp_path / 'out'))
+    with open(manifest_path) as f:
+        rows = [json.loads(line) for line in f]
+    assert [row['asset_name'] for row in rows] == ['a']
+    assert rows[0]['obj_path'] == os.path.join('a', 'a.obj')
+
+
+def test_ready_manifest_hashes_spare_the_editor(tmp_path, monkeypatch):
+    results = ingest_pool.run_pool([_job(tmp_path, 'mtllib a.mtl\n' + TRIANGLE, 'a')], workers=0, verbose=False)
+    manifest_path = ingest_pool.write_ready_manifest(results, str(tmp_path / 'out'))
+    source, = import_sources.load_source_manifest(manifest_path)
+    assert source['files'] == import_sources.file_records(results[0]['output_path'])
+    assert source['files'][str(tmp_path / 'out' / 'a' / 'a.mtl')] == {'missing': True}
+
+    def no_hashing(path):
+        raise AssertionError(f"hashed {path}")
+
+    manifest = import_sources.ImportManifest(str(tmp_path / 'import_manifest.json'))
+    monkeypatch.setattr(import_sources, 'file_hash', no_hashing)
+    changed, files = manifest.check('/Game/Meshes/a', source['obj_path'], source['files'])
+    assert changed and files == source['files']
+
+    # Records that no longer match the files on disk are computed again
+    monkeypatch.undo()
+    write_file(source['obj_path'], TRIANGLE + 'f 1 3 2\n')
+    changed, files = manifest.check('/Game/Meshes/a', source['obj_path'], source['files'])
+    assert files == import_sources.file_records(source['obj_path']) != source['files']
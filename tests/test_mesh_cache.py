@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+
+import mesh_cache
+import obj_loader
+from conftest import write_file
+
+TRIANGLE = 'mtllib mesh.mtl\nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n'
+
+
+def _mesh_dir(tmp_path, name='mesh', text=TRIANGLE):
+    folder = tmp_path / name
+    os.makedirs(folder, exist_ok=True)
+    write_file(folder / 'mesh.mtl', 'newmtl m\nmap_Kd albedo.png\n')
+    write_file(folder / 'albedo.png', 'png')
+    return write_file(folder / 'mesh.obj', text)
+
+
+def test_load_hits_without_parsing(tmp_path, monkeypatch):
+    obj_path = _mesh_dir(tmp_path)
+    cache = mesh_cache.MeshCache(str(tmp_path / 'cache'))
+    mesh = cache.load(obj_path)
+    # Read-only views of the memory-mapped .npy files
+    assert not mesh.vertices.flags.writeable and mesh.faces.tolist() == [[0, 1, 2]]
+    assert mesh.mtllibs == ['mesh.mtl']
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError('parsed on a cache hit')
+
+    monkeypatch.setattr(obj_loader, 'load_obj', no_parse)
+    # A new instance reads the path index from disk, like a new process
+    again = mesh_cache.MeshCache(str(tmp_path / 'cache')).load(obj_path)
+    assert np.array_equal(again.vertices, mesh.vertices)
+    assert len(cache.entries()) == 1
+
+
+def test_key_follows_content_of_obj_and_materials(tmp_path):
+    obj_path = _mesh_dir(tmp_path)
+    cache = mesh_cache.MeshCache(str(tmp_path / 'cache'))
+    key = cache.key_for(obj_path)
+
+    # Touching a file without changing it keeps the key
+    os.utime(obj_path, ns=(1, 1))
+    assert cache.key_for(obj_path) == key
+
+    write_file(tmp_path / 'mesh' / 'albedo.png', 'new texture')
+    texture_key = cache.key_for(obj_path)
+    assert texture_key != key
+
+    write_file(obj_path, TRIANGLE + 'f 3 2 1\n')
+    assert cache.key_for(obj_path) not in (key, texture_key)
+    assert cache.load(obj_path).face_count == 2
+
+    # The same bytes at another path share the entry
+    copy_path = _mesh_dir(tmp_path, 'copy', TRIANGLE + 'f 3 2 1\n')
+    write_file(tmp_path / 'copy' / 'albedo.png', 'new texture')
+    assert cache.key_for(copy_path) == cache.key_for(obj_path)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = mesh_cache.MeshCache(str(tmp_path / 'cache'))
+    paths = [_mesh_dir(tmp_path, f"m{i}", TRIANGLE + f"v {i} {i} {i}\n") for i in range(3)]
+    keys = [cache.key_for(path) for path in paths]
+    for number, (key, path) in enumerate(zip(keys, paths)):
+        cache.put(key, obj_loader.load_obj(path))
+        os.utime(os.path.join(cache.cache_dir, key, 'meta.json'), (number, number))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+
+    entry_size = cache.entries()[0][1]
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 1
+    assert [key for _, _, key in cache.entries()] == [keys[2], keys[0]]
+    assert cache.get(keys[1]) is None
+
+    cache.clear()
+    assert cache.entries() == [] and not os.path.exists(cache.cache_dir)
+
+
+def test_mesh_larger_than_the_cache_still_loads(tmp_path):
+    obj_path = _mesh_dir(tmp_path)
+    cache = mesh_cache.MeshCache(str(tmp_path / 'cache'), max_bytes=1)
+    for _ in range(2):
+        mesh = cache.load(obj_path)
+        assert mesh.faces.tolist() == [[0, 1, 2]]
+    assert cache.entries() == []
+    assert mesh_cache.load_mesh_cached(obj_path, cache).bounds() is not None
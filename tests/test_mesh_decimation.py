@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+import mesh_decimation
+import obj_loader
+from conftest import write_file
+
+
+def grid_obj(n=8, split=None, materials=False):
+    """
+    A flat n x n quad grid. Columns from `split` on use a second copy of the
+    UVs shifted by one, which puts a UV seam down that column; `materials`
+    gives the left and right halves their own material.
+    """
+    lines = [f"v {i} {j} 0" for j in range(n + 1) for i in range(n + 1)]
+    lines += [f"vt {i / n + side} {j / n}" for side in (0, 1) for j in range(n + 1) for i in range(n + 1)]
+    current = None
+    for j in range(n):
+        for i in range(n):
+            if materials and current != (i >= n // 2):
+                current = i >= n // 2
+                lines.append(f"usemtl {'right' if current else 'left'}")
+            shift = (n + 1) ** 2 if split is not None and i >= split else 0
+            a = j * (n + 1) + i + 1
+            b, c, d = a + 1, a + n + 2, a + n + 1
+            for face in ((a, b, c), (a, c, d)):
+                lines.append('f ' + ' '.join(f"{v}/{v + shift}" for v in face))
+    return '\n'.join(lines) + '\n'
+
+
+def _load(tmp_path, text):
+    return obj_loader.load_obj(write_file(tmp_path / 'grid.obj', text))
+
+
+def test_flat_grid_reaches_the_target_without_error(tmp_path):
+    mesh = _load(tmp_path, grid_obj())
+    result, stats = mesh_decimation.decimate(mesh, ratio=0.25)
+    assert stats['output_faces'] == result.face_count == stats['target_faces'] == 32
+    assert stats['max_error'] == pytest.approx(0.0) and stats['max_deviation'] == pytest.approx(0.0)
+    low, high = result.bounds()
+    assert np.allclose(low, 0) and np.allclose(high, [8, 8, 0])
+
+
+def test_uv_seam_stays_closed(tmp_path):
+    result, _ = mesh_decimation.decimate(_load(tmp_path, grid_obj(split=4)), ratio=0.25)
+    triangles = result.vertices[result.faces]
+    left = triangles[:, :, 0].mean(axis=1) < 4
+    uvs = result.texcoords[result.face_texcoords]
+    # Every face keeps the UVs of its own side of the seam
+    assert np.array_equal((uvs[:, :, 0] > 1).any(axis=1), ~left)
+
+    def seam_positions(side):
+        corners = triangles[side].reshape(-1, 3)
+        return {tuple(p) for p in corners[np.isclose(corners[:, 0], 4)].tolist()}
+
+    assert seam_positions(left) == seam_positions(~left)
+
+
+def test_material_border_is_locked(tmp_path):
+    result, stats = mesh_decimation.decimate(_load(tmp_path, grid_obj(materials=True)), ratio=0.25)
+    assert stats['locked_positions'] == 9
+    triangles = result.vertices[result.faces]
+    on_border = np.isclose(result.vertices[:, 0], 4)
+    assert sorted(result.vertices[on_border][:, 1].tolist()) == list(range(9))
+    right = result.face_materials == result.material_names.index('right')
+    assert (triangles[right][:, :, 0] >= 4).all() and (triangles[~right][:, :, 0] <= 4).all()
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'ratio': 0}, {'ratio': 1.5}])
+def test_decimate_needs_a_budget(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        mesh_decimation.decimate(_load(tmp_path, grid_obj(n=2)), **kwargs)
+
+
+def test_decimate_obj_writes_next_to_the_source(tmp_path):
+    path, stats = mesh_decimation.decimate_obj(write_file(tmp_path / 'grid.obj', grid_obj()),
+                                               target_faces=50, verbose=False)
+    assert path == str(tmp_path / 'grid_50tris.obj') and os.path.exists(path)
+    assert obj_loader.load_obj(path).face_count == stats['output_faces'] == 50
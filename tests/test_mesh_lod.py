@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+import mesh_lod
+import obj_loader
+from conftest import write_file
+
+
+def _grid_obj(n=8):
+    lines = ['mtllib grid.mtl']
+    lines += [f"v {i} {j} 0" for j in range(n + 1) for i in range(n + 1)]
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            lines += [f"f {a} {a + 1} {a + n + 2}", f"f {a} {a + n + 2} {a + n + 1}"]
+    return '\n'.join(lines) + '\n'
+
+
+def test_parse_float_list():
+    assert mesh_lod.parse_float_list('1, 0.5,,0.25') == (1.0, 0.5, 0.25)
+
+
+def test_build_lod_chain_writes_levels_and_manifest(tmp_path):
+    write_file(tmp_path / 'grid.mtl', 'newmtl grid\n')
+    obj_path = write_file(tmp_path / 'grid.obj', _grid_obj())
+    manifest = mesh_lod.build_lod_chain(obj_path, ratios=(1.0, 0.5, 0.25), screen_sizes=(1.0, 0.4, 0.1),
+                                        optimize=True, verbose=False)
+    output_dir = tmp_path / 'grid_lods'
+    with open(output_dir / mesh_lod.MANIFEST_NAME) as f:
+        assert json.load(f)['lods'] == manifest['lods']
+    assert manifest['source'] == obj_path and manifest['name'] == 'grid'
+    assert [lod['path'] for lod in manifest['lods']] == ['grid_LOD0.obj', 'grid_LOD1.obj', 'grid_LOD2.obj']
+    assert [lod['triangles'] for lod in manifest['lods']] == [128, 64, 32]
+    assert [lod['screen_size'] for lod in manifest['lods']] == [1.0, 0.4, 0.1]
+    for lod in manifest['lods']:
+        assert obj_loader.load_obj(str(output_dir / lod['path'])).face_count == lod['triangles']
+    # The levels share one copy of the materials
+    assert sorted(os.listdir(output_dir)) == ['grid.mtl', 'grid_LOD0.obj', 'grid_LOD1.obj', 'grid_LOD2.obj',
+                                              mesh_lod.MANIFEST_NAME]
+
+
+@pytest.mark.parametrize('ratios, screen_sizes', [
+    ((), ()),
+    ((1.0, 0.5), (1.0,)),
+    ((1.0, 0.0), (1.0, 0.5)),
+    ((0.5, 1.0), (1.0, 0.5)),
+    ((1.0, 0.5), (0.5, 1.0)),
+])
+def test_build_lod_chain_validates_levels(tmp_path, ratios, screen_sizes):
+    with pytest.raises(ValueError):
+        mesh_lod.build_lod_chain(str(tmp_path / 'missing.obj'), ratios=ratios, screen_sizes=screen_sizes,
+                                 verbose=False)
+    assert not os.path.exists(tmp_path / 'missing_lods')
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+import mesh_optimize
+import obj_loader
+from conftest import write_file
+
+
+def test_weld_merges_chains_within_epsilon():
+    vertices = [[0, 0, 0], [0.4, 0, 0], [0.8, 0, 0], [5, 5, 5], [5, 5, 5]]
+    welded, remap = mesh_optimize.weld_positions(vertices, epsilon=0.5)
+    assert len(welded) == 2
+    assert remap.tolist() == [0, 0, 0, 1, 1]
+    assert np.allclose(welded[1], [5, 5, 5])
+
+
+def test_weld_with_zero_epsilon_merges_exact_duplicates_only():
+    welded, remap = mesh_optimize.weld_positions([[0, 0, 0], [1e-9, 0, 0], [0, 0, 0]], epsilon=0)
+    assert len(welded) == 2 and remap[0] == remap[2] != remap[1]
+
+
+def test_acmr_counts_fifo_misses():
+    assert mesh_optimize.acmr(np.zeros((0, 3))) == 0.0
+    strip = [[0, 1, 2], [1, 2, 3], [2, 3, 4]]
+    assert mesh_optimize.acmr(strip, cache_size=3) == pytest.approx(5 / 3)
+    # A cache of one entry keeps nothing between corners of a triangle
+    assert mesh_optimize.acmr(strip, cache_size=1) == 3.0
+
+
+def test_tipsify_returns_a_permutation_that_helps_the_cache():
+    rng = np.random.default_rng(0)
+    n = 16
+    quads = [(j * (n + 1) + i) for j in range(n) for i in range(n)]
+    faces = np.array([f for a in quads for f in ([a, a + 1, a + n + 2], [a, a + n + 2, a + n + 1])])
+    shuffled = faces[rng.permutation(len(faces))]
+    order = mesh_optimize.tipsify(shuffled, (n + 1) ** 2, cache_size=16)
+    assert sorted(order.tolist()) == list(range(len(faces)))
+    assert mesh_optimize.acmr(shuffled[order]) < mesh_optimize.acmr(shuffled) / 2
+
+
+# Two triangles that duplicate their shared edge, as a UV seam export does
+SEAM = '''v 0 0 0
+v 1 0 0
+v 0 1 0
+v 1 0 0
+v 0 1 0
+v 1 1 0
+vt 0 0
+vt 1 0
+vt 0 1
+vt 0.5 0
+vt 0 0.5
+vt 1 1
+usemtl a
+f 1/1 2/2 3/3
+usemtl b
+f 4/4 6/6 5/5
+'''
+
+
+def test_optimize_welds_seams_and_keeps_the_surface(tmp_path):
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'seam.obj', SEAM))
+    result, stats = mesh_optimize.optimize(mesh)
+    assert (stats['input_vertices'], stats['output_vertices']) == (6, 4)
+    assert stats['output_faces'] == 2 and stats['render_vertices'] == 6
+    # The UVs still split at the seam and every triangle keeps its material and corners
+    assert result.face_texcoords.max() == 5
+    for face in range(2):
+        material = result.material_names[result.face_materials[face]]
+        expected = {'a': [[0, 0], [1, 0], [0, 1]], 'b': [[1, 0], [1, 1], [0, 1]]}[material]
+        corners = result.vertices[result.faces[face]][:, :2]
+        assert sorted(corners.tolist()) == sorted(expected)
+
+
+def test_optimize_drops_faces_that_weld_away(tmp_path):
+    text = 'v 0 0 0\nv 1 0 0\nv 0 1 0\nv 1e-9 0 0\nf 1 2 3\nf 1 4 3\n'
+    result, stats = mesh_optimize.optimize(obj_loader.load_obj(write_file(tmp_path / 'sliver.obj', text)))
+    assert result.face_count == stats['output_faces'] == 1 and result.vertex_count == 3
+
+
+def test_optimize_obj_writes_next_to_the_source(tmp_path):
+    path, stats = mesh_optimize.optimize_obj(write_file(tmp_path / 'seam.obj', SEAM), verbose=False)
+    assert path == str(tmp_path / 'seam_opt.obj')
+    assert obj_loader.load_obj(path).vertex_count == stats['output_vertices'] == 4
@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+import mock_unrealcv_server
+
+MESH = '/Game/Meshes/MeshBP.MeshBP_C'
+
+
+@pytest.fixture
+def scene():
+    return mock_unrealcv_server.MockScene()
+
+
+def test_spawn_names(scene):
+    assert scene.handle(f"vset /objects/spawn {MESH} Chair") == 'Chair'
+    assert scene.handle(f"vset /objects/spawn {MESH} Chair") == 'error Object Chair already exists'
+    assert scene.handle(f"vset /objects/spawn {MESH}") == 'MeshBP_0'
+    assert scene.handle('vset /objects/spawn StaticMeshActor 1 2 3') == 'StaticMeshActor_1'
+    assert scene.objects['StaticMeshActor_1']['location'] == (1.0, 2.0, 3.0)
+    assert scene.handle('vset /objects/spawn Game/Meshes/MeshBP') == 'error Can not find class Game/Meshes/MeshBP'
+    assert scene.handle(f"vset /objects/spawn {MESH} a b").startswith('error unexpected spawn arguments')
+    assert scene.handle('vget /objects') == 'Chair MeshBP_0 StaticMeshActor_1'
+
+
+def test_object_and_camera_commands(scene):
+    scene.handle(f"vset /objects/spawn {MESH} Chair")
+    assert scene.handle('vset /object/Chair/rotation 0 90 0') == 'ok'
+    assert scene.handle('vget /object/Chair/rotation') == '0.000 90.000 0.000'
+    assert scene.handle('vset /object/Chair/hide') == 'ok' and scene.objects['Chair']['hidden']
+    assert scene.handle('vbp Chair SetColor 1 0 0') == 'ok'
+    assert scene.handle('vset /object/Chair/destroy') == 'ok'
+    assert scene.handle('vget /object/Chair/location') == 'error Can not find object Chair'
+    assert scene.handle('vbp Chair SetColor 1 0 0') == 'error Can not find object Chair'
+    assert scene.handle('vset /camera/0/location 1 2 3') == 'ok'
+    assert scene.handle('vget /camera/0/location') == '1.000 2.000 3.000'
+    assert scene.handle('vget /camera/0/scale') == mock_unrealcv_server.UNKNOWN_COMMAND
+    assert scene.handle('vget /camera/7/location') == 'error Can not find camera 7'
+
+
+@pytest.mark.parametrize('command', ['vget', 'vset /object/spawn StaticMeshActor', 'vspawn StaticMeshActor 0 0 0',
+                                     'vget /unrealcv/nothing'])
+def test_unknown_commands(scene, command):
+    assert scene.handle(command) == mock_unrealcv_server.UNKNOWN_COMMAND
+
+
+def test_injected_errors_spare_version_queries(mock_server, session):
+    mock_server.error_rate = 1.0
+    assert session.request('vget /objects') == 'error Injected failure'
+    assert session.request('vget /unrealcv/version') == 'v1.0.0'
+    assert mock_server.injected_errors == 1
+
+
+def test_pipelined_requests_overlap_their_latency(mock_server, session):
+    mock_server.latency = 0.05
+    start = time.perf_counter()
+    assert session.request_batch(['vget /objects'] * 10) == [''] * 10
+    assert time.perf_counter() - start < 0.4
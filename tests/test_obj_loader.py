@@ -0,0 +1,95 @@
+import re
+
+import numpy as np
+import pytest
+
+import obj_loader
+from conftest import write_file
+
+CUBE_FACE = '''v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0 0
+vt 1 0
+vt 1 1
+vn 0 0 1
+usemtl red
+f 1/1/1 2/2/1 3/3/1
+usemtl blue
+f 1/1/1 3/3/1 4/1/1
+'''
+
+
+def test_load_triangles_with_attributes(tmp_path):
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'quad.obj', CUBE_FACE))
+    assert mesh.vertex_count == 4 and mesh.face_count == 2
+    assert mesh.faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+    assert mesh.face_texcoords.tolist() == [[0, 1, 2], [0, 2, 0]]
+    assert mesh.face_normals.tolist() == [[0, 0, 0], [0, 0, 0]]
+    assert mesh.material_names == ['red', 'blue']
+    assert mesh.face_materials.tolist() == [0, 1]
+
+
+def test_polygons_are_fan_triangulated(tmp_path):
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'poly.obj',
+                                          'v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nv 0 2 0\nf 1 2 3 4 5\n'))
+    assert mesh.faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4]]
+
+
+def test_trailing_comments_are_ignored(tmp_path):
+    text = CUBE_FACE.replace('v 1 1 0', 'v 1 1 0 # corner').replace('vn 0 0 1', 'vn 0 0 1 # up')
+    text = text.replace('2/2/1 3/3/1\n', '2/2/1 3/3/1 # first\n')
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'quad.obj', text + 'f 1/1/1 2/2/1 3/3/1 4/1/1#quad\n'))
+    assert mesh.faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 1, 2], [0, 2, 3]]
+    assert mesh.face_texcoords.tolist()[:2] == [[0, 1, 2], [0, 2, 0]]
+    assert mesh.vertices[2].tolist() == [1, 1, 0] and mesh.normals.tolist() == [[0, 0, 1]]
+
+
+def test_chunked_load_matches_naive(tmp_path):
+    rng = np.random.default_rng(0)
+    lines = ['v %f %f %f' % tuple(p) for p in rng.random((200, 3))]
+    lines += ['f %d %d %d' % tuple(f) for f in rng.integers(1, 201, (300, 3))]
+    path = write_file(tmp_path / 'random.obj', '\n'.join(lines) + '\n')
+    naive = obj_loader.load_obj_naive(path)
+    chunked = obj_loader.load_obj(path, chunk_size=256)
+    assert np.array_equal(chunked.faces, naive.faces)
+    assert np.allclose(chunked.vertices, naive.vertices)
+
+
+def test_save_round_trip(tmp_path):
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'quad.obj', CUBE_FACE))
+    again = obj_loader.load_obj(obj_loader.save_obj(mesh, str(tmp_path / 'out' / 'quad.obj')))
+    assert np.array_equal(again.faces, mesh.faces)
+    assert np.array_equal(again.face_texcoords, mesh.face_texcoords)
+    assert again.material_names == mesh.material_names
+
+
+INTERLEAVED = '''v 0 0 0
+v 1 0 0
+v 1 1 0
+vn 0 0 1
+f -3//-1 -2//-1 -1//-1
+v 5 0 0
+v 6 0 0
+v 6 1 0
+vn 0 0 -1
+f -3//-1 -2//-1 -1//-1
+f 1//1 2//1 -1//2
+'''
+
+
+@pytest.mark.parametrize('chunk_size', [obj_loader.DEFAULT_CHUNK_SIZE, 16])
+def test_relative_indices_follow_their_own_line(tmp_path, chunk_size):
+    mesh = obj_loader.load_obj(write_file(tmp_path / 'interleaved.obj', INTERLEAVED), chunk_size=chunk_size)
+    assert mesh.faces.tolist() == [[0, 1, 2], [3, 4, 5], [0, 1, 5]]
+    assert mesh.face_normals.tolist() == [[0, 0, 0], [1, 1, 1], [0, 0, 1]]
+
+
+@pytest.mark.parametrize('faces', ['f 1/1/1 2/2/1 3/3/1\nf 1//1 2//1 3//1\n',
+                                   'f 1/1/1 2/2/1 3/3/1\nf 1/1/1 2/2 3/3/1\n',
+                                   'f 1 2 3\nf 1/1 2/2 3/3 1/1\n'])
+def test_mixed_face_layouts_are_rejected(tmp_path, faces):
+    text = 'v 0 0 0\nv 1 0 0\nv 1 1 0\nvt 0 0\nvt 1 0\nvt 1 1\nvn 0 0 1\n' + faces
+    with pytest.raises(ValueError, match=re.escape(f"Face '{faces.splitlines()[1]}'")):
+        obj_loader.load_obj(write_file(tmp_path / 'mixed.obj', text))
@@ -0,0 +1,28 @@
+import sys
+
+import place_mesh_runtime
+
+
+def _run_main(monkeypatch, *argv, commands=('exit',)):
+    monkeypatch.setattr(sys, 'argv', ['place_mesh_runtime.py', *argv])
+    answers = iter(commands)
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    place_mesh_runtime.main()
+
+
+def test_places_and_runs_custom_commands(mock_server, pool, monkeypatch, capsys):
+    _run_main(monkeypatch, '--blueprint_path', '/Game/Meshes/MeshBP', '--location', '1,2,3',
+              '--rotation', '0,90,0', '--scale', '2,2,2', commands=('vget /objects', 'exit'))
+    (name, entry), = mock_server.scene.objects.items()
+    assert entry['class'] == '/Game/Meshes/MeshBP.MeshBP_C'
+    assert (entry['location'], entry['rotation'], entry['scale']) == ((1.0, 2.0, 3.0), (0.0, 90.0, 0.0),
+                                                                      (2.0, 2.0, 2.0))
+    out = capsys.readouterr().out
+    assert f"Object spawned with ID: {name}" in out and f"Response: {name}" in out
+    assert pool._idle.qsize() == 1
+
+
+def test_spawn_error_releases_the_session(mock_server, pool, monkeypatch, capsys):
+    _run_main(monkeypatch, '--blueprint_path', 'Game/Typo/MeshBP')
+    assert 'Error spawning object: error Can not find class' in capsys.readouterr().out
+    assert not mock_server.scene.objects and pool._idle.qsize() == 1
@@ -0,0 +1,67 @@
+import json
+import sys
+
+import pytest
+
+import placement_benchmark
+
+
+def _report(**scenarios):
+    return {'scenarios': scenarios}
+
+
+def _result(p50=1.0, p95=2.0, p99=3.0, throughput=100.0, errors=0):
+    return {'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99, 'throughput': throughput, 'errors': errors,
+            'unit': 'objects/s'}
+
+
+def test_percentile_and_summarize():
+    values = [0.001 * i for i in range(1, 101)]
+    assert placement_benchmark.percentile(values, 50) == values[49]
+    assert placement_benchmark.percentile(values, 99) == values[98]
+    assert placement_benchmark.percentile([], 50) is None
+    summary = placement_benchmark.summarize(values, 200, 2.0, errors=1, unit='objects')
+    assert summary['samples'] == 100 and summary['errors'] == 1
+    assert summary['p95_ms'] == pytest.approx(95.0) and summary['throughput'] == 100.0
+    assert summary['unit'] == 'objects/s'
+    assert placement_benchmark.summarize([], 0, 0.0)['throughput'] is None
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = _report(spawn=_result(), batch=_result(throughput=1000.0))
+    # Within 25%, or slower by less than half a millisecond: not a regression
+    assert placement_benchmark.compare(_report(spawn=_result(p50=1.4, p95=2.4)), baseline) == []
+    assert placement_benchmark.compare(_report(unknown=_result(p50=50.0)), baseline) == []
+
+    regressions = placement_benchmark.compare(
+        _report(spawn=_result(p99=4.0, errors=2), batch=_result(throughput=700.0)), baseline)
+    assert regressions == ['spawn p99_ms: 3.00 -> 4.00 ms (+33%)',
+                           'spawn: 2 failed samples (baseline had none)',
+                           'batch throughput: 1000.0 -> 700.0 objects/s (-30%)']
+    assert placement_benchmark.compare(_report(spawn=_result(p99=4.0)), baseline, tolerance=0.5) == []
+
+
+def test_run_benchmarks_against_mock(mock_server, pool):
+    report = placement_benchmark.run_benchmarks(mock_server.endpoint, samples=3, batch_size=4, verbose=False)
+    assert list(report['scenarios']) == list(placement_benchmark.SCENARIOS)
+    assert [result['errors'] for result in report['scenarios'].values()] == [0] * 5
+    # serial_transforms times each of the three requests of a sample
+    assert [result['samples'] for result in report['scenarios'].values()] == [3, 3, 9, 3, 3]
+    assert report['scenarios']['batch_placement']['batch_size'] == 4
+    assert pool._idle.qsize() == 1
+    with pytest.raises(ValueError, match='Unknown scenarios: warp'):
+        placement_benchmark.run_benchmarks(mock_server.endpoint, ['warp'], verbose=False)
+
+
+def test_main_fails_on_a_regression(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(_report(connect=_result(p50=0.0, p95=0.0, p99=0.0, throughput=1e9))))
+    monkeypatch.setattr(sys, 'argv', ['placement_benchmark.py', '--mock', '--scenarios', 'connect',
+                                      '--samples', '3', '--baseline', str(baseline),
+                                      '--output', str(tmp_path / 'out' / 'results.json')])
+    with pytest.raises(SystemExit) as exit_info:
+        placement_benchmark.main()
+    assert exit_info.value.code == 1
+    assert 'connect throughput' in capsys.readouterr().out
+    with open(tmp_path / 'out' / 'results.json') as f:
+        assert json.load(f)['scenarios']['connect']['samples'] == 3
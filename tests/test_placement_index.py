@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+import placement_index
+
+
+def test_spatial_grid_query_and_remove():
+    grid = placement_index.SpatialGrid(100.0)
+    grid.insert('a', (0, 0, 0), (50, 50, 50))
+    grid.insert('b', (200, 200, 0), (260, 260, 50))
+    assert grid.query((25, 25, 0), (30, 30, 10)) == ['a']
+    assert grid.query((50, 50, 0), (60, 60, 10)) == []     # touching is not overlapping
+    grid.remove('a')
+    assert grid.query((0, 0, 0), (300, 300, 100)) == ['b']
+    assert 'a' not in grid and len(grid) == 1
+
+
+def test_spatial_grid_rejects_bad_cell_size():
+    with pytest.raises(ValueError):
+        placement_index.SpatialGrid(0)
+
+
+def test_free_locations_do_not_overlap():
+    index = placement_index.PlacementIndex()
+    bounds = ((-50.0, -50.0, 0.0), (50.0, 50.0, 100.0))
+    for number in range(50):
+        location = index.find_free_location(bounds)
+        assert location is not None
+        assert index.is_free(location, bounds)
+        index.add(f"obj{number}", location, bounds)
+    assert len(index) == 50
+    assert not index.is_free(placement_index.DEFAULT_LOCATION, bounds)
+
+
+def test_layouts_fill_region_without_overlap():
+    region = placement_index.parse_region('-2000,-2000,2000,2000')
+    for mode in placement_index.LAYOUTS:
+        index = placement_index.PlacementIndex()
+        placed = index.layout(mode, 40, region, seed=1)
+        assert len(placed) == 40
+        names = [p['name'] for p in placed]
+        for p in placed:
+            assert index.overlapping(p['location']) == [p['name']]
+        assert len(set(names)) == 40
+
+
+def test_save_and_load(tmp_path):
+    index = placement_index.PlacementIndex(padding=5.0)
+    index.add('chair', (0.0, 0.0, 0.0))
+    path = str(tmp_path / 'scene.json')
+    index.save(path)
+    loaded = placement_index.PlacementIndex.load(path)
+    assert len(loaded) == 1 and loaded.padding == 5.0
+    assert not loaded.is_free((10.0, 10.0, 0.0))
+    assert len(placement_index.PlacementIndex.load(str(tmp_path / 'missing.json'))) == 0
+
+
+def test_mixed_sizes_do_not_flood_the_grid():
+    index = placement_index.PlacementIndex()
+    index.add('pebble', (0.0, 0.0, 0.0), ((-1.0, -1.0, 0.0), (1.0, 1.0, 2.0)))
+    start = time.perf_counter()
+    index.add('hangar', (5000.0, 0.0, 0.0), ((-500.0, -500.0, 0.0), (500.0, 500.0, 1000.0)))
+    assert time.perf_counter() - start < 0.1
+    assert index.grid.large == {'hangar'}
+    assert all(keys == ['pebble'] for keys in index.grid.cells.values())
+    assert index.overlapping((5400.0, 400.0, 10.0)) == ['hangar']
+    assert index.is_free((1000.0, 0.0, 0.0))
+
+    # Once most objects are large the automatic cell size grows to suit them
+    for number in range(40):
+        index.add(f"house{number}", (number * 1000.0, 3000.0, 0.0), ((-200.0, -200.0, 0.0), (200.0, 200.0, 400.0)))
+    assert index.grid.cell_size >= 800.0
+    assert len(index.grid.large) <= 1
+    assert index.overlapping((39000.0, 3100.0, 0.0)) == ['house39']
+    assert index.overlapping((0.0, 0.0, 0.0)) == ['pebble']
+
+
+def test_spatial_grid_large_box_query_and_remove():
+    grid = placement_index.SpatialGrid(10.0, max_cells=4)
+    grid.insert('small', (0, 0, 0), (5, 5, 5))
+    grid.insert('big', (-1000, -1000, 0), (1000, 1000, 10))
+    assert 'big' in grid.large and list(grid.cells) == [(0, 0)]
+    assert sorted(grid.query((-1e6, -1e6, 0), (1e6, 1e6, 1))) == ['big', 'small']
+    grid.remove('big')
+    assert not grid.large and grid.query((-500, -500, 0), (-400, -400, 5)) == []
+
+
+def test_transform_bounds_scales_and_rotates():
+    bounds = ((-1.0, -0.5, 0.0), (1.0, 0.5, 2.0))
+    assert placement_index.transform_bounds(bounds) == bounds
+    assert placement_index.transform_bounds(bounds, scale=(100.0, 100.0, 100.0)) == \
+        ((-100.0, -50.0, 0.0), (100.0, 50.0, 200.0))
+    # Yaw turns X towards Y, pitch turns X up, roll turns Y up
+    low, high = placement_index.transform_bounds(bounds, (0.0, 90.0, 0.0))
+    assert low == pytest.approx((-0.5, -1.0, 0.0)) and high == pytest.approx((0.5, 1.0, 2.0))
+    low, high = placement_index.transform_bounds(bounds, (90.0, 0.0, 0.0))
+    assert low == pytest.approx((-2.0, -0.5, -1.0)) and high == pytest.approx((0.0, 0.5, 1.0))
+    low, high = placement_index.transform_bounds(bounds, (0.0, 0.0, 90.0))
+    assert low == pytest.approx((-1.0, 0.0, -0.5)) and high == pytest.approx((1.0, 2.0, 0.5))
+    low, high = placement_index.transform_bounds(bounds, (0.0, 45.0, 0.0), (-1.0, 1.0, 1.0))
+    assert high[0] == pytest.approx(1.5 / 2 ** 0.5) and low[0] == pytest.approx(-high[0])
@@ -0,0 +1,203 @@
+"""Runtime placement paths against an in-process mock UnrealCV server"""
+import asyncio
+import time
+
+import pytest
+
+import async_unrealcv
+import batch_placement
+import camera_streaming
+import command_pipeline
+import mock_unrealcv_server
+import scene_mirror
+import spawn_strategy
+
+BLUEPRINT = '/Game/Meshes/MeshBP'
+
+
+def _placement(name, location, rotation=None, scale=None):
+    return {'blueprint': BLUEPRINT, 'name': name, 'location': location, 'rotation': rotation, 'scale': scale,
+            'obj_path': None}
+
+
+def test_spawn_and_place_probes_and_caches(mock_server, session, strategy_cache):
+    result = spawn_strategy.spawn_and_place(session, BLUEPRINT, 'Chair', (10.0, 20.0, 30.0), (0.0, 90.0, 0.0),
+                                            (2.0, 2.0, 2.0), cache=strategy_cache)
+    assert result.ok and result.object_name == 'Chair'
+    assert strategy_cache.get('v1.0.0') is spawn_strategy.STRATEGIES[0]
+    entry = mock_server.scene.objects['Chair']
+    assert entry['location'] == (10.0, 20.0, 30.0)
+    assert entry['rotation'] == (0.0, 90.0, 0.0)
+    assert entry['scale'] == (2.0, 2.0, 2.0)
+
+
+def test_command_pipeline_matches_responses(mock_server, session):
+    pipeline = command_pipeline.CommandPipeline(session, max_in_flight=4)
+    spawns = [pipeline.spawn('/Game/Meshes/MeshBP.MeshBP_C', f"Obj{i}") for i in range(10)]
+    moves = [pipeline.set_location(f"Obj{i}", (i, 0, 0)) for i in range(10)]
+    missing = pipeline.set_location('Missing', (0, 0, 0))
+    pipeline.flush()
+    assert all(r.ok for r in spawns + moves)
+    assert not missing.ok and command_pipeline.errors([missing]) == [missing]
+    assert mock_server.scene.objects['Obj7']['location'] == (7.0, 0.0, 0.0)
+
+
+def test_place_batch(mock_server, session, strategy_cache):
+    placements = [_placement(f"Row{i}", (i * 100.0, 0.0, 100.0), (0.0, 90.0, 0.0)) for i in range(20)]
+    placements.append(_placement('Bad', (0.0, 0.0, 0.0)))
+    placements[-1]['blueprint'] = 'NotAClass'
+    results = batch_placement.place_batch(placements, session, chunk_size=8, cache=strategy_cache)
+    assert [r['ok'] for r in results] == [True] * 20 + [False]
+    assert mock_server.scene.objects['Row19']['location'] == (1900.0, 0.0, 100.0)
+    assert mock_server.scene.objects['Row3']['rotation'] == (0.0, 90.0, 0.0)
+
+
+def test_scene_mirror_tracks_placements(session, strategy_cache):
+    mirror = scene_mirror.SceneMirror(session)
+    try:
+        mirror.snapshot()
+        batch_placement.place_batch([_placement(f"M{i}", (i, 0.0, 0.0)) for i in range(5)], session,
+                                    cache=strategy_cache)
+        assert sorted(mirror.names()) == [f"M{i}" for i in range(5)]
+        assert mirror.get('M3')['location'] == (3.0, 0.0, 0.0)
+    finally:
+        mirror.close()
+
+
+def test_camera_streaming_bounds_live_objects(mock_server, session, strategy_cache):
+    placements = [_placement(f"S{x}_{y}", (x * 500.0, y * 500.0, 0.0)) for x in range(-10, 11) for y in range(-10, 11)]
+    controller = camera_streaming.StreamingController(session, placements, spawn_radius=1000.0, despawn_radius=1500.0,
+                                                      mode='hide', cache=strategy_cache)
+    controller.tick((0.0, 0.0, 200.0))
+    near = {p['name'] for p in placements if (p['location'][0] ** 2 + p['location'][1] ** 2) ** 0.5 <= 1000.0}
+    assert set(controller.live.values()) == near
+    controller.tick((4000.0, 0.0, 200.0))
+    visible = {name for name, entry in mock_server.scene.objects.items() if not entry['hidden']}
+    assert visible == set(controller.live.values())
+    assert all(entry['hidden'] for name, entry in mock_server.scene.objects.items() if name in near)
+    controller.clear()
+    assert not mock_server.scene.objects
+
+
+def test_stalled_batch_times_out(mock_server, session):
+    session.batch_timeout = 0.3
+    mock_server.latency = 2.0
+    start = time.perf_counter()
+    with pytest.raises(ConnectionError, match='no response within'):
+        session.request_batch(['vget /objects', 'vget /camera/0/location'])
+    # disconnect() gives the client's receive thread up to 2 s to stop
+    assert time.perf_counter() - start < 3.0
+    assert not session.isconnected()
+    mock_server.latency = 0.0
+    assert session.request_batch(['vget /unrealcv/version']) == ['v1.0.0']
+
+
+@pytest.mark.parametrize('key', ['objects_spawn_class_at', 'vrun_spawnactor'])
+def test_place_batch_pipelines_server_named_spawns(mock_server, session, strategy_cache, capsys, key):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES_BY_KEY[key])
+    batches = []
+    session.add_listener(lambda commands, responses: batches.append(len(commands)))
+    placements = [_placement(f"Row{i}", (i * 100.0, 0.0, 100.0), (0.0, 90.0, 0.0), (2.0, 2.0, 2.0))
+                  for i in range(30)]
+    results = batch_placement.place_batch(placements, session, cache=strategy_cache)
+    assert all(r['ok'] for r in results)
+    if key == 'objects_spawn_class_at':
+        # Names come from the server, and the transforms are sent by those names
+        assert all(r['name'] in mock_server.scene.objects for r in results)
+        entry = mock_server.scene.objects[results[-1]['name']]
+        assert entry['location'] == (2900.0, 0.0, 100.0)
+        assert entry['rotation'] == (0.0, 90.0, 0.0) and entry['scale'] == (2.0, 2.0, 2.0)
+    else:
+        assert 'were not applied' in capsys.readouterr().out
+    # The rows after the first one are pipelined, not sent one by one
+    assert max(batches) >= 29
+
+
+def _async_place(mock_server, name, cache, **kwargs):
+    async def place():
+        async with async_unrealcv.AsyncUnrealCVClient(mock_server.endpoint, verbose=False) as client:
+            return await spawn_strategy.async_spawn_and_place(client, BLUEPRINT, name, cache=cache, **kwargs)
+    return asyncio.run(place())
+
+
+def test_async_spawn_transforms_server_named_objects(mock_server, strategy_cache):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES_BY_KEY['objects_spawn_class_at'])
+    result = _async_place(mock_server, 'Ignored', strategy_cache, location=(5.0, 6.0, 7.0),
+                          rotation=(0.0, 90.0, 0.0), scale=(3.0, 3.0, 3.0))
+    assert result.ok and not result.probed
+    assert [r.op for r in result.transforms] == ['rotation', 'scale']
+    entry = mock_server.scene.objects[result.object_name]
+    assert entry['location'] == (5.0, 6.0, 7.0)
+    assert entry['rotation'] == (0.0, 90.0, 0.0) and entry['scale'] == (3.0, 3.0, 3.0)
+
+
+def _reject_syntax(mock_server, prefix):
+    """Make the mock answer commands starting with prefix like a build without that syntax"""
+    handle = mock_server.scene.handle
+    mock_server.scene.handle = lambda command: (mock_unrealcv_server.UNKNOWN_COMMAND if command.startswith(prefix)
+                                                else handle(command))
+
+
+def test_async_spawn_replaces_stale_cached_strategy(mock_server, strategy_cache):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES_BY_KEY['objects_spawn_asset'])
+    _reject_syntax(mock_server, 'vset /objects/spawn /Game/Meshes/MeshBP ')
+    result = _async_place(mock_server, 'Lamp', strategy_cache, location=(1.0, 2.0, 3.0))
+    assert result.ok and result.probed and result.object_name == 'Lamp'
+    assert result.failures and result.failures[0][0].startswith('vset /objects/spawn /Game/Meshes/MeshBP ')
+    assert strategy_cache.get('v1.0.0') is spawn_strategy.STRATEGIES[0]
+    assert mock_server.scene.objects['Lamp']['location'] == (1.0, 2.0, 3.0)
+
+
+def test_bad_asset_path_keeps_cached_strategy(mock_server, session, strategy_cache):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES[0])
+    result = spawn_strategy.spawn_and_place(session, '/Game/Meshes/MeshBP', 'Typo', cache=strategy_cache)
+    assert result.ok
+    result = spawn_strategy.spawn_and_place(session, 'Game/Typo/MeshBP', 'Typo', cache=strategy_cache)
+    assert not result.ok and not result.probed
+    assert strategy_cache.get('v1.0.0') is spawn_strategy.STRATEGIES[0]
+
+
+def test_taken_name_retries_under_a_fresh_one(mock_server, session, strategy_cache):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES[0])
+    spawn_strategy.spawn_and_place(session, BLUEPRINT, 'Chair', cache=strategy_cache)
+    result = spawn_strategy.spawn_and_place(session, BLUEPRINT, 'Chair', (5.0, 0.0, 0.0), cache=strategy_cache)
+    assert result.ok and not result.probed
+    assert result.object_name.startswith('Chair_')
+    assert mock_server.scene.objects[result.object_name]['location'] == (5.0, 0.0, 0.0)
+    assert strategy_cache.get('v1.0.0') is spawn_strategy.STRATEGIES[0]
+
+
+def test_first_probe_with_a_bad_asset_caches_nothing(mock_server, session, strategy_cache):
+    result = spawn_strategy.spawn_and_place(session, 'Game/Typo/MeshBP', 'Chair', cache=strategy_cache)
+    assert result.ok and result.strategy.key == 'vrun_spawnactor'
+    assert strategy_cache.get('v1.0.0') is None
+
+
+def test_reprobe_never_caches_unaddressable_strategy(mock_server, session, strategy_cache):
+    strategy_cache.set('v1.0.0', spawn_strategy.STRATEGIES[0])
+    _reject_syntax(mock_server, 'vset /objects/spawn')
+    result = spawn_strategy.spawn_and_place(session, BLUEPRINT, 'Chair', cache=strategy_cache)
+    assert result.probed and result.strategy.key == 'vrun_spawnactor'
+    assert strategy_cache.get('v1.0.0') is None
+    # With no cached strategy, a server that understands only vrun settles on it
+    spawn_strategy.spawn_and_place(session, BLUEPRINT, 'Table', cache=strategy_cache)
+    assert strategy_cache.get('v1.0.0').key == 'vrun_spawnactor'
+
+
+def test_camera_streaming_survives_failed_first_spawns(mock_server, session, strategy_cache):
+    placements = [_placement(f"F{x}", (x * 100.0, 0.0, 0.0)) for x in range(5)]
+    placements[0]['blueprint'] = 'Game/Typo/MeshBP'
+    controller = camera_streaming.StreamingController(session, placements, spawn_radius=1000.0,
+                                                      cache=strategy_cache)
+    mock_server.error_rate = 1.0
+    stats = controller.tick((0.0, 0.0, 200.0))
+    assert stats['errors'] == 5 and controller.strategy is None and not controller.live
+
+    # A bad asset on the nearest placement does not stop the others from spawning
+    mock_server.error_rate = 0.0
+    controller.failed.clear()
+    controller.pending.update(range(5))
+    stats = controller.tick((10.0, 0.0, 200.0))
+    assert controller.strategy is spawn_strategy.STRATEGIES[0]
+    assert stats['spawned'] == 4 and 0 in controller.failed
+    assert sorted(controller.live) == [1, 2, 3, 4]
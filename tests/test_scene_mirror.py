@@ -0,0 +1,94 @@
+import pytest
+
+import scene_mirror
+
+MESH = '/Game/Meshes/MeshBP.MeshBP_C'
+
+
+@pytest.fixture
+def mirror(session):
+    mirror = scene_mirror.SceneMirror(session)
+    yield mirror
+    mirror.close()
+
+
+def _add(mock_server, name, location):
+    """An object created behind the mirror's back"""
+    mock_server.scene.objects[name] = {'class': MESH, 'location': location, 'rotation': (0.0, 0.0, 0.0),
+                                       'scale': (1.0, 1.0, 1.0), 'hidden': False}
+
+
+@pytest.mark.parametrize('response, vector', [
+    ('10.000 20.000 100.000', (10.0, 20.0, 100.0)),
+    ('1,2,3', (1.0, 2.0, 3.0)),
+    ('ok', None),
+    ('1 2', None),
+    (None, None),
+])
+def test_parse_vector(response, vector):
+    assert scene_mirror.parse_vector(response) == vector
+
+
+def test_snapshot_reads_every_transform(mock_server, mirror):
+    _add(mock_server, 'Chair', (1.0, 2.0, 3.0))
+    _add(mock_server, 'Lamp', (100.0, 0.0, 0.0))
+    assert mirror.snapshot() == 2
+    assert mirror.queries == 1 + 2 * 3
+    assert mirror.get('Chair')['location'] == (1.0, 2.0, 3.0) and mirror.get('Lamp')['scale'] == (1.0, 1.0, 1.0)
+    assert mirror.unknown() == [] and mirror.names() == ['Chair', 'Lamp']
+    assert mirror.find(prefix='Ch') == ['Chair']
+    assert mirror.find(within=((50, -10, -10), (150, 10, 10))) == ['Lamp']
+    assert mirror.get('Sofa') is None
+
+
+def test_own_commands_are_tracked_without_queries(mock_server, session, mirror):
+    mirror.snapshot()
+    session.request(f"vset /objects/spawn {MESH} Chair")
+    session.request_batch(['vset /object/Chair/location 1 2 3', 'vset /object/Chair/scale 2 2 2'])
+    assert 'Chair' in mirror and mirror.get('Chair')['location'] == (1.0, 2.0, 3.0)
+    # The rotation was never set, so a sync queries that field and nothing else
+    assert mirror.unknown() == [('Chair', 'rotation')]
+    queries = mirror.queries
+    assert mirror.sync(check_names=False) == 1 and mirror.queries == queries + 1
+    assert mirror.get('Chair')['rotation'] == (0.0, 0.0, 0.0)
+
+    # A spawn at a location names the object only in its reply
+    name = session.request(f"vset /objects/spawn {MESH} 5 5 5")
+    assert mirror.get(name)['location'] == (5.0, 5.0, 5.0)
+
+    session.request('vset /object/Chair/destroy')
+    assert 'Chair' not in mirror and mirror.tracked == 5
+
+
+def test_failed_and_opaque_commands_are_requeried(mock_server, session, mirror):
+    _add(mock_server, 'Chair', (1.0, 2.0, 3.0))
+    mirror.snapshot()
+    mock_server.error_rate = 1.0
+    session.request('vset /object/Chair/location 9 9 9')
+    mock_server.error_rate = 0.0
+    assert mirror.unknown() == [('Chair', 'location')]
+
+    session.request('vbp Chair SetColor 1 0 0')
+    assert len(mirror.unknown()) == 3
+    mirror.refresh()
+    assert mirror.get('Chair')['location'] == (1.0, 2.0, 3.0) and mirror.unknown() == []
+
+    # A console spawn leaves the names stale, so even sync(check_names=False) lists them
+    session.request('vrun "SpawnActor /Game/A.A_C"')
+    assert mirror.names_stale
+    _add(mock_server, 'Lamp', (0.0, 0.0, 0.0))
+    assert mirror.sync(check_names=False) == 1 + 3
+    assert mirror.names() == ['Chair', 'Lamp'] and not mirror.names_stale
+
+
+def test_sync_drops_objects_removed_by_others(mock_server, mirror):
+    _add(mock_server, 'Chair', (1.0, 2.0, 3.0))
+    mirror.snapshot()
+    del mock_server.scene.objects['Chair']
+    assert mirror.sync() == 1 and len(mirror) == 0
+
+
+def test_close_stops_tracking(session, mirror):
+    mirror.close()
+    session.request(f"vset /objects/spawn {MESH} Chair")
+    assert 'Chair' not in mirror
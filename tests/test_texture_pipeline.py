@@ -0,0 +1,107 @@
+import os
+import struct
+
+import numpy as np
+import pytest
+
+import texture_pipeline
+from conftest import write_file
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def _png(path, size, mode='RGBA', color=(200, 100, 50, 255)):
+    Image.new(mode, size, color[:len(mode)]).save(path)
+    return str(path)
+
+
+def test_gpu_bytes():
+    assert texture_pipeline.gpu_bytes(1024, 1024, 'DXT1', mips=False) == 512 * 1024
+    assert texture_pipeline.gpu_bytes(1024, 1024, 'DXT5', mips=False) == 1024 * 1024
+    # 4x2 -> 2x1 -> 1x1 is one block per level
+    assert texture_pipeline.gpu_bytes(4, 2, 'DXT1') == 3 * 8
+
+
+@pytest.mark.parametrize('size, max_size, expected', [
+    ((1024, 1024), 1024, (1024, 1024)),
+    ((2048, 1024), 1024, (1024, 512)),
+    ((1000, 600), 1024, (1024, 512)),
+    ((1024, 1024), 700, (512, 512)),
+    ((4096, 8), 256, (256, 1)),
+])
+def test_target_size(size, max_size, expected):
+    assert texture_pipeline.target_size(*size, max_size) == expected
+
+
+def test_material_uses_alpha():
+    assert not texture_pipeline.material_uses_alpha({'map_Kd': 'albedo.png', 'd': '1.0'})
+    assert texture_pipeline.material_uses_alpha({'d': '0.5'})
+    assert texture_pipeline.material_uses_alpha({'Tr': '0.25'})
+    assert texture_pipeline.material_uses_alpha({'map_d': 'alpha.png'})
+    assert not texture_pipeline.material_uses_alpha({'d': '-halo nonsense'})
+
+
+def test_build_mips_averages_in_linear_light():
+    pixels = np.zeros((2, 4, 3), np.uint8)
+    pixels[:, ::2] = 255
+    levels = texture_pipeline.build_mips(Image.fromarray(pixels, 'RGB'))
+    assert [level.size for level in levels] == [(4, 2), (2, 1), (1, 1)]
+    # Half white, half black is 0.5 in linear light, i.e. sRGB 188 rather than 128
+    assert np.asarray(levels[-1])[0, 0].tolist() == [188, 188, 188]
+
+
+def test_save_dds_declares_every_mip_level(tmp_path):
+    levels = texture_pipeline.build_mips(Image.new('RGB', (16, 8), (10, 20, 30)))
+    path = str(tmp_path / 'albedo.dds')
+    texture_pipeline.save_dds(levels, path, 'DXT1')
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert data[:4] == b'DDS ' and data[84:88] == b'DXT1'
+    flags, = struct.unpack_from('<I', data, 8)
+    mip_count, = struct.unpack_from('<I', data, 28)
+    caps, = struct.unpack_from('<I', data, 108)
+    assert mip_count == len(levels) == 5 and flags & 0x20000 and caps & 0x400008 == 0x400008
+    assert len(data) == 128 + texture_pipeline.gpu_bytes(16, 8, 'DXT1')
+    with Image.open(path) as image:
+        assert image.size == (16, 8)
+
+
+def test_convert_texture_drops_alpha_and_resizes(tmp_path):
+    source = _png(tmp_path / 'albedo.png', (300, 300))
+    result = texture_pipeline.convert_texture(source, str(tmp_path / 'out'), max_size=128)
+    assert result['filename'] == 'albedo.dds' and result['output_size'] == (128, 128)
+    assert not result['alpha'] and result['mips'] == 8
+    assert result['output_gpu_bytes'] == texture_pipeline.gpu_bytes(128, 128, 'DXT1')
+    # A non-power-of-two RGBA source imports as DXT5 without mips
+    assert result['source_gpu_bytes'] == texture_pipeline.gpu_bytes(300, 300, 'DXT5', mips=False)
+
+    kept = texture_pipeline.convert_texture(source, str(tmp_path / 'png'), max_size=64, texture_format='png',
+                                            keep_alpha=True)
+    assert kept['alpha'] and kept['mips'] == 0
+    with Image.open(tmp_path / 'png' / 'albedo.png') as image:
+        assert image.mode == 'RGBA' and image.size == (64, 64)
+    with pytest.raises(ValueError, match='Unknown texture format'):
+        texture_pipeline.convert_texture(source, str(tmp_path / 'out'), texture_format='tga')
+
+
+def test_prepare_textures_rewrites_the_mtl(tmp_path):
+    _png(tmp_path / 'albedo.png', (64, 64))
+    _png(tmp_path / 'glass.png', (64, 64))
+    _png(tmp_path / 'normal.png', (64, 64), mode='RGB')
+    write_file(tmp_path / 'mesh.mtl', '# exported\nnewmtl body\nmap_Kd -bm 1 albedo.png\nbump normal.png\n'
+                                      'newmtl window\nd 0.4\nmap_Kd glass.png\nmap_Ks missing.png\n')
+    obj_path = write_file(tmp_path / 'mesh.obj', 'mtllib mesh.mtl\nv 0 0 0\n')
+
+    output_path, stats = texture_pipeline.prepare_textures(obj_path, max_size=32, verbose=False)
+    output_dir = tmp_path / 'mesh_tex'
+    assert output_path == str(output_dir / 'mesh.obj') and os.path.exists(output_path)
+    with open(output_dir / 'mesh.mtl') as f:
+        assert f.read() == ('# exported\nnewmtl body\nmap_Kd -bm 1 albedo.dds\nbump normal.png\n'
+                            'newmtl window\nd 0.4\nmap_Kd glass.dds\nmap_Ks missing.png\n')
+    assert os.path.exists(output_dir / 'normal.png')
+    assert [(t['filename'], t['alpha']) for t in stats['textures']] == [('albedo.dds', False), ('glass.dds', True)]
+    assert stats['missing'] == [str(tmp_path / 'missing.png')]
+    assert stats['output_gpu_bytes'] < stats['source_gpu_bytes']
+
+    with pytest.raises(ValueError, match='must differ'):
+        texture_pipeline.prepare_textures(obj_path, output_dir=str(tmp_path), verbose=False)
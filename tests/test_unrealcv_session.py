@@ -0,0 +1,88 @@
+import socket
+
+import pytest
+
+import unrealcv_session
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+def test_connect_with_backoff_gives_up():
+    assert unrealcv_session.connect_with_backoff(('localhost', _free_port()), timeout=0.05, verbose=False) is None
+
+
+def test_request_and_listeners(session):
+    seen = []
+    listener = lambda command, response: seen.append((command, response))
+    session.add_listener(listener)
+    assert session.request('vset /objects/spawn StaticMeshActor Cube') == 'Cube'
+    assert session.request_batch(['vget /object/Cube/location', 'vget /objects']) == ['0.000 0.000 0.000', 'Cube']
+    session.remove_listener(listener)
+    session.remove_listener(listener)
+    session.request('vget /objects')
+    assert [command for command, _ in seen] == ['vset /objects/spawn StaticMeshActor Cube',
+                                                'vget /object/Cube/location', 'vget /objects']
+
+
+def test_request_reconnects_after_a_dropped_socket(session):
+    session.client.disconnect()
+    assert session.request('vget /unrealcv/version') == 'v1.0.0'
+
+    request = session.client.request
+    session.client.request = lambda command: None
+    assert session.request('vget /unrealcv/version') == 'v1.0.0'
+    assert session.reconnects == 1 and session.client.request is not request
+
+
+def test_request_raises_without_a_server():
+    session = unrealcv_session.UnrealCVSession(('localhost', _free_port()), connect_timeout=0.05, verbose=False)
+    with pytest.raises(ConnectionError, match='No response from UnrealCV'):
+        session.request('vget /objects', retries=1)
+    with pytest.raises(ConnectionError):
+        session.request_batch(['vget /objects'])
+
+
+def test_pool_reuses_one_warm_session(mock_server):
+    pool = unrealcv_session.SessionPool(mock_server.endpoint, size=1, verbose=False)
+    assert pool.warm() == 1
+    session = pool.acquire()
+    assert session is not None and session.isconnected()
+    assert pool.acquire(timeout=0.01) is None
+    pool.release(session)
+    assert pool.acquire() is session
+    # A session returned without a connection frees its slot for a new one
+    session.disconnect()
+    pool.release(session)
+    other = pool.acquire()
+    assert other is not None and other is not session
+    pool.release(other)
+    pool.close()
+    assert pool._idle.qsize() == 0 and pool._created == 0
+
+
+def test_pool_health_check_reconnects(mock_server):
+    pool = unrealcv_session.SessionPool(mock_server.endpoint, health_check_interval=0.0, verbose=False)
+    session = pool.acquire()
+    pool.release(session)
+    session.is_healthy = lambda: False
+    assert pool.acquire() is session and session.reconnects == 1
+    pool.release(session)
+    pool.close()
+
+
+def test_pool_without_server():
+    pool = unrealcv_session.SessionPool(('localhost', _free_port()), connect_timeout=0.05, verbose=False)
+    assert pool.acquire() is None and pool._created == 0
+
+
+def test_get_pool_is_shared_per_endpoint(mock_server, monkeypatch):
+    monkeypatch.setattr(unrealcv_session, '_pools', {})
+    assert unrealcv_session.get_pool(mock_server.endpoint) is unrealcv_session.get_pool(list(mock_server.endpoint))
+    monkeypatch.setattr(unrealcv_session, 'DEFAULT_ENDPOINT', mock_server.endpoint)
+    assert unrealcv_session.get_pool() is unrealcv_session.get_pool(mock_server.endpoint)
+    unrealcv_session.close_all_pools()
+    assert not unrealcv_session._pools
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import unrealcv_session
+import unrealcv_trace
+from conftest import ROOT, write_file
+
+
+@pytest.mark.parametrize('command, key', [
+    ('vset /object/Chair_01/location 1 2 3', ('vset', '/object/{id}/location')),
+    ('vget /camera/0/location', ('vget', '/camera/{id}/location')),
+    ('vset /objects/spawn /Game/Meshes/MeshBP.MeshBP_C Chair', ('vset', '/objects/spawn')),
+    ('vbp Chair_01 SetColor 1 0 0', ('vbp', '{id} SetColor')),
+    ('vrun "SpawnActor /Game/A.A_C Location=(0,0,0)"', ('vrun', 'SpawnActor')),
+    ('vget', ('vget', '')),
+    ('', ('', '')),
+])
+def test_command_key(command, key):
+    assert unrealcv_trace.command_key(command) == key
+
+
+def test_record_and_prometheus():
+    tracer = unrealcv_trace.Tracer()
+    tracer.record('vset /object/A/location 1 2 3', 0.0, 0.0003, 'ok')
+    tracer.record('vset /object/B/location 1 2 3', 0.0, 0.002, 'error Can not find object B')
+    tracer.record('vget /objects', 0.0, 0.01, None)
+    tracer.record_batch(['vset /object/A/scale 1 1 1', 'vset /object/B/scale 1 1 1'], 0.0, 0.004, ['ok', 'ok'])
+
+    location = tracer.stats[('vset', '/object/{id}/location')]
+    assert (location.count, location.errors, location.failures) == (2, 1, 0)
+    assert tracer.stats[('vget', '/objects')].failures == 1
+    assert tracer.stats[('vset', '/object/{id}/scale')].seconds == pytest.approx(0.004)
+    assert tracer.percentile(('vset', '/object/{id}/location'), 50) == 0.0005
+    assert len(tracer.events) == 4 and tracer.events[-1][4] == 'ok'
+
+    text = tracer.prometheus()
+    assert 'unrealcv_request_duration_seconds_bucket{verb="vset",path="/object/{id}/location",le="0.0005"} 1' in text
+    assert 'unrealcv_request_duration_seconds_bucket{verb="vset",path="/object/{id}/location",le="+Inf"} 2' in text
+    assert 'unrealcv_requests_total{verb="vset",path="/object/{id}/location",status="error"} 1' in text
+    assert 'unrealcv_requests_total{verb="vget",path="/objects",status="failed"} 1' in text
+    assert 'unrealcv_request_bytes_total{verb="vget",path="/objects",direction="received"} 0' in text
+
+
+def test_session_requests_are_traced(mock_server, session, tmp_path):
+    tracer = unrealcv_trace.install()
+    try:
+        session.request('vset /objects/spawn StaticMeshActor Cube')
+        session.request_batch(['vset /object/Cube/location 1 2 3', 'vget /object/Cube/location'])
+    finally:
+        unrealcv_trace.uninstall()
+    assert unrealcv_session.get_tracer() is None
+    assert tracer.stats[('vset', '/objects/spawn')].count == 1
+    assert tracer.stats[('vget', '/object/{id}/location')].count == 1
+
+    unrealcv_trace.write_outputs(tracer, str(tmp_path / 'out' / 'trace'), verbose=False)
+    with open(tmp_path / 'out' / 'trace.json') as f:
+        events = json.load(f)['traceEvents']
+    assert [e['name'] for e in events] == ['vset /objects/spawn', 'batch 2 commands']
+    assert os.path.exists(tmp_path / 'out' / 'trace.prom')
+
+
+def test_main_keeps_the_script_exit_status(tmp_path):
+    script = write_file(tmp_path / 'fails.py', 'import sys\nprint("placing")\nsys.exit(3)\n')
+    process = subprocess.run([sys.executable, os.path.join(ROOT, 'unrealcv_trace.py'),
+                              '--output', str(tmp_path / 'trace'), script],
+                             capture_output=True, text=True, timeout=60)
+    assert process.returncode == 3
+    assert 'placing' in process.stdout
+    assert os.path.exists(tmp_path / 'trace.json') and os.path.exists(tmp_path / 'trace.prom')
@@ -0,0 +1,423 @@
+"""
+Texture Pipeline
+================
+
+Shrinks the base color textures of a HunYuan3D-v2 mesh before it is imported
+into UE5. With import_textures=True the importer takes whatever the MTL points
+at, so a 1024x1024 RGBA PNG ends up as a DXT5 texture on the GPU for every
+mesh, even though the imported material is opaque and never reads the alpha.
+
+For every map_Kd texture of an OBJ's materials this:
+
+1. drops the alpha channel unless the material uses transparency (d < 1,
+   Tr > 0 or map_d), which halves the compressed size (DXT5 -> DXT1),
+2. resizes it to a power of two no larger than a configurable maximum,
+3. pre-builds the mip chain (box filter in linear light), and
+4. writes it as a BC1/BC3 compressed DDS holding every mip level, or as a
+   PNG if the editor should compress and build the mips itself.
+
+The MTL is rewritten to point at the new files, so the regular OBJ import
+picks them up. Other maps (normal, bump, ...) are copied unchanged.
+
+Memory is reported as the size the texture takes on the GPU, i.e. the block
+compressed format UE picks on import (DXT5 with alpha, DXT1 without) plus the
+mip chain, before and after.
+
+Requires Pillow (pip install pillow) and NumPy, except for gpu_bytes().
+
+Example usage:
+python texture_pipeline.py data/result/mesh.obj
+python texture_pipeline.py data/result/mesh.obj --max_size 512 --format png --output_dir /tmp/mesh_tex
+"""
+import argparse
+import io
+import os
+import shutil
+import struct
+
+import import_sources
+
+# gpu_bytes() needs neither, so asset_index can use it inside the editor
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_FORMAT = 'dds'
+FORMATS = ('dds', 'png')
+
+# Bytes per 4x4 block of the block compressed formats UE uses for color textures
+BLOCK_BYTES = {'DXT1': 8, 'DXT5': 16}
+
+# DDS header fields that Pillow leaves unset for single-level files
+_DDSD_MIPMAPCOUNT = 0x20000
+_DDSCAPS_COMPLEX = 0x8
+_DDSCAPS_MIPMAP = 0x400000
+
+
+def _require_dependencies():
+    if Image is None:
+        raise ImportError("Pillow is required for the texture pipeline (pip install pillow)")
+    if np is None:
+        raise ImportError("NumPy is required for the texture pipeline (pip install numpy)")
+
+
+def gpu_bytes(width, height, pixel_format, mips=True):
+    """
+    Size of a block compressed texture on the GPU.
+
+    Args:
+        width (int): Width of the top level
+        height (int): Height of the top level
+        pixel_format (str): 'DXT1' or 'DXT5'
+        mips (bool): Include the full mip chain
+
+    Returns:
+        int: Size in bytes
+    """
+    total = 0
+    while True:
+        total += ((width + 3) // 4) * ((height + 3) // 4) * BLOCK_BYTES[pixel_format]
+        if not mips or (width == 1 and height == 1):
+            return total
+        width, height = max(1, width // 2), max(1, height // 2)
+
+
+def _is_power_of_two(value):
+    return value > 0 and value & (value - 1) == 0
+
+
+def _import_estimate(width, height, has_alpha):
+    """GPU bytes UE would use for a source image as is (no mips for non-power-of-two sizes)"""
+    mips = _is_power_of_two(width) and _is_power_of_two(height)
+    return gpu_bytes(width, height, 'DXT5' if has_alpha else 'DXT1', mips)
+
+
+def target_size(width, height, max_size=DEFAULT_MAX_SIZE):
+    """
+    Power-of-two size for a texture, keeping the aspect ratio as well as possible.
+
+    Args:
+        width (int): Source width
+        height (int): Source height
+        max_size (int): Largest allowed width or height
+
+    Returns:
+        tuple: (width, height)
+    """
+    if max_size < 1:
+        raise ValueError(f"max_size must be at least 1, got {max_size}")
+    limit = 1 << int(np.floor(np.log2(max_size)))
+    scale = min(1.0, max_size / max(width, height))
+
+    def nearest(value):
+        return int(min(limit, max(1, 1 << int(round(np.log2(max(value * scale, 1)))))))
+
+    return nearest(width), nearest(height)
+
+
+def material_uses_alpha(statements):
+    """
+    Args:
+        statements (dict): One material from import_sources.parse_mtl
+
+    Returns:
+        bool: True if the material is transparent, so its texture alpha matters
+    """
+    if statements.get('map_d'):
+        return True
+    try:
+        if float(statements.get('d', '1').split()[-1]) < 1.0:
+            return True
+        if float(statements.get('Tr', '0').split()[-1]) > 0.0:
+            return True
+    except ValueError:
+        pass
+    return False
+
+
+def _to_linear(srgb):
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def _to_srgb(linear):
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
+
+
+def build_mips(image):
+    """
+    Build the mip chain of an image down to 1x1.
+
+    Each level averages 2x2 texels of the previous one; color is averaged in
+    linear light so dark and bright areas keep their brightness, alpha as is.
+
+    Args:
+        image (PIL.Image.Image): RGB or RGBA top level with power-of-two sides
+
+    Returns:
+        list: PIL images, top level first
+    """
+    levels = [image]
+    data = np.asarray(image, np.float32) / 255.0
+    channels = data.shape[2]
+    data[..., :3] = _to_linear(data[..., :3])
+    while data.shape[0] > 1 or data.shape[1] > 1:
+        height, width = data.shape[:2]
+        # A side that is already 1 texel stays 1 texel
+        data = data.reshape(max(1, height // 2), min(2, height), max(1, width // 2), min(2, width), channels)
+        data = data.mean(axis=(1, 3))
+        level = data.copy()
+        level[..., :3] = _to_srgb(level[..., :3])
+        pixels = np.clip(np.rint(level * 255.0), 0, 255).astype(np.uint8)
+        levels.append(Image.fromarray(pixels, image.mode))
+    return levels
+
+
+def save_dds(levels, path, pixel_format):
+    """
+    Write a block compressed DDS file holding every mip level.
+
+    Pillow writes one level per file; the levels are encoded one by one and
+    concatenated behind a header that declares the mip count.
+
+    Args:
+        levels (list): PIL images from build_mips, top level first
+        path (str): Destination .dds path
+        pixel_format (str): 'DXT1' or 'DXT5'
+    """
+    payloads = []
+    header = None
+    for level in levels:
+        buffer = io.BytesIO()
+        level.save(buffer, 'DDS', pixel_format=pixel_format)
+        data = buffer.getvalue()
+        header = header or bytearray(data[:128])
+        payloads.append(data[128:])
+    flags, = struct.unpack_from('<I', header, 8)
+    caps, = struct.unpack_from('<I', header, 108)
+    struct.pack_into('<I', header, 8, flags | _DDSD_MIPMAPCOUNT)
+    struct.pack_into('<I', header, 28, len(levels))
+    struct.pack_into('<I', header, 108, caps | _DDSCAPS_COMPLEX | _DDSCAPS_MIPMAP)
+    with open(path, 'wb') as f:
+        f.write(bytes(header))
+        for payload in payloads:
+            f.write(payload)
+
+
+def convert_texture(source_path, output_dir, max_size=DEFAULT_MAX_SIZE, texture_format=DEFAULT_FORMAT,
+                    keep_alpha=False):
+    """
+    Resize, strip and compress one texture.
+
+    Args:
+        source_path (str): Source image
+        output_dir (str): Directory for the converted image
+        max_size (int): Largest allowed width or height
+        texture_format (str): 'dds' (compressed, with mips) or 'png' (mips built on import)
+        keep_alpha (bool): Keep the alpha channel
+
+    Returns:
+        dict: filename, source/output size, alpha, source/output GPU bytes and file bytes
+    """
+    _require_dependencies()
+    if texture_format not in FORMATS:
+        raise ValueError(f"Unknown texture format '{texture_format}', expected one of {', '.join(FORMATS)}")
+    with Image.open(source_path) as image:
+        image.load()
+    source_size = image.size
+    source_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    keep_alpha = keep_alpha and source_alpha
+    image = image.convert('RGBA' if keep_alpha else 'RGB')
+
+    size = target_size(*source_size, max_size)
+    if size != image.size:
+        image = image.resize(size, Image.LANCZOS)
+
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    filename = f"{stem}.{texture_format}"
+    output_path = os.path.join(output_dir, filename)
+    os.makedirs(output_dir, exist_ok=True)
+    pixel_format = 'DXT5' if keep_alpha else 'DXT1'
+    if texture_format == 'dds':
+        levels = build_mips(image)
+        save_dds(levels, output_path, pixel_format)
+        mip_count = len(levels)
+    else:
+        image.save(output_path, optimize=True)
+        mip_count = 0
+
+    return {
+        'source': source_path,
+        'filename': filename,
+        'source_size': source_size,
+        'output_size': size,
+        'alpha': keep_alpha,
+        'mips': mip_count,
+        'source_gpu_bytes': _import_estimate(*source_size, source_alpha),
+        'output_gpu_bytes': gpu_bytes(*size, pixel_format),
+        'source_file_bytes': os.path.getsize(source_path),
+        'output_file_bytes': os.path.getsize(output_path),
+    }
+
+
+def _replace_filename(value, filename):
+    """Swap the file name at the end of an MTL map statement, keeping its options"""
+    parts = value.split()
+    return ' '.join(parts[:-1] + [filename])
+
+
+def prepare_materials(obj_path, output_dir, max_size=DEFAULT_MAX_SIZE, texture_format=DEFAULT_FORMAT,
+                      keep_alpha=None):
+    """
+    Write an OBJ's material libraries into output_dir with converted base color textures.
+
+    Args:
+        obj_path (str): Source .obj file whose mtllib statements are followed
+        output_dir (str): Directory of the OBJ that will be imported
+        max_size (int): Largest allowed texture width or height
+        texture_format (str): 'dds' or 'png'
+        keep_alpha (bool): Force keeping (True) or dropping (False) alpha; None
+            keeps it only for transparent materials
+
+    Returns:
+        dict: 'textures' (convert_texture results), 'missing' (referenced files
+            that do not exist), 'source_gpu_bytes' and 'output_gpu_bytes'
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    mtl_paths, _ = import_sources.material_files(obj_path)
+    converted = {}
+    missing = []
+    for mtl_path in mtl_paths:
+        if not os.path.exists(mtl_path):
+            missing.append(mtl_path)
+            continue
+        base_dir = os.path.dirname(os.path.abspath(mtl_path))
+        materials = import_sources.parse_mtl(mtl_path)
+        # The MTL is rewritten line by line so comments and statement order survive
+        current = None
+        lines = []
+        with open(mtl_path, 'r', errors='replace') as f:
+            for line in f:
+                parts = line.strip().split(None, 1)
+                if parts and parts[0] == 'newmtl':
+                    current = materials.get(parts[1] if len(parts) > 1 else '', {})
+                elif parts and len(parts) > 1 and (parts[0].startswith('map_') or parts[0] in ('bump', 'disp', 'decal')):
+                    path = os.path.join(base_dir, parts[1].split()[-1])
+                    if not os.path.exists(path):
+                        missing.append(path)
+                    elif parts[0] == 'map_Kd':
+                        alpha = material_uses_alpha(current or {}) if keep_alpha is None else keep_alpha
+                        key = (path, alpha)
+                        if key not in converted:
+                            converted[key] = convert_texture(path, output_dir, max_size, texture_format, alpha)
+                        line = f"{parts[0]} {_replace_filename(parts[1], converted[key]['filename'])}\n"
+                    else:
+                        target = os.path.join(output_dir, os.path.basename(path))
+                        if os.path.abspath(path) != os.path.abspath(target):
+                            shutil.copy2(path, target)
+                lines.append(line)
+        with open(os.path.join(output_dir, os.path.basename(mtl_path)), 'w') as f:
+            f.writelines(lines)
+
+    textures = list(converted.values())
+    return {
+        'textures': textures,
+        'missing': missing,
+        'source_gpu_bytes': sum(t['source_gpu_bytes'] for t in textures),
+        'output_gpu_bytes': sum(t['output_gpu_bytes'] for t in textures),
+    }
+
+
+def print_report(stats, name=''):
+    """
+    Print the outcome of prepare_materials().
+
+    Args:
+        stats (dict): Stats returned by prepare_materials()
+        name (str): Asset name for the summary line
+    """
+    for texture in stats['textures']:
+        saved = texture['source_gpu_bytes'] - texture['output_gpu_bytes']
+        print(f"{os.path.basename(texture['source'])} {texture['source_size'][0]}x{texture['source_size'][1]} -> "
+              f"{texture['filename']} {texture['output_size'][0]}x{texture['output_size'][1]} "
+              f"({'RGBA' if texture['alpha'] else 'RGB'}, {texture['mips'] or 'editor'} mips): "
+              f"GPU {texture['source_gpu_bytes'] / 1024:.0f} KB -> {texture['output_gpu_bytes'] / 1024:.0f} KB "
+              f"(saved {saved / 1024:.0f} KB), file {texture['source_file_bytes'] / 1024:.0f} KB -> "
+              f"{texture['output_file_bytes'] / 1024:.0f} KB")
+    for path in stats['missing']:
+        print(f"Warning: missing texture or material file {path}")
+    if not stats['textures']:
+        print(f"{name or 'Mesh'}: no base color textures to convert")
+        return
+    before, after = stats['source_gpu_bytes'], stats['output_gpu_bytes']
+    print(f"{name or 'Mesh'}: texture memory {before / 1024:.0f} KB -> {after / 1024:.0f} KB "
+          f"(saved {(before - after) / 1024:.0f} KB, {1 - after / before if before else 0:.0%})")
+
+
+def default_output_dir(obj_path):
+    """
+    Returns:
+        str: e.g. data/result/mesh_tex for data/result/mesh.obj
+    """
+    root = os.path.splitext(os.path.abspath(obj_path))[0]
+    return f"{root}_tex"
+
+
+def prepare_textures(obj_path, output_dir=None, max_size=DEFAULT_MAX_SIZE, texture_format=DEFAULT_FORMAT,
+                     keep_alpha=None, verbose=True):
+    """
+    Copy an OBJ into its own folder next to converted materials and textures.
+
+    Args:
+        obj_path (str): Source .obj file
+        output_dir (str): Destination folder (default: <name>_tex next to the source)
+        max_size (int): Largest allowed texture width or height
+        texture_format (str): 'dds' or 'png'
+        keep_alpha (bool): Force keeping or dropping alpha (default: only for transparent materials)
+        verbose (bool): Print the memory report
+
+    Returns:
+        tuple: (path of the OBJ to import, stats from prepare_materials)
+    """
+    output_dir = output_dir or default_output_dir(obj_path)
+    if os.path.abspath(output_dir) == os.path.dirname(os.path.abspath(obj_path)):
+        raise ValueError("The output directory must differ from the OBJ's directory")
+    stats = prepare_materials(obj_path, output_dir, max_size, texture_format, keep_alpha)
+    output_path = os.path.join(output_dir, os.path.basename(obj_path))
+    shutil.copy2(obj_path, output_path)
+    if verbose:
+        print_report(stats, os.path.splitext(os.path.basename(obj_path))[0])
+        print(f"Wrote {output_path}")
+    return output_path, stats
+
+
+def main():
+    """
+    Convert the base color textures of an OBJ for import into UE5.
+    """
+    parser = argparse.ArgumentParser(description='Downscale and compress the textures of an OBJ before importing it into UE5')
+    parser.add_argument('obj_path', type=str, help='Path to the .obj file')
+    parser.add_argument('--output_dir', type=str,
+                        help='Directory for the OBJ and converted materials (default: <name>_tex next to the input)')
+    parser.add_argument('--max_size', type=int, default=DEFAULT_MAX_SIZE,
+                        help='Largest texture width or height, rounded to a power of two (default: 1024)')
+    parser.add_argument('--format', dest='texture_format', choices=FORMATS, default=DEFAULT_FORMAT,
+                        help='dds: BC1/BC3 with pre-built mips; png: compressed and mipped by the editor (default: dds)')
+    parser.add_argument('--keep_alpha', action='store_true',
+                        help='Keep the alpha channel even for opaque materials')
+    args = parser.parse_args()
+
+    try:
+        prepare_textures(args.obj_path, args.output_dir, args.max_size, args.texture_format,
+                         True if args.keep_alpha else None)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
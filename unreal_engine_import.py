@@ -1,8 +1,47 @@
 import unreal
+import argparse
+import json
 import os
 import sys
+import time
 
-def import_obj_to_uasset(obj_path, output_asset_path='/Game/Meshes', blueprint_name='MeshBP', create_blueprint=False):
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import asset_index
+import import_profiler
+import import_sources
+
+INSTANCED_SUFFIX = 'Instanced'
+
+def instanced_blueprint_name(blueprint_name):
+    """
+    Returns:
+        str: Name of the instanced blueprint created next to a regular one, e.g. MeshBPInstanced
+    """
+    return f"{blueprint_name}{INSTANCED_SUFFIX}"
+
+def default_import_manifest_path():
+    """
+    Returns:
+        str: <Project>/Saved/HunYuan3D/import_manifest.json
+    """
+    return os.path.join(unreal.Paths.project_saved_dir(), 'HunYuan3D', 'import_manifest.json')
+
+def _existing_blueprint(record):
+    """Return the blueprint recorded for an asset if it still exists"""
+    blueprint_path = (record or {}).get('blueprint_path')
+    if blueprint_path and unreal.EditorAssetLibrary.does_asset_exist(blueprint_path):
+        return blueprint_path
+    return None
+
+def _update_asset_index(imports):
+    """Add imported meshes to the asset index (see asset_index.py); a failure only warns"""
+    try:
+        asset_index.record_imports(imports)
+    except asset_index.INDEX_ERRORS as e:
+        print(f"Warning: could not update the asset index: {e}")
+
+def import_obj_to_uasset(obj_path, output_asset_path='/Game/Meshes', blueprint_name='MeshBP', create_blueprint=False,
+                         asset_name=None, incremental=False, manifest_path=None, instanced=False):
     """
     Import an OBJ file as a Static Mesh and optionally create a Blueprint from it
     
@@ -11,14 +50,116 @@ def import_obj_to_uasset(obj_path, output_asset_path='/Game/Meshes', blueprint_n
         output_asset_path (str): Asset path in the content browser
         blueprint_name (str): Name for the generated blueprint
         create_blueprint (bool): Whether to create a blueprint from the mesh
+        asset_name (str): Name of the mesh asset (default: the OBJ file name)
+        incremental (bool): Skip the import (and keep the blueprint) if the OBJ,
+            MTL and textures are unchanged since the last import
+        manifest_path (str): Import manifest for incremental imports
+            (default: <Project>/Saved/HunYuan3D/import_manifest.json)
+        instanced (bool): Also create <blueprint_name>Instanced, an actor with an
+            InstancedStaticMeshComponent for instanced placement
     
     Returns:
         tuple: (mesh_asset_path, blueprint_path or None)
     """
-    # Ensure the output directory exists
-    if not unreal.EditorAssetLibrary.does_directory_exist(output_asset_path):
-        unreal.EditorAssetLibrary.make_directory(output_asset_path)
+    # Get the filename without extension for the asset name
+    filename = os.path.basename(obj_path)
+    asset_name = asset_name or os.path.splitext(filename)[0]
+    mesh_asset_path = f"{output_asset_path}/{asset_name}"
+    
+    with import_profiler.asset(mesh_asset_path):
+        manifest = None
+        files = None
+        if incremental:
+            with import_profiler.phase('change_check'):
+                manifest = import_sources.ImportManifest(manifest_path or default_import_manifest_path())
+                changed, files = manifest.check(mesh_asset_path, obj_path)
+                record = manifest.get(mesh_asset_path)
+                unchanged = not changed and unreal.EditorAssetLibrary.does_asset_exist(mesh_asset_path)
+            if unchanged:
+                blueprint_path = _existing_blueprint(record) if create_blueprint else None
+                print(f"{obj_path} is unchanged since the last import, keeping {mesh_asset_path}")
+                if create_blueprint and blueprint_path is None:
+                    blueprint_path = create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name)
+                    with import_profiler.phase('manifest'):
+                        manifest.record(mesh_asset_path, obj_path, files, blueprint_path)
+                        manifest.save()
+                name = instanced_blueprint_name(blueprint_name)
+                if create_blueprint and instanced and \
+                        not unreal.EditorAssetLibrary.does_asset_exist(f"{output_asset_path}/{name}"):
+                    create_simple_blueprint(mesh_asset_path, output_asset_path, name, instanced=True)
+                with import_profiler.phase('asset_index'):
+                    _update_asset_index([{'mesh_path': mesh_asset_path, 'obj_path': obj_path,
+                                          'blueprint_path': blueprint_path, 'files': files}])
+                return mesh_asset_path, blueprint_path
+        
+        # Ensure the output directory exists
+        if not unreal.EditorAssetLibrary.does_directory_exist(output_asset_path):
+            unreal.EditorAssetLibrary.make_directory(output_asset_path)
+        
+        task = build_import_task(obj_path, output_asset_path, asset_name, save=False)
+        
+        # Execute import; UE parses the OBJ and imports its materials and textures in this one call
+        with import_profiler.phase('import'):
+            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+        imported_paths = list(task.get_editor_property('imported_object_paths') or [])
+        if import_profiler.active():
+            import_profiler.note('imported', _count_asset_classes(imported_paths))
+        
+        # Saved separately from the import so the profile shows both
+        with import_profiler.phase('save_mesh'):
+            for imported_path in imported_paths:
+                unreal.EditorAssetLibrary.save_asset(imported_path, only_if_is_dirty=False)
+        
+        print(f"Mesh imported as: {mesh_asset_path}")
+        
+        # Create blueprint from the mesh if requested
+        blueprint_path = None
+        if create_blueprint:
+            blueprint_path = create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name)
+            if instanced:
+                create_simple_blueprint(mesh_asset_path, output_asset_path, instanced_blueprint_name(blueprint_name),
+                                        instanced=True)
+        
+        if manifest is not None:
+            with import_profiler.phase('manifest'):
+                manifest.record(mesh_asset_path, obj_path, files, blueprint_path)
+                manifest.save()
+        
+        if imported_paths:
+            with import_profiler.phase('asset_index'):
+                _update_asset_index([{'mesh_path': mesh_asset_path, 'obj_path': obj_path,
+                                      'blueprint_path': blueprint_path, 'files': files}])
+    
+    return mesh_asset_path, blueprint_path
+
+def _count_asset_classes(object_paths):
+    """
+    Args:
+        object_paths (list): Object paths reported by an import task
+
+    Returns:
+        dict: Asset class name (StaticMesh, Material, Texture2D, ...) -> count
+    """
+    counts = {}
+    for object_path in object_paths:
+        asset = unreal.EditorAssetLibrary.load_asset(object_path)
+        name = asset.get_class().get_name() if asset is not None else 'Missing'
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+def build_import_task(obj_path, output_asset_path, asset_name, save=True):
+    """
+    Build an automated import task for one OBJ file
     
+    Args:
+        obj_path (str): Path to the .obj file
+        output_asset_path (str): Asset path in the content browser
+        asset_name (str): Name of the mesh asset
+        save (bool): Save the package as soon as this asset is imported
+    
+    Returns:
+        unreal.AssetImportTask: The task, ready for import_asset_tasks
+    """
     # Set import options for OBJ
     import_options = unreal.FbxImportUI()
     import_options.set_editor_property('import_mesh', True)
@@ -30,38 +171,184 @@ def import_obj_to_uasset(obj_path, output_asset_path='/Game/Meshes', blueprint_n
     task = unreal.AssetImportTask()
     task.set_editor_property('automated', True)
     task.set_editor_property('destination_path', output_asset_path)
-    
-    # Get the filename without extension for the asset name
-    filename = os.path.basename(obj_path)
-    asset_name = os.path.splitext(filename)[0]
     task.set_editor_property('destination_name', asset_name)
     task.set_editor_property('filename', obj_path)
     task.set_editor_property('replace_existing', True)
-    task.set_editor_property('save', True)
+    task.set_editor_property('save', save)
     task.options = import_options
+    return task
+
+def import_obj_batch(source, output_asset_path='/Game/Meshes', create_blueprints=False, chunk_size=64,
+                     incremental=True, manifest_path=None):
+    """
+    Import many OBJ files with a few import_asset_tasks calls and a single save
     
-    # Execute import
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+    All tasks are built up front with save=False and submitted in chunks; the
+    dirty packages are saved once at the end instead of once per mesh. With
+    incremental imports, meshes whose OBJ, MTL and textures match the import
+    manifest are skipped, and only the blueprints of re-imported meshes are
+    rebuilt.
     
-    # Get the imported asset path
-    mesh_asset_path = f"{output_asset_path}/{asset_name}"
-    print(f"Mesh imported as: {mesh_asset_path}")
+    Args:
+        source: Folder to scan, manifest file (see import_sources.py), or a list
+            of source dictionaries from import_sources.find_import_sources
+        output_asset_path (str): Destination path in the content browser
+        create_blueprints (bool): Whether to create a blueprint per mesh
+        chunk_size (int): Number of tasks per import_asset_tasks call
+        incremental (bool): Skip meshes that are unchanged since the last import
+        manifest_path (str): Import manifest for incremental imports
+            (default: <Project>/Saved/HunYuan3D/import_manifest.json)
     
-    # Create blueprint from the mesh if requested
-    blueprint_path = None
-    if create_blueprint:
-        blueprint_path = create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name)
+    Returns:
+        list: One result dictionary per mesh with obj_path, mesh_asset_path,
+            blueprint_path, ok, skipped and seconds keys
+    """
+    sources = source if isinstance(source, list) else import_sources.find_import_sources(source, output_asset_path)
+    if not sources:
+        print(f"No OBJ files found in {source}")
+        return []
     
-    return mesh_asset_path, blueprint_path
+    total_start = time.perf_counter()
+    manifest = None
+    if incremental:
+        manifest = import_sources.ImportManifest(manifest_path or default_import_manifest_path())
+    
+    results = []
+    pending = []
+    source_files = {}
+    for entry in sources:
+        start = time.perf_counter()
+        mesh_asset_path = f"{entry['asset_path']}/{entry['asset_name']}"
+        result = {
+            'obj_path': entry['obj_path'],
+            'mesh_asset_path': mesh_asset_path,
+            'blueprint_path': None,
+            'ok': True,
+            'skipped': False,
+        }
+        files = None
+        if manifest is not None:
+            with import_profiler.asset(mesh_asset_path), import_profiler.phase('change_check'):
+                changed, files = manifest.check(mesh_asset_path, entry['obj_path'], entry.get('files'))
+                if not changed and unreal.EditorAssetLibrary.does_asset_exist(mesh_asset_path):
+                    result['skipped'] = True
+                    result['blueprint_path'] = _existing_blueprint(manifest.get(mesh_asset_path))
+        result['seconds'] = time.perf_counter() - start
+        results.append(result)
+        source_files[mesh_asset_path] = files
+        if not result['skipped']:
+            pending.append((entry, result, files))
+    check_seconds = time.perf_counter() - total_start
+    
+    for directory in sorted(set(entry['asset_path'] for entry, _, _ in pending)):
+        if not unreal.EditorAssetLibrary.does_directory_exist(directory):
+            unreal.EditorAssetLibrary.make_directory(directory)
+    with import_profiler.shared_phase('build_tasks', [result['mesh_asset_path'] for _, result, _ in pending]):
+        tasks = [build_import_task(entry['obj_path'], entry['asset_path'], entry['asset_name'], save=False)
+                 for entry, _, _ in pending]
+    
+    import_start = time.perf_counter()
+    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    for chunk_start in range(0, len(tasks), chunk_size):
+        chunk = tasks[chunk_start:chunk_start + chunk_size]
+        start = time.perf_counter()
+        with import_profiler.shared_phase('import', [result['mesh_asset_path'] for _, result, _ in
+                                                     pending[chunk_start:chunk_start + chunk_size]]):
+            asset_tools.import_asset_tasks(chunk)
+        # Assets in one call import back to back, so each gets the chunk average
+        per_asset = (time.perf_counter() - start) / len(chunk)
+        print(f"Imported {min(chunk_start + len(chunk), len(tasks))}/{len(tasks)} meshes")
+        
+        for (_, result, _), task in zip(pending[chunk_start:chunk_start + chunk_size], chunk):
+            result['ok'] = bool(list(task.get_editor_property('imported_object_paths') or []))
+            result['seconds'] += per_asset
+    import_seconds = time.perf_counter() - import_start
+    
+    blueprint_start = time.perf_counter()
+    if create_blueprints:
+        for entry, result in zip(sources, results):
+            # Unchanged meshes keep their blueprint unless it was deleted
+            if not result['ok'] or result['blueprint_path']:
+                continue
+            start = time.perf_counter()
+            with import_profiler.asset(result['mesh_asset_path']):
+                result['blueprint_path'] = create_simple_blueprint(result['mesh_asset_path'], entry['asset_path'],
+                                                                   entry['blueprint_name'], save=False)
+            result['seconds'] += time.perf_counter() - start
+            if result['skipped']:
+                pending.append((entry, result, manifest.check(result['mesh_asset_path'], entry['obj_path'],
+                                                             entry.get('files'))[1]))
+    blueprint_seconds = time.perf_counter() - blueprint_start
+    
+    save_seconds = 0.0
+    if pending:
+        save_start = time.perf_counter()
+        with import_profiler.shared_phase('save', [result['mesh_asset_path'] for _, result, _ in pending]):
+            unreal.EditorLoadingAndSavingUtils.save_dirty_packages(False, True)
+        save_seconds = time.perf_counter() - save_start
+        if manifest is not None:
+            for entry, result, files in pending:
+                if result['ok']:
+                    manifest.record(result['mesh_asset_path'], entry['obj_path'], files, result['blueprint_path'])
+            manifest.save()
+    
+    indexed = [(entry, result) for entry, result in zip(sources, results) if result['ok']]
+    with import_profiler.shared_phase('asset_index', [result['mesh_asset_path'] for _, result in indexed]):
+        _update_asset_index([{'mesh_path': result['mesh_asset_path'], 'obj_path': entry['obj_path'],
+                              'blueprint_path': result['blueprint_path'],
+                              'files': source_files[result['mesh_asset_path']]} for entry, result in indexed])
+    total_seconds = time.perf_counter() - total_start
+    
+    print(f"\n{'Seconds':>8}  {'Result':<9} Asset")
+    print("-" * 80)
+    for result in results:
+        status = 'UNCHANGED' if result['skipped'] else ('OK' if result['ok'] else 'FAILED')
+        print(f"{result['seconds']:8.3f}  {status:<9} {result['mesh_asset_path']}")
+    print("-" * 80)
+    imported = [r for r in results if not r['skipped']]
+    succeeded = sum(1 for r in imported if r['ok'])
+    print(f"Imported {succeeded}/{len(imported)} meshes, {len(results) - len(imported)} unchanged, "
+          f"in {total_seconds:.2f}s (change check {check_seconds:.2f}s, import {import_seconds:.2f}s, "
+          f"blueprints {blueprint_seconds:.2f}s, single save {save_seconds:.2f}s, "
+          f"{total_seconds / len(results):.3f}s per mesh)")
+    return results
+
+def _add_instanced_mesh_component(blueprint, mesh_asset):
+    """
+    Add an InstancedStaticMeshComponent rendering mesh_asset to an actor blueprint
+    
+    Args:
+        blueprint: The blueprint asset
+        mesh_asset: The static mesh the instances draw
+    """
+    subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    root = subsystem.k2_gather_subobject_data_for_blueprint(blueprint)[0]
+    params = unreal.AddNewSubobjectParams(parent_handle=root, new_class=unreal.InstancedStaticMeshComponent,
+                                          blueprint_context=blueprint)
+    handle, fail_reason = subsystem.add_new_subobject(params)
+    if not unreal.SubobjectDataBlueprintFunctionLibrary.is_handle_valid(handle):
+        raise RuntimeError(f"Could not add an InstancedStaticMeshComponent: {fail_reason}")
+    subsystem.rename_subobject(handle, unreal.Text('Instances'))
+    data = unreal.SubobjectDataBlueprintFunctionLibrary.get_data(handle)
+    component = unreal.SubobjectDataBlueprintFunctionLibrary.get_object(data)
+    component.set_editor_property('static_mesh', mesh_asset)
+    with import_profiler.phase('blueprint_compile'):
+        unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
 
-def create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name):
+def create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name, save=True, instanced=False):
     """
     Create a minimal blueprint with a static mesh component using a simpler approach
     
+    With instanced=True the blueprint is a plain actor with an
+    InstancedStaticMeshComponent instead, so a single spawned actor can draw
+    any number of copies of the mesh (see instanced_placement.py).
+    
     Args:
         mesh_asset_path (str): Path to the imported mesh asset
         output_asset_path (str): Path where to save the blueprint
         blueprint_name (str): Name for the blueprint
+        save (bool): Save the blueprint right away (batch imports save once at the end)
+        instanced (bool): Create an instanced blueprint
     
     Returns:
         str: Path to the created blueprint
@@ -72,37 +359,46 @@ def create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name):
         # Create a blueprint factory for StaticMeshActor directly
         blueprint_path = f"{output_asset_path}/{blueprint_name}"
         
-        # Check if the blueprint already exists and delete it if it does
-        if unreal.EditorAssetLibrary.does_asset_exist(blueprint_path):
-            unreal.EditorAssetLibrary.delete_asset(blueprint_path)
-        
-        # Create a basic actor blueprint
-        factory = unreal.BlueprintFactory()
-        factory.set_editor_property('parent_class', unreal.StaticMeshActor)
-        
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        blueprint = asset_tools.create_asset(blueprint_name, output_asset_path, unreal.Blueprint, factory)
+        with import_profiler.phase('blueprint_create'):
+            # Check if the blueprint already exists and delete it if it does
+            if unreal.EditorAssetLibrary.does_asset_exist(blueprint_path):
+                unreal.EditorAssetLibrary.delete_asset(blueprint_path)
+            
+            # Create a basic actor blueprint
+            factory = unreal.BlueprintFactory()
+            factory.set_editor_property('parent_class', unreal.Actor if instanced else unreal.StaticMeshActor)
+            
+            asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+            blueprint = asset_tools.create_asset(blueprint_name, output_asset_path, unreal.Blueprint, factory)
         
         if blueprint is None:
             print("Failed to create blueprint asset")
             return None
         
         # Load the static mesh asset
-        mesh_asset = unreal.EditorAssetLibrary.load_asset(mesh_asset_path)
+        with import_profiler.phase('load_mesh'):
+            mesh_asset = unreal.EditorAssetLibrary.load_asset(mesh_asset_path)
         if mesh_asset is None:
             print(f"Failed to load mesh asset at {mesh_asset_path}")
             return None
         
+        if instanced:
+            _add_instanced_mesh_component(blueprint, mesh_asset)
+            print("Successfully added an InstancedStaticMeshComponent to the blueprint")
+        
         # Set the StaticMeshActor's mesh property - this works because we're extending StaticMeshActor
-        default_object = unreal.get_default_object(blueprint.generated_class())
-        if hasattr(default_object, 'static_mesh_component'):
-            static_mesh_component = default_object.static_mesh_component
-            if static_mesh_component:
-                static_mesh_component.set_static_mesh(mesh_asset)
-                print("Successfully set the static mesh on the blueprint")
+        with import_profiler.phase('blueprint_setup'):
+            default_object = unreal.get_default_object(blueprint.generated_class())
+            if not instanced and hasattr(default_object, 'static_mesh_component'):
+                static_mesh_component = default_object.static_mesh_component
+                if static_mesh_component:
+                    static_mesh_component.set_static_mesh(mesh_asset)
+                    print("Successfully set the static mesh on the blueprint")
         
         # Save the blueprint
-        unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+        if save:
+            with import_profiler.phase('save_blueprint'):
+                unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
         
         print(f"Simple blueprint created at: {blueprint_path}")
         return blueprint_path
@@ -111,5 +407,155 @@ def create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name):
         print(f"Error creating simple blueprint: {str(e)}")
         return None
 
+def load_lod_manifest(manifest_path):
+    """
+    Read a lod_stats.json manifest written by mesh_lod.py and resolve the LOD file paths
+    
+    Args:
+        manifest_path (str): Path to lod_stats.json, or the directory holding it
+    
+    Returns:
+        dict: The manifest, with each LOD's 'path' made absolute
+    """
+    if os.path.isdir(manifest_path):
+        manifest_path = os.path.join(manifest_path, 'lod_stats.json')
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    for lod in manifest['lods']:
+        lod['path'] = os.path.join(base_dir, lod['path'])
+    return manifest
+
+def set_lod_screen_sizes(static_mesh, screen_sizes):
+    """
+    Create LOD slots on a Static Mesh with fixed screen-size thresholds
+    
+    Uses set_lods with a reduction of 100% for every level, so the slots keep the
+    full mesh until a LOD file is imported into them.
+    
+    Args:
+        static_mesh (unreal.StaticMesh): The mesh asset
+        screen_sizes (list): Screen size per LOD, starting with LOD0
+    
+    Returns:
+        bool: True if the screen sizes were applied
+    """
+    options = unreal.EditorScriptingMeshReductionOptions()
+    options.set_editor_property('auto_compute_lod_screen_size', False)
+    settings = []
+    for screen_size in screen_sizes:
+        setting = unreal.EditorScriptingMeshReductionSettings()
+        setting.set_editor_property('percent_triangles', 1.0)
+        setting.set_editor_property('screen_size', float(screen_size))
+        settings.append(setting)
+    options.set_editor_property('reduction_settings', settings)
+    
+    library = _static_mesh_library()
+    return library.set_lods(static_mesh, options) == len(screen_sizes)
+
+def _static_mesh_library():
+    """Return the StaticMeshEditorSubsystem, or EditorStaticMeshLibrary on older engines"""
+    subsystem_class = getattr(unreal, 'StaticMeshEditorSubsystem', None)
+    if subsystem_class is not None:
+        subsystem = unreal.get_editor_subsystem(subsystem_class)
+        if subsystem is not None and hasattr(subsystem, 'import_lod'):
+            return subsystem
+    return unreal.EditorStaticMeshLibrary
+
+def import_lod_chain(lod_manifest_path, output_asset_path='/Game/Meshes', blueprint_name='MeshBP', create_blueprint=True):
+    """
+    Import the LOD files written by mesh_lod.py as the LODs of one Static Mesh
+    
+    LOD0 is imported like any other OBJ; every further level is imported into the
+    same asset with import_lod, and the screen sizes from the manifest decide
+    when UE switches between them. The blueprint references the mesh, so every
+    placed instance uses the whole chain.
+    
+    Args:
+        lod_manifest_path (str): Path to lod_stats.json (or the directory holding it)
+        output_asset_path (str): Asset path in the content browser
+        blueprint_name (str): Name for the generated blueprint
+        create_blueprint (bool): Whether to create a blueprint from the mesh
+    
+    Returns:
+        tuple: (mesh_asset_path, blueprint_path or None)
+    """
+    manifest = load_lod_manifest(lod_manifest_path)
+    lods = manifest['lods']
+    with import_profiler.asset(f"{output_asset_path}/{manifest['name']}"):
+        mesh_asset_path, _ = import_obj_to_uasset(lods[0]['path'], output_asset_path, blueprint_name,
+                                                  create_blueprint=False, asset_name=manifest['name'])
+        
+        static_mesh = unreal.EditorAssetLibrary.load_asset(mesh_asset_path)
+        if static_mesh is None:
+            print(f"Failed to load mesh asset at {mesh_asset_path}")
+            return mesh_asset_path, None
+        
+        if not set_lod_screen_sizes(static_mesh, [lod['screen_size'] for lod in lods]):
+            print("Warning: could not create the LOD slots; UE will compute the screen sizes")
+        
+        library = _static_mesh_library()
+        for lod in lods[1:]:
+            with import_profiler.phase('import_lod'):
+                result = library.import_lod(static_mesh, lod['lod'], lod['path'])
+            if result < 0:
+                print(f"Failed to import LOD{lod['lod']} from {lod['path']}")
+            else:
+                print(f"Imported LOD{lod['lod']} ({lod['triangles']} triangles, screen size {lod['screen_size']:g})")
+        
+        with import_profiler.phase('save_mesh'):
+            unreal.EditorAssetLibrary.save_loaded_asset(static_mesh)
+        print(f"{mesh_asset_path} has {library.get_lod_count(static_mesh)} LODs")
+        
+        blueprint_path = None
+        if create_blueprint:
+            blueprint_path = create_simple_blueprint(mesh_asset_path, output_asset_path, blueprint_name)
+            # LOD0 was indexed by import_obj_to_uasset; add the blueprint to its record
+            with import_profiler.phase('asset_index'):
+                _update_asset_index([{'mesh_path': mesh_asset_path, 'obj_path': lods[0]['path'],
+                                      'blueprint_path': blueprint_path}])
+    
+    return mesh_asset_path, blueprint_path
+
+def main():
+    """
+    Batch import entry point for the editor's Python console or a commandlet, e.g.
+    
+    py "/path/to/unreal_engine_import.py" --batch /data/hunyuan3d_outputs --create_blueprints
+    py "/path/to/unreal_engine_import.py" --batch /data/hunyuan3d_outputs --profile /tmp/import_profile.json
+    UnrealEditor-Cmd.exe MyProject.uproject -run=pythonscript -script="/path/to/unreal_engine_import.py --batch /data/hunyuan3d_outputs"
+    """
+    parser = argparse.ArgumentParser(description='Batch import OBJ files into UE5')
+    parser.add_argument('--batch', type=str, required=True,
+                        help='Folder of OBJ files or manifest listing them')
+    parser.add_argument('--asset_path', type=str, default='/Game/Meshes',
+                        help='Destination path in the content browser')
+    parser.add_argument('--create_blueprints', action='store_true',
+                        help='Create a blueprint for every imported mesh')
+    parser.add_argument('--chunk_size', type=int, default=64,
+                        help='Number of import tasks per import_asset_tasks call')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-import every mesh, even if it is unchanged since the last import')
+    parser.add_argument('--profile', type=str, metavar='REPORT',
+                        help='Time every import phase per asset and write a JSON report (see import_profiler.py)')
+    parser.add_argument('--cprofile', action='store_true',
+                        help='With --profile, also run every asset under cProfile')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='With --profile, also record Python memory allocations per asset')
+    args = parser.parse_args()
+    
+    if not args.profile:
+        import_obj_batch(args.batch, args.asset_path, args.create_blueprints, args.chunk_size,
+                         incremental=not args.force)
+        return
+    with import_profiler.profiling(args.profile, cprofile=args.cprofile, memory=args.tracemalloc):
+        import_obj_batch(args.batch, args.asset_path, args.create_blueprints, args.chunk_size,
+                         incremental=not args.force)
+
+if __name__ == "__main__":
+    main()
+
 # Example usage:
-# mesh_path, bp_path = import_obj_to_uasset(r"C:\Path\To\Your\Mesh.obj", "/Game/Meshes", "MyMeshBP") 
\ No newline at end of file
+# mesh_path, bp_path = import_obj_to_uasset(r"C:\Path\To\Your\Mesh.obj", "/Game/Meshes", "MyMeshBP")
+# results = import_obj_batch(r"C:\Path\To\HunYuan3D\Outputs", "/Game/Meshes", create_blueprints=True)
+# mesh_path, bp_path = import_lod_chain(r"C:\Path\To\Your\mesh_lods\lod_stats.json", "/Game/Meshes", "MyMeshBP") 
\ No newline at end of file
@@ -0,0 +1,512 @@
+"""
+UnrealCV Session Layer
+======================
+
+Shared connection handling for every script that talks to a running UE5 game
+through the UnrealCV plugin. Instead of each entry point creating its own
+``unrealcv.Client`` and polling it once per second, scripts borrow a warm
+session from a per-process pool:
+
+    pool = unrealcv_session.get_pool()
+    session = pool.acquire()
+    if session is None:
+        print("Failed to connect to UnrealCV")
+    else:
+        try:
+            session.request('vget /unrealcv/version')
+        finally:
+            pool.release(session)
+
+Connection attempts use exponential backoff starting at a few milliseconds, so
+a game that is already listening is reached almost immediately while a game
+that is still starting up is polled without spinning. Sessions are health
+checked when they have been idle for a while and are transparently reconnected
+when the socket drops.
+
+The endpoint defaults to localhost:9000 and can be overridden with the
+UNREALCV_HOST and UNREALCV_PORT environment variables.
+
+Note: the stock UnrealCV server only accepts one client at a time, which is
+why the default pool size is 1. Larger pools are only useful with servers that
+accept several connections.
+"""
+import atexit
+import os
+import queue
+import threading
+import time
+
+try:
+    import unrealcv
+except ImportError:
+    unrealcv = None
+
+DEFAULT_HOST = os.environ.get('UNREALCV_HOST', 'localhost')
+DEFAULT_PORT = int(os.environ.get('UNREALCV_PORT', '9000'))
+DEFAULT_ENDPOINT = (DEFAULT_HOST, DEFAULT_PORT)
+
+# Exceptions that indicate the underlying socket is no longer usable
+CONNECTION_ERRORS = (ConnectionError, TimeoutError, OSError)
+
+# Seconds to wait for all responses of one batch (a single request waits 15 s)
+DEFAULT_BATCH_TIMEOUT = 15.0
+
+# Request tracer installed by unrealcv_trace (None: no tracing)
+_tracer = None
+
+
+def connect_with_backoff(endpoint=None, timeout=30.0, initial_delay=0.005, max_delay=1.0, verbose=True):
+    """
+    Connect an UnrealCV client, retrying with exponential backoff.
+
+    Args:
+        endpoint (tuple): (host, port) of the UnrealCV server (default: DEFAULT_ENDPOINT)
+        timeout (float): Give up after this many seconds
+        initial_delay (float): Delay before the first retry, in seconds
+        max_delay (float): Upper bound for the delay between retries, in seconds
+        verbose (bool): Print progress messages while waiting
+
+    Returns:
+        unrealcv.Client or None: A connected client, or None if the timeout expired
+    """
+    if unrealcv is None:
+        print("Error: UnrealCV module not found. Install with: pip install unrealcv")
+        return None
+
+    endpoint = tuple(endpoint or DEFAULT_ENDPOINT)
+    client = unrealcv.Client(endpoint)
+    start = time.perf_counter()
+    delay = initial_delay
+    attempt = 0
+
+    while True:
+        attempt += 1
+        try:
+            client.connect()
+        except Exception:
+            pass
+        if client.isconnected():
+            return client
+
+        elapsed = time.perf_counter() - start
+        if elapsed + delay > timeout:
+            return None
+        if verbose:
+            print(f"Waiting for UnrealCV connection... attempt {attempt} ({elapsed:.2f}s/{timeout:.0f}s)")
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+class UnrealCVSession:
+    """
+    A reconnecting wrapper around a single ``unrealcv.Client``.
+
+    The session exposes the same ``request``/``isconnected``/``disconnect``
+    methods as the UnrealCV client so existing code can use it as a drop-in
+    replacement.
+    """
+
+    def __init__(self, endpoint=None, connect_timeout=30.0, health_check_interval=5.0, verbose=True,
+                 batch_timeout=DEFAULT_BATCH_TIMEOUT):
+        """
+        Args:
+            endpoint (tuple): (host, port) of the UnrealCV server (default: DEFAULT_ENDPOINT)
+            connect_timeout (float): Seconds to keep retrying when (re)connecting
+            health_check_interval (float): Idle seconds after which the connection
+                is probed before being handed out again
+            verbose (bool): Print connection progress messages
+            batch_timeout (float): Seconds to wait for all responses of a batch
+        """
+        self.endpoint = tuple(endpoint or DEFAULT_ENDPOINT)
+        self.connect_timeout = connect_timeout
+        self.batch_timeout = batch_timeout
+        self.health_check_interval = health_check_interval
+        self.verbose = verbose
+        self.client = None
+        self.connect_latency = None
+        self.reconnects = 0
+        self.last_used = 0.0
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """
+        Call callback(command, response) for every command answered on this session.
+
+        Listeners see the traffic of every caller that uses the session, which
+        lets a scene mirror follow placements without querying them back.
+
+        Args:
+            callback (callable): Function taking the command and its response string
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """
+        Stop calling a listener added with add_listener; unknown listeners are ignored.
+
+        Args:
+            callback (callable): The listener
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, commands, responses):
+        for callback in list(self._listeners):
+            for command, response in zip(commands, responses):
+                callback(command, response)
+
+    def connect(self):
+        """
+        Open the connection if it is not already open.
+
+        Returns:
+            bool: True if the session is connected
+        """
+        if self.isconnected():
+            return True
+
+        start = time.perf_counter()
+        self.client = connect_with_backoff(self.endpoint, timeout=self.connect_timeout, verbose=self.verbose)
+        if self.client is None:
+            return False
+
+        self.connect_latency = time.perf_counter() - start
+        self.last_used = time.monotonic()
+        if self.verbose:
+            print(f"Connected to UnrealCV at {self.endpoint[0]}:{self.endpoint[1]} "
+                  f"in {self.connect_latency * 1000:.1f} ms")
+        return True
+
+    def reconnect(self):
+        """
+        Drop the current socket and connect again.
+
+        Returns:
+            bool: True if the session is connected afterwards
+        """
+        self.disconnect()
+        self.reconnects += 1
+        return self.connect()
+
+    def isconnected(self):
+        """Check whether the underlying client is connected"""
+        return self.client is not None and self.client.isconnected()
+
+    def is_healthy(self):
+        """
+        Probe the server with a cheap status request.
+
+        Returns:
+            bool: True if the server answered
+        """
+        if not self.isconnected():
+            return False
+        try:
+            response = self.client.request('vget /unrealcv/status')
+        except CONNECTION_ERRORS:
+            return False
+        return response is not None
+
+    def ensure_healthy(self):
+        """
+        Make sure the session is usable, reconnecting if the health check fails.
+
+        The probe is skipped when the session was used recently, so handing out a
+        busy session costs nothing.
+
+        Returns:
+            bool: True if the session is connected and healthy
+        """
+        if not self.isconnected():
+            return self.connect()
+        if time.monotonic() - self.last_used < self.health_check_interval:
+            return True
+        if self.is_healthy():
+            self.last_used = time.monotonic()
+            return True
+        if self.verbose:
+            print("UnrealCV health check failed, reconnecting...")
+        return self.reconnect()
+
+    def request(self, command, retries=1):
+        """
+        Send a command and wait for the response, reconnecting on socket failures.
+
+        Args:
+            command (str): UnrealCV command, e.g. 'vget /objects'
+            retries (int): How many times to reconnect and resend after a failure
+
+        Returns:
+            str: The server response
+
+        Raises:
+            ConnectionError: If the server could not be reached
+        """
+        for attempt in range(retries + 1):
+            if not self.isconnected() and not self.connect():
+                break
+            tracer = _tracer
+            start = time.perf_counter()
+            try:
+                response = self.client.request(command)
+            except CONNECTION_ERRORS:
+                response = None
+            if tracer is not None:
+                tracer.record(command, start, time.perf_counter() - start, response)
+            if response is not None:
+                self.last_used = time.monotonic()
+                self._notify([command], [response])
+                return response
+            if attempt < retries:
+                if self.verbose:
+                    print(f"UnrealCV request failed, reconnecting: {command}")
+                self.reconnect()
+        raise ConnectionError(f"No response from UnrealCV at {self.endpoint[0]}:{self.endpoint[1]} for: {command}")
+
+    def request_batch(self, commands):
+        """
+        Send several commands back to back and collect their responses in order.
+
+        All commands are written to the socket before the first response is read,
+        so a batch costs roughly one round trip instead of one per command. Clients
+        without batch support fall back to sequential requests.
+
+        A failed batch is not resent, because some of its commands may already
+        have been executed by the server. The unrealcv client waits for batch
+        responses without a timeout, so the batch runs in a worker thread and is
+        given up after batch_timeout seconds; the connection is then closed.
+
+        Args:
+            commands (list): UnrealCV command strings
+
+        Returns:
+            list: One response string per command, in the same order
+
+        Raises:
+            ConnectionError: If the connection dropped during the batch or the
+                responses did not arrive within batch_timeout
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        if not self.isconnected() and not self.connect():
+            raise ConnectionError(f"Could not connect to UnrealCV at {self.endpoint[0]}:{self.endpoint[1]}")
+
+        request_batch = getattr(self.client, 'request_batch', None)
+        tracer = _tracer
+        start = time.perf_counter()
+        if request_batch is None:
+            client = self.client
+
+            def request_batch(batch):
+                return [client.request(command) for command in batch]
+        try:
+            responses = self._run_with_deadline(request_batch, commands)
+        except CONNECTION_ERRORS as e:
+            if tracer is not None:
+                tracer.record_batch(commands, start, time.perf_counter() - start, None)
+            self.disconnect()
+            raise ConnectionError(f"UnrealCV connection lost during a batch of {len(commands)} commands: {e}")
+        if tracer is not None:
+            tracer.record_batch(commands, start, time.perf_counter() - start, responses)
+        if responses is None or len(responses) != len(commands) or any(r is None for r in responses):
+            self.disconnect()
+            raise ConnectionError(f"UnrealCV connection lost during a batch of {len(commands)} commands")
+
+        self.last_used = time.monotonic()
+        self._notify(commands, responses)
+        return responses
+
+    def _run_with_deadline(self, request_batch, commands):
+        """Call request_batch(commands) in a worker thread, raising TimeoutError after batch_timeout"""
+        outcome = {}
+
+        def run():
+            try:
+                outcome['responses'] = request_batch(commands)
+            except Exception as e:
+                outcome['error'] = e
+
+        worker = threading.Thread(target=run, name='unrealcv-batch', daemon=True)
+        worker.start()
+        worker.join(self.batch_timeout)
+        if worker.is_alive():
+            # Closing the connection in the caller wakes the worker up
+            raise TimeoutError(f"no response within {self.batch_timeout:g}s")
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['responses']
+
+    def disconnect(self):
+        """Close the underlying client"""
+        if self.client is not None:
+            try:
+                self.client.disconnect()
+            except Exception:
+                pass
+            self.client = None
+
+
+class SessionPool:
+    """
+    A thread-safe pool of warm UnrealCV sessions for one endpoint.
+    """
+
+    def __init__(self, endpoint=None, size=1, **session_kwargs):
+        """
+        Args:
+            endpoint (tuple): (host, port) of the UnrealCV server (default: DEFAULT_ENDPOINT)
+            size (int): Maximum number of open sessions
+            **session_kwargs: Extra arguments passed to UnrealCVSession
+        """
+        self.endpoint = tuple(endpoint or DEFAULT_ENDPOINT)
+        self.size = size
+        self.session_kwargs = session_kwargs
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def warm(self, count=None):
+        """
+        Open sessions ahead of time so the first acquire does not pay for the connect.
+
+        Args:
+            count (int): Number of sessions to open (default: the pool size)
+
+        Returns:
+            int: Number of idle, connected sessions
+        """
+        sessions = []
+        for _ in range(min(count or self.size, self.size)):
+            session = self.acquire()
+            if session is None:
+                break
+            sessions.append(session)
+        for session in sessions:
+            self.release(session)
+        return self._idle.qsize()
+
+    def acquire(self, timeout=None):
+        """
+        Borrow a connected session from the pool.
+
+        Args:
+            timeout (float): Seconds to wait for a free session when the pool is exhausted
+
+        Returns:
+            UnrealCVSession or None: A healthy session, or None if no connection could be made
+        """
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            session = None
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    session = UnrealCVSession(self.endpoint, **self.session_kwargs)
+            if session is None:
+                try:
+                    session = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    return None
+
+        if session.ensure_healthy():
+            return session
+
+        session.disconnect()
+        with self._lock:
+            self._created -= 1
+        return None
+
+    def release(self, session):
+        """
+        Return a borrowed session to the pool, keeping its connection open.
+
+        Args:
+            session (UnrealCVSession): The session obtained from acquire()
+        """
+        if session.isconnected():
+            self._idle.put(session)
+        else:
+            with self._lock:
+                self._created -= 1
+
+    def close(self):
+        """Disconnect every idle session"""
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            session.disconnect()
+            with self._lock:
+                self._created -= 1
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(endpoint=None, size=1, **session_kwargs):
+    """
+    Get the shared session pool for an endpoint, creating it on first use.
+
+    Args:
+        endpoint (tuple): (host, port) of the UnrealCV server (default: DEFAULT_ENDPOINT)
+        size (int): Pool size used if the pool has to be created
+        **session_kwargs: Extra arguments passed to UnrealCVSession on creation
+
+    Returns:
+        SessionPool: The pool shared by every caller in this process
+    """
+    endpoint = tuple(endpoint or DEFAULT_ENDPOINT)
+    with _pools_lock:
+        pool = _pools.get(endpoint)
+        if pool is None:
+            pool = SessionPool(endpoint, size=size, **session_kwargs)
+            _pools[endpoint] = pool
+        return pool
+
+
+def set_default_endpoint(endpoint):
+    """
+    Point every later get_pool() call without an explicit endpoint at another server,
+    e.g. a benchmark target or a mock server started in the same process.
+
+    Args:
+        endpoint (tuple): (host, port) of the UnrealCV server
+    """
+    global DEFAULT_ENDPOINT
+    DEFAULT_ENDPOINT = tuple(endpoint)
+
+
+def set_tracer(tracer):
+    """
+    Install a request tracer (see unrealcv_trace) for every session and the async client.
+
+    Args:
+        tracer: Object with record() and record_batch(), or None to stop tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer():
+    """Return the installed request tracer, or None"""
+    return _tracer
+
+
+def close_all_pools():
+    """Disconnect every pooled session in this process"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
+
+if os.environ.get('UNREALCV_TRACE'):
+    import unrealcv_trace
+    unrealcv_trace.install_from_env()
@@ -0,0 +1,433 @@
+"""
+UnrealCV Request Tracing
+========================
+
+Records every request sent through UnrealCVSession (single and batched) and
+the asyncio client: the command's verb and path, its latency, payload sizes
+and whether it succeeded. Commands are grouped by verb and path with object
+and camera names replaced by {id}, so "vset /object/Chair_01/location 1 2 3"
+and "vset /object/Chair_02/location 4 5 6" land in the same histogram.
+
+Per group the tracer keeps counts, error counts, byte totals and a fixed-bucket
+latency histogram; the most recent requests are also kept in a bounded ring
+buffer for a timeline. Recording a request only updates counters and appends
+one ring buffer entry, which costs a few microseconds (see measure_overhead).
+
+Pipelined batches are recorded as one timeline event; each of their commands
+is counted in its group with an equal share of the batch time, since
+individual reply times are not observable inside a batch.
+
+    tracer = unrealcv_trace.install()
+    ...                                   # any placement code
+    tracer.print_summary()
+    tracer.write_chrome_trace('trace.json')   # open in chrome://tracing or ui.perfetto.dev
+    tracer.write_prometheus('metrics.prom')
+
+Setting UNREALCV_TRACE=<path prefix> traces every script without code changes
+and writes <prefix>.json and <prefix>.prom when the process exits.
+
+Example usage:
+python unrealcv_trace.py --output /tmp/place -- hunyuan3d_ue5_demo.py --action place --blueprint_path /Game/Meshes/MeshBP
+python unrealcv_trace.py --overhead
+"""
+import argparse
+import atexit
+import bisect
+import collections
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+
+import unrealcv_session
+
+# Upper bounds of the latency histogram buckets in seconds (Prometheus "le"), +Inf implied
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_MAX_EVENTS = 100000
+# Allowed cost of tracing per request, checked by measure_overhead
+OVERHEAD_BUDGET_US = 10.0
+
+_NAMED_PREFIXES = ('/object/', '/camera/')
+
+
+def command_key(command):
+    """
+    Group a command by verb and path, with object and camera names replaced by {id}.
+
+    Args:
+        command (str): UnrealCV command, e.g. 'vset /object/Chair_01/location 1 2 3'
+
+    Returns:
+        tuple: (verb, path), e.g. ('vset', '/object/{id}/location')
+    """
+    parts = command.split(None, 3)
+    if not parts:
+        return ('', '')
+    verb = parts[0]
+    if len(parts) < 2:
+        return (verb, '')
+    if verb == 'vbp':
+        # vbp <object> <function> [args]
+        return (verb, f"{{id}} {parts[2]}" if len(parts) > 2 else '{id}')
+    if verb == 'vrun':
+        return (verb, parts[1].strip('"'))
+    path = parts[1]
+    if path.startswith(_NAMED_PREFIXES):
+        prefix, _, rest = path[1:].partition('/')
+        _, slash, tail = rest.partition('/')
+        path = f"/{prefix}/{{id}}{slash}{tail}"
+    return (verb, path)
+
+
+def _size(value):
+    if value is None:
+        return 0
+    return len(value) if isinstance(value, (bytes, bytearray)) else len(str(value))
+
+
+class _Stats:
+    __slots__ = ('count', 'errors', 'failures', 'seconds', 'max', 'sent', 'received', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.max = 0.0
+        self.sent = 0
+        self.received = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+
+class Tracer:
+    """
+    In-memory request statistics and a bounded timeline of recent requests.
+
+    Args:
+        max_events (int): Timeline events kept for the Chrome trace (oldest dropped first)
+    """
+
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS):
+        self.stats = {}
+        self.events = collections.deque(maxlen=max_events)
+        self.started = time.perf_counter()
+        self._epoch = time.time() - self.started
+        self._lock = threading.Lock()
+
+    def _add(self, key, seconds, sent, response):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = _Stats()
+        stats.count += 1
+        stats.seconds += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+        stats.sent += sent
+        stats.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        if response is None:
+            stats.failures += 1
+            return 'failed'
+        stats.received += _size(response)
+        if isinstance(response, str) and response.startswith('error'):
+            stats.errors += 1
+            return 'error'
+        return 'ok'
+
+    def record(self, command, start, seconds, response):
+        """
+        Record one request.
+
+        Args:
+            command (str): The command sent
+            start (float): time.perf_counter() when it was sent
+            seconds (float): Time until the reply arrived
+            response (str): The reply, or None if the connection failed
+        """
+        key = command_key(command)
+        with self._lock:
+            status = self._add(key, seconds, len(command), response)
+            self.events.append((start, seconds, key, command, status, threading.get_ident()))
+
+    def record_batch(self, commands, start, seconds, responses):
+        """
+        Record a pipelined batch as one timeline event.
+
+        Args:
+            commands (list): The commands sent
+            start (float): time.perf_counter() when the batch was sent
+            seconds (float): Time until the last reply arrived
+            responses (list): The replies, or None if the connection failed
+        """
+        if not commands:
+            return
+        share = seconds / len(commands)
+        responses = responses if responses is not None else [None] * len(commands)
+        with self._lock:
+            failed = 0
+            for command, response in zip(commands, responses):
+                failed += self._add(command_key(command), share, len(command), response) != 'ok'
+            self.events.append((start, seconds, ('batch', f"{len(commands)} commands"),
+                                commands[0], 'ok' if not failed else f"{failed} failed", threading.get_ident()))
+
+    def reset(self):
+        """Drop all statistics and events"""
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+            self.started = time.perf_counter()
+
+    def percentile(self, key, pct):
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            key (tuple): (verb, path) group
+            pct (float): Percentile, 0-100
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile in seconds
+                (the group's max for the last bucket), or None
+        """
+        stats = self.stats.get(key)
+        if stats is None or not stats.count:
+            return None
+        target = pct / 100.0 * stats.count
+        seen = 0
+        for index, count in enumerate(stats.buckets):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKETS[index], stats.max) if index < len(BUCKETS) else stats.max
+        return stats.max
+
+    def print_summary(self):
+        """Print one row per command group, slowest total time first"""
+        with self._lock:
+            rows = sorted(self.stats.items(), key=lambda item: item[1].seconds, reverse=True)
+        if not rows:
+            print("No UnrealCV requests recorded")
+            return
+        print(f"\n{'Command':<44} {'Count':>7} {'Errors':>7} {'Mean ms':>9} {'p50 <=':>9} {'p95 <=':>9} "
+              f"{'Max ms':>9} {'Total s':>8} {'KB in/out':>12}")
+        print("-" * 122)
+        for key, stats in rows:
+            label = f"{key[0]} {key[1]}"[:44]
+            p50 = self.percentile(key, 50) * 1000
+            p95 = self.percentile(key, 95) * 1000
+            print(f"{label:<44} {stats.count:>7} {stats.errors + stats.failures:>7} "
+                  f"{stats.seconds / stats.count * 1000:>9.3f} {p50:>9.3f} {p95:>9.3f} {stats.max * 1000:>9.3f} "
+                  f"{stats.seconds:>8.3f} {stats.received / 1024:>5.1f}/{stats.sent / 1024:<6.1f}")
+        total = sum(stats.count for _, stats in rows)
+        errors = sum(stats.errors + stats.failures for _, stats in rows)
+        print("-" * 122)
+        print(f"{total} requests, {errors} errors, over {time.perf_counter() - self.started:.2f}s")
+
+    def chrome_trace(self):
+        """
+        Returns:
+            dict: The timeline in Chrome trace event format (chrome://tracing, Perfetto)
+        """
+        with self._lock:
+            events = list(self.events)
+        trace = []
+        pid = os.getpid()
+        for start, seconds, key, command, status, thread in events:
+            trace.append({
+                'name': f"{key[0]} {key[1]}", 'cat': key[0], 'ph': 'X', 'pid': pid, 'tid': thread,
+                'ts': (self._epoch + start) * 1e6, 'dur': seconds * 1e6,
+                'args': {'command': command[:200], 'status': status},
+            })
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """Write chrome_trace() to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def prometheus(self):
+        """
+        Returns:
+            str: Metrics in the Prometheus text exposition format
+        """
+        lines = [
+            '# HELP unrealcv_request_duration_seconds UnrealCV request latency',
+            '# TYPE unrealcv_request_duration_seconds histogram',
+        ]
+        with self._lock:
+            items = [(key, stats.count, stats.errors, stats.failures, stats.seconds, stats.sent, stats.received,
+                      list(stats.buckets)) for key, stats in sorted(self.stats.items())]
+
+        def labels(key, **extra):
+            pairs = [('verb', key[0]), ('path', key[1])] + list(extra.items())
+            return ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                            for name, value in pairs)
+
+        for key, count, _, _, seconds, _, _, buckets in items:
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS + ('+Inf',), buckets):
+                cumulative += bucket
+                lines.append(f"unrealcv_request_duration_seconds_bucket{{{labels(key, le=bound)}}} {cumulative}")
+            lines.append(f"unrealcv_request_duration_seconds_sum{{{labels(key)}}} {seconds:.9f}")
+            lines.append(f"unrealcv_request_duration_seconds_count{{{labels(key)}}} {count}")
+        lines += ['# HELP unrealcv_requests_total UnrealCV requests by result',
+                  '# TYPE unrealcv_requests_total counter']
+        for key, count, errors, failures, _, _, _, _ in items:
+            lines.append(f"unrealcv_requests_total{{{labels(key, status='ok')}}} {count - errors - failures}")
+            lines.append(f"unrealcv_requests_total{{{labels(key, status='error')}}} {errors}")
+            lines.append(f"unrealcv_requests_total{{{labels(key, status='failed')}}} {failures}")
+        lines += ['# HELP unrealcv_request_bytes_total UnrealCV payload bytes',
+                  '# TYPE unrealcv_request_bytes_total counter']
+        for key, _, _, _, _, sent, received, _ in items:
+            lines.append(f"unrealcv_request_bytes_total{{{labels(key, direction='sent')}}} {sent}")
+            lines.append(f"unrealcv_request_bytes_total{{{labels(key, direction='received')}}} {received}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Write prometheus() to a text file"""
+        with open(path, 'w') as f:
+            f.write(self.prometheus())
+
+
+def install(tracer=None):
+    """
+    Start tracing all UnrealCV requests in this process.
+
+    Args:
+        tracer (Tracer): Tracer to record into (default: a new one)
+
+    Returns:
+        Tracer: The installed tracer
+    """
+    tracer = tracer or Tracer()
+    unrealcv_session.set_tracer(tracer)
+    return tracer
+
+
+def uninstall():
+    """Stop tracing"""
+    unrealcv_session.set_tracer(None)
+
+
+def write_outputs(tracer, prefix, verbose=True):
+    """
+    Write <prefix>.json (Chrome trace) and <prefix>.prom (Prometheus metrics).
+
+    Args:
+        tracer (Tracer): The tracer
+        prefix (str): Output path without extension
+    """
+    directory = os.path.dirname(os.path.abspath(prefix))
+    os.makedirs(directory, exist_ok=True)
+    tracer.write_chrome_trace(f"{prefix}.json")
+    tracer.write_prometheus(f"{prefix}.prom")
+    if verbose:
+        print(f"UnrealCV trace written to {prefix}.json and {prefix}.prom")
+
+
+def install_from_env():
+    """Install a tracer if UNREALCV_TRACE is set, writing its outputs at exit"""
+    prefix = os.environ.get('UNREALCV_TRACE')
+    if not prefix or unrealcv_session.get_tracer() is not None:
+        return None
+    tracer = install()
+    atexit.register(write_outputs, tracer, prefix)
+    return tracer
+
+
+class _NullClient:
+    """In-process client that answers instantly, to isolate the cost of tracing"""
+
+    def isconnected(self):
+        return True
+
+    def request(self, command):
+        return 'ok'
+
+    def request_batch(self, commands):
+        return ['ok'] * len(commands)
+
+    def disconnect(self):
+        pass
+
+
+def measure_overhead(iterations=20000):
+    """
+    Microbenchmark: UnrealCVSession.request against an instant client, with and
+    without a tracer installed. The difference is the cost tracing adds to
+    every request.
+
+    Args:
+        iterations (int): Requests per measurement
+
+    Returns:
+        dict: untraced_us, traced_us and overhead_us per request
+    """
+    session = unrealcv_session.UnrealCVSession(verbose=False)
+    session.client = _NullClient()
+    commands = [f"vset /object/Chair_{i % 50}/location {i} 0 100" for i in range(iterations)]
+    previous = unrealcv_session.get_tracer()
+
+    def run():
+        start = time.perf_counter()
+        for command in commands:
+            session.request(command)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    try:
+        unrealcv_session.set_tracer(None)
+        run()
+        untraced = min(run() for _ in range(3))
+        unrealcv_session.set_tracer(Tracer(max_events=iterations))
+        traced = min(run() for _ in range(3))
+    finally:
+        unrealcv_session.set_tracer(previous)
+    return {'untraced_us': untraced, 'traced_us': traced, 'overhead_us': traced - untraced}
+
+
+def main():
+    """
+    Run a script with tracing enabled, or check the tracing overhead budget.
+    """
+    parser = argparse.ArgumentParser(description='Trace the UnrealCV requests of a script')
+    parser.add_argument('--output', type=str, default='unrealcv_trace',
+                        help='Output path prefix for the .json and .prom files')
+    parser.add_argument('--overhead', action='store_true',
+                        help=f'Measure the per-request cost of tracing against the {OVERHEAD_BUDGET_US:g} us budget')
+    parser.add_argument('--budget_us', type=float, default=OVERHEAD_BUDGET_US,
+                        help='Overhead budget in microseconds per request')
+    parser.add_argument('script', nargs='?', help='Python script to run')
+    parser.add_argument('script_args', nargs=argparse.REMAINDER, help='Arguments for the script')
+    args = parser.parse_args()
+
+    if args.overhead:
+        result = measure_overhead()
+        print(f"Untraced: {result['untraced_us']:.2f} us per request")
+        print(f"Traced:   {result['traced_us']:.2f} us per request")
+        print(f"Overhead: {result['overhead_us']:.2f} us per request (budget {args.budget_us:g} us)")
+        if result['overhead_us'] > args.budget_us:
+            print("Tracing overhead is over budget")
+            sys.exit(1)
+        return
+
+    if not args.script:
+        parser.error('a script to run is required unless --overhead is given')
+
+    tracer = install()
+    script_args = args.script_args[1:] if args.script_args[:1] == ['--'] else args.script_args
+    sys.argv = [args.script] + script_args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    # The outputs are written in the finally block, so an exit status from the
+    # script propagates after them
+    try:
+        runpy.run_path(args.script, run_name='__main__')
+    except KeyboardInterrupt:
+        print("\nExiting...")
+    finally:
+        uninstall()
+        tracer.print_summary()
+        write_outputs(tracer, args.output)
+
+
+if __name__ == "__main__":
+    main()